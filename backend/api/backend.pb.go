@@ -266,6 +266,210 @@ func (x *CreateScenarioResponse) GetScenarioID() string {
 	return ""
 }
 
+type CreateScenarioPoolRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	ScenarioID string `protobuf:"bytes,1,opt,name=scenarioID,proto3" json:"scenarioID,omitempty"` // scenario to create pool under
+	Name       string `protobuf:"bytes,2,opt,name=name,proto3" json:"name,omitempty"`
+}
+
+func (x *CreateScenarioPoolRequest) Reset() {
+	*x = CreateScenarioPoolRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_backend_proto_msgTypes[4]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *CreateScenarioPoolRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*CreateScenarioPoolRequest) ProtoMessage() {}
+
+func (x *CreateScenarioPoolRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_api_backend_proto_msgTypes[4]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use CreateScenarioPoolRequest.ProtoReflect.Descriptor instead.
+func (*CreateScenarioPoolRequest) Descriptor() ([]byte, []int) {
+	return file_api_backend_proto_rawDescGZIP(), []int{4}
+}
+
+func (x *CreateScenarioPoolRequest) GetScenarioID() string {
+	if x != nil {
+		return x.ScenarioID
+	}
+	return ""
+}
+
+func (x *CreateScenarioPoolRequest) GetName() string {
+	if x != nil {
+		return x.Name
+	}
+	return ""
+}
+
+type SetContextValueRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Hash  string `protobuf:"bytes,1,opt,name=hash,proto3" json:"hash,omitempty"` // content hash of value
+	Value []byte `protobuf:"bytes,2,opt,name=value,proto3" json:"value,omitempty"`
+}
+
+func (x *SetContextValueRequest) Reset() {
+	*x = SetContextValueRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_backend_proto_msgTypes[5]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *SetContextValueRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SetContextValueRequest) ProtoMessage() {}
+
+func (x *SetContextValueRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_api_backend_proto_msgTypes[5]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SetContextValueRequest.ProtoReflect.Descriptor instead.
+func (*SetContextValueRequest) Descriptor() ([]byte, []int) {
+	return file_api_backend_proto_rawDescGZIP(), []int{5}
+}
+
+func (x *SetContextValueRequest) GetHash() string {
+	if x != nil {
+		return x.Hash
+	}
+	return ""
+}
+
+func (x *SetContextValueRequest) GetValue() []byte {
+	if x != nil {
+		return x.Value
+	}
+	return nil
+}
+
+type GetContextValueRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Hash string `protobuf:"bytes,1,opt,name=hash,proto3" json:"hash,omitempty"`
+}
+
+func (x *GetContextValueRequest) Reset() {
+	*x = GetContextValueRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_backend_proto_msgTypes[6]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *GetContextValueRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetContextValueRequest) ProtoMessage() {}
+
+func (x *GetContextValueRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_api_backend_proto_msgTypes[6]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetContextValueRequest.ProtoReflect.Descriptor instead.
+func (*GetContextValueRequest) Descriptor() ([]byte, []int) {
+	return file_api_backend_proto_rawDescGZIP(), []int{6}
+}
+
+func (x *GetContextValueRequest) GetHash() string {
+	if x != nil {
+		return x.Hash
+	}
+	return ""
+}
+
+type GetContextValueResponse struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Value []byte `protobuf:"bytes,1,opt,name=value,proto3" json:"value,omitempty"`
+}
+
+func (x *GetContextValueResponse) Reset() {
+	*x = GetContextValueResponse{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_backend_proto_msgTypes[7]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *GetContextValueResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetContextValueResponse) ProtoMessage() {}
+
+func (x *GetContextValueResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_api_backend_proto_msgTypes[7]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetContextValueResponse.ProtoReflect.Descriptor instead.
+func (*GetContextValueResponse) Descriptor() ([]byte, []int) {
+	return file_api_backend_proto_rawDescGZIP(), []int{7}
+}
+
+func (x *GetContextValueResponse) GetValue() []byte {
+	if x != nil {
+		return x.Value
+	}
+	return nil
+}
+
 type CreateUsersRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
@@ -279,7 +483,7 @@ type CreateUsersRequest struct {
 func (x *CreateUsersRequest) Reset() {
 	*x = CreateUsersRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[4]
+		mi := &file_api_backend_proto_msgTypes[8]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -292,7 +496,7 @@ func (x *CreateUsersRequest) String() string {
 func (*CreateUsersRequest) ProtoMessage() {}
 
 func (x *CreateUsersRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[4]
+	mi := &file_api_backend_proto_msgTypes[8]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -305,7 +509,7 @@ func (x *CreateUsersRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use CreateUsersRequest.ProtoReflect.Descriptor instead.
 func (*CreateUsersRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{4}
+	return file_api_backend_proto_rawDescGZIP(), []int{8}
 }
 
 func (x *CreateUsersRequest) GetScenarioID() string {
@@ -341,7 +545,7 @@ type StopUsersRequest struct {
 func (x *StopUsersRequest) Reset() {
 	*x = StopUsersRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[5]
+		mi := &file_api_backend_proto_msgTypes[9]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -354,7 +558,7 @@ func (x *StopUsersRequest) String() string {
 func (*StopUsersRequest) ProtoMessage() {}
 
 func (x *StopUsersRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[5]
+	mi := &file_api_backend_proto_msgTypes[9]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -367,7 +571,7 @@ func (x *StopUsersRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use StopUsersRequest.ProtoReflect.Descriptor instead.
 func (*StopUsersRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{5}
+	return file_api_backend_proto_rawDescGZIP(), []int{9}
 }
 
 func (x *StopUsersRequest) GetScenarioID() string {
@@ -395,7 +599,7 @@ type CleanTestInstancesRequest struct {
 func (x *CleanTestInstancesRequest) Reset() {
 	*x = CleanTestInstancesRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[6]
+		mi := &file_api_backend_proto_msgTypes[10]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -408,7 +612,7 @@ func (x *CleanTestInstancesRequest) String() string {
 func (*CleanTestInstancesRequest) ProtoMessage() {}
 
 func (x *CleanTestInstancesRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[6]
+	mi := &file_api_backend_proto_msgTypes[10]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -421,7 +625,7 @@ func (x *CleanTestInstancesRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use CleanTestInstancesRequest.ProtoReflect.Descriptor instead.
 func (*CleanTestInstancesRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{6}
+	return file_api_backend_proto_rawDescGZIP(), []int{10}
 }
 
 func (x *CleanTestInstancesRequest) GetTestID() string {
@@ -443,7 +647,7 @@ type CheckTestInstanceRequest struct {
 func (x *CheckTestInstanceRequest) Reset() {
 	*x = CheckTestInstanceRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[7]
+		mi := &file_api_backend_proto_msgTypes[11]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -456,7 +660,7 @@ func (x *CheckTestInstanceRequest) String() string {
 func (*CheckTestInstanceRequest) ProtoMessage() {}
 
 func (x *CheckTestInstanceRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[7]
+	mi := &file_api_backend_proto_msgTypes[11]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -469,7 +673,7 @@ func (x *CheckTestInstanceRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use CheckTestInstanceRequest.ProtoReflect.Descriptor instead.
 func (*CheckTestInstanceRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{7}
+	return file_api_backend_proto_rawDescGZIP(), []int{11}
 }
 
 func (x *CheckTestInstanceRequest) GetTestID() string {
@@ -497,7 +701,7 @@ type CheckTestInstanceResponse struct {
 func (x *CheckTestInstanceResponse) Reset() {
 	*x = CheckTestInstanceResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[8]
+		mi := &file_api_backend_proto_msgTypes[12]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -510,7 +714,7 @@ func (x *CheckTestInstanceResponse) String() string {
 func (*CheckTestInstanceResponse) ProtoMessage() {}
 
 func (x *CheckTestInstanceResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[8]
+	mi := &file_api_backend_proto_msgTypes[12]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -523,7 +727,7 @@ func (x *CheckTestInstanceResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use CheckTestInstanceResponse.ProtoReflect.Descriptor instead.
 func (*CheckTestInstanceResponse) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{8}
+	return file_api_backend_proto_rawDescGZIP(), []int{12}
 }
 
 func (x *CheckTestInstanceResponse) GetRunning() bool {
@@ -544,7 +748,7 @@ type CreateUsersResponse struct {
 func (x *CreateUsersResponse) Reset() {
 	*x = CreateUsersResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[9]
+		mi := &file_api_backend_proto_msgTypes[13]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -557,7 +761,7 @@ func (x *CreateUsersResponse) String() string {
 func (*CreateUsersResponse) ProtoMessage() {}
 
 func (x *CreateUsersResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[9]
+	mi := &file_api_backend_proto_msgTypes[13]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -570,7 +774,7 @@ func (x *CreateUsersResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use CreateUsersResponse.ProtoReflect.Descriptor instead.
 func (*CreateUsersResponse) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{9}
+	return file_api_backend_proto_rawDescGZIP(), []int{13}
 }
 
 func (x *CreateUsersResponse) GetUserManagerIDs() []string {
@@ -592,7 +796,7 @@ type Event struct {
 func (x *Event) Reset() {
 	*x = Event{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[10]
+		mi := &file_api_backend_proto_msgTypes[14]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -605,7 +809,7 @@ func (x *Event) String() string {
 func (*Event) ProtoMessage() {}
 
 func (x *Event) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[10]
+	mi := &file_api_backend_proto_msgTypes[14]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -618,7 +822,7 @@ func (x *Event) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use Event.ProtoReflect.Descriptor instead.
 func (*Event) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{10}
+	return file_api_backend_proto_rawDescGZIP(), []int{14}
 }
 
 func (x *Event) GetKind() string {
@@ -647,7 +851,7 @@ type AddEventRequest struct {
 func (x *AddEventRequest) Reset() {
 	*x = AddEventRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[11]
+		mi := &file_api_backend_proto_msgTypes[15]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -660,7 +864,7 @@ func (x *AddEventRequest) String() string {
 func (*AddEventRequest) ProtoMessage() {}
 
 func (x *AddEventRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[11]
+	mi := &file_api_backend_proto_msgTypes[15]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -673,7 +877,7 @@ func (x *AddEventRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use AddEventRequest.ProtoReflect.Descriptor instead.
 func (*AddEventRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{11}
+	return file_api_backend_proto_rawDescGZIP(), []int{15}
 }
 
 func (x *AddEventRequest) GetId() string {
@@ -702,7 +906,7 @@ type GetEventsRequest struct {
 func (x *GetEventsRequest) Reset() {
 	*x = GetEventsRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[12]
+		mi := &file_api_backend_proto_msgTypes[16]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -715,7 +919,7 @@ func (x *GetEventsRequest) String() string {
 func (*GetEventsRequest) ProtoMessage() {}
 
 func (x *GetEventsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[12]
+	mi := &file_api_backend_proto_msgTypes[16]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -728,7 +932,7 @@ func (x *GetEventsRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetEventsRequest.ProtoReflect.Descriptor instead.
 func (*GetEventsRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{12}
+	return file_api_backend_proto_rawDescGZIP(), []int{16}
 }
 
 func (x *GetEventsRequest) GetId() string {
@@ -756,7 +960,7 @@ type Events struct {
 func (x *Events) Reset() {
 	*x = Events{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[13]
+		mi := &file_api_backend_proto_msgTypes[17]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -769,7 +973,7 @@ func (x *Events) String() string {
 func (*Events) ProtoMessage() {}
 
 func (x *Events) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[13]
+	mi := &file_api_backend_proto_msgTypes[17]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -782,7 +986,7 @@ func (x *Events) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use Events.ProtoReflect.Descriptor instead.
 func (*Events) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{13}
+	return file_api_backend_proto_rawDescGZIP(), []int{17}
 }
 
 func (x *Events) GetEvents() []*Event {
@@ -804,7 +1008,7 @@ type AddUserResultsRequest struct {
 func (x *AddUserResultsRequest) Reset() {
 	*x = AddUserResultsRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[14]
+		mi := &file_api_backend_proto_msgTypes[18]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -817,7 +1021,7 @@ func (x *AddUserResultsRequest) String() string {
 func (*AddUserResultsRequest) ProtoMessage() {}
 
 func (x *AddUserResultsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[14]
+	mi := &file_api_backend_proto_msgTypes[18]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -830,7 +1034,7 @@ func (x *AddUserResultsRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use AddUserResultsRequest.ProtoReflect.Descriptor instead.
 func (*AddUserResultsRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{14}
+	return file_api_backend_proto_rawDescGZIP(), []int{18}
 }
 
 func (x *AddUserResultsRequest) GetUserManagerID() string {
@@ -859,12 +1063,13 @@ type SetScenarioResultRequest struct {
 	TimeTaken  float64               `protobuf:"fixed64,5,opt,name=timeTaken,proto3" json:"timeTaken,omitempty"`
 	Succeeded  int32                 `protobuf:"varint,6,opt,name=succeeded,proto3" json:"succeeded,omitempty"`
 	Failed     int32                 `protobuf:"varint,7,opt,name=failed,proto3" json:"failed,omitempty"`
+	MaxUsers   int32                 `protobuf:"varint,8,opt,name=maxUsers,proto3" json:"maxUsers,omitempty"`
 }
 
 func (x *SetScenarioResultRequest) Reset() {
 	*x = SetScenarioResultRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[15]
+		mi := &file_api_backend_proto_msgTypes[19]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -877,7 +1082,7 @@ func (x *SetScenarioResultRequest) String() string {
 func (*SetScenarioResultRequest) ProtoMessage() {}
 
 func (x *SetScenarioResultRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[15]
+	mi := &file_api_backend_proto_msgTypes[19]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -890,7 +1095,7 @@ func (x *SetScenarioResultRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SetScenarioResultRequest.ProtoReflect.Descriptor instead.
 func (*SetScenarioResultRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{15}
+	return file_api_backend_proto_rawDescGZIP(), []int{19}
 }
 
 func (x *SetScenarioResultRequest) GetScenarioID() string {
@@ -942,6 +1147,13 @@ func (x *SetScenarioResultRequest) GetFailed() int32 {
 	return 0
 }
 
+func (x *SetScenarioResultRequest) GetMaxUsers() int32 {
+	if x != nil {
+		return x.MaxUsers
+	}
+	return 0
+}
+
 type MoveUserResultsRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
@@ -954,7 +1166,7 @@ type MoveUserResultsRequest struct {
 func (x *MoveUserResultsRequest) Reset() {
 	*x = MoveUserResultsRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[16]
+		mi := &file_api_backend_proto_msgTypes[20]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -967,7 +1179,7 @@ func (x *MoveUserResultsRequest) String() string {
 func (*MoveUserResultsRequest) ProtoMessage() {}
 
 func (x *MoveUserResultsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[16]
+	mi := &file_api_backend_proto_msgTypes[20]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -980,7 +1192,7 @@ func (x *MoveUserResultsRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use MoveUserResultsRequest.ProtoReflect.Descriptor instead.
 func (*MoveUserResultsRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{16}
+	return file_api_backend_proto_rawDescGZIP(), []int{20}
 }
 
 func (x *MoveUserResultsRequest) GetScenarioID() string {
@@ -1008,7 +1220,7 @@ type MoveUserResultsResponse struct {
 func (x *MoveUserResultsResponse) Reset() {
 	*x = MoveUserResultsResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[17]
+		mi := &file_api_backend_proto_msgTypes[21]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1021,7 +1233,7 @@ func (x *MoveUserResultsResponse) String() string {
 func (*MoveUserResultsResponse) ProtoMessage() {}
 
 func (x *MoveUserResultsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[17]
+	mi := &file_api_backend_proto_msgTypes[21]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1034,7 +1246,7 @@ func (x *MoveUserResultsResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use MoveUserResultsResponse.ProtoReflect.Descriptor instead.
 func (*MoveUserResultsResponse) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{17}
+	return file_api_backend_proto_rawDescGZIP(), []int{21}
 }
 
 func (x *MoveUserResultsResponse) GetResults() [][]byte {
@@ -1055,7 +1267,7 @@ type MoveScenarioResultRequest struct {
 func (x *MoveScenarioResultRequest) Reset() {
 	*x = MoveScenarioResultRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[18]
+		mi := &file_api_backend_proto_msgTypes[22]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1068,7 +1280,7 @@ func (x *MoveScenarioResultRequest) String() string {
 func (*MoveScenarioResultRequest) ProtoMessage() {}
 
 func (x *MoveScenarioResultRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[18]
+	mi := &file_api_backend_proto_msgTypes[22]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1081,7 +1293,7 @@ func (x *MoveScenarioResultRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use MoveScenarioResultRequest.ProtoReflect.Descriptor instead.
 func (*MoveScenarioResultRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{18}
+	return file_api_backend_proto_rawDescGZIP(), []int{22}
 }
 
 func (x *MoveScenarioResultRequest) GetScenarioID() string {
@@ -1104,12 +1316,13 @@ type MoveScenarioResultResponse struct {
 	TimeTaken float64               `protobuf:"fixed64,6,opt,name=timeTaken,proto3" json:"timeTaken,omitempty"`
 	Succeeded int32                 `protobuf:"varint,7,opt,name=succeeded,proto3" json:"succeeded,omitempty"`
 	Failed    int32                 `protobuf:"varint,8,opt,name=failed,proto3" json:"failed,omitempty"`
+	MaxUsers  int32                 `protobuf:"varint,9,opt,name=maxUsers,proto3" json:"maxUsers,omitempty"`
 }
 
 func (x *MoveScenarioResultResponse) Reset() {
 	*x = MoveScenarioResultResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[19]
+		mi := &file_api_backend_proto_msgTypes[23]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1122,7 +1335,7 @@ func (x *MoveScenarioResultResponse) String() string {
 func (*MoveScenarioResultResponse) ProtoMessage() {}
 
 func (x *MoveScenarioResultResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[19]
+	mi := &file_api_backend_proto_msgTypes[23]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1135,7 +1348,7 @@ func (x *MoveScenarioResultResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use MoveScenarioResultResponse.ProtoReflect.Descriptor instead.
 func (*MoveScenarioResultResponse) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{19}
+	return file_api_backend_proto_rawDescGZIP(), []int{23}
 }
 
 func (x *MoveScenarioResultResponse) GetId() string {
@@ -1194,6 +1407,13 @@ func (x *MoveScenarioResultResponse) GetFailed() int32 {
 	return 0
 }
 
+func (x *MoveScenarioResultResponse) GetMaxUsers() int32 {
+	if x != nil {
+		return x.MaxUsers
+	}
+	return 0
+}
+
 type DistributeWorkRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
@@ -1206,7 +1426,7 @@ type DistributeWorkRequest struct {
 func (x *DistributeWorkRequest) Reset() {
 	*x = DistributeWorkRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[20]
+		mi := &file_api_backend_proto_msgTypes[24]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1219,7 +1439,7 @@ func (x *DistributeWorkRequest) String() string {
 func (*DistributeWorkRequest) ProtoMessage() {}
 
 func (x *DistributeWorkRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[20]
+	mi := &file_api_backend_proto_msgTypes[24]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1232,7 +1452,7 @@ func (x *DistributeWorkRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use DistributeWorkRequest.ProtoReflect.Descriptor instead.
 func (*DistributeWorkRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{20}
+	return file_api_backend_proto_rawDescGZIP(), []int{24}
 }
 
 func (x *DistributeWorkRequest) GetScenarioID() string {
@@ -1260,7 +1480,7 @@ type GetUserWorkRequest struct {
 func (x *GetUserWorkRequest) Reset() {
 	*x = GetUserWorkRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[21]
+		mi := &file_api_backend_proto_msgTypes[25]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1273,7 +1493,7 @@ func (x *GetUserWorkRequest) String() string {
 func (*GetUserWorkRequest) ProtoMessage() {}
 
 func (x *GetUserWorkRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[21]
+	mi := &file_api_backend_proto_msgTypes[25]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1286,7 +1506,7 @@ func (x *GetUserWorkRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetUserWorkRequest.ProtoReflect.Descriptor instead.
 func (*GetUserWorkRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{21}
+	return file_api_backend_proto_rawDescGZIP(), []int{25}
 }
 
 func (x *GetUserWorkRequest) GetUserManagerID() string {
@@ -1307,7 +1527,7 @@ type GetUserWorkResponse struct {
 func (x *GetUserWorkResponse) Reset() {
 	*x = GetUserWorkResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[22]
+		mi := &file_api_backend_proto_msgTypes[26]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1320,7 +1540,7 @@ func (x *GetUserWorkResponse) String() string {
 func (*GetUserWorkResponse) ProtoMessage() {}
 
 func (x *GetUserWorkResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[22]
+	mi := &file_api_backend_proto_msgTypes[26]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1333,7 +1553,7 @@ func (x *GetUserWorkResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetUserWorkResponse.ProtoReflect.Descriptor instead.
 func (*GetUserWorkResponse) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{22}
+	return file_api_backend_proto_rawDescGZIP(), []int{26}
 }
 
 func (x *GetUserWorkResponse) GetWork() int32 {
@@ -1343,6 +1563,108 @@ func (x *GetUserWorkResponse) GetWork() int32 {
 	return 0
 }
 
+type DistributeWorkItemsRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	ScenarioID string   `protobuf:"bytes,1,opt,name=scenarioID,proto3" json:"scenarioID,omitempty"`
+	Items      [][]byte `protobuf:"bytes,2,rep,name=items,proto3" json:"items,omitempty"`
+}
+
+func (x *DistributeWorkItemsRequest) Reset() {
+	*x = DistributeWorkItemsRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_backend_proto_msgTypes[27]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *DistributeWorkItemsRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*DistributeWorkItemsRequest) ProtoMessage() {}
+
+func (x *DistributeWorkItemsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_api_backend_proto_msgTypes[27]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use DistributeWorkItemsRequest.ProtoReflect.Descriptor instead.
+func (*DistributeWorkItemsRequest) Descriptor() ([]byte, []int) {
+	return file_api_backend_proto_rawDescGZIP(), []int{27}
+}
+
+func (x *DistributeWorkItemsRequest) GetScenarioID() string {
+	if x != nil {
+		return x.ScenarioID
+	}
+	return ""
+}
+
+func (x *DistributeWorkItemsRequest) GetItems() [][]byte {
+	if x != nil {
+		return x.Items
+	}
+	return nil
+}
+
+type GetUserWorkItemsResponse struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Items [][]byte `protobuf:"bytes,1,rep,name=items,proto3" json:"items,omitempty"`
+}
+
+func (x *GetUserWorkItemsResponse) Reset() {
+	*x = GetUserWorkItemsResponse{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_backend_proto_msgTypes[28]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *GetUserWorkItemsResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetUserWorkItemsResponse) ProtoMessage() {}
+
+func (x *GetUserWorkItemsResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_api_backend_proto_msgTypes[28]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetUserWorkItemsResponse.ProtoReflect.Descriptor instead.
+func (*GetUserWorkItemsResponse) Descriptor() ([]byte, []int) {
+	return file_api_backend_proto_rawDescGZIP(), []int{28}
+}
+
+func (x *GetUserWorkItemsResponse) GetItems() [][]byte {
+	if x != nil {
+		return x.Items
+	}
+	return nil
+}
+
 type AddMetricRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
@@ -1356,7 +1678,7 @@ type AddMetricRequest struct {
 func (x *AddMetricRequest) Reset() {
 	*x = AddMetricRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[23]
+		mi := &file_api_backend_proto_msgTypes[29]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1369,7 +1691,7 @@ func (x *AddMetricRequest) String() string {
 func (*AddMetricRequest) ProtoMessage() {}
 
 func (x *AddMetricRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[23]
+	mi := &file_api_backend_proto_msgTypes[29]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1382,7 +1704,7 @@ func (x *AddMetricRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use AddMetricRequest.ProtoReflect.Descriptor instead.
 func (*AddMetricRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{23}
+	return file_api_backend_proto_rawDescGZIP(), []int{29}
 }
 
 func (x *AddMetricRequest) GetScenarioID() string {
@@ -1406,6 +1728,117 @@ func (x *AddMetricRequest) GetValue() float64 {
 	return 0
 }
 
+type AddMetricSummaryRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	ScenarioID   string          `protobuf:"bytes,1,opt,name=scenarioID,proto3" json:"scenarioID,omitempty"`
+	Name         string          `protobuf:"bytes,2,opt,name=name,proto3" json:"name,omitempty"`
+	Count        int64           `protobuf:"varint,3,opt,name=count,proto3" json:"count,omitempty"`
+	Sum          float64         `protobuf:"fixed64,4,opt,name=sum,proto3" json:"sum,omitempty"`
+	Min          float64         `protobuf:"fixed64,5,opt,name=min,proto3" json:"min,omitempty"`
+	Max          float64         `protobuf:"fixed64,6,opt,name=max,proto3" json:"max,omitempty"`
+	Last         float64         `protobuf:"fixed64,7,opt,name=last,proto3" json:"last,omitempty"`
+	SumOfSquares float64         `protobuf:"fixed64,8,opt,name=sumOfSquares,proto3" json:"sumOfSquares,omitempty"`
+	Histogram    map[int32]int64 `protobuf:"bytes,9,rep,name=histogram,proto3" json:"histogram,omitempty" protobuf_key:"varint,1,opt,name=key,proto3" protobuf_val:"varint,2,opt,name=value,proto3"`
+}
+
+func (x *AddMetricSummaryRequest) Reset() {
+	*x = AddMetricSummaryRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_backend_proto_msgTypes[30]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *AddMetricSummaryRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*AddMetricSummaryRequest) ProtoMessage() {}
+
+func (x *AddMetricSummaryRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_api_backend_proto_msgTypes[30]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use AddMetricSummaryRequest.ProtoReflect.Descriptor instead.
+func (*AddMetricSummaryRequest) Descriptor() ([]byte, []int) {
+	return file_api_backend_proto_rawDescGZIP(), []int{30}
+}
+
+func (x *AddMetricSummaryRequest) GetScenarioID() string {
+	if x != nil {
+		return x.ScenarioID
+	}
+	return ""
+}
+
+func (x *AddMetricSummaryRequest) GetName() string {
+	if x != nil {
+		return x.Name
+	}
+	return ""
+}
+
+func (x *AddMetricSummaryRequest) GetCount() int64 {
+	if x != nil {
+		return x.Count
+	}
+	return 0
+}
+
+func (x *AddMetricSummaryRequest) GetSum() float64 {
+	if x != nil {
+		return x.Sum
+	}
+	return 0
+}
+
+func (x *AddMetricSummaryRequest) GetMin() float64 {
+	if x != nil {
+		return x.Min
+	}
+	return 0
+}
+
+func (x *AddMetricSummaryRequest) GetMax() float64 {
+	if x != nil {
+		return x.Max
+	}
+	return 0
+}
+
+func (x *AddMetricSummaryRequest) GetLast() float64 {
+	if x != nil {
+		return x.Last
+	}
+	return 0
+}
+
+func (x *AddMetricSummaryRequest) GetSumOfSquares() float64 {
+	if x != nil {
+		return x.SumOfSquares
+	}
+	return 0
+}
+
+func (x *AddMetricSummaryRequest) GetHistogram() map[int32]int64 {
+	if x != nil {
+		return x.Histogram
+	}
+	return nil
+}
+
 type GetMetricRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
@@ -1418,7 +1851,7 @@ type GetMetricRequest struct {
 func (x *GetMetricRequest) Reset() {
 	*x = GetMetricRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[24]
+		mi := &file_api_backend_proto_msgTypes[31]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1431,7 +1864,7 @@ func (x *GetMetricRequest) String() string {
 func (*GetMetricRequest) ProtoMessage() {}
 
 func (x *GetMetricRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[24]
+	mi := &file_api_backend_proto_msgTypes[31]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1444,7 +1877,7 @@ func (x *GetMetricRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetMetricRequest.ProtoReflect.Descriptor instead.
 func (*GetMetricRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{24}
+	return file_api_backend_proto_rawDescGZIP(), []int{31}
 }
 
 func (x *GetMetricRequest) GetScenarioID() string {
@@ -1461,6 +1894,85 @@ func (x *GetMetricRequest) GetName() string {
 	return ""
 }
 
+type GetMetricSeriesRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	ScenarioID    string `protobuf:"bytes,1,opt,name=scenarioID,proto3" json:"scenarioID,omitempty"`
+	Name          string `protobuf:"bytes,2,opt,name=name,proto3" json:"name,omitempty"`
+	FromTimestamp int64  `protobuf:"varint,3,opt,name=fromTimestamp,proto3" json:"fromTimestamp,omitempty"` // unix seconds, inclusive
+	ToTimestamp   int64  `protobuf:"varint,4,opt,name=toTimestamp,proto3" json:"toTimestamp,omitempty"`     // unix seconds, exclusive. Current time if 0
+	Step          int64  `protobuf:"varint,5,opt,name=step,proto3" json:"step,omitempty"`                   // seconds per point
+}
+
+func (x *GetMetricSeriesRequest) Reset() {
+	*x = GetMetricSeriesRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_backend_proto_msgTypes[32]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *GetMetricSeriesRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetMetricSeriesRequest) ProtoMessage() {}
+
+func (x *GetMetricSeriesRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_api_backend_proto_msgTypes[32]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetMetricSeriesRequest.ProtoReflect.Descriptor instead.
+func (*GetMetricSeriesRequest) Descriptor() ([]byte, []int) {
+	return file_api_backend_proto_rawDescGZIP(), []int{32}
+}
+
+func (x *GetMetricSeriesRequest) GetScenarioID() string {
+	if x != nil {
+		return x.ScenarioID
+	}
+	return ""
+}
+
+func (x *GetMetricSeriesRequest) GetName() string {
+	if x != nil {
+		return x.Name
+	}
+	return ""
+}
+
+func (x *GetMetricSeriesRequest) GetFromTimestamp() int64 {
+	if x != nil {
+		return x.FromTimestamp
+	}
+	return 0
+}
+
+func (x *GetMetricSeriesRequest) GetToTimestamp() int64 {
+	if x != nil {
+		return x.ToTimestamp
+	}
+	return 0
+}
+
+func (x *GetMetricSeriesRequest) GetStep() int64 {
+	if x != nil {
+		return x.Step
+	}
+	return 0
+}
+
 type GetMetricRateRequest struct {
 	state         protoimpl.MessageState
 	sizeCache     protoimpl.SizeCache
@@ -1474,7 +1986,7 @@ type GetMetricRateRequest struct {
 func (x *GetMetricRateRequest) Reset() {
 	*x = GetMetricRateRequest{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[25]
+		mi := &file_api_backend_proto_msgTypes[33]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1487,7 +1999,7 @@ func (x *GetMetricRateRequest) String() string {
 func (*GetMetricRateRequest) ProtoMessage() {}
 
 func (x *GetMetricRateRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[25]
+	mi := &file_api_backend_proto_msgTypes[33]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1500,7 +2012,7 @@ func (x *GetMetricRateRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetMetricRateRequest.ProtoReflect.Descriptor instead.
 func (*GetMetricRateRequest) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{25}
+	return file_api_backend_proto_rawDescGZIP(), []int{33}
 }
 
 func (x *GetMetricRateRequest) GetScenarioID() string {
@@ -1535,7 +2047,7 @@ type MetricTotalResponse struct {
 func (x *MetricTotalResponse) Reset() {
 	*x = MetricTotalResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[26]
+		mi := &file_api_backend_proto_msgTypes[34]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1548,7 +2060,7 @@ func (x *MetricTotalResponse) String() string {
 func (*MetricTotalResponse) ProtoMessage() {}
 
 func (x *MetricTotalResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[26]
+	mi := &file_api_backend_proto_msgTypes[34]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1561,7 +2073,7 @@ func (x *MetricTotalResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use MetricTotalResponse.ProtoReflect.Descriptor instead.
 func (*MetricTotalResponse) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{26}
+	return file_api_backend_proto_rawDescGZIP(), []int{34}
 }
 
 func (x *MetricTotalResponse) GetTotal() float64 {
@@ -1582,7 +2094,7 @@ type LastMetricResponse struct {
 func (x *LastMetricResponse) Reset() {
 	*x = LastMetricResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[27]
+		mi := &file_api_backend_proto_msgTypes[35]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1595,7 +2107,7 @@ func (x *LastMetricResponse) String() string {
 func (*LastMetricResponse) ProtoMessage() {}
 
 func (x *LastMetricResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[27]
+	mi := &file_api_backend_proto_msgTypes[35]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1608,7 +2120,7 @@ func (x *LastMetricResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use LastMetricResponse.ProtoReflect.Descriptor instead.
 func (*LastMetricResponse) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{27}
+	return file_api_backend_proto_rawDescGZIP(), []int{35}
 }
 
 func (x *LastMetricResponse) GetLast() float64 {
@@ -1629,7 +2141,7 @@ type MetricRateResponse struct {
 func (x *MetricRateResponse) Reset() {
 	*x = MetricRateResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[28]
+		mi := &file_api_backend_proto_msgTypes[36]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1642,7 +2154,7 @@ func (x *MetricRateResponse) String() string {
 func (*MetricRateResponse) ProtoMessage() {}
 
 func (x *MetricRateResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[28]
+	mi := &file_api_backend_proto_msgTypes[36]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1655,7 +2167,7 @@ func (x *MetricRateResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use MetricRateResponse.ProtoReflect.Descriptor instead.
 func (*MetricRateResponse) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{28}
+	return file_api_backend_proto_rawDescGZIP(), []int{36}
 }
 
 func (x *MetricRateResponse) GetPercentage() float64 {
@@ -1675,12 +2187,13 @@ type MetricStatisticsResponse struct {
 	Median  float64 `protobuf:"fixed64,3,opt,name=median,proto3" json:"median,omitempty"`
 	Average float64 `protobuf:"fixed64,4,opt,name=average,proto3" json:"average,omitempty"`
 	Len     int64   `protobuf:"varint,5,opt,name=len,proto3" json:"len,omitempty"`
+	Stddev  float64 `protobuf:"fixed64,6,opt,name=stddev,proto3" json:"stddev,omitempty"` // NOTE: only reported for metrics added as summaries
 }
 
 func (x *MetricStatisticsResponse) Reset() {
 	*x = MetricStatisticsResponse{}
 	if protoimpl.UnsafeEnabled {
-		mi := &file_api_backend_proto_msgTypes[29]
+		mi := &file_api_backend_proto_msgTypes[37]
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		ms.StoreMessageInfo(mi)
 	}
@@ -1693,7 +2206,7 @@ func (x *MetricStatisticsResponse) String() string {
 func (*MetricStatisticsResponse) ProtoMessage() {}
 
 func (x *MetricStatisticsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_api_backend_proto_msgTypes[29]
+	mi := &file_api_backend_proto_msgTypes[37]
 	if protoimpl.UnsafeEnabled && x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1706,7 +2219,7 @@ func (x *MetricStatisticsResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use MetricStatisticsResponse.ProtoReflect.Descriptor instead.
 func (*MetricStatisticsResponse) Descriptor() ([]byte, []int) {
-	return file_api_backend_proto_rawDescGZIP(), []int{29}
+	return file_api_backend_proto_rawDescGZIP(), []int{37}
 }
 
 func (x *MetricStatisticsResponse) GetMin() float64 {
@@ -1744,6 +2257,415 @@ func (x *MetricStatisticsResponse) GetLen() int64 {
 	return 0
 }
 
+func (x *MetricStatisticsResponse) GetStddev() float64 {
+	if x != nil {
+		return x.Stddev
+	}
+	return 0
+}
+
+type MetricSeriesPoint struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Timestamp int64   `protobuf:"varint,1,opt,name=timestamp,proto3" json:"timestamp,omitempty"` // unix seconds at start of point
+	Count     int64   `protobuf:"varint,2,opt,name=count,proto3" json:"count,omitempty"`
+	Sum       float64 `protobuf:"fixed64,3,opt,name=sum,proto3" json:"sum,omitempty"`
+	Min       float64 `protobuf:"fixed64,4,opt,name=min,proto3" json:"min,omitempty"`
+	Max       float64 `protobuf:"fixed64,5,opt,name=max,proto3" json:"max,omitempty"`
+	Average   float64 `protobuf:"fixed64,6,opt,name=average,proto3" json:"average,omitempty"`
+	Stddev    float64 `protobuf:"fixed64,7,opt,name=stddev,proto3" json:"stddev,omitempty"`
+}
+
+func (x *MetricSeriesPoint) Reset() {
+	*x = MetricSeriesPoint{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_backend_proto_msgTypes[38]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *MetricSeriesPoint) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*MetricSeriesPoint) ProtoMessage() {}
+
+func (x *MetricSeriesPoint) ProtoReflect() protoreflect.Message {
+	mi := &file_api_backend_proto_msgTypes[38]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use MetricSeriesPoint.ProtoReflect.Descriptor instead.
+func (*MetricSeriesPoint) Descriptor() ([]byte, []int) {
+	return file_api_backend_proto_rawDescGZIP(), []int{38}
+}
+
+func (x *MetricSeriesPoint) GetTimestamp() int64 {
+	if x != nil {
+		return x.Timestamp
+	}
+	return 0
+}
+
+func (x *MetricSeriesPoint) GetCount() int64 {
+	if x != nil {
+		return x.Count
+	}
+	return 0
+}
+
+func (x *MetricSeriesPoint) GetSum() float64 {
+	if x != nil {
+		return x.Sum
+	}
+	return 0
+}
+
+func (x *MetricSeriesPoint) GetMin() float64 {
+	if x != nil {
+		return x.Min
+	}
+	return 0
+}
+
+func (x *MetricSeriesPoint) GetMax() float64 {
+	if x != nil {
+		return x.Max
+	}
+	return 0
+}
+
+func (x *MetricSeriesPoint) GetAverage() float64 {
+	if x != nil {
+		return x.Average
+	}
+	return 0
+}
+
+func (x *MetricSeriesPoint) GetStddev() float64 {
+	if x != nil {
+		return x.Stddev
+	}
+	return 0
+}
+
+type MetricSeriesResponse struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Points []*MetricSeriesPoint `protobuf:"bytes,1,rep,name=points,proto3" json:"points,omitempty"`
+}
+
+func (x *MetricSeriesResponse) Reset() {
+	*x = MetricSeriesResponse{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_backend_proto_msgTypes[39]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *MetricSeriesResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*MetricSeriesResponse) ProtoMessage() {}
+
+func (x *MetricSeriesResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_api_backend_proto_msgTypes[39]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use MetricSeriesResponse.ProtoReflect.Descriptor instead.
+func (*MetricSeriesResponse) Descriptor() ([]byte, []int) {
+	return file_api_backend_proto_rawDescGZIP(), []int{39}
+}
+
+func (x *MetricSeriesResponse) GetPoints() []*MetricSeriesPoint {
+	if x != nil {
+		return x.Points
+	}
+	return nil
+}
+
+type MetricQuery struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Kind          string  `protobuf:"bytes,1,opt,name=kind,proto3" json:"kind,omitempty"` // one of total, last, rate, statistics, series
+	ScenarioID    string  `protobuf:"bytes,2,opt,name=scenarioID,proto3" json:"scenarioID,omitempty"`
+	Name          string  `protobuf:"bytes,3,opt,name=name,proto3" json:"name,omitempty"`
+	SplitPoint    float64 `protobuf:"fixed64,4,opt,name=splitPoint,proto3" json:"splitPoint,omitempty"`      // rate only
+	FromTimestamp int64   `protobuf:"varint,5,opt,name=fromTimestamp,proto3" json:"fromTimestamp,omitempty"` // series only
+	ToTimestamp   int64   `protobuf:"varint,6,opt,name=toTimestamp,proto3" json:"toTimestamp,omitempty"`     // series only
+	Step          int64   `protobuf:"varint,7,opt,name=step,proto3" json:"step,omitempty"`                   // series only
+}
+
+func (x *MetricQuery) Reset() {
+	*x = MetricQuery{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_backend_proto_msgTypes[40]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *MetricQuery) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*MetricQuery) ProtoMessage() {}
+
+func (x *MetricQuery) ProtoReflect() protoreflect.Message {
+	mi := &file_api_backend_proto_msgTypes[40]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use MetricQuery.ProtoReflect.Descriptor instead.
+func (*MetricQuery) Descriptor() ([]byte, []int) {
+	return file_api_backend_proto_rawDescGZIP(), []int{40}
+}
+
+func (x *MetricQuery) GetKind() string {
+	if x != nil {
+		return x.Kind
+	}
+	return ""
+}
+
+func (x *MetricQuery) GetScenarioID() string {
+	if x != nil {
+		return x.ScenarioID
+	}
+	return ""
+}
+
+func (x *MetricQuery) GetName() string {
+	if x != nil {
+		return x.Name
+	}
+	return ""
+}
+
+func (x *MetricQuery) GetSplitPoint() float64 {
+	if x != nil {
+		return x.SplitPoint
+	}
+	return 0
+}
+
+func (x *MetricQuery) GetFromTimestamp() int64 {
+	if x != nil {
+		return x.FromTimestamp
+	}
+	return 0
+}
+
+func (x *MetricQuery) GetToTimestamp() int64 {
+	if x != nil {
+		return x.ToTimestamp
+	}
+	return 0
+}
+
+func (x *MetricQuery) GetStep() int64 {
+	if x != nil {
+		return x.Step
+	}
+	return 0
+}
+
+type MetricQueryResult struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Found      bool                      `protobuf:"varint,1,opt,name=found,proto3" json:"found,omitempty"`
+	Value      float64                   `protobuf:"fixed64,2,opt,name=value,proto3" json:"value,omitempty"` // total, last and rate
+	Statistics *MetricStatisticsResponse `protobuf:"bytes,3,opt,name=statistics,proto3" json:"statistics,omitempty"`
+	Points     []*MetricSeriesPoint      `protobuf:"bytes,4,rep,name=points,proto3" json:"points,omitempty"`
+}
+
+func (x *MetricQueryResult) Reset() {
+	*x = MetricQueryResult{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_backend_proto_msgTypes[41]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *MetricQueryResult) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*MetricQueryResult) ProtoMessage() {}
+
+func (x *MetricQueryResult) ProtoReflect() protoreflect.Message {
+	mi := &file_api_backend_proto_msgTypes[41]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use MetricQueryResult.ProtoReflect.Descriptor instead.
+func (*MetricQueryResult) Descriptor() ([]byte, []int) {
+	return file_api_backend_proto_rawDescGZIP(), []int{41}
+}
+
+func (x *MetricQueryResult) GetFound() bool {
+	if x != nil {
+		return x.Found
+	}
+	return false
+}
+
+func (x *MetricQueryResult) GetValue() float64 {
+	if x != nil {
+		return x.Value
+	}
+	return 0
+}
+
+func (x *MetricQueryResult) GetStatistics() *MetricStatisticsResponse {
+	if x != nil {
+		return x.Statistics
+	}
+	return nil
+}
+
+func (x *MetricQueryResult) GetPoints() []*MetricSeriesPoint {
+	if x != nil {
+		return x.Points
+	}
+	return nil
+}
+
+type GetMetricsSnapshotRequest struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Queries []*MetricQuery `protobuf:"bytes,1,rep,name=queries,proto3" json:"queries,omitempty"`
+}
+
+func (x *GetMetricsSnapshotRequest) Reset() {
+	*x = GetMetricsSnapshotRequest{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_backend_proto_msgTypes[42]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *GetMetricsSnapshotRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetMetricsSnapshotRequest) ProtoMessage() {}
+
+func (x *GetMetricsSnapshotRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_api_backend_proto_msgTypes[42]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetMetricsSnapshotRequest.ProtoReflect.Descriptor instead.
+func (*GetMetricsSnapshotRequest) Descriptor() ([]byte, []int) {
+	return file_api_backend_proto_rawDescGZIP(), []int{42}
+}
+
+func (x *GetMetricsSnapshotRequest) GetQueries() []*MetricQuery {
+	if x != nil {
+		return x.Queries
+	}
+	return nil
+}
+
+type GetMetricsSnapshotResponse struct {
+	state         protoimpl.MessageState
+	sizeCache     protoimpl.SizeCache
+	unknownFields protoimpl.UnknownFields
+
+	Results []*MetricQueryResult `protobuf:"bytes,1,rep,name=results,proto3" json:"results,omitempty"` // in order of queries
+}
+
+func (x *GetMetricsSnapshotResponse) Reset() {
+	*x = GetMetricsSnapshotResponse{}
+	if protoimpl.UnsafeEnabled {
+		mi := &file_api_backend_proto_msgTypes[43]
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		ms.StoreMessageInfo(mi)
+	}
+}
+
+func (x *GetMetricsSnapshotResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetMetricsSnapshotResponse) ProtoMessage() {}
+
+func (x *GetMetricsSnapshotResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_api_backend_proto_msgTypes[43]
+	if protoimpl.UnsafeEnabled && x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetMetricsSnapshotResponse.ProtoReflect.Descriptor instead.
+func (*GetMetricsSnapshotResponse) Descriptor() ([]byte, []int) {
+	return file_api_backend_proto_rawDescGZIP(), []int{43}
+}
+
+func (x *GetMetricsSnapshotResponse) GetResults() []*MetricQueryResult {
+	if x != nil {
+		return x.Results
+	}
+	return nil
+}
+
 var File_api_backend_proto protoreflect.FileDescriptor
 
 var file_api_backend_proto_rawDesc = []byte{
@@ -1785,71 +2707,88 @@ var file_api_backend_proto_rawDesc = []byte{
 	0x74, 0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e,
 	0x73, 0x65, 0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44,
 	0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f,
-	0x49, 0x44, 0x22, 0x64, 0x0a, 0x12, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x55, 0x73, 0x65, 0x72,
-	0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x63, 0x65, 0x6e,
-	0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x63,
-	0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x12, 0x16, 0x0a, 0x06, 0x74, 0x65, 0x73, 0x74,
-	0x49, 0x44, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x06, 0x74, 0x65, 0x73, 0x74, 0x49, 0x44,
-	0x12, 0x16, 0x0a, 0x06, 0x61, 0x6d, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x03, 0x20, 0x01, 0x28, 0x05,
-	0x52, 0x06, 0x61, 0x6d, 0x6f, 0x75, 0x6e, 0x74, 0x22, 0x4a, 0x0a, 0x10, 0x53, 0x74, 0x6f, 0x70,
+	0x49, 0x44, 0x22, 0x4f, 0x0a, 0x19, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x53, 0x63, 0x65, 0x6e,
+	0x61, 0x72, 0x69, 0x6f, 0x50, 0x6f, 0x6f, 0x6c, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12,
+	0x1e, 0x0a, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x01, 0x20,
+	0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x12,
+	0x12, 0x0a, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6e,
+	0x61, 0x6d, 0x65, 0x22, 0x42, 0x0a, 0x16, 0x53, 0x65, 0x74, 0x43, 0x6f, 0x6e, 0x74, 0x65, 0x78,
+	0x74, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x12, 0x0a,
+	0x04, 0x68, 0x61, 0x73, 0x68, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x68, 0x61, 0x73,
+	0x68, 0x12, 0x14, 0x0a, 0x05, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0c,
+	0x52, 0x05, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x22, 0x2c, 0x0a, 0x16, 0x47, 0x65, 0x74, 0x43, 0x6f,
+	0x6e, 0x74, 0x65, 0x78, 0x74, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73,
+	0x74, 0x12, 0x12, 0x0a, 0x04, 0x68, 0x61, 0x73, 0x68, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52,
+	0x04, 0x68, 0x61, 0x73, 0x68, 0x22, 0x2f, 0x0a, 0x17, 0x47, 0x65, 0x74, 0x43, 0x6f, 0x6e, 0x74,
+	0x65, 0x78, 0x74, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65,
+	0x12, 0x14, 0x0a, 0x05, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x0c, 0x52,
+	0x05, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x22, 0x64, 0x0a, 0x12, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65,
 	0x55, 0x73, 0x65, 0x72, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1e, 0x0a, 0x0a,
 	0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09,
 	0x52, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x12, 0x16, 0x0a, 0x06,
-	0x61, 0x6d, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x06, 0x61, 0x6d,
-	0x6f, 0x75, 0x6e, 0x74, 0x22, 0x33, 0x0a, 0x19, 0x43, 0x6c, 0x65, 0x61, 0x6e, 0x54, 0x65, 0x73,
-	0x74, 0x49, 0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63, 0x65, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73,
-	0x74, 0x12, 0x16, 0x0a, 0x06, 0x74, 0x65, 0x73, 0x74, 0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28,
-	0x09, 0x52, 0x06, 0x74, 0x65, 0x73, 0x74, 0x49, 0x44, 0x22, 0x52, 0x0a, 0x18, 0x43, 0x68, 0x65,
-	0x63, 0x6b, 0x54, 0x65, 0x73, 0x74, 0x49, 0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63, 0x65, 0x52, 0x65,
+	0x74, 0x65, 0x73, 0x74, 0x49, 0x44, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x06, 0x74, 0x65,
+	0x73, 0x74, 0x49, 0x44, 0x12, 0x16, 0x0a, 0x06, 0x61, 0x6d, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x03,
+	0x20, 0x01, 0x28, 0x05, 0x52, 0x06, 0x61, 0x6d, 0x6f, 0x75, 0x6e, 0x74, 0x22, 0x4a, 0x0a, 0x10,
+	0x53, 0x74, 0x6f, 0x70, 0x55, 0x73, 0x65, 0x72, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
+	0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x01,
+	0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44,
+	0x12, 0x16, 0x0a, 0x06, 0x61, 0x6d, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05,
+	0x52, 0x06, 0x61, 0x6d, 0x6f, 0x75, 0x6e, 0x74, 0x22, 0x33, 0x0a, 0x19, 0x43, 0x6c, 0x65, 0x61,
+	0x6e, 0x54, 0x65, 0x73, 0x74, 0x49, 0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63, 0x65, 0x73, 0x52, 0x65,
 	0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x16, 0x0a, 0x06, 0x74, 0x65, 0x73, 0x74, 0x49, 0x44, 0x18,
-	0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x06, 0x74, 0x65, 0x73, 0x74, 0x49, 0x44, 0x12, 0x1e, 0x0a,
-	0x0a, 0x69, 0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63, 0x65, 0x49, 0x44, 0x18, 0x02, 0x20, 0x01, 0x28,
-	0x09, 0x52, 0x0a, 0x69, 0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63, 0x65, 0x49, 0x44, 0x22, 0x35, 0x0a,
-	0x19, 0x43, 0x68, 0x65, 0x63, 0x6b, 0x54, 0x65, 0x73, 0x74, 0x49, 0x6e, 0x73, 0x74, 0x61, 0x6e,
-	0x63, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x18, 0x0a, 0x07, 0x72, 0x75,
-	0x6e, 0x6e, 0x69, 0x6e, 0x67, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52, 0x07, 0x72, 0x75, 0x6e,
-	0x6e, 0x69, 0x6e, 0x67, 0x22, 0x3d, 0x0a, 0x13, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x55, 0x73,
-	0x65, 0x72, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x26, 0x0a, 0x0e, 0x75,
-	0x73, 0x65, 0x72, 0x4d, 0x61, 0x6e, 0x61, 0x67, 0x65, 0x72, 0x49, 0x44, 0x73, 0x18, 0x01, 0x20,
-	0x03, 0x28, 0x09, 0x52, 0x0e, 0x75, 0x73, 0x65, 0x72, 0x4d, 0x61, 0x6e, 0x61, 0x67, 0x65, 0x72,
-	0x49, 0x44, 0x73, 0x22, 0x35, 0x0a, 0x05, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x12, 0x12, 0x0a, 0x04,
-	0x6b, 0x69, 0x6e, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6b, 0x69, 0x6e, 0x64,
-	0x12, 0x18, 0x0a, 0x07, 0x70, 0x61, 0x79, 0x6c, 0x6f, 0x61, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28,
-	0x0c, 0x52, 0x07, 0x70, 0x61, 0x79, 0x6c, 0x6f, 0x61, 0x64, 0x22, 0x47, 0x0a, 0x0f, 0x41, 0x64,
-	0x64, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x0e, 0x0a,
-	0x02, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x02, 0x69, 0x64, 0x12, 0x24, 0x0a,
-	0x05, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x0e, 0x2e, 0x62,
-	0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x52, 0x05, 0x65, 0x76,
-	0x65, 0x6e, 0x74, 0x22, 0x36, 0x0a, 0x10, 0x47, 0x65, 0x74, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x73,
-	0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x0e, 0x0a, 0x02, 0x69, 0x64, 0x18, 0x01, 0x20,
-	0x01, 0x28, 0x09, 0x52, 0x02, 0x69, 0x64, 0x12, 0x12, 0x0a, 0x04, 0x6b, 0x69, 0x6e, 0x64, 0x18,
-	0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6b, 0x69, 0x6e, 0x64, 0x22, 0x30, 0x0a, 0x06, 0x45,
-	0x76, 0x65, 0x6e, 0x74, 0x73, 0x12, 0x26, 0x0a, 0x06, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x73, 0x18,
-	0x01, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x0e, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e,
-	0x45, 0x76, 0x65, 0x6e, 0x74, 0x52, 0x06, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x73, 0x22, 0x57, 0x0a,
-	0x15, 0x41, 0x64, 0x64, 0x55, 0x73, 0x65, 0x72, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x52,
-	0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x24, 0x0a, 0x0d, 0x75, 0x73, 0x65, 0x72, 0x4d, 0x61,
-	0x6e, 0x61, 0x67, 0x65, 0x72, 0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0d, 0x75,
-	0x73, 0x65, 0x72, 0x4d, 0x61, 0x6e, 0x61, 0x67, 0x65, 0x72, 0x49, 0x44, 0x12, 0x18, 0x0a, 0x07,
-	0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x0c, 0x52, 0x07, 0x72,
-	0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x22, 0x94, 0x02, 0x0a, 0x18, 0x53, 0x65, 0x74, 0x53, 0x63,
-	0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x65, 0x71, 0x75,
-	0x65, 0x73, 0x74, 0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49,
-	0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69,
-	0x6f, 0x49, 0x44, 0x12, 0x34, 0x0a, 0x06, 0x6f, 0x75, 0x74, 0x70, 0x75, 0x74, 0x18, 0x02, 0x20,
-	0x01, 0x28, 0x0b, 0x32, 0x1c, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f,
-	0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x53, 0x74, 0x72, 0x69, 0x6e, 0x67, 0x56, 0x61, 0x6c, 0x75,
-	0x65, 0x52, 0x06, 0x6f, 0x75, 0x74, 0x70, 0x75, 0x74, 0x12, 0x3a, 0x0a, 0x09, 0x65, 0x78, 0x63,
-	0x65, 0x70, 0x74, 0x69, 0x6f, 0x6e, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1c, 0x2e, 0x67,
-	0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x53,
-	0x74, 0x72, 0x69, 0x6e, 0x67, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x52, 0x09, 0x65, 0x78, 0x63, 0x65,
-	0x70, 0x74, 0x69, 0x6f, 0x6e, 0x12, 0x12, 0x0a, 0x04, 0x6c, 0x6f, 0x67, 0x73, 0x18, 0x04, 0x20,
-	0x01, 0x28, 0x09, 0x52, 0x04, 0x6c, 0x6f, 0x67, 0x73, 0x12, 0x1c, 0x0a, 0x09, 0x74, 0x69, 0x6d,
-	0x65, 0x54, 0x61, 0x6b, 0x65, 0x6e, 0x18, 0x05, 0x20, 0x01, 0x28, 0x01, 0x52, 0x09, 0x74, 0x69,
-	0x6d, 0x65, 0x54, 0x61, 0x6b, 0x65, 0x6e, 0x12, 0x1c, 0x0a, 0x09, 0x73, 0x75, 0x63, 0x63, 0x65,
-	0x65, 0x64, 0x65, 0x64, 0x18, 0x06, 0x20, 0x01, 0x28, 0x05, 0x52, 0x09, 0x73, 0x75, 0x63, 0x63,
-	0x65, 0x65, 0x64, 0x65, 0x64, 0x12, 0x16, 0x0a, 0x06, 0x66, 0x61, 0x69, 0x6c, 0x65, 0x64, 0x18,
-	0x07, 0x20, 0x01, 0x28, 0x05, 0x52, 0x06, 0x66, 0x61, 0x69, 0x6c, 0x65, 0x64, 0x22, 0x4e, 0x0a,
+	0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x06, 0x74, 0x65, 0x73, 0x74, 0x49, 0x44, 0x22, 0x52, 0x0a,
+	0x18, 0x43, 0x68, 0x65, 0x63, 0x6b, 0x54, 0x65, 0x73, 0x74, 0x49, 0x6e, 0x73, 0x74, 0x61, 0x6e,
+	0x63, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x16, 0x0a, 0x06, 0x74, 0x65, 0x73,
+	0x74, 0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x06, 0x74, 0x65, 0x73, 0x74, 0x49,
+	0x44, 0x12, 0x1e, 0x0a, 0x0a, 0x69, 0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63, 0x65, 0x49, 0x44, 0x18,
+	0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x69, 0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63, 0x65, 0x49,
+	0x44, 0x22, 0x35, 0x0a, 0x19, 0x43, 0x68, 0x65, 0x63, 0x6b, 0x54, 0x65, 0x73, 0x74, 0x49, 0x6e,
+	0x73, 0x74, 0x61, 0x6e, 0x63, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x18,
+	0x0a, 0x07, 0x72, 0x75, 0x6e, 0x6e, 0x69, 0x6e, 0x67, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52,
+	0x07, 0x72, 0x75, 0x6e, 0x6e, 0x69, 0x6e, 0x67, 0x22, 0x3d, 0x0a, 0x13, 0x43, 0x72, 0x65, 0x61,
+	0x74, 0x65, 0x55, 0x73, 0x65, 0x72, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12,
+	0x26, 0x0a, 0x0e, 0x75, 0x73, 0x65, 0x72, 0x4d, 0x61, 0x6e, 0x61, 0x67, 0x65, 0x72, 0x49, 0x44,
+	0x73, 0x18, 0x01, 0x20, 0x03, 0x28, 0x09, 0x52, 0x0e, 0x75, 0x73, 0x65, 0x72, 0x4d, 0x61, 0x6e,
+	0x61, 0x67, 0x65, 0x72, 0x49, 0x44, 0x73, 0x22, 0x35, 0x0a, 0x05, 0x45, 0x76, 0x65, 0x6e, 0x74,
+	0x12, 0x12, 0x0a, 0x04, 0x6b, 0x69, 0x6e, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04,
+	0x6b, 0x69, 0x6e, 0x64, 0x12, 0x18, 0x0a, 0x07, 0x70, 0x61, 0x79, 0x6c, 0x6f, 0x61, 0x64, 0x18,
+	0x02, 0x20, 0x01, 0x28, 0x0c, 0x52, 0x07, 0x70, 0x61, 0x79, 0x6c, 0x6f, 0x61, 0x64, 0x22, 0x47,
+	0x0a, 0x0f, 0x41, 0x64, 0x64, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73,
+	0x74, 0x12, 0x0e, 0x0a, 0x02, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x02, 0x69,
+	0x64, 0x12, 0x24, 0x0a, 0x05, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0b,
+	0x32, 0x0e, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x45, 0x76, 0x65, 0x6e, 0x74,
+	0x52, 0x05, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x22, 0x36, 0x0a, 0x10, 0x47, 0x65, 0x74, 0x45, 0x76,
+	0x65, 0x6e, 0x74, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x0e, 0x0a, 0x02, 0x69,
+	0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x02, 0x69, 0x64, 0x12, 0x12, 0x0a, 0x04, 0x6b,
+	0x69, 0x6e, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6b, 0x69, 0x6e, 0x64, 0x22,
+	0x30, 0x0a, 0x06, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x73, 0x12, 0x26, 0x0a, 0x06, 0x65, 0x76, 0x65,
+	0x6e, 0x74, 0x73, 0x18, 0x01, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x0e, 0x2e, 0x62, 0x61, 0x63, 0x6b,
+	0x65, 0x6e, 0x64, 0x2e, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x52, 0x06, 0x65, 0x76, 0x65, 0x6e, 0x74,
+	0x73, 0x22, 0x57, 0x0a, 0x15, 0x41, 0x64, 0x64, 0x55, 0x73, 0x65, 0x72, 0x52, 0x65, 0x73, 0x75,
+	0x6c, 0x74, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x24, 0x0a, 0x0d, 0x75, 0x73,
+	0x65, 0x72, 0x4d, 0x61, 0x6e, 0x61, 0x67, 0x65, 0x72, 0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28,
+	0x09, 0x52, 0x0d, 0x75, 0x73, 0x65, 0x72, 0x4d, 0x61, 0x6e, 0x61, 0x67, 0x65, 0x72, 0x49, 0x44,
+	0x12, 0x18, 0x0a, 0x07, 0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28,
+	0x0c, 0x52, 0x07, 0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x22, 0xb0, 0x02, 0x0a, 0x18, 0x53,
+	0x65, 0x74, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74,
+	0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61,
+	0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x63, 0x65,
+	0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x12, 0x34, 0x0a, 0x06, 0x6f, 0x75, 0x74, 0x70, 0x75,
+	0x74, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1c, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65,
+	0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x53, 0x74, 0x72, 0x69, 0x6e, 0x67,
+	0x56, 0x61, 0x6c, 0x75, 0x65, 0x52, 0x06, 0x6f, 0x75, 0x74, 0x70, 0x75, 0x74, 0x12, 0x3a, 0x0a,
+	0x09, 0x65, 0x78, 0x63, 0x65, 0x70, 0x74, 0x69, 0x6f, 0x6e, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0b,
+	0x32, 0x1c, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62,
+	0x75, 0x66, 0x2e, 0x53, 0x74, 0x72, 0x69, 0x6e, 0x67, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x52, 0x09,
+	0x65, 0x78, 0x63, 0x65, 0x70, 0x74, 0x69, 0x6f, 0x6e, 0x12, 0x12, 0x0a, 0x04, 0x6c, 0x6f, 0x67,
+	0x73, 0x18, 0x04, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6c, 0x6f, 0x67, 0x73, 0x12, 0x1c, 0x0a,
+	0x09, 0x74, 0x69, 0x6d, 0x65, 0x54, 0x61, 0x6b, 0x65, 0x6e, 0x18, 0x05, 0x20, 0x01, 0x28, 0x01,
+	0x52, 0x09, 0x74, 0x69, 0x6d, 0x65, 0x54, 0x61, 0x6b, 0x65, 0x6e, 0x12, 0x1c, 0x0a, 0x09, 0x73,
+	0x75, 0x63, 0x63, 0x65, 0x65, 0x64, 0x65, 0x64, 0x18, 0x06, 0x20, 0x01, 0x28, 0x05, 0x52, 0x09,
+	0x73, 0x75, 0x63, 0x63, 0x65, 0x65, 0x64, 0x65, 0x64, 0x12, 0x16, 0x0a, 0x06, 0x66, 0x61, 0x69,
+	0x6c, 0x65, 0x64, 0x18, 0x07, 0x20, 0x01, 0x28, 0x05, 0x52, 0x06, 0x66, 0x61, 0x69, 0x6c, 0x65,
+	0x64, 0x12, 0x1a, 0x0a, 0x08, 0x6d, 0x61, 0x78, 0x55, 0x73, 0x65, 0x72, 0x73, 0x18, 0x08, 0x20,
+	0x01, 0x28, 0x05, 0x52, 0x08, 0x6d, 0x61, 0x78, 0x55, 0x73, 0x65, 0x72, 0x73, 0x22, 0x4e, 0x0a,
 	0x16, 0x4d, 0x6f, 0x76, 0x65, 0x55, 0x73, 0x65, 0x72, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73,
 	0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61,
 	0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x63, 0x65,
@@ -1862,7 +2801,7 @@ var file_api_backend_proto_rawDesc = []byte{
 	0x69, 0x6f, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12,
 	0x1e, 0x0a, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x01, 0x20,
 	0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x22,
-	0xa4, 0x02, 0x0a, 0x1a, 0x4d, 0x6f, 0x76, 0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f,
+	0xc0, 0x02, 0x0a, 0x1a, 0x4d, 0x6f, 0x76, 0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f,
 	0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x0e,
 	0x0a, 0x02, 0x69, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x02, 0x69, 0x64, 0x12, 0x34,
 	0x0a, 0x06, 0x6f, 0x75, 0x74, 0x70, 0x75, 0x74, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1c,
@@ -1880,155 +2819,296 @@ var file_api_backend_proto_rawDesc = []byte{
 	0x12, 0x1c, 0x0a, 0x09, 0x73, 0x75, 0x63, 0x63, 0x65, 0x65, 0x64, 0x65, 0x64, 0x18, 0x07, 0x20,
 	0x01, 0x28, 0x05, 0x52, 0x09, 0x73, 0x75, 0x63, 0x63, 0x65, 0x65, 0x64, 0x65, 0x64, 0x12, 0x16,
 	0x0a, 0x06, 0x66, 0x61, 0x69, 0x6c, 0x65, 0x64, 0x18, 0x08, 0x20, 0x01, 0x28, 0x05, 0x52, 0x06,
-	0x66, 0x61, 0x69, 0x6c, 0x65, 0x64, 0x22, 0x4f, 0x0a, 0x15, 0x44, 0x69, 0x73, 0x74, 0x72, 0x69,
-	0x62, 0x75, 0x74, 0x65, 0x57, 0x6f, 0x72, 0x6b, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12,
-	0x1e, 0x0a, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x01, 0x20,
-	0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x12,
-	0x16, 0x0a, 0x06, 0x61, 0x6d, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52,
-	0x06, 0x61, 0x6d, 0x6f, 0x75, 0x6e, 0x74, 0x22, 0x3a, 0x0a, 0x12, 0x47, 0x65, 0x74, 0x55, 0x73,
-	0x65, 0x72, 0x57, 0x6f, 0x72, 0x6b, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x24, 0x0a,
-	0x0d, 0x75, 0x73, 0x65, 0x72, 0x4d, 0x61, 0x6e, 0x61, 0x67, 0x65, 0x72, 0x49, 0x44, 0x18, 0x01,
-	0x20, 0x01, 0x28, 0x09, 0x52, 0x0d, 0x75, 0x73, 0x65, 0x72, 0x4d, 0x61, 0x6e, 0x61, 0x67, 0x65,
-	0x72, 0x49, 0x44, 0x22, 0x29, 0x0a, 0x13, 0x47, 0x65, 0x74, 0x55, 0x73, 0x65, 0x72, 0x57, 0x6f,
-	0x72, 0x6b, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x12, 0x0a, 0x04, 0x77, 0x6f,
-	0x72, 0x6b, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05, 0x52, 0x04, 0x77, 0x6f, 0x72, 0x6b, 0x22, 0x5c,
-	0x0a, 0x10, 0x41, 0x64, 0x64, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x65, 0x71, 0x75, 0x65,
+	0x66, 0x61, 0x69, 0x6c, 0x65, 0x64, 0x12, 0x1a, 0x0a, 0x08, 0x6d, 0x61, 0x78, 0x55, 0x73, 0x65,
+	0x72, 0x73, 0x18, 0x09, 0x20, 0x01, 0x28, 0x05, 0x52, 0x08, 0x6d, 0x61, 0x78, 0x55, 0x73, 0x65,
+	0x72, 0x73, 0x22, 0x4f, 0x0a, 0x15, 0x44, 0x69, 0x73, 0x74, 0x72, 0x69, 0x62, 0x75, 0x74, 0x65,
+	0x57, 0x6f, 0x72, 0x6b, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1e, 0x0a, 0x0a, 0x73,
+	0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52,
+	0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x12, 0x16, 0x0a, 0x06, 0x61,
+	0x6d, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05, 0x52, 0x06, 0x61, 0x6d, 0x6f,
+	0x75, 0x6e, 0x74, 0x22, 0x3a, 0x0a, 0x12, 0x47, 0x65, 0x74, 0x55, 0x73, 0x65, 0x72, 0x57, 0x6f,
+	0x72, 0x6b, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x24, 0x0a, 0x0d, 0x75, 0x73, 0x65,
+	0x72, 0x4d, 0x61, 0x6e, 0x61, 0x67, 0x65, 0x72, 0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09,
+	0x52, 0x0d, 0x75, 0x73, 0x65, 0x72, 0x4d, 0x61, 0x6e, 0x61, 0x67, 0x65, 0x72, 0x49, 0x44, 0x22,
+	0x29, 0x0a, 0x13, 0x47, 0x65, 0x74, 0x55, 0x73, 0x65, 0x72, 0x57, 0x6f, 0x72, 0x6b, 0x52, 0x65,
+	0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x12, 0x0a, 0x04, 0x77, 0x6f, 0x72, 0x6b, 0x18, 0x01,
+	0x20, 0x01, 0x28, 0x05, 0x52, 0x04, 0x77, 0x6f, 0x72, 0x6b, 0x22, 0x52, 0x0a, 0x1a, 0x44, 0x69,
+	0x73, 0x74, 0x72, 0x69, 0x62, 0x75, 0x74, 0x65, 0x57, 0x6f, 0x72, 0x6b, 0x49, 0x74, 0x65, 0x6d,
+	0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x63, 0x65, 0x6e,
+	0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x63,
+	0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x12, 0x14, 0x0a, 0x05, 0x69, 0x74, 0x65, 0x6d,
+	0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x0c, 0x52, 0x05, 0x69, 0x74, 0x65, 0x6d, 0x73, 0x22, 0x30,
+	0x0a, 0x18, 0x47, 0x65, 0x74, 0x55, 0x73, 0x65, 0x72, 0x57, 0x6f, 0x72, 0x6b, 0x49, 0x74, 0x65,
+	0x6d, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x14, 0x0a, 0x05, 0x69, 0x74,
+	0x65, 0x6d, 0x73, 0x18, 0x01, 0x20, 0x03, 0x28, 0x0c, 0x52, 0x05, 0x69, 0x74, 0x65, 0x6d, 0x73,
+	0x22, 0x5c, 0x0a, 0x10, 0x41, 0x64, 0x64, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x65, 0x71,
+	0x75, 0x65, 0x73, 0x74, 0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f,
+	0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72,
+	0x69, 0x6f, 0x49, 0x44, 0x12, 0x12, 0x0a, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x02, 0x20, 0x01,
+	0x28, 0x09, 0x52, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x12, 0x14, 0x0a, 0x05, 0x76, 0x61, 0x6c, 0x75,
+	0x65, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01, 0x52, 0x05, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x22, 0xde,
+	0x02, 0x0a, 0x17, 0x41, 0x64, 0x64, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x53, 0x75, 0x6d, 0x6d,
+	0x61, 0x72, 0x79, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x63,
+	0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a,
+	0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x12, 0x12, 0x0a, 0x04, 0x6e, 0x61,
+	0x6d, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x12, 0x14,
+	0x0a, 0x05, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x03, 0x20, 0x01, 0x28, 0x03, 0x52, 0x05, 0x63,
+	0x6f, 0x75, 0x6e, 0x74, 0x12, 0x10, 0x0a, 0x03, 0x73, 0x75, 0x6d, 0x18, 0x04, 0x20, 0x01, 0x28,
+	0x01, 0x52, 0x03, 0x73, 0x75, 0x6d, 0x12, 0x10, 0x0a, 0x03, 0x6d, 0x69, 0x6e, 0x18, 0x05, 0x20,
+	0x01, 0x28, 0x01, 0x52, 0x03, 0x6d, 0x69, 0x6e, 0x12, 0x10, 0x0a, 0x03, 0x6d, 0x61, 0x78, 0x18,
+	0x06, 0x20, 0x01, 0x28, 0x01, 0x52, 0x03, 0x6d, 0x61, 0x78, 0x12, 0x12, 0x0a, 0x04, 0x6c, 0x61,
+	0x73, 0x74, 0x18, 0x07, 0x20, 0x01, 0x28, 0x01, 0x52, 0x04, 0x6c, 0x61, 0x73, 0x74, 0x12, 0x22,
+	0x0a, 0x0c, 0x73, 0x75, 0x6d, 0x4f, 0x66, 0x53, 0x71, 0x75, 0x61, 0x72, 0x65, 0x73, 0x18, 0x08,
+	0x20, 0x01, 0x28, 0x01, 0x52, 0x0c, 0x73, 0x75, 0x6d, 0x4f, 0x66, 0x53, 0x71, 0x75, 0x61, 0x72,
+	0x65, 0x73, 0x12, 0x4d, 0x0a, 0x09, 0x68, 0x69, 0x73, 0x74, 0x6f, 0x67, 0x72, 0x61, 0x6d, 0x18,
+	0x09, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x2f, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e,
+	0x41, 0x64, 0x64, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x53, 0x75, 0x6d, 0x6d, 0x61, 0x72, 0x79,
+	0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x2e, 0x48, 0x69, 0x73, 0x74, 0x6f, 0x67, 0x72, 0x61,
+	0x6d, 0x45, 0x6e, 0x74, 0x72, 0x79, 0x52, 0x09, 0x68, 0x69, 0x73, 0x74, 0x6f, 0x67, 0x72, 0x61,
+	0x6d, 0x1a, 0x3c, 0x0a, 0x0e, 0x48, 0x69, 0x73, 0x74, 0x6f, 0x67, 0x72, 0x61, 0x6d, 0x45, 0x6e,
+	0x74, 0x72, 0x79, 0x12, 0x10, 0x0a, 0x03, 0x6b, 0x65, 0x79, 0x18, 0x01, 0x20, 0x01, 0x28, 0x05,
+	0x52, 0x03, 0x6b, 0x65, 0x79, 0x12, 0x14, 0x0a, 0x05, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x02,
+	0x20, 0x01, 0x28, 0x03, 0x52, 0x05, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x3a, 0x02, 0x38, 0x01, 0x22,
+	0x46, 0x0a, 0x10, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x65, 0x71, 0x75,
+	0x65, 0x73, 0x74, 0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49,
+	0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69,
+	0x6f, 0x49, 0x44, 0x12, 0x12, 0x0a, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28,
+	0x09, 0x52, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x22, 0xa8, 0x01, 0x0a, 0x16, 0x47, 0x65, 0x74, 0x4d,
+	0x65, 0x74, 0x72, 0x69, 0x63, 0x53, 0x65, 0x72, 0x69, 0x65, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65,
 	0x73, 0x74, 0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44,
 	0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f,
 	0x49, 0x44, 0x12, 0x12, 0x0a, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09,
-	0x52, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x12, 0x14, 0x0a, 0x05, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18,
-	0x03, 0x20, 0x01, 0x28, 0x01, 0x52, 0x05, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x22, 0x46, 0x0a, 0x10,
-	0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
-	0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x01,
-	0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44,
-	0x12, 0x12, 0x0a, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04,
-	0x6e, 0x61, 0x6d, 0x65, 0x22, 0x6a, 0x0a, 0x14, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69,
-	0x63, 0x52, 0x61, 0x74, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1e, 0x0a, 0x0a,
-	0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09,
-	0x52, 0x0a, 0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x12, 0x12, 0x0a, 0x04,
-	0x6e, 0x61, 0x6d, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6e, 0x61, 0x6d, 0x65,
-	0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x70, 0x6c, 0x69, 0x74, 0x50, 0x6f, 0x69, 0x6e, 0x74, 0x18, 0x03,
-	0x20, 0x01, 0x28, 0x01, 0x52, 0x0a, 0x73, 0x70, 0x6c, 0x69, 0x74, 0x50, 0x6f, 0x69, 0x6e, 0x74,
-	0x22, 0x2b, 0x0a, 0x13, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x54, 0x6f, 0x74, 0x61, 0x6c, 0x52,
-	0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x14, 0x0a, 0x05, 0x74, 0x6f, 0x74, 0x61, 0x6c,
-	0x18, 0x01, 0x20, 0x01, 0x28, 0x01, 0x52, 0x05, 0x74, 0x6f, 0x74, 0x61, 0x6c, 0x22, 0x28, 0x0a,
-	0x12, 0x4c, 0x61, 0x73, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x65, 0x73, 0x70, 0x6f,
-	0x6e, 0x73, 0x65, 0x12, 0x12, 0x0a, 0x04, 0x6c, 0x61, 0x73, 0x74, 0x18, 0x01, 0x20, 0x01, 0x28,
-	0x01, 0x52, 0x04, 0x6c, 0x61, 0x73, 0x74, 0x22, 0x34, 0x0a, 0x12, 0x4d, 0x65, 0x74, 0x72, 0x69,
-	0x63, 0x52, 0x61, 0x74, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x1e, 0x0a,
-	0x0a, 0x70, 0x65, 0x72, 0x63, 0x65, 0x6e, 0x74, 0x61, 0x67, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28,
-	0x01, 0x52, 0x0a, 0x70, 0x65, 0x72, 0x63, 0x65, 0x6e, 0x74, 0x61, 0x67, 0x65, 0x22, 0x82, 0x01,
-	0x0a, 0x18, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69,
-	0x63, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x10, 0x0a, 0x03, 0x6d, 0x69,
-	0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x01, 0x52, 0x03, 0x6d, 0x69, 0x6e, 0x12, 0x10, 0x0a, 0x03,
-	0x6d, 0x61, 0x78, 0x18, 0x02, 0x20, 0x01, 0x28, 0x01, 0x52, 0x03, 0x6d, 0x61, 0x78, 0x12, 0x16,
-	0x0a, 0x06, 0x6d, 0x65, 0x64, 0x69, 0x61, 0x6e, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01, 0x52, 0x06,
-	0x6d, 0x65, 0x64, 0x69, 0x61, 0x6e, 0x12, 0x18, 0x0a, 0x07, 0x61, 0x76, 0x65, 0x72, 0x61, 0x67,
-	0x65, 0x18, 0x04, 0x20, 0x01, 0x28, 0x01, 0x52, 0x07, 0x61, 0x76, 0x65, 0x72, 0x61, 0x67, 0x65,
-	0x12, 0x10, 0x0a, 0x03, 0x6c, 0x65, 0x6e, 0x18, 0x05, 0x20, 0x01, 0x28, 0x03, 0x52, 0x03, 0x6c,
-	0x65, 0x6e, 0x32, 0xb2, 0x0c, 0x0a, 0x07, 0x42, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x12, 0x45,
-	0x0a, 0x0a, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x54, 0x65, 0x73, 0x74, 0x12, 0x1a, 0x2e, 0x62,
-	0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x54, 0x65, 0x73,
-	0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x1b, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65,
-	0x6e, 0x64, 0x2e, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x54, 0x65, 0x73, 0x74, 0x52, 0x65, 0x73,
-	0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x51, 0x0a, 0x0e, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x53,
-	0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x12, 0x1e, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e,
-	0x64, 0x2e, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f,
-	0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x1f, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e,
-	0x64, 0x2e, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f,
-	0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x48, 0x0a, 0x0b, 0x43, 0x72, 0x65, 0x61,
-	0x74, 0x65, 0x55, 0x73, 0x65, 0x72, 0x73, 0x12, 0x1b, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e,
-	0x64, 0x2e, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x55, 0x73, 0x65, 0x72, 0x73, 0x52, 0x65, 0x71,
-	0x75, 0x65, 0x73, 0x74, 0x1a, 0x1c, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x43,
-	0x72, 0x65, 0x61, 0x74, 0x65, 0x55, 0x73, 0x65, 0x72, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e,
-	0x73, 0x65, 0x12, 0x3e, 0x0a, 0x09, 0x53, 0x74, 0x6f, 0x70, 0x55, 0x73, 0x65, 0x72, 0x73, 0x12,
-	0x19, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x53, 0x74, 0x6f, 0x70, 0x55, 0x73,
-	0x65, 0x72, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x16, 0x2e, 0x67, 0x6f, 0x6f,
-	0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70,
-	0x74, 0x79, 0x12, 0x50, 0x0a, 0x12, 0x43, 0x6c, 0x65, 0x61, 0x6e, 0x54, 0x65, 0x73, 0x74, 0x49,
-	0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63, 0x65, 0x73, 0x12, 0x22, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65,
-	0x6e, 0x64, 0x2e, 0x43, 0x6c, 0x65, 0x61, 0x6e, 0x54, 0x65, 0x73, 0x74, 0x49, 0x6e, 0x73, 0x74,
-	0x61, 0x6e, 0x63, 0x65, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x16, 0x2e, 0x67,
-	0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x45,
-	0x6d, 0x70, 0x74, 0x79, 0x12, 0x5a, 0x0a, 0x11, 0x43, 0x68, 0x65, 0x63, 0x6b, 0x54, 0x65, 0x73,
-	0x74, 0x49, 0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63, 0x65, 0x12, 0x21, 0x2e, 0x62, 0x61, 0x63, 0x6b,
+	0x52, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x12, 0x24, 0x0a, 0x0d, 0x66, 0x72, 0x6f, 0x6d, 0x54, 0x69,
+	0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x18, 0x03, 0x20, 0x01, 0x28, 0x03, 0x52, 0x0d, 0x66,
+	0x72, 0x6f, 0x6d, 0x54, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x12, 0x20, 0x0a, 0x0b,
+	0x74, 0x6f, 0x54, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x18, 0x04, 0x20, 0x01, 0x28,
+	0x03, 0x52, 0x0b, 0x74, 0x6f, 0x54, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x12, 0x12,
+	0x0a, 0x04, 0x73, 0x74, 0x65, 0x70, 0x18, 0x05, 0x20, 0x01, 0x28, 0x03, 0x52, 0x04, 0x73, 0x74,
+	0x65, 0x70, 0x22, 0x6a, 0x0a, 0x14, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52,
+	0x61, 0x74, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x63,
+	0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a,
+	0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x12, 0x12, 0x0a, 0x04, 0x6e, 0x61,
+	0x6d, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x12, 0x1e,
+	0x0a, 0x0a, 0x73, 0x70, 0x6c, 0x69, 0x74, 0x50, 0x6f, 0x69, 0x6e, 0x74, 0x18, 0x03, 0x20, 0x01,
+	0x28, 0x01, 0x52, 0x0a, 0x73, 0x70, 0x6c, 0x69, 0x74, 0x50, 0x6f, 0x69, 0x6e, 0x74, 0x22, 0x2b,
+	0x0a, 0x13, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x54, 0x6f, 0x74, 0x61, 0x6c, 0x52, 0x65, 0x73,
+	0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x14, 0x0a, 0x05, 0x74, 0x6f, 0x74, 0x61, 0x6c, 0x18, 0x01,
+	0x20, 0x01, 0x28, 0x01, 0x52, 0x05, 0x74, 0x6f, 0x74, 0x61, 0x6c, 0x22, 0x28, 0x0a, 0x12, 0x4c,
+	0x61, 0x73, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73,
+	0x65, 0x12, 0x12, 0x0a, 0x04, 0x6c, 0x61, 0x73, 0x74, 0x18, 0x01, 0x20, 0x01, 0x28, 0x01, 0x52,
+	0x04, 0x6c, 0x61, 0x73, 0x74, 0x22, 0x34, 0x0a, 0x12, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52,
+	0x61, 0x74, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x1e, 0x0a, 0x0a, 0x70,
+	0x65, 0x72, 0x63, 0x65, 0x6e, 0x74, 0x61, 0x67, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x01, 0x52,
+	0x0a, 0x70, 0x65, 0x72, 0x63, 0x65, 0x6e, 0x74, 0x61, 0x67, 0x65, 0x22, 0x9a, 0x01, 0x0a, 0x18,
+	0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73,
+	0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x10, 0x0a, 0x03, 0x6d, 0x69, 0x6e, 0x18,
+	0x01, 0x20, 0x01, 0x28, 0x01, 0x52, 0x03, 0x6d, 0x69, 0x6e, 0x12, 0x10, 0x0a, 0x03, 0x6d, 0x61,
+	0x78, 0x18, 0x02, 0x20, 0x01, 0x28, 0x01, 0x52, 0x03, 0x6d, 0x61, 0x78, 0x12, 0x16, 0x0a, 0x06,
+	0x6d, 0x65, 0x64, 0x69, 0x61, 0x6e, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01, 0x52, 0x06, 0x6d, 0x65,
+	0x64, 0x69, 0x61, 0x6e, 0x12, 0x18, 0x0a, 0x07, 0x61, 0x76, 0x65, 0x72, 0x61, 0x67, 0x65, 0x18,
+	0x04, 0x20, 0x01, 0x28, 0x01, 0x52, 0x07, 0x61, 0x76, 0x65, 0x72, 0x61, 0x67, 0x65, 0x12, 0x10,
+	0x0a, 0x03, 0x6c, 0x65, 0x6e, 0x18, 0x05, 0x20, 0x01, 0x28, 0x03, 0x52, 0x03, 0x6c, 0x65, 0x6e,
+	0x12, 0x16, 0x0a, 0x06, 0x73, 0x74, 0x64, 0x64, 0x65, 0x76, 0x18, 0x06, 0x20, 0x01, 0x28, 0x01,
+	0x52, 0x06, 0x73, 0x74, 0x64, 0x64, 0x65, 0x76, 0x22, 0xaf, 0x01, 0x0a, 0x11, 0x4d, 0x65, 0x74,
+	0x72, 0x69, 0x63, 0x53, 0x65, 0x72, 0x69, 0x65, 0x73, 0x50, 0x6f, 0x69, 0x6e, 0x74, 0x12, 0x1c,
+	0x0a, 0x09, 0x74, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x18, 0x01, 0x20, 0x01, 0x28,
+	0x03, 0x52, 0x09, 0x74, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x12, 0x14, 0x0a, 0x05,
+	0x63, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x02, 0x20, 0x01, 0x28, 0x03, 0x52, 0x05, 0x63, 0x6f, 0x75,
+	0x6e, 0x74, 0x12, 0x10, 0x0a, 0x03, 0x73, 0x75, 0x6d, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01, 0x52,
+	0x03, 0x73, 0x75, 0x6d, 0x12, 0x10, 0x0a, 0x03, 0x6d, 0x69, 0x6e, 0x18, 0x04, 0x20, 0x01, 0x28,
+	0x01, 0x52, 0x03, 0x6d, 0x69, 0x6e, 0x12, 0x10, 0x0a, 0x03, 0x6d, 0x61, 0x78, 0x18, 0x05, 0x20,
+	0x01, 0x28, 0x01, 0x52, 0x03, 0x6d, 0x61, 0x78, 0x12, 0x18, 0x0a, 0x07, 0x61, 0x76, 0x65, 0x72,
+	0x61, 0x67, 0x65, 0x18, 0x06, 0x20, 0x01, 0x28, 0x01, 0x52, 0x07, 0x61, 0x76, 0x65, 0x72, 0x61,
+	0x67, 0x65, 0x12, 0x16, 0x0a, 0x06, 0x73, 0x74, 0x64, 0x64, 0x65, 0x76, 0x18, 0x07, 0x20, 0x01,
+	0x28, 0x01, 0x52, 0x06, 0x73, 0x74, 0x64, 0x64, 0x65, 0x76, 0x22, 0x4a, 0x0a, 0x14, 0x4d, 0x65,
+	0x74, 0x72, 0x69, 0x63, 0x53, 0x65, 0x72, 0x69, 0x65, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e,
+	0x73, 0x65, 0x12, 0x32, 0x0a, 0x06, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x73, 0x18, 0x01, 0x20, 0x03,
+	0x28, 0x0b, 0x32, 0x1a, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x65, 0x74,
+	0x72, 0x69, 0x63, 0x53, 0x65, 0x72, 0x69, 0x65, 0x73, 0x50, 0x6f, 0x69, 0x6e, 0x74, 0x52, 0x06,
+	0x70, 0x6f, 0x69, 0x6e, 0x74, 0x73, 0x22, 0xd1, 0x01, 0x0a, 0x0b, 0x4d, 0x65, 0x74, 0x72, 0x69,
+	0x63, 0x51, 0x75, 0x65, 0x72, 0x79, 0x12, 0x12, 0x0a, 0x04, 0x6b, 0x69, 0x6e, 0x64, 0x18, 0x01,
+	0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6b, 0x69, 0x6e, 0x64, 0x12, 0x1e, 0x0a, 0x0a, 0x73, 0x63,
+	0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a,
+	0x73, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x49, 0x44, 0x12, 0x12, 0x0a, 0x04, 0x6e, 0x61,
+	0x6d, 0x65, 0x18, 0x03, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6e, 0x61, 0x6d, 0x65, 0x12, 0x1e,
+	0x0a, 0x0a, 0x73, 0x70, 0x6c, 0x69, 0x74, 0x50, 0x6f, 0x69, 0x6e, 0x74, 0x18, 0x04, 0x20, 0x01,
+	0x28, 0x01, 0x52, 0x0a, 0x73, 0x70, 0x6c, 0x69, 0x74, 0x50, 0x6f, 0x69, 0x6e, 0x74, 0x12, 0x24,
+	0x0a, 0x0d, 0x66, 0x72, 0x6f, 0x6d, 0x54, 0x69, 0x6d, 0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x18,
+	0x05, 0x20, 0x01, 0x28, 0x03, 0x52, 0x0d, 0x66, 0x72, 0x6f, 0x6d, 0x54, 0x69, 0x6d, 0x65, 0x73,
+	0x74, 0x61, 0x6d, 0x70, 0x12, 0x20, 0x0a, 0x0b, 0x74, 0x6f, 0x54, 0x69, 0x6d, 0x65, 0x73, 0x74,
+	0x61, 0x6d, 0x70, 0x18, 0x06, 0x20, 0x01, 0x28, 0x03, 0x52, 0x0b, 0x74, 0x6f, 0x54, 0x69, 0x6d,
+	0x65, 0x73, 0x74, 0x61, 0x6d, 0x70, 0x12, 0x12, 0x0a, 0x04, 0x73, 0x74, 0x65, 0x70, 0x18, 0x07,
+	0x20, 0x01, 0x28, 0x03, 0x52, 0x04, 0x73, 0x74, 0x65, 0x70, 0x22, 0xb6, 0x01, 0x0a, 0x11, 0x4d,
+	0x65, 0x74, 0x72, 0x69, 0x63, 0x51, 0x75, 0x65, 0x72, 0x79, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74,
+	0x12, 0x14, 0x0a, 0x05, 0x66, 0x6f, 0x75, 0x6e, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x08, 0x52,
+	0x05, 0x66, 0x6f, 0x75, 0x6e, 0x64, 0x12, 0x14, 0x0a, 0x05, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18,
+	0x02, 0x20, 0x01, 0x28, 0x01, 0x52, 0x05, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x12, 0x41, 0x0a, 0x0a,
+	0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0b,
+	0x32, 0x21, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x65, 0x74, 0x72, 0x69,
+	0x63, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f,
+	0x6e, 0x73, 0x65, 0x52, 0x0a, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73, 0x12,
+	0x32, 0x0a, 0x06, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x73, 0x18, 0x04, 0x20, 0x03, 0x28, 0x0b, 0x32,
+	0x1a, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63,
+	0x53, 0x65, 0x72, 0x69, 0x65, 0x73, 0x50, 0x6f, 0x69, 0x6e, 0x74, 0x52, 0x06, 0x70, 0x6f, 0x69,
+	0x6e, 0x74, 0x73, 0x22, 0x4b, 0x0a, 0x19, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63,
+	0x73, 0x53, 0x6e, 0x61, 0x70, 0x73, 0x68, 0x6f, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
+	0x12, 0x2e, 0x0a, 0x07, 0x71, 0x75, 0x65, 0x72, 0x69, 0x65, 0x73, 0x18, 0x01, 0x20, 0x03, 0x28,
+	0x0b, 0x32, 0x14, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x65, 0x74, 0x72,
+	0x69, 0x63, 0x51, 0x75, 0x65, 0x72, 0x79, 0x52, 0x07, 0x71, 0x75, 0x65, 0x72, 0x69, 0x65, 0x73,
+	0x22, 0x52, 0x0a, 0x1a, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x73, 0x53, 0x6e,
+	0x61, 0x70, 0x73, 0x68, 0x6f, 0x74, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x34,
+	0x0a, 0x07, 0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x18, 0x01, 0x20, 0x03, 0x28, 0x0b, 0x32,
+	0x1a, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63,
+	0x51, 0x75, 0x65, 0x72, 0x79, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x07, 0x72, 0x65, 0x73,
+	0x75, 0x6c, 0x74, 0x73, 0x32, 0x96, 0x12, 0x0a, 0x07, 0x42, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64,
+	0x12, 0x45, 0x0a, 0x0a, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x54, 0x65, 0x73, 0x74, 0x12, 0x1a,
+	0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x54,
+	0x65, 0x73, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x1b, 0x2e, 0x62, 0x61, 0x63,
+	0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x54, 0x65, 0x73, 0x74, 0x52,
+	0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x51, 0x0a, 0x0e, 0x43, 0x72, 0x65, 0x61, 0x74,
+	0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x12, 0x1e, 0x2e, 0x62, 0x61, 0x63, 0x6b,
+	0x65, 0x6e, 0x64, 0x2e, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72,
+	0x69, 0x6f, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x1f, 0x2e, 0x62, 0x61, 0x63, 0x6b,
+	0x65, 0x6e, 0x64, 0x2e, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72,
+	0x69, 0x6f, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x59, 0x0a, 0x12, 0x43, 0x72,
+	0x65, 0x61, 0x74, 0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x50, 0x6f, 0x6f, 0x6c,
+	0x12, 0x22, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x43, 0x72, 0x65, 0x61, 0x74,
+	0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x50, 0x6f, 0x6f, 0x6c, 0x52, 0x65, 0x71,
+	0x75, 0x65, 0x73, 0x74, 0x1a, 0x1f, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x43,
+	0x72, 0x65, 0x61, 0x74, 0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x52, 0x65, 0x73,
+	0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x48, 0x0a, 0x0b, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x55,
+	0x73, 0x65, 0x72, 0x73, 0x12, 0x1b, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x43,
+	0x72, 0x65, 0x61, 0x74, 0x65, 0x55, 0x73, 0x65, 0x72, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73,
+	0x74, 0x1a, 0x1c, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x43, 0x72, 0x65, 0x61,
+	0x74, 0x65, 0x55, 0x73, 0x65, 0x72, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12,
+	0x3e, 0x0a, 0x09, 0x53, 0x74, 0x6f, 0x70, 0x55, 0x73, 0x65, 0x72, 0x73, 0x12, 0x19, 0x2e, 0x62,
+	0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x53, 0x74, 0x6f, 0x70, 0x55, 0x73, 0x65, 0x72, 0x73,
+	0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65,
+	0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x12,
+	0x50, 0x0a, 0x12, 0x43, 0x6c, 0x65, 0x61, 0x6e, 0x54, 0x65, 0x73, 0x74, 0x49, 0x6e, 0x73, 0x74,
+	0x61, 0x6e, 0x63, 0x65, 0x73, 0x12, 0x22, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e,
+	0x43, 0x6c, 0x65, 0x61, 0x6e, 0x54, 0x65, 0x73, 0x74, 0x49, 0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63,
+	0x65, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67,
+	0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74,
+	0x79, 0x12, 0x5a, 0x0a, 0x11, 0x43, 0x68, 0x65, 0x63, 0x6b, 0x54, 0x65, 0x73, 0x74, 0x49, 0x6e,
+	0x73, 0x74, 0x61, 0x6e, 0x63, 0x65, 0x12, 0x21, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64,
+	0x2e, 0x43, 0x68, 0x65, 0x63, 0x6b, 0x54, 0x65, 0x73, 0x74, 0x49, 0x6e, 0x73, 0x74, 0x61, 0x6e,
+	0x63, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x22, 0x2e, 0x62, 0x61, 0x63, 0x6b,
 	0x65, 0x6e, 0x64, 0x2e, 0x43, 0x68, 0x65, 0x63, 0x6b, 0x54, 0x65, 0x73, 0x74, 0x49, 0x6e, 0x73,
-	0x74, 0x61, 0x6e, 0x63, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x22, 0x2e, 0x62,
-	0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x43, 0x68, 0x65, 0x63, 0x6b, 0x54, 0x65, 0x73, 0x74,
-	0x49, 0x6e, 0x73, 0x74, 0x61, 0x6e, 0x63, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65,
-	0x12, 0x40, 0x0a, 0x0c, 0x41, 0x64, 0x64, 0x54, 0x65, 0x73, 0x74, 0x45, 0x76, 0x65, 0x6e, 0x74,
-	0x12, 0x18, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x41, 0x64, 0x64, 0x45, 0x76,
-	0x65, 0x6e, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x16, 0x2e, 0x67, 0x6f, 0x6f,
-	0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70,
-	0x74, 0x79, 0x12, 0x3b, 0x0a, 0x0d, 0x47, 0x65, 0x74, 0x54, 0x65, 0x73, 0x74, 0x45, 0x76, 0x65,
-	0x6e, 0x74, 0x73, 0x12, 0x19, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65,
-	0x74, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x0f,
-	0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x73, 0x12,
-	0x48, 0x0a, 0x0e, 0x41, 0x64, 0x64, 0x55, 0x73, 0x65, 0x72, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74,
-	0x73, 0x12, 0x1e, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x41, 0x64, 0x64, 0x55,
-	0x73, 0x65, 0x72, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73,
-	0x74, 0x1a, 0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f,
-	0x62, 0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x12, 0x4e, 0x0a, 0x11, 0x53, 0x65, 0x74,
-	0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x12, 0x21,
-	0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x53, 0x65, 0x74, 0x53, 0x63, 0x65, 0x6e,
-	0x61, 0x72, 0x69, 0x6f, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73,
-	0x74, 0x1a, 0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f,
-	0x62, 0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x12, 0x54, 0x0a, 0x0f, 0x4d, 0x6f, 0x76,
-	0x65, 0x55, 0x73, 0x65, 0x72, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x12, 0x1f, 0x2e, 0x62,
-	0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x6f, 0x76, 0x65, 0x55, 0x73, 0x65, 0x72, 0x52,
-	0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x20, 0x2e,
-	0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x6f, 0x76, 0x65, 0x55, 0x73, 0x65, 0x72,
-	0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12,
-	0x5d, 0x0a, 0x12, 0x4d, 0x6f, 0x76, 0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x52,
-	0x65, 0x73, 0x75, 0x6c, 0x74, 0x12, 0x22, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e,
+	0x74, 0x61, 0x6e, 0x63, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x40, 0x0a,
+	0x0c, 0x41, 0x64, 0x64, 0x54, 0x65, 0x73, 0x74, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x12, 0x18, 0x2e,
+	0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x41, 0x64, 0x64, 0x45, 0x76, 0x65, 0x6e, 0x74,
+	0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65,
+	0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x12,
+	0x3b, 0x0a, 0x0d, 0x47, 0x65, 0x74, 0x54, 0x65, 0x73, 0x74, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x73,
+	0x12, 0x19, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65, 0x74, 0x45, 0x76,
+	0x65, 0x6e, 0x74, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x0f, 0x2e, 0x62, 0x61,
+	0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x73, 0x12, 0x48, 0x0a, 0x0e,
+	0x41, 0x64, 0x64, 0x55, 0x73, 0x65, 0x72, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x12, 0x1e,
+	0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x41, 0x64, 0x64, 0x55, 0x73, 0x65, 0x72,
+	0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x16,
+	0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66,
+	0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x12, 0x4e, 0x0a, 0x11, 0x53, 0x65, 0x74, 0x53, 0x63, 0x65,
+	0x6e, 0x61, 0x72, 0x69, 0x6f, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x12, 0x21, 0x2e, 0x62, 0x61,
+	0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x53, 0x65, 0x74, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69,
+	0x6f, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x16,
+	0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66,
+	0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x12, 0x54, 0x0a, 0x0f, 0x4d, 0x6f, 0x76, 0x65, 0x55, 0x73,
+	0x65, 0x72, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x12, 0x1f, 0x2e, 0x62, 0x61, 0x63, 0x6b,
+	0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x6f, 0x76, 0x65, 0x55, 0x73, 0x65, 0x72, 0x52, 0x65, 0x73, 0x75,
+	0x6c, 0x74, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x20, 0x2e, 0x62, 0x61, 0x63,
+	0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x6f, 0x76, 0x65, 0x55, 0x73, 0x65, 0x72, 0x52, 0x65, 0x73,
+	0x75, 0x6c, 0x74, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x5d, 0x0a, 0x12,
 	0x4d, 0x6f, 0x76, 0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x52, 0x65, 0x73, 0x75,
-	0x6c, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x23, 0x2e, 0x62, 0x61, 0x63, 0x6b,
-	0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x6f, 0x76, 0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f,
-	0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x48,
-	0x0a, 0x0e, 0x44, 0x69, 0x73, 0x74, 0x72, 0x69, 0x62, 0x75, 0x74, 0x65, 0x57, 0x6f, 0x72, 0x6b,
-	0x12, 0x1e, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x44, 0x69, 0x73, 0x74, 0x72,
-	0x69, 0x62, 0x75, 0x74, 0x65, 0x57, 0x6f, 0x72, 0x6b, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
+	0x6c, 0x74, 0x12, 0x22, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x6f, 0x76,
+	0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52,
+	0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x23, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64,
+	0x2e, 0x4d, 0x6f, 0x76, 0x65, 0x53, 0x63, 0x65, 0x6e, 0x61, 0x72, 0x69, 0x6f, 0x52, 0x65, 0x73,
+	0x75, 0x6c, 0x74, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x4a, 0x0a, 0x0f, 0x53,
+	0x65, 0x74, 0x43, 0x6f, 0x6e, 0x74, 0x65, 0x78, 0x74, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x12, 0x1f,
+	0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x53, 0x65, 0x74, 0x43, 0x6f, 0x6e, 0x74,
+	0x65, 0x78, 0x74, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a,
+	0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75,
+	0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x12, 0x54, 0x0a, 0x0f, 0x47, 0x65, 0x74, 0x43, 0x6f,
+	0x6e, 0x74, 0x65, 0x78, 0x74, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x12, 0x1f, 0x2e, 0x62, 0x61, 0x63,
+	0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65, 0x74, 0x43, 0x6f, 0x6e, 0x74, 0x65, 0x78, 0x74, 0x56,
+	0x61, 0x6c, 0x75, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x20, 0x2e, 0x62, 0x61,
+	0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65, 0x74, 0x43, 0x6f, 0x6e, 0x74, 0x65, 0x78, 0x74,
+	0x56, 0x61, 0x6c, 0x75, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x48, 0x0a,
+	0x0e, 0x44, 0x69, 0x73, 0x74, 0x72, 0x69, 0x62, 0x75, 0x74, 0x65, 0x57, 0x6f, 0x72, 0x6b, 0x12,
+	0x1e, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x44, 0x69, 0x73, 0x74, 0x72, 0x69,
+	0x62, 0x75, 0x74, 0x65, 0x57, 0x6f, 0x72, 0x6b, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a,
+	0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75,
+	0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x12, 0x48, 0x0a, 0x0b, 0x47, 0x65, 0x74, 0x55, 0x73,
+	0x65, 0x72, 0x57, 0x6f, 0x72, 0x6b, 0x12, 0x1b, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64,
+	0x2e, 0x47, 0x65, 0x74, 0x55, 0x73, 0x65, 0x72, 0x57, 0x6f, 0x72, 0x6b, 0x52, 0x65, 0x71, 0x75,
+	0x65, 0x73, 0x74, 0x1a, 0x1c, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65,
+	0x74, 0x55, 0x73, 0x65, 0x72, 0x57, 0x6f, 0x72, 0x6b, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73,
+	0x65, 0x12, 0x52, 0x0a, 0x13, 0x44, 0x69, 0x73, 0x74, 0x72, 0x69, 0x62, 0x75, 0x74, 0x65, 0x57,
+	0x6f, 0x72, 0x6b, 0x49, 0x74, 0x65, 0x6d, 0x73, 0x12, 0x23, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65,
+	0x6e, 0x64, 0x2e, 0x44, 0x69, 0x73, 0x74, 0x72, 0x69, 0x62, 0x75, 0x74, 0x65, 0x57, 0x6f, 0x72,
+	0x6b, 0x49, 0x74, 0x65, 0x6d, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x16, 0x2e,
+	0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e,
+	0x45, 0x6d, 0x70, 0x74, 0x79, 0x12, 0x52, 0x0a, 0x10, 0x47, 0x65, 0x74, 0x55, 0x73, 0x65, 0x72,
+	0x57, 0x6f, 0x72, 0x6b, 0x49, 0x74, 0x65, 0x6d, 0x73, 0x12, 0x1b, 0x2e, 0x62, 0x61, 0x63, 0x6b,
+	0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65, 0x74, 0x55, 0x73, 0x65, 0x72, 0x57, 0x6f, 0x72, 0x6b, 0x52,
+	0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x21, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64,
+	0x2e, 0x47, 0x65, 0x74, 0x55, 0x73, 0x65, 0x72, 0x57, 0x6f, 0x72, 0x6b, 0x49, 0x74, 0x65, 0x6d,
+	0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x40, 0x0a, 0x0c, 0x41, 0x64, 0x64,
+	0x55, 0x73, 0x65, 0x72, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x12, 0x18, 0x2e, 0x62, 0x61, 0x63, 0x6b,
+	0x65, 0x6e, 0x64, 0x2e, 0x41, 0x64, 0x64, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x52, 0x65, 0x71, 0x75,
+	0x65, 0x73, 0x74, 0x1a, 0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f,
+	0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x12, 0x3b, 0x0a, 0x0d, 0x47,
+	0x65, 0x74, 0x55, 0x73, 0x65, 0x72, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x73, 0x12, 0x19, 0x2e, 0x62,
+	0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65, 0x74, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x73,
+	0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x0f, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e,
+	0x64, 0x2e, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x73, 0x12, 0x3e, 0x0a, 0x09, 0x41, 0x64, 0x64, 0x4d,
+	0x65, 0x74, 0x72, 0x69, 0x63, 0x12, 0x19, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e,
+	0x41, 0x64, 0x64, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
 	0x1a, 0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62,
-	0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x12, 0x48, 0x0a, 0x0b, 0x47, 0x65, 0x74, 0x55,
-	0x73, 0x65, 0x72, 0x57, 0x6f, 0x72, 0x6b, 0x12, 0x1b, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e,
-	0x64, 0x2e, 0x47, 0x65, 0x74, 0x55, 0x73, 0x65, 0x72, 0x57, 0x6f, 0x72, 0x6b, 0x52, 0x65, 0x71,
-	0x75, 0x65, 0x73, 0x74, 0x1a, 0x1c, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x47,
-	0x65, 0x74, 0x55, 0x73, 0x65, 0x72, 0x57, 0x6f, 0x72, 0x6b, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e,
-	0x73, 0x65, 0x12, 0x40, 0x0a, 0x0c, 0x41, 0x64, 0x64, 0x55, 0x73, 0x65, 0x72, 0x45, 0x76, 0x65,
-	0x6e, 0x74, 0x12, 0x18, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x41, 0x64, 0x64,
-	0x45, 0x76, 0x65, 0x6e, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x16, 0x2e, 0x67,
-	0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x45,
-	0x6d, 0x70, 0x74, 0x79, 0x12, 0x3b, 0x0a, 0x0d, 0x47, 0x65, 0x74, 0x55, 0x73, 0x65, 0x72, 0x45,
-	0x76, 0x65, 0x6e, 0x74, 0x73, 0x12, 0x19, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e,
-	0x47, 0x65, 0x74, 0x45, 0x76, 0x65, 0x6e, 0x74, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
-	0x1a, 0x0f, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x45, 0x76, 0x65, 0x6e, 0x74,
-	0x73, 0x12, 0x3e, 0x0a, 0x09, 0x41, 0x64, 0x64, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x12, 0x19,
-	0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x41, 0x64, 0x64, 0x4d, 0x65, 0x74, 0x72,
-	0x69, 0x63, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67,
-	0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74,
-	0x79, 0x12, 0x49, 0x0a, 0x0e, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x54, 0x6f,
-	0x74, 0x61, 0x6c, 0x12, 0x19, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65,
-	0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x1c,
-	0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x54,
-	0x6f, 0x74, 0x61, 0x6c, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x47, 0x0a, 0x0d,
-	0x47, 0x65, 0x74, 0x4c, 0x61, 0x73, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x12, 0x19, 0x2e,
-	0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69,
-	0x63, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x1b, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65,
-	0x6e, 0x64, 0x2e, 0x4c, 0x61, 0x73, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x65, 0x73,
-	0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x4b, 0x0a, 0x0d, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72,
-	0x69, 0x63, 0x52, 0x61, 0x74, 0x65, 0x12, 0x1d, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64,
-	0x2e, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x61, 0x74, 0x65, 0x52, 0x65,
-	0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x1b, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e,
-	0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x61, 0x74, 0x65, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e,
-	0x73, 0x65, 0x12, 0x53, 0x0a, 0x13, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x53,
-	0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73, 0x12, 0x19, 0x2e, 0x62, 0x61, 0x63, 0x6b,
-	0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x65, 0x71,
-	0x75, 0x65, 0x73, 0x74, 0x1a, 0x21, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4d,
-	0x65, 0x74, 0x72, 0x69, 0x63, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73, 0x52,
-	0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x42, 0x26, 0x5a, 0x24, 0x67, 0x69, 0x74, 0x68, 0x75,
-	0x62, 0x2e, 0x63, 0x6f, 0x6d, 0x2f, 0x63, 0x69, 0x63, 0x61, 0x64, 0x61, 0x74, 0x65, 0x73, 0x74,
-	0x69, 0x6e, 0x67, 0x2f, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2f, 0x61, 0x70, 0x69, 0x62,
-	0x06, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x33,
+	0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x12, 0x4c, 0x0a, 0x10, 0x41, 0x64, 0x64, 0x4d,
+	0x65, 0x74, 0x72, 0x69, 0x63, 0x53, 0x75, 0x6d, 0x6d, 0x61, 0x72, 0x79, 0x12, 0x20, 0x2e, 0x62,
+	0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x41, 0x64, 0x64, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63,
+	0x53, 0x75, 0x6d, 0x6d, 0x61, 0x72, 0x79, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x16,
+	0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66,
+	0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x12, 0x49, 0x0a, 0x0e, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74,
+	0x72, 0x69, 0x63, 0x54, 0x6f, 0x74, 0x61, 0x6c, 0x12, 0x19, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65,
+	0x6e, 0x64, 0x2e, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x65, 0x71, 0x75,
+	0x65, 0x73, 0x74, 0x1a, 0x1c, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x65,
+	0x74, 0x72, 0x69, 0x63, 0x54, 0x6f, 0x74, 0x61, 0x6c, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73,
+	0x65, 0x12, 0x47, 0x0a, 0x0d, 0x47, 0x65, 0x74, 0x4c, 0x61, 0x73, 0x74, 0x4d, 0x65, 0x74, 0x72,
+	0x69, 0x63, 0x12, 0x19, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65, 0x74,
+	0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x1b, 0x2e,
+	0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4c, 0x61, 0x73, 0x74, 0x4d, 0x65, 0x74, 0x72,
+	0x69, 0x63, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x4b, 0x0a, 0x0d, 0x47, 0x65,
+	0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x61, 0x74, 0x65, 0x12, 0x1d, 0x2e, 0x62, 0x61,
+	0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52,
+	0x61, 0x74, 0x65, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x1b, 0x2e, 0x62, 0x61, 0x63,
+	0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x52, 0x61, 0x74, 0x65, 0x52,
+	0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x53, 0x0a, 0x13, 0x47, 0x65, 0x74, 0x4d, 0x65,
+	0x74, 0x72, 0x69, 0x63, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73, 0x12, 0x19,
+	0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72,
+	0x69, 0x63, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x21, 0x2e, 0x62, 0x61, 0x63, 0x6b,
+	0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73,
+	0x74, 0x69, 0x63, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x51, 0x0a, 0x0f,
+	0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x53, 0x65, 0x72, 0x69, 0x65, 0x73, 0x12,
+	0x1f, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74,
+	0x72, 0x69, 0x63, 0x53, 0x65, 0x72, 0x69, 0x65, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
+	0x1a, 0x1d, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e, 0x4d, 0x65, 0x74, 0x72, 0x69,
+	0x63, 0x53, 0x65, 0x72, 0x69, 0x65, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12,
+	0x5d, 0x0a, 0x12, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x73, 0x53, 0x6e, 0x61,
+	0x70, 0x73, 0x68, 0x6f, 0x74, 0x12, 0x22, 0x2e, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e, 0x64, 0x2e,
+	0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x73, 0x53, 0x6e, 0x61, 0x70, 0x73, 0x68,
+	0x6f, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x23, 0x2e, 0x62, 0x61, 0x63, 0x6b,
+	0x65, 0x6e, 0x64, 0x2e, 0x47, 0x65, 0x74, 0x4d, 0x65, 0x74, 0x72, 0x69, 0x63, 0x73, 0x53, 0x6e,
+	0x61, 0x70, 0x73, 0x68, 0x6f, 0x74, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x3d,
+	0x0a, 0x0b, 0x43, 0x68, 0x65, 0x63, 0x6b, 0x48, 0x65, 0x61, 0x6c, 0x74, 0x68, 0x12, 0x16, 0x2e,
+	0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e,
+	0x45, 0x6d, 0x70, 0x74, 0x79, 0x1a, 0x16, 0x2e, 0x67, 0x6f, 0x6f, 0x67, 0x6c, 0x65, 0x2e, 0x70,
+	0x72, 0x6f, 0x74, 0x6f, 0x62, 0x75, 0x66, 0x2e, 0x45, 0x6d, 0x70, 0x74, 0x79, 0x42, 0x26, 0x5a,
+	0x24, 0x67, 0x69, 0x74, 0x68, 0x75, 0x62, 0x2e, 0x63, 0x6f, 0x6d, 0x2f, 0x63, 0x69, 0x63, 0x61,
+	0x64, 0x61, 0x74, 0x65, 0x73, 0x74, 0x69, 0x6e, 0x67, 0x2f, 0x62, 0x61, 0x63, 0x6b, 0x65, 0x6e,
+	0x64, 0x2f, 0x61, 0x70, 0x69, 0x62, 0x06, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x33,
 }
 
 var (
@@ -2043,97 +3123,136 @@ func file_api_backend_proto_rawDescGZIP() []byte {
 	return file_api_backend_proto_rawDescData
 }
 
-var file_api_backend_proto_msgTypes = make([]protoimpl.MessageInfo, 31)
+var file_api_backend_proto_msgTypes = make([]protoimpl.MessageInfo, 46)
 var file_api_backend_proto_goTypes = []interface{}{
 	(*CreateTestRequest)(nil),          // 0: backend.CreateTestRequest
 	(*CreateTestResponse)(nil),         // 1: backend.CreateTestResponse
 	(*CreateScenarioRequest)(nil),      // 2: backend.CreateScenarioRequest
 	(*CreateScenarioResponse)(nil),     // 3: backend.CreateScenarioResponse
-	(*CreateUsersRequest)(nil),         // 4: backend.CreateUsersRequest
-	(*StopUsersRequest)(nil),           // 5: backend.StopUsersRequest
-	(*CleanTestInstancesRequest)(nil),  // 6: backend.CleanTestInstancesRequest
-	(*CheckTestInstanceRequest)(nil),   // 7: backend.CheckTestInstanceRequest
-	(*CheckTestInstanceResponse)(nil),  // 8: backend.CheckTestInstanceResponse
-	(*CreateUsersResponse)(nil),        // 9: backend.CreateUsersResponse
-	(*Event)(nil),                      // 10: backend.Event
-	(*AddEventRequest)(nil),            // 11: backend.AddEventRequest
-	(*GetEventsRequest)(nil),           // 12: backend.GetEventsRequest
-	(*Events)(nil),                     // 13: backend.Events
-	(*AddUserResultsRequest)(nil),      // 14: backend.AddUserResultsRequest
-	(*SetScenarioResultRequest)(nil),   // 15: backend.SetScenarioResultRequest
-	(*MoveUserResultsRequest)(nil),     // 16: backend.MoveUserResultsRequest
-	(*MoveUserResultsResponse)(nil),    // 17: backend.MoveUserResultsResponse
-	(*MoveScenarioResultRequest)(nil),  // 18: backend.MoveScenarioResultRequest
-	(*MoveScenarioResultResponse)(nil), // 19: backend.MoveScenarioResultResponse
-	(*DistributeWorkRequest)(nil),      // 20: backend.DistributeWorkRequest
-	(*GetUserWorkRequest)(nil),         // 21: backend.GetUserWorkRequest
-	(*GetUserWorkResponse)(nil),        // 22: backend.GetUserWorkResponse
-	(*AddMetricRequest)(nil),           // 23: backend.AddMetricRequest
-	(*GetMetricRequest)(nil),           // 24: backend.GetMetricRequest
-	(*GetMetricRateRequest)(nil),       // 25: backend.GetMetricRateRequest
-	(*MetricTotalResponse)(nil),        // 26: backend.MetricTotalResponse
-	(*LastMetricResponse)(nil),         // 27: backend.LastMetricResponse
-	(*MetricRateResponse)(nil),         // 28: backend.MetricRateResponse
-	(*MetricStatisticsResponse)(nil),   // 29: backend.MetricStatisticsResponse
-	nil,                                // 30: backend.CreateTestRequest.EnvEntry
-	(*wrappers.StringValue)(nil),       // 31: google.protobuf.StringValue
-	(*empty.Empty)(nil),                // 32: google.protobuf.Empty
+	(*CreateScenarioPoolRequest)(nil),  // 4: backend.CreateScenarioPoolRequest
+	(*SetContextValueRequest)(nil),     // 5: backend.SetContextValueRequest
+	(*GetContextValueRequest)(nil),     // 6: backend.GetContextValueRequest
+	(*GetContextValueResponse)(nil),    // 7: backend.GetContextValueResponse
+	(*CreateUsersRequest)(nil),         // 8: backend.CreateUsersRequest
+	(*StopUsersRequest)(nil),           // 9: backend.StopUsersRequest
+	(*CleanTestInstancesRequest)(nil),  // 10: backend.CleanTestInstancesRequest
+	(*CheckTestInstanceRequest)(nil),   // 11: backend.CheckTestInstanceRequest
+	(*CheckTestInstanceResponse)(nil),  // 12: backend.CheckTestInstanceResponse
+	(*CreateUsersResponse)(nil),        // 13: backend.CreateUsersResponse
+	(*Event)(nil),                      // 14: backend.Event
+	(*AddEventRequest)(nil),            // 15: backend.AddEventRequest
+	(*GetEventsRequest)(nil),           // 16: backend.GetEventsRequest
+	(*Events)(nil),                     // 17: backend.Events
+	(*AddUserResultsRequest)(nil),      // 18: backend.AddUserResultsRequest
+	(*SetScenarioResultRequest)(nil),   // 19: backend.SetScenarioResultRequest
+	(*MoveUserResultsRequest)(nil),     // 20: backend.MoveUserResultsRequest
+	(*MoveUserResultsResponse)(nil),    // 21: backend.MoveUserResultsResponse
+	(*MoveScenarioResultRequest)(nil),  // 22: backend.MoveScenarioResultRequest
+	(*MoveScenarioResultResponse)(nil), // 23: backend.MoveScenarioResultResponse
+	(*DistributeWorkRequest)(nil),      // 24: backend.DistributeWorkRequest
+	(*GetUserWorkRequest)(nil),         // 25: backend.GetUserWorkRequest
+	(*GetUserWorkResponse)(nil),        // 26: backend.GetUserWorkResponse
+	(*DistributeWorkItemsRequest)(nil), // 27: backend.DistributeWorkItemsRequest
+	(*GetUserWorkItemsResponse)(nil),   // 28: backend.GetUserWorkItemsResponse
+	(*AddMetricRequest)(nil),           // 29: backend.AddMetricRequest
+	(*AddMetricSummaryRequest)(nil),    // 30: backend.AddMetricSummaryRequest
+	(*GetMetricRequest)(nil),           // 31: backend.GetMetricRequest
+	(*GetMetricSeriesRequest)(nil),     // 32: backend.GetMetricSeriesRequest
+	(*GetMetricRateRequest)(nil),       // 33: backend.GetMetricRateRequest
+	(*MetricTotalResponse)(nil),        // 34: backend.MetricTotalResponse
+	(*LastMetricResponse)(nil),         // 35: backend.LastMetricResponse
+	(*MetricRateResponse)(nil),         // 36: backend.MetricRateResponse
+	(*MetricStatisticsResponse)(nil),   // 37: backend.MetricStatisticsResponse
+	(*MetricSeriesPoint)(nil),          // 38: backend.MetricSeriesPoint
+	(*MetricSeriesResponse)(nil),       // 39: backend.MetricSeriesResponse
+	(*MetricQuery)(nil),                // 40: backend.MetricQuery
+	(*MetricQueryResult)(nil),          // 41: backend.MetricQueryResult
+	(*GetMetricsSnapshotRequest)(nil),  // 42: backend.GetMetricsSnapshotRequest
+	(*GetMetricsSnapshotResponse)(nil), // 43: backend.GetMetricsSnapshotResponse
+	nil,                                // 44: backend.CreateTestRequest.EnvEntry
+	nil,                                // 45: backend.AddMetricSummaryRequest.HistogramEntry
+	(*wrappers.StringValue)(nil),       // 46: google.protobuf.StringValue
+	(*empty.Empty)(nil),                // 47: google.protobuf.Empty
 }
 var file_api_backend_proto_depIdxs = []int32{
-	30, // 0: backend.CreateTestRequest.env:type_name -> backend.CreateTestRequest.EnvEntry
-	10, // 1: backend.AddEventRequest.event:type_name -> backend.Event
-	10, // 2: backend.Events.events:type_name -> backend.Event
-	31, // 3: backend.SetScenarioResultRequest.output:type_name -> google.protobuf.StringValue
-	31, // 4: backend.SetScenarioResultRequest.exception:type_name -> google.protobuf.StringValue
-	31, // 5: backend.MoveScenarioResultResponse.output:type_name -> google.protobuf.StringValue
-	31, // 6: backend.MoveScenarioResultResponse.exception:type_name -> google.protobuf.StringValue
-	0,  // 7: backend.Backend.CreateTest:input_type -> backend.CreateTestRequest
-	2,  // 8: backend.Backend.CreateScenario:input_type -> backend.CreateScenarioRequest
-	4,  // 9: backend.Backend.CreateUsers:input_type -> backend.CreateUsersRequest
-	5,  // 10: backend.Backend.StopUsers:input_type -> backend.StopUsersRequest
-	6,  // 11: backend.Backend.CleanTestInstances:input_type -> backend.CleanTestInstancesRequest
-	7,  // 12: backend.Backend.CheckTestInstance:input_type -> backend.CheckTestInstanceRequest
-	11, // 13: backend.Backend.AddTestEvent:input_type -> backend.AddEventRequest
-	12, // 14: backend.Backend.GetTestEvents:input_type -> backend.GetEventsRequest
-	14, // 15: backend.Backend.AddUserResults:input_type -> backend.AddUserResultsRequest
-	15, // 16: backend.Backend.SetScenarioResult:input_type -> backend.SetScenarioResultRequest
-	16, // 17: backend.Backend.MoveUserResults:input_type -> backend.MoveUserResultsRequest
-	18, // 18: backend.Backend.MoveScenarioResult:input_type -> backend.MoveScenarioResultRequest
-	20, // 19: backend.Backend.DistributeWork:input_type -> backend.DistributeWorkRequest
-	21, // 20: backend.Backend.GetUserWork:input_type -> backend.GetUserWorkRequest
-	11, // 21: backend.Backend.AddUserEvent:input_type -> backend.AddEventRequest
-	12, // 22: backend.Backend.GetUserEvents:input_type -> backend.GetEventsRequest
-	23, // 23: backend.Backend.AddMetric:input_type -> backend.AddMetricRequest
-	24, // 24: backend.Backend.GetMetricTotal:input_type -> backend.GetMetricRequest
-	24, // 25: backend.Backend.GetLastMetric:input_type -> backend.GetMetricRequest
-	25, // 26: backend.Backend.GetMetricRate:input_type -> backend.GetMetricRateRequest
-	24, // 27: backend.Backend.GetMetricStatistics:input_type -> backend.GetMetricRequest
-	1,  // 28: backend.Backend.CreateTest:output_type -> backend.CreateTestResponse
-	3,  // 29: backend.Backend.CreateScenario:output_type -> backend.CreateScenarioResponse
-	9,  // 30: backend.Backend.CreateUsers:output_type -> backend.CreateUsersResponse
-	32, // 31: backend.Backend.StopUsers:output_type -> google.protobuf.Empty
-	32, // 32: backend.Backend.CleanTestInstances:output_type -> google.protobuf.Empty
-	8,  // 33: backend.Backend.CheckTestInstance:output_type -> backend.CheckTestInstanceResponse
-	32, // 34: backend.Backend.AddTestEvent:output_type -> google.protobuf.Empty
-	13, // 35: backend.Backend.GetTestEvents:output_type -> backend.Events
-	32, // 36: backend.Backend.AddUserResults:output_type -> google.protobuf.Empty
-	32, // 37: backend.Backend.SetScenarioResult:output_type -> google.protobuf.Empty
-	17, // 38: backend.Backend.MoveUserResults:output_type -> backend.MoveUserResultsResponse
-	19, // 39: backend.Backend.MoveScenarioResult:output_type -> backend.MoveScenarioResultResponse
-	32, // 40: backend.Backend.DistributeWork:output_type -> google.protobuf.Empty
-	22, // 41: backend.Backend.GetUserWork:output_type -> backend.GetUserWorkResponse
-	32, // 42: backend.Backend.AddUserEvent:output_type -> google.protobuf.Empty
-	13, // 43: backend.Backend.GetUserEvents:output_type -> backend.Events
-	32, // 44: backend.Backend.AddMetric:output_type -> google.protobuf.Empty
-	26, // 45: backend.Backend.GetMetricTotal:output_type -> backend.MetricTotalResponse
-	27, // 46: backend.Backend.GetLastMetric:output_type -> backend.LastMetricResponse
-	28, // 47: backend.Backend.GetMetricRate:output_type -> backend.MetricRateResponse
-	29, // 48: backend.Backend.GetMetricStatistics:output_type -> backend.MetricStatisticsResponse
-	28, // [28:49] is the sub-list for method output_type
-	7,  // [7:28] is the sub-list for method input_type
-	7,  // [7:7] is the sub-list for extension type_name
-	7,  // [7:7] is the sub-list for extension extendee
-	0,  // [0:7] is the sub-list for field type_name
+	44, // 0: backend.CreateTestRequest.env:type_name -> backend.CreateTestRequest.EnvEntry
+	14, // 1: backend.AddEventRequest.event:type_name -> backend.Event
+	14, // 2: backend.Events.events:type_name -> backend.Event
+	46, // 3: backend.SetScenarioResultRequest.output:type_name -> google.protobuf.StringValue
+	46, // 4: backend.SetScenarioResultRequest.exception:type_name -> google.protobuf.StringValue
+	46, // 5: backend.MoveScenarioResultResponse.output:type_name -> google.protobuf.StringValue
+	46, // 6: backend.MoveScenarioResultResponse.exception:type_name -> google.protobuf.StringValue
+	45, // 7: backend.AddMetricSummaryRequest.histogram:type_name -> backend.AddMetricSummaryRequest.HistogramEntry
+	38, // 8: backend.MetricSeriesResponse.points:type_name -> backend.MetricSeriesPoint
+	37, // 9: backend.MetricQueryResult.statistics:type_name -> backend.MetricStatisticsResponse
+	38, // 10: backend.MetricQueryResult.points:type_name -> backend.MetricSeriesPoint
+	40, // 11: backend.GetMetricsSnapshotRequest.queries:type_name -> backend.MetricQuery
+	41, // 12: backend.GetMetricsSnapshotResponse.results:type_name -> backend.MetricQueryResult
+	0,  // 13: backend.Backend.CreateTest:input_type -> backend.CreateTestRequest
+	2,  // 14: backend.Backend.CreateScenario:input_type -> backend.CreateScenarioRequest
+	4,  // 15: backend.Backend.CreateScenarioPool:input_type -> backend.CreateScenarioPoolRequest
+	8,  // 16: backend.Backend.CreateUsers:input_type -> backend.CreateUsersRequest
+	9,  // 17: backend.Backend.StopUsers:input_type -> backend.StopUsersRequest
+	10, // 18: backend.Backend.CleanTestInstances:input_type -> backend.CleanTestInstancesRequest
+	11, // 19: backend.Backend.CheckTestInstance:input_type -> backend.CheckTestInstanceRequest
+	15, // 20: backend.Backend.AddTestEvent:input_type -> backend.AddEventRequest
+	16, // 21: backend.Backend.GetTestEvents:input_type -> backend.GetEventsRequest
+	18, // 22: backend.Backend.AddUserResults:input_type -> backend.AddUserResultsRequest
+	19, // 23: backend.Backend.SetScenarioResult:input_type -> backend.SetScenarioResultRequest
+	20, // 24: backend.Backend.MoveUserResults:input_type -> backend.MoveUserResultsRequest
+	22, // 25: backend.Backend.MoveScenarioResult:input_type -> backend.MoveScenarioResultRequest
+	5,  // 26: backend.Backend.SetContextValue:input_type -> backend.SetContextValueRequest
+	6,  // 27: backend.Backend.GetContextValue:input_type -> backend.GetContextValueRequest
+	24, // 28: backend.Backend.DistributeWork:input_type -> backend.DistributeWorkRequest
+	25, // 29: backend.Backend.GetUserWork:input_type -> backend.GetUserWorkRequest
+	27, // 30: backend.Backend.DistributeWorkItems:input_type -> backend.DistributeWorkItemsRequest
+	25, // 31: backend.Backend.GetUserWorkItems:input_type -> backend.GetUserWorkRequest
+	15, // 32: backend.Backend.AddUserEvent:input_type -> backend.AddEventRequest
+	16, // 33: backend.Backend.GetUserEvents:input_type -> backend.GetEventsRequest
+	29, // 34: backend.Backend.AddMetric:input_type -> backend.AddMetricRequest
+	30, // 35: backend.Backend.AddMetricSummary:input_type -> backend.AddMetricSummaryRequest
+	31, // 36: backend.Backend.GetMetricTotal:input_type -> backend.GetMetricRequest
+	31, // 37: backend.Backend.GetLastMetric:input_type -> backend.GetMetricRequest
+	33, // 38: backend.Backend.GetMetricRate:input_type -> backend.GetMetricRateRequest
+	31, // 39: backend.Backend.GetMetricStatistics:input_type -> backend.GetMetricRequest
+	32, // 40: backend.Backend.GetMetricSeries:input_type -> backend.GetMetricSeriesRequest
+	42, // 41: backend.Backend.GetMetricsSnapshot:input_type -> backend.GetMetricsSnapshotRequest
+	47, // 42: backend.Backend.CheckHealth:input_type -> google.protobuf.Empty
+	1,  // 43: backend.Backend.CreateTest:output_type -> backend.CreateTestResponse
+	3,  // 44: backend.Backend.CreateScenario:output_type -> backend.CreateScenarioResponse
+	3,  // 45: backend.Backend.CreateScenarioPool:output_type -> backend.CreateScenarioResponse
+	13, // 46: backend.Backend.CreateUsers:output_type -> backend.CreateUsersResponse
+	47, // 47: backend.Backend.StopUsers:output_type -> google.protobuf.Empty
+	47, // 48: backend.Backend.CleanTestInstances:output_type -> google.protobuf.Empty
+	12, // 49: backend.Backend.CheckTestInstance:output_type -> backend.CheckTestInstanceResponse
+	47, // 50: backend.Backend.AddTestEvent:output_type -> google.protobuf.Empty
+	17, // 51: backend.Backend.GetTestEvents:output_type -> backend.Events
+	47, // 52: backend.Backend.AddUserResults:output_type -> google.protobuf.Empty
+	47, // 53: backend.Backend.SetScenarioResult:output_type -> google.protobuf.Empty
+	21, // 54: backend.Backend.MoveUserResults:output_type -> backend.MoveUserResultsResponse
+	23, // 55: backend.Backend.MoveScenarioResult:output_type -> backend.MoveScenarioResultResponse
+	47, // 56: backend.Backend.SetContextValue:output_type -> google.protobuf.Empty
+	7,  // 57: backend.Backend.GetContextValue:output_type -> backend.GetContextValueResponse
+	47, // 58: backend.Backend.DistributeWork:output_type -> google.protobuf.Empty
+	26, // 59: backend.Backend.GetUserWork:output_type -> backend.GetUserWorkResponse
+	47, // 60: backend.Backend.DistributeWorkItems:output_type -> google.protobuf.Empty
+	28, // 61: backend.Backend.GetUserWorkItems:output_type -> backend.GetUserWorkItemsResponse
+	47, // 62: backend.Backend.AddUserEvent:output_type -> google.protobuf.Empty
+	17, // 63: backend.Backend.GetUserEvents:output_type -> backend.Events
+	47, // 64: backend.Backend.AddMetric:output_type -> google.protobuf.Empty
+	47, // 65: backend.Backend.AddMetricSummary:output_type -> google.protobuf.Empty
+	34, // 66: backend.Backend.GetMetricTotal:output_type -> backend.MetricTotalResponse
+	35, // 67: backend.Backend.GetLastMetric:output_type -> backend.LastMetricResponse
+	36, // 68: backend.Backend.GetMetricRate:output_type -> backend.MetricRateResponse
+	37, // 69: backend.Backend.GetMetricStatistics:output_type -> backend.MetricStatisticsResponse
+	39, // 70: backend.Backend.GetMetricSeries:output_type -> backend.MetricSeriesResponse
+	43, // 71: backend.Backend.GetMetricsSnapshot:output_type -> backend.GetMetricsSnapshotResponse
+	47, // 72: backend.Backend.CheckHealth:output_type -> google.protobuf.Empty
+	43, // [43:73] is the sub-list for method output_type
+	13, // [13:43] is the sub-list for method input_type
+	13, // [13:13] is the sub-list for extension type_name
+	13, // [13:13] is the sub-list for extension extendee
+	0,  // [0:13] is the sub-list for field type_name
 }
 
 func init() { file_api_backend_proto_init() }
@@ -2191,7 +3310,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[4].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CreateUsersRequest); i {
+			switch v := v.(*CreateScenarioPoolRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2203,7 +3322,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[5].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*StopUsersRequest); i {
+			switch v := v.(*SetContextValueRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2215,7 +3334,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[6].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CleanTestInstancesRequest); i {
+			switch v := v.(*GetContextValueRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2227,7 +3346,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[7].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CheckTestInstanceRequest); i {
+			switch v := v.(*GetContextValueResponse); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2239,7 +3358,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[8].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CheckTestInstanceResponse); i {
+			switch v := v.(*CreateUsersRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2251,7 +3370,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[9].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*CreateUsersResponse); i {
+			switch v := v.(*StopUsersRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2263,7 +3382,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[10].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*Event); i {
+			switch v := v.(*CleanTestInstancesRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2275,7 +3394,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[11].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*AddEventRequest); i {
+			switch v := v.(*CheckTestInstanceRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2287,7 +3406,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[12].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*GetEventsRequest); i {
+			switch v := v.(*CheckTestInstanceResponse); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2299,7 +3418,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[13].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*Events); i {
+			switch v := v.(*CreateUsersResponse); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2311,7 +3430,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[14].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*AddUserResultsRequest); i {
+			switch v := v.(*Event); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2323,7 +3442,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[15].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*SetScenarioResultRequest); i {
+			switch v := v.(*AddEventRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2335,7 +3454,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[16].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*MoveUserResultsRequest); i {
+			switch v := v.(*GetEventsRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2347,7 +3466,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[17].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*MoveUserResultsResponse); i {
+			switch v := v.(*Events); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2359,7 +3478,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[18].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*MoveScenarioResultRequest); i {
+			switch v := v.(*AddUserResultsRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2371,7 +3490,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[19].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*MoveScenarioResultResponse); i {
+			switch v := v.(*SetScenarioResultRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2383,7 +3502,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[20].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*DistributeWorkRequest); i {
+			switch v := v.(*MoveUserResultsRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2395,7 +3514,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[21].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*GetUserWorkRequest); i {
+			switch v := v.(*MoveUserResultsResponse); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2407,7 +3526,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[22].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*GetUserWorkResponse); i {
+			switch v := v.(*MoveScenarioResultRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2419,7 +3538,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[23].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*AddMetricRequest); i {
+			switch v := v.(*MoveScenarioResultResponse); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2431,7 +3550,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[24].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*GetMetricRequest); i {
+			switch v := v.(*DistributeWorkRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2443,7 +3562,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[25].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*GetMetricRateRequest); i {
+			switch v := v.(*GetUserWorkRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2455,7 +3574,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[26].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*MetricTotalResponse); i {
+			switch v := v.(*GetUserWorkResponse); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2467,7 +3586,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[27].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*LastMetricResponse); i {
+			switch v := v.(*DistributeWorkItemsRequest); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2479,7 +3598,7 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[28].Exporter = func(v interface{}, i int) interface{} {
-			switch v := v.(*MetricRateResponse); i {
+			switch v := v.(*GetUserWorkItemsResponse); i {
 			case 0:
 				return &v.state
 			case 1:
@@ -2491,6 +3610,102 @@ func file_api_backend_proto_init() {
 			}
 		}
 		file_api_backend_proto_msgTypes[29].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*AddMetricRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_backend_proto_msgTypes[30].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*AddMetricSummaryRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_backend_proto_msgTypes[31].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*GetMetricRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_backend_proto_msgTypes[32].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*GetMetricSeriesRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_backend_proto_msgTypes[33].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*GetMetricRateRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_backend_proto_msgTypes[34].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*MetricTotalResponse); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_backend_proto_msgTypes[35].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*LastMetricResponse); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_backend_proto_msgTypes[36].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*MetricRateResponse); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_backend_proto_msgTypes[37].Exporter = func(v interface{}, i int) interface{} {
 			switch v := v.(*MetricStatisticsResponse); i {
 			case 0:
 				return &v.state
@@ -2502,6 +3717,78 @@ func file_api_backend_proto_init() {
 				return nil
 			}
 		}
+		file_api_backend_proto_msgTypes[38].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*MetricSeriesPoint); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_backend_proto_msgTypes[39].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*MetricSeriesResponse); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_backend_proto_msgTypes[40].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*MetricQuery); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_backend_proto_msgTypes[41].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*MetricQueryResult); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_backend_proto_msgTypes[42].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*GetMetricsSnapshotRequest); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
+		file_api_backend_proto_msgTypes[43].Exporter = func(v interface{}, i int) interface{} {
+			switch v := v.(*GetMetricsSnapshotResponse); i {
+			case 0:
+				return &v.state
+			case 1:
+				return &v.sizeCache
+			case 2:
+				return &v.unknownFields
+			default:
+				return nil
+			}
+		}
 	}
 	type x struct{}
 	out := protoimpl.TypeBuilder{
@@ -2509,7 +3796,7 @@ func file_api_backend_proto_init() {
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: file_api_backend_proto_rawDesc,
 			NumEnums:      0,
-			NumMessages:   31,
+			NumMessages:   46,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
@@ -21,6 +21,7 @@ const _ = grpc.SupportPackageIsVersion7
 type BackendClient interface {
 	CreateTest(ctx context.Context, in *CreateTestRequest, opts ...grpc.CallOption) (*CreateTestResponse, error)
 	CreateScenario(ctx context.Context, in *CreateScenarioRequest, opts ...grpc.CallOption) (*CreateScenarioResponse, error)
+	CreateScenarioPool(ctx context.Context, in *CreateScenarioPoolRequest, opts ...grpc.CallOption) (*CreateScenarioResponse, error)
 	CreateUsers(ctx context.Context, in *CreateUsersRequest, opts ...grpc.CallOption) (*CreateUsersResponse, error)
 	StopUsers(ctx context.Context, in *StopUsersRequest, opts ...grpc.CallOption) (*empty.Empty, error)
 	CleanTestInstances(ctx context.Context, in *CleanTestInstancesRequest, opts ...grpc.CallOption) (*empty.Empty, error)
@@ -31,15 +32,23 @@ type BackendClient interface {
 	SetScenarioResult(ctx context.Context, in *SetScenarioResultRequest, opts ...grpc.CallOption) (*empty.Empty, error)
 	MoveUserResults(ctx context.Context, in *MoveUserResultsRequest, opts ...grpc.CallOption) (*MoveUserResultsResponse, error)
 	MoveScenarioResult(ctx context.Context, in *MoveScenarioResultRequest, opts ...grpc.CallOption) (*MoveScenarioResultResponse, error)
+	SetContextValue(ctx context.Context, in *SetContextValueRequest, opts ...grpc.CallOption) (*empty.Empty, error)
+	GetContextValue(ctx context.Context, in *GetContextValueRequest, opts ...grpc.CallOption) (*GetContextValueResponse, error)
 	DistributeWork(ctx context.Context, in *DistributeWorkRequest, opts ...grpc.CallOption) (*empty.Empty, error)
 	GetUserWork(ctx context.Context, in *GetUserWorkRequest, opts ...grpc.CallOption) (*GetUserWorkResponse, error)
+	DistributeWorkItems(ctx context.Context, in *DistributeWorkItemsRequest, opts ...grpc.CallOption) (*empty.Empty, error)
+	GetUserWorkItems(ctx context.Context, in *GetUserWorkRequest, opts ...grpc.CallOption) (*GetUserWorkItemsResponse, error)
 	AddUserEvent(ctx context.Context, in *AddEventRequest, opts ...grpc.CallOption) (*empty.Empty, error)
 	GetUserEvents(ctx context.Context, in *GetEventsRequest, opts ...grpc.CallOption) (*Events, error)
 	AddMetric(ctx context.Context, in *AddMetricRequest, opts ...grpc.CallOption) (*empty.Empty, error)
+	AddMetricSummary(ctx context.Context, in *AddMetricSummaryRequest, opts ...grpc.CallOption) (*empty.Empty, error)
 	GetMetricTotal(ctx context.Context, in *GetMetricRequest, opts ...grpc.CallOption) (*MetricTotalResponse, error)
 	GetLastMetric(ctx context.Context, in *GetMetricRequest, opts ...grpc.CallOption) (*LastMetricResponse, error)
 	GetMetricRate(ctx context.Context, in *GetMetricRateRequest, opts ...grpc.CallOption) (*MetricRateResponse, error)
 	GetMetricStatistics(ctx context.Context, in *GetMetricRequest, opts ...grpc.CallOption) (*MetricStatisticsResponse, error)
+	GetMetricSeries(ctx context.Context, in *GetMetricSeriesRequest, opts ...grpc.CallOption) (*MetricSeriesResponse, error)
+	GetMetricsSnapshot(ctx context.Context, in *GetMetricsSnapshotRequest, opts ...grpc.CallOption) (*GetMetricsSnapshotResponse, error)
+	CheckHealth(ctx context.Context, in *empty.Empty, opts ...grpc.CallOption) (*empty.Empty, error)
 }
 
 type backendClient struct {
@@ -68,6 +77,15 @@ func (c *backendClient) CreateScenario(ctx context.Context, in *CreateScenarioRe
 	return out, nil
 }
 
+func (c *backendClient) CreateScenarioPool(ctx context.Context, in *CreateScenarioPoolRequest, opts ...grpc.CallOption) (*CreateScenarioResponse, error) {
+	out := new(CreateScenarioResponse)
+	err := c.cc.Invoke(ctx, "/backend.Backend/CreateScenarioPool", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 func (c *backendClient) CreateUsers(ctx context.Context, in *CreateUsersRequest, opts ...grpc.CallOption) (*CreateUsersResponse, error) {
 	out := new(CreateUsersResponse)
 	err := c.cc.Invoke(ctx, "/backend.Backend/CreateUsers", in, out, opts...)
@@ -158,6 +176,24 @@ func (c *backendClient) MoveScenarioResult(ctx context.Context, in *MoveScenario
 	return out, nil
 }
 
+func (c *backendClient) SetContextValue(ctx context.Context, in *SetContextValueRequest, opts ...grpc.CallOption) (*empty.Empty, error) {
+	out := new(empty.Empty)
+	err := c.cc.Invoke(ctx, "/backend.Backend/SetContextValue", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *backendClient) GetContextValue(ctx context.Context, in *GetContextValueRequest, opts ...grpc.CallOption) (*GetContextValueResponse, error) {
+	out := new(GetContextValueResponse)
+	err := c.cc.Invoke(ctx, "/backend.Backend/GetContextValue", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 func (c *backendClient) DistributeWork(ctx context.Context, in *DistributeWorkRequest, opts ...grpc.CallOption) (*empty.Empty, error) {
 	out := new(empty.Empty)
 	err := c.cc.Invoke(ctx, "/backend.Backend/DistributeWork", in, out, opts...)
@@ -176,6 +212,24 @@ func (c *backendClient) GetUserWork(ctx context.Context, in *GetUserWorkRequest,
 	return out, nil
 }
 
+func (c *backendClient) DistributeWorkItems(ctx context.Context, in *DistributeWorkItemsRequest, opts ...grpc.CallOption) (*empty.Empty, error) {
+	out := new(empty.Empty)
+	err := c.cc.Invoke(ctx, "/backend.Backend/DistributeWorkItems", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *backendClient) GetUserWorkItems(ctx context.Context, in *GetUserWorkRequest, opts ...grpc.CallOption) (*GetUserWorkItemsResponse, error) {
+	out := new(GetUserWorkItemsResponse)
+	err := c.cc.Invoke(ctx, "/backend.Backend/GetUserWorkItems", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 func (c *backendClient) AddUserEvent(ctx context.Context, in *AddEventRequest, opts ...grpc.CallOption) (*empty.Empty, error) {
 	out := new(empty.Empty)
 	err := c.cc.Invoke(ctx, "/backend.Backend/AddUserEvent", in, out, opts...)
@@ -203,6 +257,15 @@ func (c *backendClient) AddMetric(ctx context.Context, in *AddMetricRequest, opt
 	return out, nil
 }
 
+func (c *backendClient) AddMetricSummary(ctx context.Context, in *AddMetricSummaryRequest, opts ...grpc.CallOption) (*empty.Empty, error) {
+	out := new(empty.Empty)
+	err := c.cc.Invoke(ctx, "/backend.Backend/AddMetricSummary", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 func (c *backendClient) GetMetricTotal(ctx context.Context, in *GetMetricRequest, opts ...grpc.CallOption) (*MetricTotalResponse, error) {
 	out := new(MetricTotalResponse)
 	err := c.cc.Invoke(ctx, "/backend.Backend/GetMetricTotal", in, out, opts...)
@@ -239,12 +302,40 @@ func (c *backendClient) GetMetricStatistics(ctx context.Context, in *GetMetricRe
 	return out, nil
 }
 
+func (c *backendClient) GetMetricSeries(ctx context.Context, in *GetMetricSeriesRequest, opts ...grpc.CallOption) (*MetricSeriesResponse, error) {
+	out := new(MetricSeriesResponse)
+	err := c.cc.Invoke(ctx, "/backend.Backend/GetMetricSeries", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *backendClient) GetMetricsSnapshot(ctx context.Context, in *GetMetricsSnapshotRequest, opts ...grpc.CallOption) (*GetMetricsSnapshotResponse, error) {
+	out := new(GetMetricsSnapshotResponse)
+	err := c.cc.Invoke(ctx, "/backend.Backend/GetMetricsSnapshot", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *backendClient) CheckHealth(ctx context.Context, in *empty.Empty, opts ...grpc.CallOption) (*empty.Empty, error) {
+	out := new(empty.Empty)
+	err := c.cc.Invoke(ctx, "/backend.Backend/CheckHealth", in, out, opts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 // BackendServer is the server API for Backend service.
 // All implementations must embed UnimplementedBackendServer
 // for forward compatibility
 type BackendServer interface {
 	CreateTest(context.Context, *CreateTestRequest) (*CreateTestResponse, error)
 	CreateScenario(context.Context, *CreateScenarioRequest) (*CreateScenarioResponse, error)
+	CreateScenarioPool(context.Context, *CreateScenarioPoolRequest) (*CreateScenarioResponse, error)
 	CreateUsers(context.Context, *CreateUsersRequest) (*CreateUsersResponse, error)
 	StopUsers(context.Context, *StopUsersRequest) (*empty.Empty, error)
 	CleanTestInstances(context.Context, *CleanTestInstancesRequest) (*empty.Empty, error)
@@ -255,15 +346,23 @@ type BackendServer interface {
 	SetScenarioResult(context.Context, *SetScenarioResultRequest) (*empty.Empty, error)
 	MoveUserResults(context.Context, *MoveUserResultsRequest) (*MoveUserResultsResponse, error)
 	MoveScenarioResult(context.Context, *MoveScenarioResultRequest) (*MoveScenarioResultResponse, error)
+	SetContextValue(context.Context, *SetContextValueRequest) (*empty.Empty, error)
+	GetContextValue(context.Context, *GetContextValueRequest) (*GetContextValueResponse, error)
 	DistributeWork(context.Context, *DistributeWorkRequest) (*empty.Empty, error)
 	GetUserWork(context.Context, *GetUserWorkRequest) (*GetUserWorkResponse, error)
+	DistributeWorkItems(context.Context, *DistributeWorkItemsRequest) (*empty.Empty, error)
+	GetUserWorkItems(context.Context, *GetUserWorkRequest) (*GetUserWorkItemsResponse, error)
 	AddUserEvent(context.Context, *AddEventRequest) (*empty.Empty, error)
 	GetUserEvents(context.Context, *GetEventsRequest) (*Events, error)
 	AddMetric(context.Context, *AddMetricRequest) (*empty.Empty, error)
+	AddMetricSummary(context.Context, *AddMetricSummaryRequest) (*empty.Empty, error)
 	GetMetricTotal(context.Context, *GetMetricRequest) (*MetricTotalResponse, error)
 	GetLastMetric(context.Context, *GetMetricRequest) (*LastMetricResponse, error)
 	GetMetricRate(context.Context, *GetMetricRateRequest) (*MetricRateResponse, error)
 	GetMetricStatistics(context.Context, *GetMetricRequest) (*MetricStatisticsResponse, error)
+	GetMetricSeries(context.Context, *GetMetricSeriesRequest) (*MetricSeriesResponse, error)
+	GetMetricsSnapshot(context.Context, *GetMetricsSnapshotRequest) (*GetMetricsSnapshotResponse, error)
+	CheckHealth(context.Context, *empty.Empty) (*empty.Empty, error)
 	mustEmbedUnimplementedBackendServer()
 }
 
@@ -277,6 +376,9 @@ func (UnimplementedBackendServer) CreateTest(context.Context, *CreateTestRequest
 func (UnimplementedBackendServer) CreateScenario(context.Context, *CreateScenarioRequest) (*CreateScenarioResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method CreateScenario not implemented")
 }
+func (UnimplementedBackendServer) CreateScenarioPool(context.Context, *CreateScenarioPoolRequest) (*CreateScenarioResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method CreateScenarioPool not implemented")
+}
 func (UnimplementedBackendServer) CreateUsers(context.Context, *CreateUsersRequest) (*CreateUsersResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method CreateUsers not implemented")
 }
@@ -307,12 +409,24 @@ func (UnimplementedBackendServer) MoveUserResults(context.Context, *MoveUserResu
 func (UnimplementedBackendServer) MoveScenarioResult(context.Context, *MoveScenarioResultRequest) (*MoveScenarioResultResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method MoveScenarioResult not implemented")
 }
+func (UnimplementedBackendServer) SetContextValue(context.Context, *SetContextValueRequest) (*empty.Empty, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method SetContextValue not implemented")
+}
+func (UnimplementedBackendServer) GetContextValue(context.Context, *GetContextValueRequest) (*GetContextValueResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method GetContextValue not implemented")
+}
 func (UnimplementedBackendServer) DistributeWork(context.Context, *DistributeWorkRequest) (*empty.Empty, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method DistributeWork not implemented")
 }
 func (UnimplementedBackendServer) GetUserWork(context.Context, *GetUserWorkRequest) (*GetUserWorkResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method GetUserWork not implemented")
 }
+func (UnimplementedBackendServer) DistributeWorkItems(context.Context, *DistributeWorkItemsRequest) (*empty.Empty, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method DistributeWorkItems not implemented")
+}
+func (UnimplementedBackendServer) GetUserWorkItems(context.Context, *GetUserWorkRequest) (*GetUserWorkItemsResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method GetUserWorkItems not implemented")
+}
 func (UnimplementedBackendServer) AddUserEvent(context.Context, *AddEventRequest) (*empty.Empty, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method AddUserEvent not implemented")
 }
@@ -322,6 +436,9 @@ func (UnimplementedBackendServer) GetUserEvents(context.Context, *GetEventsReque
 func (UnimplementedBackendServer) AddMetric(context.Context, *AddMetricRequest) (*empty.Empty, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method AddMetric not implemented")
 }
+func (UnimplementedBackendServer) AddMetricSummary(context.Context, *AddMetricSummaryRequest) (*empty.Empty, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method AddMetricSummary not implemented")
+}
 func (UnimplementedBackendServer) GetMetricTotal(context.Context, *GetMetricRequest) (*MetricTotalResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method GetMetricTotal not implemented")
 }
@@ -334,6 +451,15 @@ func (UnimplementedBackendServer) GetMetricRate(context.Context, *GetMetricRateR
 func (UnimplementedBackendServer) GetMetricStatistics(context.Context, *GetMetricRequest) (*MetricStatisticsResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method GetMetricStatistics not implemented")
 }
+func (UnimplementedBackendServer) GetMetricSeries(context.Context, *GetMetricSeriesRequest) (*MetricSeriesResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method GetMetricSeries not implemented")
+}
+func (UnimplementedBackendServer) GetMetricsSnapshot(context.Context, *GetMetricsSnapshotRequest) (*GetMetricsSnapshotResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method GetMetricsSnapshot not implemented")
+}
+func (UnimplementedBackendServer) CheckHealth(context.Context, *empty.Empty) (*empty.Empty, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method CheckHealth not implemented")
+}
 func (UnimplementedBackendServer) mustEmbedUnimplementedBackendServer() {}
 
 // UnsafeBackendServer may be embedded to opt out of forward compatibility for this service.
@@ -383,6 +509,24 @@ func _Backend_CreateScenario_Handler(srv interface{}, ctx context.Context, dec f
 	return interceptor(ctx, in, info, handler)
 }
 
+func _Backend_CreateScenarioPool_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(CreateScenarioPoolRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(BackendServer).CreateScenarioPool(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/backend.Backend/CreateScenarioPool",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(BackendServer).CreateScenarioPool(ctx, req.(*CreateScenarioPoolRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 func _Backend_CreateUsers_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(CreateUsersRequest)
 	if err := dec(in); err != nil {
@@ -563,6 +707,42 @@ func _Backend_MoveScenarioResult_Handler(srv interface{}, ctx context.Context, d
 	return interceptor(ctx, in, info, handler)
 }
 
+func _Backend_SetContextValue_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(SetContextValueRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(BackendServer).SetContextValue(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/backend.Backend/SetContextValue",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(BackendServer).SetContextValue(ctx, req.(*SetContextValueRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _Backend_GetContextValue_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(GetContextValueRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(BackendServer).GetContextValue(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/backend.Backend/GetContextValue",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(BackendServer).GetContextValue(ctx, req.(*GetContextValueRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 func _Backend_DistributeWork_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(DistributeWorkRequest)
 	if err := dec(in); err != nil {
@@ -599,6 +779,42 @@ func _Backend_GetUserWork_Handler(srv interface{}, ctx context.Context, dec func
 	return interceptor(ctx, in, info, handler)
 }
 
+func _Backend_DistributeWorkItems_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(DistributeWorkItemsRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(BackendServer).DistributeWorkItems(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/backend.Backend/DistributeWorkItems",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(BackendServer).DistributeWorkItems(ctx, req.(*DistributeWorkItemsRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _Backend_GetUserWorkItems_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(GetUserWorkRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(BackendServer).GetUserWorkItems(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/backend.Backend/GetUserWorkItems",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(BackendServer).GetUserWorkItems(ctx, req.(*GetUserWorkRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 func _Backend_AddUserEvent_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(AddEventRequest)
 	if err := dec(in); err != nil {
@@ -653,6 +869,24 @@ func _Backend_AddMetric_Handler(srv interface{}, ctx context.Context, dec func(i
 	return interceptor(ctx, in, info, handler)
 }
 
+func _Backend_AddMetricSummary_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(AddMetricSummaryRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(BackendServer).AddMetricSummary(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/backend.Backend/AddMetricSummary",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(BackendServer).AddMetricSummary(ctx, req.(*AddMetricSummaryRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 func _Backend_GetMetricTotal_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(GetMetricRequest)
 	if err := dec(in); err != nil {
@@ -725,6 +959,60 @@ func _Backend_GetMetricStatistics_Handler(srv interface{}, ctx context.Context,
 	return interceptor(ctx, in, info, handler)
 }
 
+func _Backend_GetMetricSeries_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(GetMetricSeriesRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(BackendServer).GetMetricSeries(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/backend.Backend/GetMetricSeries",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(BackendServer).GetMetricSeries(ctx, req.(*GetMetricSeriesRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _Backend_GetMetricsSnapshot_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(GetMetricsSnapshotRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(BackendServer).GetMetricsSnapshot(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/backend.Backend/GetMetricsSnapshot",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(BackendServer).GetMetricsSnapshot(ctx, req.(*GetMetricsSnapshotRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _Backend_CheckHealth_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(empty.Empty)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(BackendServer).CheckHealth(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: "/backend.Backend/CheckHealth",
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(BackendServer).CheckHealth(ctx, req.(*empty.Empty))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 // Backend_ServiceDesc is the grpc.ServiceDesc for Backend service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -740,6 +1028,10 @@ var Backend_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "CreateScenario",
 			Handler:    _Backend_CreateScenario_Handler,
 		},
+		{
+			MethodName: "CreateScenarioPool",
+			Handler:    _Backend_CreateScenarioPool_Handler,
+		},
 		{
 			MethodName: "CreateUsers",
 			Handler:    _Backend_CreateUsers_Handler,
@@ -780,6 +1072,14 @@ var Backend_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "MoveScenarioResult",
 			Handler:    _Backend_MoveScenarioResult_Handler,
 		},
+		{
+			MethodName: "SetContextValue",
+			Handler:    _Backend_SetContextValue_Handler,
+		},
+		{
+			MethodName: "GetContextValue",
+			Handler:    _Backend_GetContextValue_Handler,
+		},
 		{
 			MethodName: "DistributeWork",
 			Handler:    _Backend_DistributeWork_Handler,
@@ -788,6 +1088,14 @@ var Backend_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "GetUserWork",
 			Handler:    _Backend_GetUserWork_Handler,
 		},
+		{
+			MethodName: "DistributeWorkItems",
+			Handler:    _Backend_DistributeWorkItems_Handler,
+		},
+		{
+			MethodName: "GetUserWorkItems",
+			Handler:    _Backend_GetUserWorkItems_Handler,
+		},
 		{
 			MethodName: "AddUserEvent",
 			Handler:    _Backend_AddUserEvent_Handler,
@@ -800,6 +1108,10 @@ var Backend_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "AddMetric",
 			Handler:    _Backend_AddMetric_Handler,
 		},
+		{
+			MethodName: "AddMetricSummary",
+			Handler:    _Backend_AddMetricSummary_Handler,
+		},
 		{
 			MethodName: "GetMetricTotal",
 			Handler:    _Backend_GetMetricTotal_Handler,
@@ -816,6 +1128,18 @@ var Backend_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "GetMetricStatistics",
 			Handler:    _Backend_GetMetricStatistics_Handler,
 		},
+		{
+			MethodName: "GetMetricSeries",
+			Handler:    _Backend_GetMetricSeries_Handler,
+		},
+		{
+			MethodName: "GetMetricsSnapshot",
+			Handler:    _Backend_GetMetricsSnapshot_Handler,
+		},
+		{
+			MethodName: "CheckHealth",
+			Handler:    _Backend_CheckHealth_Handler,
+		},
 	},
 	Streams:  []grpc.StreamDesc{},
 	Metadata: "api/backend.proto",
@@ -56,6 +56,16 @@ func (s *Server) CreateScenario(ctx context.Context, in *api.CreateScenarioReque
 	return &api.CreateScenarioResponse{ScenarioID: scenarioID}, err
 }
 
+func (s *Server) CreateScenarioPool(ctx context.Context, in *api.CreateScenarioPoolRequest) (*api.CreateScenarioResponse, error) {
+	poolID, err := s.backend.CreateScenarioPool(in.GetScenarioID(), in.GetName())
+
+	if err != nil {
+		logrus.Error("Error creating scenario pool:", err)
+	}
+
+	return &api.CreateScenarioResponse{ScenarioID: poolID}, err
+}
+
 func (s *Server) CreateUsers(ctx context.Context, in *api.CreateUsersRequest) (*api.CreateUsersResponse, error) {
 	userManagerIDs, err := s.backend.CreateUsers(in.GetScenarioID(), in.GetTestID(), int(in.GetAmount()))
 
@@ -162,6 +172,7 @@ func (s *Server) SetScenarioResult(ctx context.Context, in *api.SetScenarioResul
 		in.GetTimeTaken(),
 		in.GetSucceeded(),
 		in.GetFailed(),
+		in.GetMaxUsers(),
 	)
 
 	if err != nil {
@@ -214,11 +225,37 @@ func (s *Server) MoveScenarioResult(ctx context.Context, in *api.MoveScenarioRes
 		TimeTaken: result.TimeTaken,
 		Succeeded: result.Succeeded,
 		Failed:    result.Failed,
+		MaxUsers:  result.MaxUsers,
 	}
 
 	return &response, nil
 }
 
+func (s *Server) SetContextValue(ctx context.Context, in *api.SetContextValueRequest) (*empty.Empty, error) {
+	err := s.backend.SetContextValue(in.GetHash(), in.GetValue())
+
+	if err != nil {
+		logrus.Error("Error setting context value:", err)
+	}
+
+	return &empty.Empty{}, err
+}
+
+func (s *Server) GetContextValue(ctx context.Context, in *api.GetContextValueRequest) (*api.GetContextValueResponse, error) {
+	value, err := s.backend.GetContextValue(in.GetHash())
+
+	if err == types.NotFound {
+		return nil, status.Error(codes.NotFound, fmt.Sprintf("Context value %s not found", in.GetHash()))
+	}
+
+	if err != nil {
+		logrus.Error("Error getting context value:", err)
+		return nil, fmt.Errorf("Error getting context value: %v", err)
+	}
+
+	return &api.GetContextValueResponse{Value: value}, nil
+}
+
 func (s *Server) DistributeWork(ctx context.Context, in *api.DistributeWorkRequest) (*empty.Empty, error) {
 	err := s.backend.DistributeWork(in.GetScenarioID(), int(in.GetAmount()))
 
@@ -239,6 +276,26 @@ func (s *Server) GetUserWork(ctx context.Context, in *api.GetUserWorkRequest) (*
 	return &api.GetUserWorkResponse{Work: int32(work)}, err
 }
 
+func (s *Server) DistributeWorkItems(ctx context.Context, in *api.DistributeWorkItemsRequest) (*empty.Empty, error) {
+	err := s.backend.DistributeWorkItems(in.GetScenarioID(), in.GetItems())
+
+	if err != nil {
+		logrus.Error("Error distributing work items:", err)
+	}
+
+	return &empty.Empty{}, err
+}
+
+func (s *Server) GetUserWorkItems(ctx context.Context, in *api.GetUserWorkRequest) (*api.GetUserWorkItemsResponse, error) {
+	items, err := s.backend.GetUserWorkItems(in.GetUserManagerID())
+
+	if err != nil {
+		logrus.Error("Error getting user work items:", err)
+	}
+
+	return &api.GetUserWorkItemsResponse{Items: items}, err
+}
+
 func (s *Server) AddUserEvent(ctx context.Context, in *api.AddEventRequest) (*empty.Empty, error) {
 	err := s.backend.AddUserEvent(
 		in.GetId(),
@@ -282,6 +339,28 @@ func (s *Server) AddMetric(ctx context.Context, in *api.AddMetricRequest) (*empt
 	return &empty.Empty{}, err
 }
 
+func (s *Server) AddMetricSummary(ctx context.Context, in *api.AddMetricSummaryRequest) (*empty.Empty, error) {
+	err := s.backend.AddMetricSummary(
+		in.GetScenarioID(),
+		in.GetName(),
+		&application.MetricSummary{
+			Count:        in.GetCount(),
+			Sum:          in.GetSum(),
+			Min:          in.GetMin(),
+			Max:          in.GetMax(),
+			Last:         in.GetLast(),
+			SumOfSquares: in.GetSumOfSquares(),
+			Histogram:    in.GetHistogram(),
+		},
+	)
+
+	if err != nil {
+		logrus.Error("Error adding metric summary:", err)
+	}
+
+	return &empty.Empty{}, err
+}
+
 func (s *Server) GetMetricTotal(ctx context.Context, in *api.GetMetricRequest) (*api.MetricTotalResponse, error) {
 	total, err := s.backend.GetMetricTotal(in.GetScenarioID(), in.GetName())
 
@@ -334,5 +413,123 @@ func (s *Server) GetMetricStatistics(ctx context.Context, in *api.GetMetricReque
 		Median:  stats.Median,
 		Average: stats.Average,
 		Len:     stats.Len,
+		Stddev:  stats.Stddev,
 	}, err
 }
+
+func (s *Server) GetMetricSeries(ctx context.Context, in *api.GetMetricSeriesRequest) (*api.MetricSeriesResponse, error) {
+	points, err := s.backend.GetMetricSeries(
+		in.GetScenarioID(),
+		in.GetName(),
+		in.GetFromTimestamp(),
+		in.GetToTimestamp(),
+		in.GetStep(),
+	)
+
+	if err != nil {
+		logrus.Error("Error getting metric series:", err)
+		return nil, err
+	}
+
+	responsePoints := []*api.MetricSeriesPoint{}
+
+	for _, point := range points {
+		responsePoints = append(responsePoints, &api.MetricSeriesPoint{
+			Timestamp: point.Timestamp,
+			Count:     point.Count,
+			Sum:       point.Sum,
+			Min:       point.Min,
+			Max:       point.Max,
+			Average:   point.Average,
+			Stddev:    point.Stddev,
+		})
+	}
+
+	return &api.MetricSeriesResponse{Points: responsePoints}, nil
+}
+
+func (s *Server) GetMetricsSnapshot(ctx context.Context, in *api.GetMetricsSnapshotRequest) (*api.GetMetricsSnapshotResponse, error) {
+	results := []*api.MetricQueryResult{}
+
+	for _, query := range in.GetQueries() {
+		result, err := s.getMetricQueryResult(query)
+
+		if err == types.NotFound {
+			result = &api.MetricQueryResult{Found: false}
+		} else if err != nil {
+			logrus.Error("Error getting metrics snapshot:", err)
+			return nil, err
+		}
+
+		results = append(results, result)
+	}
+
+	return &api.GetMetricsSnapshotResponse{Results: results}, nil
+}
+
+func (s *Server) getMetricQueryResult(query *api.MetricQuery) (*api.MetricQueryResult, error) {
+	switch query.GetKind() {
+	case "total":
+		total, err := s.backend.GetMetricTotal(query.GetScenarioID(), query.GetName())
+		return &api.MetricQueryResult{Found: true, Value: total}, err
+	case "last":
+		last, err := s.backend.GetLastMetric(query.GetScenarioID(), query.GetName())
+		return &api.MetricQueryResult{Found: true, Value: last}, err
+	case "rate":
+		rate, err := s.backend.GetRate(query.GetScenarioID(), query.GetName(), query.GetSplitPoint())
+		return &api.MetricQueryResult{Found: true, Value: rate}, err
+	case "statistics":
+		stats, err := s.backend.GetMetricStatistics(query.GetScenarioID(), query.GetName())
+
+		if err != nil {
+			return nil, err
+		}
+
+		return &api.MetricQueryResult{
+			Found: true,
+			Statistics: &api.MetricStatisticsResponse{
+				Min:     stats.Min,
+				Max:     stats.Max,
+				Median:  stats.Median,
+				Average: stats.Average,
+				Len:     stats.Len,
+				Stddev:  stats.Stddev,
+			},
+		}, nil
+	case "series":
+		points, err := s.backend.GetMetricSeries(
+			query.GetScenarioID(),
+			query.GetName(),
+			query.GetFromTimestamp(),
+			query.GetToTimestamp(),
+			query.GetStep(),
+		)
+
+		if err != nil {
+			return nil, err
+		}
+
+		responsePoints := []*api.MetricSeriesPoint{}
+
+		for _, point := range points {
+			responsePoints = append(responsePoints, &api.MetricSeriesPoint{
+				Timestamp: point.Timestamp,
+				Count:     point.Count,
+				Sum:       point.Sum,
+				Min:       point.Min,
+				Max:       point.Max,
+				Average:   point.Average,
+				Stddev:    point.Stddev,
+			})
+		}
+
+		return &api.MetricQueryResult{Found: true, Points: responsePoints}, nil
+	default:
+		return nil, status.Error(codes.InvalidArgument, fmt.Sprintf("Unknown metric query kind %s", query.GetKind()))
+	}
+}
+
+func (s *Server) CheckHealth(ctx context.Context, in *empty.Empty) (*empty.Empty, error) {
+	// NOTE: server is only started once backend is configured, so serving means ready
+	return &empty.Empty{}, nil
+}
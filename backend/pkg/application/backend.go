@@ -15,6 +15,9 @@ type Datastore interface {
 	CreateTest(backendAddress, schedulingMetadata string, tags []string, env map[string]string) (string, error)
 	GetTest(testID string) (*Test, error)
 	CreateScenario(testID, scenarioName, context string, usersPerInstance int, tags []string) (string, error)
+	CreateScenarioPool(scenarioID, name string) (string, error)
+	SetContextValue(hash string, value []byte) error
+	GetContextValue(hash string) ([]byte, error)
 	GetScenario(scenarioID string) (*Scenario, error)
 	CreateUsers(scenarioID string, amount int) ([]string, error)
 	StopUsers(scenarioID string, amount int) ([]string, error)
@@ -29,16 +32,21 @@ type Datastore interface {
 		timeTaken float64,
 		succeeded int32,
 		failed int32,
+		maxUsers int32,
 	) error
 	MoveUserResults(scenarioID string, limit int) ([][]byte, error)
 	MoveScenarioResult(scenarioID string) (*ScenarioResult, error)
 	DistributeWork(scenarioID string, amount int) error
 	GetUserWork(userManagerID string) (int, error)
+	DistributeWorkItems(scenarioID string, items [][]byte) error
+	GetUserWorkItems(userManagerID string) ([][]byte, error)
 	AddUserEvent(scenarioID, kind string, payload []byte) error
 	GetUserEvents(userManagerID, kind string) ([]Event, error)
 	AddMetric(scenarioID, name string, value float64) error
+	AddMetricSummary(scenarioID, name string, summary *MetricSummary) error
 	GetLastMetric(scenarioID, name string) (float64, error)
 	GetMetricStatistics(scenarioID, name string) (*MetricStatistics, error)
+	GetMetricSeries(scenarioID, name string, from, to, step int64) ([]*MetricSeriesPoint, error)
 	GetMetricTotal(scenarioID, name string) (float64, error)
 	GetRate(scenarioID, name string, splitPoint float64) (float64, error)
 }
@@ -95,6 +103,7 @@ type ScenarioResult struct {
 	TimeTaken float64
 	Succeeded int32
 	Failed    int32
+	MaxUsers  int32
 }
 
 type MetricStatistics struct {
@@ -103,6 +112,28 @@ type MetricStatistics struct {
 	Median  float64
 	Average float64
 	Len     int64
+	Stddev  float64
+}
+
+type MetricSummary struct {
+	Count        int64
+	Sum          float64
+	Min          float64
+	Max          float64
+	Last         float64
+	SumOfSquares float64
+	// NOTE: not kept in metric series buckets
+	Histogram map[int32]int64 `msgpack:"-"`
+}
+
+type MetricSeriesPoint struct {
+	Timestamp int64
+	Count     int64
+	Sum       float64
+	Min       float64
+	Max       float64
+	Average   float64
+	Stddev    float64
 }
 
 func (b *Backend) CreateTest(backendAddress, schedulingMetadata string, tags []string, env map[string]string) (string, error) {
@@ -157,6 +188,18 @@ func (b *Backend) CreateScenario(
 	return scenarioID, nil
 }
 
+func (b *Backend) CreateScenarioPool(scenarioID, name string) (string, error) {
+	return b.datastore.CreateScenarioPool(scenarioID, name)
+}
+
+func (b *Backend) SetContextValue(hash string, value []byte) error {
+	return b.datastore.SetContextValue(hash, value)
+}
+
+func (b *Backend) GetContextValue(hash string) ([]byte, error) {
+	return b.datastore.GetContextValue(hash)
+}
+
 func (b *Backend) CreateUsers(scenarioID string, testID string, amount int) ([]string, error) {
 	test, err := b.datastore.GetTest(testID)
 
@@ -273,8 +316,9 @@ func (b *Backend) SetScenarioResult(
 	timeTaken float64,
 	succeeded int32,
 	failed int32,
+	maxUsers int32,
 ) error {
-	return b.datastore.SetScenarioResult(scenarioID, output, exception, logs, timeTaken, succeeded, failed)
+	return b.datastore.SetScenarioResult(scenarioID, output, exception, logs, timeTaken, succeeded, failed, maxUsers)
 }
 
 func (b *Backend) MoveUserResults(scenarioID string, limit int) ([][]byte, error) {
@@ -293,6 +337,14 @@ func (b *Backend) GetUserWork(userManagerID string) (int, error) {
 	return b.datastore.GetUserWork(userManagerID)
 }
 
+func (b *Backend) DistributeWorkItems(scenarioID string, items [][]byte) error {
+	return b.datastore.DistributeWorkItems(scenarioID, items)
+}
+
+func (b *Backend) GetUserWorkItems(userManagerID string) ([][]byte, error) {
+	return b.datastore.GetUserWorkItems(userManagerID)
+}
+
 func (b *Backend) AddUserEvent(scenarioID, kind string, payload []byte) error {
 	return b.datastore.AddUserEvent(scenarioID, kind, payload)
 }
@@ -305,6 +357,10 @@ func (b *Backend) AddMetric(scenarioID, name string, value float64) error {
 	return b.datastore.AddMetric(scenarioID, name, value)
 }
 
+func (b *Backend) AddMetricSummary(scenarioID, name string, summary *MetricSummary) error {
+	return b.datastore.AddMetricSummary(scenarioID, name, summary)
+}
+
 func (b *Backend) GetLastMetric(scenarioID, name string) (float64, error) {
 	return b.datastore.GetLastMetric(scenarioID, name)
 }
@@ -313,6 +369,10 @@ func (b *Backend) GetMetricStatistics(scenarioID, name string) (*MetricStatistic
 	return b.datastore.GetMetricStatistics(scenarioID, name)
 }
 
+func (b *Backend) GetMetricSeries(scenarioID, name string, from, to, step int64) ([]*MetricSeriesPoint, error) {
+	return b.datastore.GetMetricSeries(scenarioID, name, from, to, step)
+}
+
 func (b *Backend) GetMetricTotal(scenarioID, name string) (float64, error) {
 	return b.datastore.GetMetricTotal(scenarioID, name)
 }
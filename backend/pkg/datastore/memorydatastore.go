@@ -8,6 +8,9 @@ import (
 	"io"
 	"math"
 	"math/rand"
+	"sort"
+	"strconv"
+	"sync"
 	"time"
 
 	"github.com/cicadatesting/backend/pkg/application"
@@ -44,6 +47,10 @@ func scenarioResultKey(scenarioID string) string {
 	return fmt.Sprintf("%s-result", scenarioID)
 }
 
+func contextValueKey(hash string) string {
+	return fmt.Sprintf("context-%s", hash)
+}
+
 func scenarioUserManagersKey(scenarioID string) string {
 	return fmt.Sprintf("%s-user-managers", scenarioID)
 }
@@ -52,6 +59,14 @@ func scenarioBufferedWorkKey(scenarioID string) string {
 	return fmt.Sprintf("%s-buffered-work", scenarioID)
 }
 
+func userWorkItemsKey(userManagerID string) string {
+	return fmt.Sprintf("%s-work-items", userManagerID)
+}
+
+func scenarioBufferedWorkItemsKey(scenarioID string) string {
+	return fmt.Sprintf("%s-buffered-work-items", scenarioID)
+}
+
 func scenarioBufferedEventsKey(scenarioID string) string {
 	return fmt.Sprintf("%s-buffered-events", scenarioID)
 }
@@ -75,8 +90,51 @@ func metricsLastKey(scenarioID, name string) string {
 	return fmt.Sprintf("%s-%s-metrics-last", scenarioID, name)
 }
 
+func metricsCountKey(scenarioID, name string) string {
+	return fmt.Sprintf("%s-%s-metrics-count", scenarioID, name)
+}
+
+func metricsSumSquaresKey(scenarioID, name string) string {
+	return fmt.Sprintf("%s-%s-metrics-sum-squares", scenarioID, name)
+}
+
+func metricsMinKey(scenarioID, name string) string {
+	return fmt.Sprintf("%s-%s-metrics-min", scenarioID, name)
+}
+
+func metricsMaxKey(scenarioID, name string) string {
+	return fmt.Sprintf("%s-%s-metrics-max", scenarioID, name)
+}
+
+func metricsHistogramKey(scenarioID, name string) string {
+	return fmt.Sprintf("%s-%s-metrics-histogram", scenarioID, name)
+}
+
+func metricSeriesKey(scenarioID, name string, width int64) string {
+	return fmt.Sprintf("%s-%s-metrics-series-%d", scenarioID, name, width)
+}
+
+// seriesTier is a resolution metric series buckets are stored at. Buckets older
+// than the retention of their tier are rolled up into the next tier so memory
+// stays bounded for long running scenarios.
+type seriesTier struct {
+	width     int64
+	retention int64
+}
+
+var metricSeriesTiers = []seriesTier{
+	{width: 1, retention: 10 * 60},
+	{width: 60, retention: 24 * 60 * 60},
+	{width: 60 * 60, retention: math.MaxInt64},
+}
+
+// NOTE: must match log buckets summaries are counted in by cicadad
+const metricBucketGrowth = 1.01
+
 type MemoryDatastore struct {
-	dc IDatastoreCommands
+	dc            IDatastoreCommands
+	seriesLock    sync.Mutex
+	histogramLock sync.Mutex
 }
 
 type IDatastoreCommands interface {
@@ -243,6 +301,32 @@ func (datastore *MemoryDatastore) CreateScenario(testID, scenarioName, context s
 	return scenarioID, nil
 }
 
+func (datastore *MemoryDatastore) CreateScenarioPool(scenarioID, name string) (string, error) {
+	// NOTE: a pool is a copy of the scenario with its own users, work, events and
+	// results, run by the same scenario process
+	scenario, err := datastore.GetScenario(scenarioID)
+
+	if err != nil {
+		return "", err
+	}
+
+	scenario.ScenarioID = fmt.Sprintf("%s-%s", scenarioID, name)
+
+	b, err := msgpack.Marshal(scenario)
+
+	if err != nil {
+		return "", fmt.Errorf("Error marshalling scenario pool: %v", err)
+	}
+
+	err = datastore.dc.Set(scenario.ScenarioID, b, time.Hour)
+
+	if err != nil {
+		return "", fmt.Errorf("Error setting scenario pool in datastore: %v", err)
+	}
+
+	return scenario.ScenarioID, nil
+}
+
 func (datastore *MemoryDatastore) GetScenario(scenarioID string) (*application.Scenario, error) {
 	b, err := datastore.dc.GetBytes(scenarioID)
 
@@ -380,6 +464,12 @@ func (datastore *MemoryDatastore) CreateUsers(scenarioID string, amount int) ([]
 		return nil, fmt.Errorf("Error distributing buffered work: %v", err)
 	}
 
+	err = datastore.distributeBufferedWorkItems(scenarioID)
+
+	if err != nil {
+		return nil, fmt.Errorf("Error distributing buffered work items: %v", err)
+	}
+
 	err = datastore.distributeBufferedUserEvents(scenarioID)
 
 	if err != nil {
@@ -487,6 +577,7 @@ func (datastore *MemoryDatastore) SetScenarioResult(
 	timeTaken float64,
 	succeeded int32,
 	failed int32,
+	maxUsers int32,
 ) error {
 	// set scenario result key
 	// set expiration?
@@ -500,6 +591,7 @@ func (datastore *MemoryDatastore) SetScenarioResult(
 		TimeTaken: timeTaken,
 		Succeeded: succeeded,
 		Failed:    failed,
+		MaxUsers:  maxUsers,
 	}
 
 	b, err := msgpack.Marshal(&result)
@@ -580,6 +672,30 @@ func (datastore *MemoryDatastore) MoveScenarioResult(scenarioID string) (*applic
 	return &result, nil
 }
 
+func (datastore *MemoryDatastore) SetContextValue(hash string, value []byte) error {
+	err := datastore.dc.Set(contextValueKey(hash), value, time.Hour)
+
+	if err != nil {
+		return fmt.Errorf("Error saving context value: %v", err)
+	}
+
+	return nil
+}
+
+func (datastore *MemoryDatastore) GetContextValue(hash string) ([]byte, error) {
+	b, err := datastore.dc.GetBytes(contextValueKey(hash))
+
+	if err == types.NotFound {
+		return nil, types.NotFound
+	}
+
+	if err != nil {
+		return nil, fmt.Errorf("Error getting context value: %v", err)
+	}
+
+	return b, nil
+}
+
 func (datastore *MemoryDatastore) DistributeWork(scenarioID string, amount int) error {
 	// for each user ID, determine amount of work
 	// rpush work into each user work key
@@ -682,6 +798,112 @@ func (datastore *MemoryDatastore) GetUserWork(userManagerID string) (int, error)
 	return totalWork, nil
 }
 
+func (datastore *MemoryDatastore) DistributeWorkItems(scenarioID string, items [][]byte) error {
+	// NOTE: items are split into one chunk per user manager to keep a single
+	// datastore write per user manager, regardless of number of items
+	if len(items) < 1 {
+		return nil
+	}
+
+	userManagers, err := datastore.dc.MapGetKeys(scenarioUserManagersKey(scenarioID))
+
+	if err != nil {
+		return fmt.Errorf("Error getting scenario user manager: %v", err)
+	}
+
+	numUserManagers := len(userManagers)
+
+	if numUserManagers < 1 {
+		b, err := msgpack.Marshal(items)
+
+		if err != nil {
+			return fmt.Errorf("Error encoding work items: %v", err)
+		}
+
+		err = datastore.dc.ListPush(scenarioBufferedWorkItemsKey(scenarioID), b)
+
+		if err != nil {
+			return fmt.Errorf("Error adding buffered work items: %v", err)
+		}
+
+		return nil
+	}
+
+	rand.Seed(time.Now().Unix())
+	rand.Shuffle(numUserManagers, func(i, j int) {
+		userManagers[i], userManagers[j] = userManagers[j], userManagers[i]
+	})
+
+	chunks := make([][][]byte, numUserManagers)
+
+	for i, item := range items {
+		chunks[i%numUserManagers] = append(chunks[i%numUserManagers], item)
+	}
+
+	for i, chunk := range chunks {
+		if len(chunk) < 1 {
+			continue
+		}
+
+		b, err := msgpack.Marshal(chunk)
+
+		if err != nil {
+			return fmt.Errorf("Error encoding work items: %v", err)
+		}
+
+		err = datastore.dc.ListPush(userWorkItemsKey(userManagers[i]), b)
+
+		if err != nil {
+			return fmt.Errorf("Error adding work items: %v", err)
+		}
+	}
+
+	return nil
+}
+
+func (datastore *MemoryDatastore) popWorkItems(key string) ([][]byte, error) {
+	len, err := datastore.dc.ListLength(key)
+
+	if err != nil {
+		return nil, fmt.Errorf("Error getting work items count: %v", err)
+	}
+
+	items := [][]byte{}
+
+	for i := int64(0); i < len; i++ {
+		b, err := datastore.dc.ListPopBytes(key)
+
+		if err != nil {
+			return nil, fmt.Errorf("Error getting work items: %v", err)
+		}
+
+		chunk := [][]byte{}
+		err = msgpack.Unmarshal(b, &chunk)
+
+		if err != nil {
+			return nil, fmt.Errorf("Error loading work items: %v", err)
+		}
+
+		items = append(items, chunk...)
+	}
+
+	return items, nil
+}
+
+func (datastore *MemoryDatastore) distributeBufferedWorkItems(scenarioID string) error {
+	items, err := datastore.popWorkItems(scenarioBufferedWorkItemsKey(scenarioID))
+
+	if err != nil {
+		return err
+	}
+
+	return datastore.DistributeWorkItems(scenarioID, items)
+}
+
+func (datastore *MemoryDatastore) GetUserWorkItems(userManagerID string) ([][]byte, error) {
+	return datastore.popWorkItems(userWorkItemsKey(userManagerID))
+}
+
 func (datastore *MemoryDatastore) GetUserEvents(userManagerID, kind string) ([]application.Event, error) {
 	// FEATURE: limit events returned
 	return datastore.getEvents(userEventKey(userManagerID, kind))
@@ -778,9 +1000,211 @@ func (datastore *MemoryDatastore) AddMetric(scenarioID, name string, value float
 		return fmt.Errorf("Error setting metric: %v", err)
 	}
 
+	return datastore.addToMetricSeries(scenarioID, name, &application.MetricSummary{
+		Count:        1,
+		Sum:          value,
+		Min:          value,
+		Max:          value,
+		Last:         value,
+		SumOfSquares: value * value,
+	})
+}
+
+func (datastore *MemoryDatastore) AddMetricSummary(scenarioID, name string, summary *application.MetricSummary) error {
+	// NOTE: summaries are merged into the same totals raw metrics use, except for the set
+	if summary.Count < 1 {
+		return nil
+	}
+
+	err := datastore.dc.IncrementCounter(metricsIncKey(scenarioID, name), summary.Sum)
+
+	if err != nil {
+		return fmt.Errorf("Error adding metric count: %v", err)
+	}
+
+	err = datastore.dc.IncrementCounter(metricsCountKey(scenarioID, name), float64(summary.Count))
+
+	if err != nil {
+		return fmt.Errorf("Error adding metric summary count: %v", err)
+	}
+
+	err = datastore.dc.IncrementCounter(metricsSumSquaresKey(scenarioID, name), summary.SumOfSquares)
+
+	if err != nil {
+		return fmt.Errorf("Error adding metric sum of squares: %v", err)
+	}
+
+	min, err := datastore.dc.GetFloat(metricsMinKey(scenarioID, name))
+
+	if err != nil && err != types.NotFound {
+		return fmt.Errorf("Error getting metric min: %v", err)
+	}
+
+	if err == types.NotFound || summary.Min < min {
+		min = summary.Min
+	}
+
+	err = datastore.dc.Set(metricsMinKey(scenarioID, name), min, time.Hour)
+
+	if err != nil {
+		return fmt.Errorf("Error setting metric min: %v", err)
+	}
+
+	max, err := datastore.dc.GetFloat(metricsMaxKey(scenarioID, name))
+
+	if err != nil && err != types.NotFound {
+		return fmt.Errorf("Error getting metric max: %v", err)
+	}
+
+	if err == types.NotFound || summary.Max > max {
+		max = summary.Max
+	}
+
+	err = datastore.dc.Set(metricsMaxKey(scenarioID, name), max, time.Hour)
+
+	if err != nil {
+		return fmt.Errorf("Error setting metric max: %v", err)
+	}
+
+	err = datastore.dc.Set(metricsLastKey(scenarioID, name), summary.Last, time.Hour)
+
+	if err != nil {
+		return fmt.Errorf("Error setting metric: %v", err)
+	}
+
+	err = datastore.addToMetricHistogram(scenarioID, name, summary.Histogram)
+
+	if err != nil {
+		return err
+	}
+
+	return datastore.addToMetricSeries(scenarioID, name, summary)
+}
+
+func (datastore *MemoryDatastore) getMetricHistogram(scenarioID, name string) (map[int32]int64, error) {
+	b, err := datastore.dc.GetBytes(metricsHistogramKey(scenarioID, name))
+
+	if err == types.NotFound {
+		return map[int32]int64{}, nil
+	}
+
+	if err != nil {
+		return nil, fmt.Errorf("Error getting metric histogram: %v", err)
+	}
+
+	histogram := map[int32]int64{}
+
+	err = msgpack.Unmarshal(b, &histogram)
+
+	if err != nil {
+		return nil, fmt.Errorf("Error decoding metric histogram: %v", err)
+	}
+
+	return histogram, nil
+}
+
+func (datastore *MemoryDatastore) addToMetricHistogram(scenarioID, name string, counts map[int32]int64) error {
+	if len(counts) < 1 {
+		return nil
+	}
+
+	datastore.histogramLock.Lock()
+	defer datastore.histogramLock.Unlock()
+
+	histogram, err := datastore.getMetricHistogram(scenarioID, name)
+
+	if err != nil {
+		return err
+	}
+
+	for index, count := range counts {
+		histogram[index] += count
+	}
+
+	b, err := msgpack.Marshal(histogram)
+
+	if err != nil {
+		return fmt.Errorf("Error encoding metric histogram: %v", err)
+	}
+
+	err = datastore.dc.Set(metricsHistogramKey(scenarioID, name), b, time.Hour)
+
+	if err != nil {
+		return fmt.Errorf("Error setting metric histogram: %v", err)
+	}
+
 	return nil
 }
 
+// histogramBucketValue gets midpoint of a log bucket, limited to the values seen
+func histogramBucketValue(index int32, min, max float64) float64 {
+	value := math.Pow(metricBucketGrowth, float64(index)+0.5)
+
+	return math.Min(math.Max(value, min), max)
+}
+
+func histogramMedian(histogram map[int32]int64, min, max float64) float64 {
+	indexes := []int{}
+	total := int64(0)
+
+	for index, count := range histogram {
+		indexes = append(indexes, int(index))
+		total += count
+	}
+
+	sort.Ints(indexes)
+
+	rank := (total + 1) / 2
+	seen := int64(0)
+
+	for _, index := range indexes {
+		seen += histogram[int32(index)]
+
+		if seen >= rank {
+			return histogramBucketValue(int32(index), min, max)
+		}
+	}
+
+	return 0
+}
+
+func (datastore *MemoryDatastore) getMetricSummary(scenarioID, name string) (*application.MetricSummary, error) {
+	count, err := datastore.dc.GetFloat(metricsCountKey(scenarioID, name))
+
+	if err == types.NotFound {
+		return nil, types.NotFound
+	}
+
+	if err != nil {
+		return nil, fmt.Errorf("Error getting metric summary count: %v", err)
+	}
+
+	sumOfSquares, err := datastore.dc.GetFloat(metricsSumSquaresKey(scenarioID, name))
+
+	if err != nil {
+		return nil, fmt.Errorf("Error getting metric sum of squares: %v", err)
+	}
+
+	min, err := datastore.dc.GetFloat(metricsMinKey(scenarioID, name))
+
+	if err != nil {
+		return nil, fmt.Errorf("Error getting metric min: %v", err)
+	}
+
+	max, err := datastore.dc.GetFloat(metricsMaxKey(scenarioID, name))
+
+	if err != nil {
+		return nil, fmt.Errorf("Error getting metric max: %v", err)
+	}
+
+	return &application.MetricSummary{
+		Count:        int64(count),
+		Min:          min,
+		Max:          max,
+		SumOfSquares: sumOfSquares,
+	}, nil
+}
+
 func (datastore *MemoryDatastore) GetLastMetric(scenarioID, name string) (float64, error) {
 	last, err := datastore.dc.GetFloat(metricsLastKey(scenarioID, name))
 
@@ -796,20 +1220,57 @@ func (datastore *MemoryDatastore) GetLastMetric(scenarioID, name string) (float6
 }
 
 func (datastore *MemoryDatastore) GetMetricStatistics(scenarioID, name string) (*application.MetricStatistics, error) {
-	min, err := datastore.dc.GetMin(metricSetKey(scenarioID, name))
+	summary, err := datastore.getMetricSummary(scenarioID, name)
+
+	if err != nil && err != types.NotFound {
+		return nil, err
+	}
+
+	len, err := datastore.dc.GetCardinality(metricSetKey(scenarioID, name))
+
+	if err != nil {
+		return nil, fmt.Errorf("Error getting stats count: %v", err)
+	}
+
+	if len < 1 && summary == nil {
+		return nil, types.NotFound
+	}
+
+	total, err := datastore.dc.GetFloat(metricsIncKey(scenarioID, name))
 
 	if err == types.NotFound {
 		return nil, types.NotFound
 	}
 
 	if err != nil {
-		return nil, fmt.Errorf("Error getting min: %v", err)
+		return nil, fmt.Errorf("Error getting total: %v", err)
 	}
 
-	len, err := datastore.dc.GetCardinality(metricSetKey(scenarioID, name))
+	if len < 1 {
+		// Only summaries were reported for this metric; median is estimated from log buckets
+		histogram, err := datastore.getMetricHistogram(scenarioID, name)
+
+		if err != nil {
+			return nil, err
+		}
+
+		average := total / float64(summary.Count)
+		variance := summary.SumOfSquares/float64(summary.Count) - average*average
+
+		return &application.MetricStatistics{
+			Min:     summary.Min,
+			Max:     summary.Max,
+			Median:  histogramMedian(histogram, summary.Min, summary.Max),
+			Average: average,
+			Len:     summary.Count,
+			Stddev:  math.Sqrt(math.Max(variance, 0)),
+		}, nil
+	}
+
+	min, err := datastore.dc.GetMin(metricSetKey(scenarioID, name))
 
 	if err != nil {
-		return nil, fmt.Errorf("Error getting stats count: %v", err)
+		return nil, fmt.Errorf("Error getting min: %v", err)
 	}
 
 	max, err := datastore.dc.GetMax(metricSetKey(scenarioID, name), len)
@@ -824,24 +1285,22 @@ func (datastore *MemoryDatastore) GetMetricStatistics(scenarioID, name string) (
 		return nil, fmt.Errorf("Error getting median: %v", err)
 	}
 
-	total, err := datastore.dc.GetFloat(metricsIncKey(scenarioID, name))
-
-	if err == types.NotFound {
-		return nil, types.NotFound
-	}
+	count := len
 
-	if err != nil {
-		return nil, fmt.Errorf("Error getting total: %v", err)
+	if summary != nil {
+		count += summary.Count
+		min = math.Min(min, summary.Min)
+		max = math.Max(max, summary.Max)
 	}
 
-	average := total / float64(len)
+	average := total / float64(count)
 
 	return &application.MetricStatistics{
 		Min:     min,
 		Max:     max,
 		Median:  median,
 		Average: average,
-		Len:     len,
+		Len:     count,
 	}, nil
 }
 
@@ -862,11 +1321,7 @@ func (datastore *MemoryDatastore) GetMetricTotal(scenarioID, name string) (float
 func (datastore *MemoryDatastore) GetRate(scenarioID, name string, splitPoint float64) (float64, error) {
 	count, err := datastore.dc.RangeCount(metricSetKey(scenarioID, name), splitPoint, -1)
 
-	if err == types.NotFound {
-		return 0, types.NotFound
-	}
-
-	if err != nil {
+	if err != nil && err != types.NotFound {
 		return 0, fmt.Errorf("Error getting rate: %v", err)
 	}
 
@@ -876,5 +1331,232 @@ func (datastore *MemoryDatastore) GetRate(scenarioID, name string, splitPoint fl
 		return 0, fmt.Errorf("Error getting stats count: %v", err)
 	}
 
+	// NOTE: values reported in summaries are counted by the log bucket they fall in
+	summary, err := datastore.getMetricSummary(scenarioID, name)
+
+	if err != nil && err != types.NotFound {
+		return 0, err
+	}
+
+	if summary != nil {
+		histogram, err := datastore.getMetricHistogram(scenarioID, name)
+
+		if err != nil {
+			return 0, err
+		}
+
+		for index, bucketCount := range histogram {
+			if histogramBucketValue(index, summary.Min, summary.Max) >= splitPoint {
+				count += bucketCount
+			}
+
+			len += bucketCount
+		}
+	}
+
+	if len < 1 {
+		return 0, types.NotFound
+	}
+
 	return float64(count) / float64(len), nil
 }
+
+func mergeMetricSummaries(a, b *application.MetricSummary) *application.MetricSummary {
+	if a == nil {
+		return b
+	}
+
+	return &application.MetricSummary{
+		Count:        a.Count + b.Count,
+		Sum:          a.Sum + b.Sum,
+		Min:          math.Min(a.Min, b.Min),
+		Max:          math.Max(a.Max, b.Max),
+		Last:         b.Last,
+		SumOfSquares: a.SumOfSquares + b.SumOfSquares,
+	}
+}
+
+func (datastore *MemoryDatastore) getMetricSeriesBucket(key, bucket string) (*application.MetricSummary, error) {
+	b, err := datastore.dc.MapGetKeyBytes(key, bucket)
+
+	if err != nil {
+		return nil, fmt.Errorf("Error getting metric series bucket: %v", err)
+	}
+
+	if b == nil {
+		return nil, nil
+	}
+
+	var summary application.MetricSummary
+
+	err = msgpack.Unmarshal(b, &summary)
+
+	if err != nil {
+		return nil, fmt.Errorf("Error decoding metric series bucket: %v", err)
+	}
+
+	return &summary, nil
+}
+
+func (datastore *MemoryDatastore) mergeIntoMetricSeries(
+	scenarioID, name string,
+	tier int,
+	start int64,
+	summary *application.MetricSummary,
+	now int64,
+) error {
+	key := metricSeriesKey(scenarioID, name, metricSeriesTiers[tier].width)
+	bucket := strconv.FormatInt(start-start%metricSeriesTiers[tier].width, 10)
+
+	existing, err := datastore.getMetricSeriesBucket(key, bucket)
+
+	if err != nil {
+		return err
+	}
+
+	b, err := msgpack.Marshal(mergeMetricSummaries(existing, summary))
+
+	if err != nil {
+		return fmt.Errorf("Error encoding metric series bucket: %v", err)
+	}
+
+	err = datastore.dc.MapSetKey(key, bucket, b)
+
+	if err != nil {
+		return fmt.Errorf("Error setting metric series bucket: %v", err)
+	}
+
+	// NOTE: only check for expired buckets when a new bucket is started in this tier
+	if existing != nil || tier == len(metricSeriesTiers)-1 {
+		return nil
+	}
+
+	return datastore.rollUpMetricSeries(scenarioID, name, tier, now)
+}
+
+func (datastore *MemoryDatastore) rollUpMetricSeries(scenarioID, name string, tier int, now int64) error {
+	key := metricSeriesKey(scenarioID, name, metricSeriesTiers[tier].width)
+	buckets, err := datastore.dc.MapGetKeys(key)
+
+	if err != nil {
+		return fmt.Errorf("Error getting metric series buckets: %v", err)
+	}
+
+	for _, bucket := range buckets {
+		start, err := strconv.ParseInt(bucket, 10, 64)
+
+		if err != nil {
+			return fmt.Errorf("Error parsing metric series bucket: %v", err)
+		}
+
+		if now-start <= metricSeriesTiers[tier].retention {
+			continue
+		}
+
+		summary, err := datastore.getMetricSeriesBucket(key, bucket)
+
+		if err != nil {
+			return err
+		}
+
+		if summary != nil {
+			err = datastore.mergeIntoMetricSeries(scenarioID, name, tier+1, start, summary, now)
+
+			if err != nil {
+				return err
+			}
+		}
+
+		err = datastore.dc.MapKeyDelete(key, bucket)
+
+		if err != nil {
+			return fmt.Errorf("Error removing metric series bucket: %v", err)
+		}
+	}
+
+	return nil
+}
+
+func (datastore *MemoryDatastore) addToMetricSeries(scenarioID, name string, summary *application.MetricSummary) error {
+	datastore.seriesLock.Lock()
+	defer datastore.seriesLock.Unlock()
+
+	now := time.Now().Unix()
+
+	return datastore.mergeIntoMetricSeries(scenarioID, name, 0, now, summary, now)
+}
+
+func (datastore *MemoryDatastore) GetMetricSeries(scenarioID, name string, from, to, step int64) ([]*application.MetricSeriesPoint, error) {
+	// NOTE: buckets that were rolled up are counted in the point their start falls in
+	if step < 1 {
+		step = 1
+	}
+
+	if to < 1 {
+		to = time.Now().Unix() + 1
+	}
+
+	windows := map[int64]*application.MetricSummary{}
+
+	for _, tier := range metricSeriesTiers {
+		key := metricSeriesKey(scenarioID, name, tier.width)
+		buckets, err := datastore.dc.MapGetKeys(key)
+
+		if err != nil {
+			return nil, fmt.Errorf("Error getting metric series buckets: %v", err)
+		}
+
+		for _, bucket := range buckets {
+			start, err := strconv.ParseInt(bucket, 10, 64)
+
+			if err != nil {
+				return nil, fmt.Errorf("Error parsing metric series bucket: %v", err)
+			}
+
+			if start+tier.width <= from || start >= to {
+				continue
+			}
+
+			summary, err := datastore.getMetricSeriesBucket(key, bucket)
+
+			if err != nil {
+				return nil, err
+			}
+
+			if summary == nil {
+				continue
+			}
+
+			window := from + (int64(math.Max(float64(start-from), 0))/step)*step
+			windows[window] = mergeMetricSummaries(windows[window], summary)
+		}
+	}
+
+	timestamps := []int64{}
+
+	for timestamp := range windows {
+		timestamps = append(timestamps, timestamp)
+	}
+
+	sort.Slice(timestamps, func(i, j int) bool { return timestamps[i] < timestamps[j] })
+
+	points := []*application.MetricSeriesPoint{}
+
+	for _, timestamp := range timestamps {
+		summary := windows[timestamp]
+		average := summary.Sum / float64(summary.Count)
+		variance := summary.SumOfSquares/float64(summary.Count) - average*average
+
+		points = append(points, &application.MetricSeriesPoint{
+			Timestamp: timestamp,
+			Count:     summary.Count,
+			Sum:       summary.Sum,
+			Min:       summary.Min,
+			Max:       summary.Max,
+			Average:   average,
+			Stddev:    math.Sqrt(math.Max(variance, 0)),
+		})
+	}
+
+	return points, nil
+}
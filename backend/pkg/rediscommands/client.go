@@ -161,7 +161,14 @@ func (rc *RedisCommands) MapSetKey(mapName, key string, value []byte) error {
 }
 
 func (rc *RedisCommands) MapGetKeyBytes(mapName, key string) ([]byte, error) {
-	return rc.client.HGet(context.Background(), mapName, key).Bytes()
+	b, err := rc.client.HGet(context.Background(), mapName, key).Bytes()
+
+	// NOTE: match badger, which returns nil for keys missing from a map
+	if err == redis.Nil {
+		return nil, nil
+	}
+
+	return b, err
 }
 
 func (rc *RedisCommands) MapGetKeys(mapName string) ([]string, error) {
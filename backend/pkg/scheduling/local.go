@@ -7,6 +7,7 @@ import (
 	"os/exec"
 	"path/filepath"
 	"strings"
+	"sync"
 	"syscall"
 
 	"github.com/sirupsen/logrus"
@@ -14,16 +15,26 @@ import (
 
 type LocalScheduler struct {
 	client *execClient
+	// NOTE: socket paths of user manager pools by test ID and by user manager ID
+	pools            map[string]string
+	userManagerPools map[string]string
+	poolsLock        sync.Mutex
 }
 
 type LocalSchedulingMetadata struct {
 	PythonExecutable string `json:"pythonExecutable"`
 	TestFilePath     string `json:"testFilePath"`
 	Logdir           string `json:"logdir"`
+	UserManagerPool  bool   `json:"userManagerPool"`
+	UserManagerHost  bool   `json:"userManagerHost"`
 }
 
 func NewLocalScheduler() *LocalScheduler {
-	return &LocalScheduler{client: newExecClient()}
+	return &LocalScheduler{
+		client:           newExecClient(),
+		pools:            make(map[string]string),
+		userManagerPools: make(map[string]string),
+	}
 }
 
 func (ls *LocalScheduler) Teardown() error {
@@ -65,6 +76,50 @@ func (ls *LocalScheduler) CreateTest(
 		return fmt.Errorf("Error starting test: %v", err)
 	}
 
+	if localSchedulingMetadata.UserManagerPool || localSchedulingMetadata.UserManagerHost {
+		socketPath := userManagerPoolSocket(testID)
+		command := []string{
+			localSchedulingMetadata.PythonExecutable,
+			"-u",
+			localSchedulingMetadata.TestFilePath,
+		}
+
+		// NOTE: user manager host accepts the same requests as a pool, but runs
+		// user managers in its own process instead of forking them
+		if localSchedulingMetadata.UserManagerHost {
+			command = append(
+				command,
+				"run-user-host",
+				"--address",
+				fmt.Sprintf("unix:%s", socketPath),
+			)
+		} else {
+			command = append(
+				command,
+				"run-user-pool",
+				"--address",
+				fmt.Sprintf("unix:%s", socketPath),
+				"--logdir",
+				localSchedulingMetadata.Logdir,
+			)
+		}
+
+		err = ls.client.startTestProcess(
+			userManagerPoolName(testID),
+			localSchedulingMetadata.Logdir,
+			command,
+			env,
+		)
+
+		if err != nil {
+			return fmt.Errorf("Error starting user manager pool: %v", err)
+		}
+
+		ls.poolsLock.Lock()
+		ls.pools[testID] = socketPath
+		ls.poolsLock.Unlock()
+	}
+
 	return nil
 }
 
@@ -127,7 +182,32 @@ func (ls *LocalScheduler) CreateUserManagers(
 		return fmt.Errorf("Error loading scheduling metadata: %v", err)
 	}
 
+	ls.poolsLock.Lock()
+	socketPath, hasPool := ls.pools[testID]
+	ls.poolsLock.Unlock()
+
 	for _, userManagerID := range userManagerIDs {
+		if hasPool {
+			err := sendPoolRequest(socketPath, userManagerPoolRequest{
+				Command:        "start",
+				UserManagerID:  userManagerID,
+				Name:           scenarioName,
+				BackendAddress: backendAddress,
+				EncodedContext: encodedContext,
+				Env:            env,
+			})
+
+			if err == nil {
+				ls.poolsLock.Lock()
+				ls.userManagerPools[userManagerID] = socketPath
+				ls.poolsLock.Unlock()
+
+				continue
+			}
+
+			logrus.Warn("Error starting user manager in pool, starting process instead: ", err)
+		}
+
 		err := ls.client.startTestProcess(
 			userManagerID,
 			localSchedulingMetadata.Logdir,
@@ -158,6 +238,24 @@ func (ls *LocalScheduler) CreateUserManagers(
 
 func (ls *LocalScheduler) StopUserManagers(userManagerIDs []string, schedulingMetadata string) error {
 	for _, userManagerID := range userManagerIDs {
+		ls.poolsLock.Lock()
+		socketPath, inPool := ls.userManagerPools[userManagerID]
+		delete(ls.userManagerPools, userManagerID)
+		ls.poolsLock.Unlock()
+
+		if inPool {
+			err := sendPoolRequest(socketPath, userManagerPoolRequest{
+				Command:       "stop",
+				UserManagerID: userManagerID,
+			})
+
+			if err != nil {
+				return fmt.Errorf("Error stopping user manager: %v", err)
+			}
+
+			continue
+		}
+
 		err := ls.client.stopTestProcess(userManagerID)
 
 		if err != nil {
@@ -175,6 +273,33 @@ func (ls *LocalScheduler) CleanTestInstances(testID, schedulingMetadata string)
 		return fmt.Errorf("Error stopping test instances: %v", err)
 	}
 
+	ls.poolsLock.Lock()
+	socketPath, hasPool := ls.pools[testID]
+	delete(ls.pools, testID)
+
+	for userManagerID, userManagerSocketPath := range ls.userManagerPools {
+		if userManagerSocketPath == socketPath {
+			delete(ls.userManagerPools, userManagerID)
+		}
+	}
+
+	ls.poolsLock.Unlock()
+
+	if hasPool {
+		// NOTE: pool kills the user managers it forked before exiting
+		err = sendPoolRequest(socketPath, userManagerPoolRequest{Command: "shutdown"})
+
+		if err != nil {
+			logrus.Warn("Error shutting down user manager pool: ", err)
+		}
+
+		err = ls.client.stopTestProcess(userManagerPoolName(testID))
+
+		if err != nil {
+			logrus.Debug("User manager pool already stopped: ", err)
+		}
+	}
+
 	// TODO: clean scenarios and managers under test
 
 	return nil
@@ -0,0 +1,100 @@
+package scheduling
+
+import (
+	"bufio"
+	"encoding/json"
+	"fmt"
+	"net"
+	"os"
+	"path/filepath"
+	"time"
+)
+
+const (
+	poolDialTries       = 8
+	poolDialInitialWait = 20 * time.Millisecond
+	poolRequestTimeout  = 10 * time.Second
+)
+
+type userManagerPoolRequest struct {
+	Command        string            `json:"command"`
+	UserManagerID  string            `json:"user_manager_id,omitempty"`
+	Name           string            `json:"name,omitempty"`
+	BackendAddress string            `json:"backend_address,omitempty"`
+	EncodedContext string            `json:"encoded_context,omitempty"`
+	Env            map[string]string `json:"env,omitempty"`
+}
+
+type userManagerPoolResponse struct {
+	Error string `json:"error"`
+}
+
+func userManagerPoolSocket(testID string) string {
+	return filepath.Join(os.TempDir(), fmt.Sprintf("cicada-%s.sock", testID))
+}
+
+func userManagerPoolName(testID string) string {
+	return fmt.Sprintf("%s-user-pool", testID)
+}
+
+// sendPoolRequest sends a request to a user manager pool started by run-user-pool.
+// Dialing is retried with a short backoff, as the pool may still be starting.
+func sendPoolRequest(socketPath string, request userManagerPoolRequest) error {
+	payload, err := json.Marshal(request)
+
+	if err != nil {
+		return fmt.Errorf("Error encoding pool request: %v", err)
+	}
+
+	var conn net.Conn
+	wait := poolDialInitialWait
+
+	for attempt := 1; ; attempt++ {
+		conn, err = net.Dial("unix", socketPath)
+
+		if err == nil {
+			break
+		}
+
+		if attempt >= poolDialTries {
+			return fmt.Errorf("Error connecting to user manager pool: %v", err)
+		}
+
+		time.Sleep(wait)
+		wait *= 2
+	}
+
+	defer conn.Close()
+
+	err = conn.SetDeadline(time.Now().Add(poolRequestTimeout))
+
+	if err != nil {
+		return fmt.Errorf("Error setting pool request deadline: %v", err)
+	}
+
+	_, err = conn.Write(append(payload, '\n'))
+
+	if err != nil {
+		return fmt.Errorf("Error sending pool request: %v", err)
+	}
+
+	line, err := bufio.NewReader(conn).ReadBytes('\n')
+
+	if err != nil {
+		return fmt.Errorf("Error reading pool response: %v", err)
+	}
+
+	response := userManagerPoolResponse{}
+
+	err = json.Unmarshal(line, &response)
+
+	if err != nil {
+		return fmt.Errorf("Error decoding pool response: %v", err)
+	}
+
+	if response.Error != "" {
+		return fmt.Errorf("User manager pool error: %s", response.Error)
+	}
+
+	return nil
+}
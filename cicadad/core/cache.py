@@ -0,0 +1,110 @@
+from typing import Callable, Dict, Mapping, Optional
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import time
+
+from cicadad.core.scenario import Scenario
+
+
+def scenario_cache_key(
+    scenario: Scenario,
+    dependency_results: Dict[str, dict],
+    env: Mapping[str, str],
+) -> str:
+    """Create key for result of a scenario run with the same code and inputs.
+
+    Key covers the source of the scenario function, its tags, the outputs of its
+    dependencies and the environment variables listed by the scenario.
+
+    Args:
+        scenario (Scenario): Cacheable scenario
+        dependency_results (Dict[str, dict]): Results of finished scenarios
+        env (Mapping[str, str]): Environment of test runner
+
+    Returns:
+        str: Hex SHA-256 cache key
+    """
+    try:
+        source = inspect.getsource(scenario.fn)
+    except (OSError, TypeError):
+        # NOTE: source is not available for functions created at runtime
+        source = getattr(scenario.fn, "__qualname__", repr(scenario.fn))
+
+    contents = {
+        "name": scenario.name,
+        "source": hashlib.sha256(source.encode("utf-8")).hexdigest(),
+        "tags": sorted(scenario.tags),
+        "dependencies": {
+            dep.name: dependency_results.get(dep.name, {}).get("output")
+            for dep in scenario.dependencies
+        },
+        "env": {name: env.get(name) for name in sorted(scenario.cache_env)},
+    }
+
+    return hashlib.sha256(
+        json.dumps(contents, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class ScenarioCache:
+    def __init__(self, directory: str, clock: Callable[[], float] = time.time) -> None:
+        """Stores successful scenario results on local disk, one file per key.
+
+        Args:
+            directory (str): Directory to keep cached results in
+            clock (Callable[[], float], optional): Get current unix time. Defaults to time.time.
+        """
+        self.__directory = os.path.expanduser(directory)
+        self.__clock = clock
+
+    def get(self, key: str) -> Optional[dict]:
+        """Get cached result if it has not expired.
+
+        Args:
+            key (str): Cache key of scenario
+
+        Returns:
+            Optional[dict]: Cached result, None if missing, expired or unreadable
+        """
+        try:
+            with open(self.__path(key)) as cache_file:
+                entry = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("expires", 0) < self.__clock():
+            return None
+
+        return entry.get("result")
+
+    def put(self, key: str, result: dict, ttl: float):
+        """Save result of scenario for ttl seconds.
+
+        Args:
+            key (str): Cache key of scenario
+            result (dict): Successful scenario result
+            ttl (float): Seconds result can be reused for
+        """
+        os.makedirs(self.__directory, exist_ok=True)
+
+        # NOTE: write to temporary file first so readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self.__directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(
+                    {"expires": self.__clock() + ttl, "result": result},
+                    tmp_file,
+                    default=str,
+                )
+
+            os.replace(tmp_path, self.__path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def __path(self, key: str) -> str:
+        return os.path.join(self.__directory, f"{key}.json")
@@ -1,27 +1,90 @@
+from contextlib import ExitStack
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional
 import atexit
 import json
 import time
 import sys
 import os
 import shutil
-import configobj  # type: ignore
 
 from rich.live import Live
 from rich.console import Console
-from blessed import Terminal  # type: ignore
 import click
-import docker  # type: ignore
 from cicadad.core.types import ICLIBackend
 from cicadad.services.backend import CLIBackend, DefaultBackendAPI  # type: ignore
+from cicadad.services.export import load_export_summaries
+from cicadad.services.history import (
+    HistoryDisplay,
+    RunHistory,
+    get_git_sha,
+    summarize_run,
+)
 
-from cicadad.util.console import LivePanel, MetricDisplay, MetricsPanel, TasksPanel
+from cicadad.metrics.compare import (
+    DEFAULT_COMPARE_WINDOW,
+    ComparisonDisplay,
+    CompareTolerances,
+    compare_runs,
+)
+from cicadad.util.console import (
+    LivePanel,
+    MetricDisplay,
+    MetricsPanel,
+    TasksPanel,
+)
 from cicadad.core import containers
 from cicadad.util import constants
+from cicadad.util.printing import JSONLinesWriter
 from cicadad import templates as templates_module
 from cicadad import backend as backend_module
 
+# NOTE: docker, blessed and configobj are imported by the commands that use them,
+# so running tests in LOCAL mode does not pay for importing them
+if TYPE_CHECKING:
+    from blessed import Terminal  # type: ignore
+
+
+def compare_options(fn):
+    """Add options for comparing a run to a baseline to a command."""
+    defaults = CompareTolerances()
+
+    for option in reversed(
+        [
+            click.option(
+                "--throughput-tolerance",
+                type=float,
+                default=defaults.throughput,
+                help="Allowed relative drop in throughput",
+                show_default=True,
+            ),
+            click.option(
+                "--latency-tolerance",
+                type=float,
+                default=defaults.latency,
+                help="Allowed relative increase in latency percentiles",
+                show_default=True,
+            ),
+            click.option(
+                "--alpha",
+                type=float,
+                default=defaults.alpha,
+                help="Significance level of Mann-Whitney U test over windows",
+                show_default=True,
+            ),
+            click.option(
+                "--window",
+                type=float,
+                default=DEFAULT_COMPARE_WINDOW,
+                help="Seconds of results per windowed sample",
+                show_default=True,
+            ),
+        ]
+    ):
+        fn = option(fn)
+
+    return fn
+
 
 @click.group()
 @click.option("--debug", type=bool, default=False, is_flag=True)
@@ -96,6 +159,8 @@ def start_cluster(ctx, network, create_network, mode):
     if mode == constants.KUBE_SCHEDULING_MODE:
         click.echo(containers.make_concatenated_kube_templates())
     elif mode == constants.DOCKER_SCHEDULING_MODE:
+        import docker  # type: ignore
+
         docker_client = docker.from_env()
 
         containers.configure_docker_network(
@@ -127,6 +192,8 @@ def start_cluster(ctx, network, create_network, mode):
 @cli.command()
 @click.pass_context
 def stop_cluster(ctx):
+    import docker  # type: ignore
+
     docker_client = docker.from_env()
 
     containers.docker_backend_down(docker_client)
@@ -217,6 +284,66 @@ def stop_cluster(ctx):
 @click.option(
     "--no-cleanup", is_flag=True, help="Do not clean up test processes or containers"
 )
+@click.option(
+    "--output",
+    type=click.Choice([constants.LIVE_OUTPUT, constants.JSONL_OUTPUT]),
+    default=constants.LIVE_OUTPUT,
+    help="Show live panel, or stream events and results as JSON lines",
+    show_default=True,
+)
+@click.option(
+    "--output-file",
+    type=click.Path(dir_okay=False, writable=True, allow_dash=True),
+    default="-",
+    help="File to stream JSON lines to, stdout if '-'",
+    show_default=True,
+)
+@click.option("--no-live", is_flag=True, help="Do not show live panel while running")
+@click.option(
+    "--export-results",
+    type=str,
+    default=None,
+    help=(
+        "Directory to export user results to as Parquet files (requires pyarrow). "
+        "Path is inside test containers when not running in LOCAL mode"
+    ),
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Exported results of a baseline run to compare to, requires --export-results",
+)
+@click.option(
+    "--user-manager-pool",
+    is_flag=True,
+    help=(
+        "Fork user managers from a warm process that has already imported the "
+        "test file (LOCAL mode only)"
+    ),
+)
+@click.option(
+    "--user-manager-host",
+    is_flag=True,
+    help=(
+        "Run all user managers in one process sharing one Dask client and "
+        "backend connection (LOCAL mode only)"
+    ),
+)
+@click.option(
+    "--record-history",
+    is_flag=True,
+    help="Append a summary of the run to the local run history",
+)
+@click.option(
+    "--history-db",
+    type=click.Path(dir_okay=False),
+    default=constants.DEFAULT_HISTORY_DB,
+    envvar=constants.HISTORY_DB_ENV_VAR,
+    help="SQLite database to record run history in",
+    show_default=True,
+)
+@compare_options
 def run(
     ctx,
     test_file,
@@ -236,10 +363,50 @@ def run(
     test_start_timeout,
     no_exit_unsuccessful,
     no_cleanup,
+    output,
+    output_file,
+    no_live,
+    export_results,
+    baseline,
+    user_manager_pool,
+    user_manager_host,
+    record_history,
+    history_db,
+    throughput_tolerance,
+    latency_tolerance,
+    alpha,
+    window,
 ):
+    if baseline is not None and export_results is None:
+        raise click.UsageError("--baseline requires --export-results")
+
+    if user_manager_pool and mode != constants.LOCAL_SCHEDULING_MODE:
+        raise click.UsageError(
+            f"--user-manager-pool is only supported in {constants.LOCAL_SCHEDULING_MODE} mode"
+        )
+
+    if user_manager_host and mode != constants.LOCAL_SCHEDULING_MODE:
+        raise click.UsageError(
+            f"--user-manager-host is only supported in {constants.LOCAL_SCHEDULING_MODE} mode"
+        )
+
+    if user_manager_pool and user_manager_host:
+        raise click.UsageError(
+            "--user-manager-pool and --user-manager-host cannot be used together"
+        )
+
     # NOTE: not configurable, probably can get rid of interfaces
     backend = CLIBackend(DefaultBackendAPI(backend_address))
-    term = Terminal()
+    writer: Optional[JSONLinesWriter] = None
+
+    if output == constants.JSONL_OUTPUT:
+        output_stream = click.open_file(output_file, "w")
+        writer = JSONLinesWriter(output_stream)
+
+        ctx.call_on_close(output_stream.close)
+
+    # NOTE: keep stdout clean for JSON lines
+    debug_to_stderr = writer is not None and output_file == "-"
 
     if mode == constants.LOCAL_SCHEDULING_MODE:
         # make sure test file exists
@@ -253,15 +420,21 @@ def run(
         )
 
         if ctx.obj["DEBUG"]:
-            click.echo(f"Started local backend: {local_backend.pid}")
-
-        # FEATURE: wait for backend to healthcheck
-        time.sleep(3)
+            click.echo(
+                f"Started local backend: {local_backend.pid}", err=debug_to_stderr
+            )
 
         atexit.register(lambda: local_backend.terminate())
+
+        backend.wait_for_backend(constants.DEFAULT_BACKEND_READY_TRIES)
+
+        if ctx.obj["DEBUG"]:
+            click.echo("Local backend is ready", err=debug_to_stderr)
     elif image:
         image_id = image
     elif mode == constants.DOCKER_SCHEDULING_MODE:
+        import docker  # type: ignore
+
         docker_client = docker.from_env()
 
         image_id = containers.build_docker_image(
@@ -276,12 +449,21 @@ def run(
 
     # Parse env file and args
     if env_file is not None:
+        import configobj  # type: ignore
+
         env_file_map = configobj.ConfigObj(env_file)
     else:
         env_file_map = {}
 
     env_map = {key: value for key, value in env}
 
+    if export_results is not None:
+        env_map[constants.EXPORT_RESULTS_ENV_VAR] = (
+            os.path.abspath(export_results)
+            if mode == constants.LOCAL_SCHEDULING_MODE
+            else export_results
+        )
+
     # Get test going
     test_id = start_test_instance(
         tag,
@@ -292,6 +474,8 @@ def run(
         network,
         namespace,
         backend,
+        user_manager_pool,
+        user_manager_host,
     )
 
     # FEATURE: Error if cluster is not up
@@ -306,16 +490,26 @@ def run(
     rich_console = Console()
 
     try:
-        # FEATURE: option to disable live printing
         tasks_panel = TasksPanel()
         metrics_panel = MetricsPanel()
 
         live_panel = LivePanel(test_id, tasks_panel, metrics_panel)
 
-        with Live(
-            console=rich_console,
-            refresh_per_second=20,
-        ) as live:
+        # NOTE: panels only change when events arrive, so refresh once per poll
+        # instead of on a timer. Spinners advance each refresh.
+        with ExitStack() as stack:
+            live = (
+                stack.enter_context(
+                    Live(
+                        live_panel.get_renderable(),
+                        console=rich_console,
+                        auto_refresh=False,
+                    )
+                )
+                if output == constants.LIVE_OUTPUT and not no_live
+                else None
+            )
+
             while not finished:
                 if not started and datetime.now() > test_start_time + timedelta(
                     seconds=test_start_timeout
@@ -332,13 +526,21 @@ def run(
                         "Check test instance logs for more details"
                     )
 
-                live.update(live_panel.get_renderable())
-
                 # poll for events
                 events = backend.get_test_events(test_id)
                 skip_sleep = False
 
                 for event in events:
+                    if writer is not None:
+                        writer.write(
+                            "event",
+                            {
+                                "test_id": test_id,
+                                "kind": event.kind,
+                                "payload": event.payload.dict(),
+                            },
+                        )
+
                     if event.kind == "SCENARIO_METRIC":
                         metrics[event.payload.scenario] = event.payload.metrics
 
@@ -346,7 +548,7 @@ def run(
                             event.payload.scenario, event.payload.metrics
                         )
                     elif event.kind == "SCENARIO_FINISHED":
-                        context = json.loads(event.payload.context)
+                        context.update(json.loads(event.payload.context))
 
                         result = context[event.payload.scenario]
 
@@ -370,7 +572,8 @@ def run(
 
                         if ctx.obj["DEBUG"]:
                             click.echo(
-                                f"Started Test: {test_id}: {event.payload.message}"
+                                f"Started Test: {test_id}: {event.payload.message}",
+                                err=debug_to_stderr,
                             )
                     elif event.kind == "TEST_ERRORED":
                         raise RuntimeError("Test failed:", event.payload.message)
@@ -378,6 +581,15 @@ def run(
                         finished = True
                         skip_sleep = True
 
+                        if ctx.obj["DEBUG"]:
+                            click.echo(
+                                f"Finished Test: {test_id}: {event.payload.message}",
+                                err=debug_to_stderr,
+                            )
+
+                if live is not None:
+                    live.update(live_panel.get_renderable(), refresh=True)
+
                 if not skip_sleep:
                     time.sleep(1)
     finally:
@@ -386,22 +598,187 @@ def run(
                 ctx.obj["DEBUG"],
                 test_id,
                 backend,
+                debug_to_stderr,
             )
 
-    print_results(
-        term,
-        rich_console,
-        passed,
-        failed,
-        context,
-        metrics,
-        ctx.obj["DEBUG"],
+    if writer is not None:
+        write_results(writer, test_id, passed, failed, context, metrics)
+    else:
+        from blessed import Terminal  # type: ignore
+
+        print_results(
+            Terminal(),
+            rich_console,
+            passed,
+            failed,
+            context,
+            metrics,
+            ctx.obj["DEBUG"],
+        )
+
+    if record_history:
+        record_run_history(
+            history_db,
+            test_id,
+            test_start_time,
+            tag,
+            context,
+            export_results if mode == constants.LOCAL_SCHEDULING_MODE else None,
+            window,
+        )
+
+    regressed = False
+
+    if baseline is not None:
+        regressed = compare_results(
+            baseline,
+            export_results,
+            CompareTolerances(
+                throughput=throughput_tolerance,
+                latency=latency_tolerance,
+                alpha=alpha,
+            ),
+            window,
+            rich_console,
+            writer,
+            test_id,
+        )
+
+    if (failed != [] or regressed) and not no_exit_unsuccessful:
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("baseline", type=click.Path(exists=True, file_okay=False))
+@click.argument("current", type=click.Path(exists=True, file_okay=False))
+@compare_options
+def compare(
+    baseline,
+    current,
+    throughput_tolerance,
+    latency_tolerance,
+    alpha,
+    window,
+):
+    """Compare exported results of a run to a baseline run
+
+    Exits non-zero if throughput or latency of any scenario regressed.
+    """
+    regressed = compare_results(
+        baseline,
+        current,
+        CompareTolerances(
+            throughput=throughput_tolerance,
+            latency=latency_tolerance,
+            alpha=alpha,
+        ),
+        window,
+        Console(),
     )
 
-    if failed != [] and not no_exit_unsuccessful:
+    if regressed:
         sys.exit(1)
 
 
+@cli.command()
+@click.argument("scenario", type=str, required=False)
+@click.option(
+    "--history-db",
+    type=click.Path(dir_okay=False),
+    default=constants.DEFAULT_HISTORY_DB,
+    envvar=constants.HISTORY_DB_ENV_VAR,
+    help="SQLite database run history was recorded in",
+    show_default=True,
+)
+@click.option(
+    "--last",
+    type=int,
+    default=constants.DEFAULT_HISTORY_RUNS,
+    help="Number of most recent runs to show",
+    show_default=True,
+)
+def history(scenario, history_db, last):
+    """Show trend of a scenario over recorded runs
+
+    Lists recorded scenarios if no scenario is given.
+    """
+    if not os.path.isfile(history_db):
+        raise click.ClickException(f"No run history found at {history_db}")
+
+    run_history = RunHistory(history_db)
+
+    try:
+        if scenario is None:
+            for name, runs in run_history.scenarios().items():
+                click.echo(f"{name} ({runs} runs)")
+        else:
+            records = run_history.scenario_trend(scenario, last)
+
+            if records == []:
+                raise click.ClickException(f"No runs recorded for {scenario}")
+
+            Console().print(HistoryDisplay(scenario, records).get_renderable())
+    finally:
+        run_history.close()
+
+
+def record_run_history(
+    history_db: str,
+    test_id: str,
+    started_at: datetime,
+    tags: List[str],
+    context: dict,
+    export_results: Optional[str],
+    window: float,
+):
+    export_summaries = {}
+
+    if export_results is not None:
+        try:
+            export_summaries = load_export_summaries(export_results, window, test_id)
+        except (OSError, ImportError) as e:
+            # NOTE: run is still recorded, without latency percentiles
+            click.echo(f"Could not summarize exported results: {e}", err=True)
+
+    run_history = RunHistory(history_db)
+
+    try:
+        run_history.add_run(
+            test_id,
+            started_at,
+            get_git_sha(),
+            tags,
+            summarize_run(context, export_summaries),
+        )
+    finally:
+        run_history.close()
+
+
+def compare_results(
+    baseline: str,
+    current: str,
+    tolerances: CompareTolerances,
+    window: float,
+    rich_console: Console,
+    writer: Optional[JSONLinesWriter] = None,
+    current_test_id: Optional[str] = None,
+) -> bool:
+    # NOTE: export directories may hold several runs, latest is used unless given
+    comparisons = compare_runs(
+        load_export_summaries(baseline, window),
+        load_export_summaries(current, window, current_test_id),
+        tolerances,
+    )
+
+    if writer is not None:
+        for comparison in comparisons:
+            writer.write("comparison", comparison.dict())
+    else:
+        rich_console.print(ComparisonDisplay(comparisons).get_renderable())
+
+    return any(comparison.regressed for comparison in comparisons)
+
+
 def start_test_instance(
     tag: List[str],
     env: Dict[str, str],
@@ -411,6 +788,8 @@ def start_test_instance(
     network: str,
     namespace: str,
     backend: ICLIBackend,
+    user_manager_pool: bool = False,
+    user_manager_host: bool = False,
 ) -> str:
     if mode == constants.KUBE_SCHEDULING_MODE:
         return backend.create_test(
@@ -433,6 +812,8 @@ def start_test_instance(
                     "pythonExecutable": sys.executable,
                     "testFilePath": image_id,
                     "logdir": log_path,
+                    "userManagerPool": user_manager_pool,
+                    "userManagerHost": user_manager_host,
                 }
             ),
             backend_address=constants.DEFAULT_BACKEND_ADDRESS,
@@ -441,18 +822,44 @@ def start_test_instance(
         )
 
 
-def cleanup(debug: bool, test_id: str, backend: ICLIBackend):
+def cleanup(debug: bool, test_id: str, backend: ICLIBackend, err: bool = False):
     if debug:
-        click.echo("Cleaning Test Instances")
+        click.echo("Cleaning Test Instances", err=err)
 
     backend.clean_test_instances(test_id)
 
     if debug:
-        click.echo("Cleaned test instances")
+        click.echo("Cleaned test instances", err=err)
+
+
+def write_results(
+    writer: JSONLinesWriter,
+    test_id: str,
+    passed: List[str],
+    failed: List[str],
+    context: dict,
+    metrics: Dict[str, Dict[str, str]],
+):
+    for scenario in context:
+        writer.write(
+            "result",
+            {
+                "test_id": test_id,
+                "scenario": scenario,
+                "passed": context[scenario]["exception"] is None,
+                "result": context[scenario],
+                "metrics": metrics.get(scenario),
+            },
+        )
+
+    writer.write(
+        "summary",
+        {"test_id": test_id, "passed": passed, "failed": failed},
+    )
 
 
 def print_results(
-    term: Terminal,
+    term: "Terminal",
     rich_console: Console,
     passed: List[str],
     failed: List[str],
@@ -1,19 +1,38 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 import io
 import traceback
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 import uuid
 
+from cicadad.core.errors import ErrorCollector
+from cicadad.core.guards import ScenarioAbortedError, ScenarioGuard
+from cicadad.core.reduction import (
+    is_partial_result,
+    is_reduced_result,
+    result_count,
+)
 from cicadad.core.scenario import Scenario
 from cicadad.core.types import (
+    ErrorGroup,
+    IResultExporter,
     IScenarioCommands,
     IScenarioBackend,
     IUserCommands,
     IUserBackend,
+    MetricSeriesPoint,
+    ReducedResults,
     Result,
+    WindowStats,
 )
+from cicadad.metrics.console import RESULTS_PER_SECOND_COLLECTOR
+from cicadad.metrics.window import ResultWindow
 from cicadad.util import printing
-from cicadad.util.constants import ONE_SEC_MS
+from cicadad.util.constants import (
+    DEFAULT_MAX_RESULT_BATCHES,
+    ONE_SEC_MS,
+    RESULT_LAG_METRIC,
+)
 
 
 class ScenarioCommands(IScenarioCommands):
@@ -24,6 +43,9 @@ class ScenarioCommands(IScenarioCommands):
         scenario_id: str,
         backend: IScenarioBackend,
         context: dict,
+        pool: Optional[str] = None,
+        guard: Optional[ScenarioGuard] = None,
+        exporter: Optional[IResultExporter] = None,
     ):
         """Commands available to a scenario.
 
@@ -33,20 +55,34 @@ class ScenarioCommands(IScenarioCommands):
             scenario_id (str): ID of scenario run
             backend (IScenarioBackend): Address of backend to pass to users
             context (dict): Context data to pass to users
+            pool (str, optional): Name of user pool commands control. Defaults to None.
+            guard (ScenarioGuard, optional): Abort conditions to check when results
+                are collected. Defaults to None.
+            exporter (IResultExporter, optional): Writes collected user results to
+                files. Defaults to None.
         """
         self.__scenario = scenario
         self.__test_id = test_id
         self.__backend = backend
         self.__context = context
         self.__scenario_id = scenario_id
+        self.__pool = pool
+        self.__guard = guard
+        self.__exporter = exporter
+        self.__pools: Dict[str, ScenarioCommands] = {}
 
         # FEATURE: get number of healthy users in scenario, healthy users per group
         # have method in IScenarioBackend to get num actual users, num user managers
         # See if it can replace __num_users counter
         self.__num_users = 0
+        self.__max_users = 0
         self.__num_results_collected = 0
         self.__aggregated_results = None
-        self.__errors: List[str] = []
+        self.__errors = ErrorCollector()
+        self.__window = ResultWindow()
+        self.__result_lag = 0.0
+        self.__prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self.__prefetched_results: Optional[Future] = None
 
     @property
     def test_id(self) -> str:
@@ -74,13 +110,49 @@ class ScenarioCommands(IScenarioCommands):
     def num_users(self) -> int:
         return self.__num_users
 
+    @property
+    def max_users(self) -> int:
+        # NOTE: pools may peak at different times, so this is an upper bound
+        return self.__max_users + sum(pool.max_users for pool in self.__pools.values())
+
     @property
     def num_results_collected(self):
-        return self.__num_results_collected
+        return self.__num_results_collected + sum(
+            pool.num_results_collected for pool in self.__pools.values()
+        )
 
     @property
     def errors(self) -> List[str]:
-        return self.__errors
+        return self.__errors.format_groups() + [
+            error for pool in self.__pools.values() for error in pool.errors
+        ]
+
+    @property
+    def num_errors(self) -> int:
+        return self.__errors.num_errors + sum(
+            pool.num_errors for pool in self.__pools.values()
+        )
+
+    @property
+    def error_groups(self) -> List[ErrorGroup]:
+        return self.__errors.groups + [
+            group for pool in self.__pools.values() for group in pool.error_groups
+        ]
+
+    def pool(self, name: str) -> "ScenarioCommands":
+        if name not in self.__pools:
+            self.__pools[name] = ScenarioCommands(
+                scenario=self.__scenario,
+                test_id=self.__test_id,
+                scenario_id=self.__scenario_id,
+                backend=self.__backend.create_pool(name),
+                context=self.__context,
+                pool=name,
+                guard=self.__guard,
+                exporter=self.__exporter,
+            )
+
+        return self.__pools[name]
 
     def scale_users(self, n: int):
         if n > self.__num_users:
@@ -91,6 +163,7 @@ class ScenarioCommands(IScenarioCommands):
     def start_users(self, n: int):
         self.__backend.create_users(amount=n)
         self.__num_users += n
+        self.__max_users = max(self.__max_users, self.__num_users)
 
     def stop_users(self, n: int):
         self.__backend.stop_users(amount=n)
@@ -99,6 +172,9 @@ class ScenarioCommands(IScenarioCommands):
     def add_work(self, n: int):
         self.__backend.distribute_work(n)
 
+    def add_work_items(self, items: List[str]):
+        self.__backend.distribute_work_items([item.encode() for item in items])
+
     def send_user_events(self, kind: str, payload: dict):
         self.__backend.send_user_events(kind, payload)
 
@@ -106,46 +182,198 @@ class ScenarioCommands(IScenarioCommands):
         self,
         timeout_ms: Optional[int] = ONE_SEC_MS,
         limit: int = 500,
+        max_batches: int = DEFAULT_MAX_RESULT_BATCHES,
     ):
-        all_results = self.__backend.move_user_results(limit, timeout_ms)
+        if self.__prefetched_results is not None:
+            results = self.__prefetched_results.result()
+            self.__prefetched_results = None
+        else:
+            results = self.__backend.move_user_results(limit, timeout_ms)
+
+        all_results = results[:]
+        batches = 1
 
-        # FEATURE: Get rest of results if limit reached
-        # all_results = results[:]
+        # NOTE: a full batch means more results are waiting, so keep draining
+        # without waiting on the timeout
+        while len(results) >= limit and batches < max_batches:
+            results = self.__backend.move_user_results(limit, None)
+            all_results.extend(results)
+            batches += 1
 
-        # while len(results) >= limit:
-        #     results = datastore.move_user_results(
-        #         self.__user_ids, limit, self.datastore_address
-        #     )
+        # NOTE: fetch next batch in background while caller aggregates this one
+        if len(results) >= limit:
+            if self.__prefetch_executor is None:
+                self.__prefetch_executor = ThreadPoolExecutor(max_workers=1)
 
-        #     all_results.extend(results)
+            self.__prefetched_results = self.__prefetch_executor.submit(
+                self.__backend.move_user_results, limit, None
+            )
 
-        self.__num_results_collected += len(all_results)
+        self.__add_results(all_results)
 
         return all_results
 
+    def close(self):
+        # NOTE: results of a prefetch were already moved out of the backend, so
+        # they are collected here instead of being dropped
+        try:
+            if self.__prefetched_results is not None:
+                results = self.__prefetched_results.result()
+                self.__prefetched_results = None
+
+                self.__add_results(results)
+                self.aggregate_results(results)
+                self.verify_results(results)
+                self.collect_datastore_metrics(results)
+
+            for pool in self.__pools.values():
+                pool.close()
+        finally:
+            if self.__prefetch_executor is not None:
+                self.__prefetch_executor.shutdown()
+                self.__prefetch_executor = None
+
+    def __add_results(self, results: List[Result]):
+        self.__record_result_lag(results)
+
+        if self.__pool is not None:
+            for result in results:
+                result.pool = self.__pool
+
+        self.__num_results_collected += sum(result_count(result) for result in results)
+
+        # NOTE: partial aggregates carry a window slot of all results they reduced,
+        # so samples and failures sent with them are not added again
+        self.__window.add_results(
+            [
+                result
+                for result in results
+                if not is_partial_result(result) and not is_reduced_result(result)
+            ]
+        )
+
+        for result in results:
+            if is_partial_result(result):
+                reduced: ReducedResults = result.output  # type: ignore
+                self.__window.add_slot(reduced.window)
+
+        if self.__exporter is not None:
+            self.__exporter.add_results(
+                [result for result in results if not is_partial_result(result)]
+            )
+
+        if self.__guard is not None:
+            try:
+                self.__guard.check(self.window_stats)
+            except ScenarioAbortedError:
+                # NOTE: caller never receives the batch that aborted the scenario,
+                # so it is aggregated and verified here instead
+                if results != []:
+                    self.aggregate_results(results)
+                    self.verify_results(results)
+                    self.collect_datastore_metrics(results)
+
+                raise
+
+    @property
+    def result_lag(self) -> float:
+        return self.__result_lag
+
+    def __record_result_lag(self, results: List[Result]):
+        timestamps = [
+            result.timestamp
+            for result in results
+            if isinstance(result.timestamp, datetime)
+        ]
+
+        if timestamps == []:
+            return
+
+        self.__result_lag = max((datetime.now() - min(timestamps)).total_seconds(), 0)
+        self.__backend.add_metric(RESULT_LAG_METRIC, self.__result_lag)
+
     def aggregate_results(self, latest_results: List[Result]) -> Any:
+        partials = [result for result in latest_results if is_partial_result(result)]
+        raw_results = [
+            result
+            for result in latest_results
+            if not is_partial_result(result) and not is_reduced_result(result)
+        ]
+
+        if self.__scenario.result_merger is not None:
+            for partial in partials:
+                reduced: ReducedResults = partial.output  # type: ignore
+                self.__aggregated_results = self.__scenario.result_merger(
+                    self.__aggregated_results, reduced.partial
+                )
+
+        # NOTE: samples and failures sent with partials are already aggregated
+        if partials != [] and raw_results == []:
+            return self.__aggregated_results
+
         if self.__scenario.result_aggregator is not None:
             self.__aggregated_results = self.__scenario.result_aggregator(
-                self.__aggregated_results, latest_results
+                self.__aggregated_results, raw_results
             )
-        elif latest_results != []:
+        elif raw_results != []:
             # Default aggregator when results are not empty
-            self.__aggregated_results = latest_results[-1].output
+            self.__aggregated_results = raw_results[-1].output
 
         return self.__aggregated_results
 
     def verify_results(self, latest_results: List[Result]) -> Optional[List[str]]:
         if self.__scenario.result_verifier is not None:
-            errors = self.__scenario.result_verifier(latest_results)
+            errors = self.__scenario.result_verifier(
+                [result for result in latest_results if not is_partial_result(result)]
+            )
 
-            self.__errors.extend(errors)
+            self.__errors.add_errors(errors)
             return errors
 
         return None
 
     def collect_datastore_metrics(self, latest_results: List[Result]):
-        for collector in self.__scenario.metric_collectors:
-            collector(latest_results, self.__backend)
+        reduced = False
+
+        for result in latest_results:
+            if is_partial_result(result):
+                partial: ReducedResults = result.output  # type: ignore
+
+                # NOTE: metrics were collected by user manager before reducing
+                for name, summary in partial.metrics.items():
+                    self.__backend.add_metric_summary(name, summary)
+
+            reduced = reduced or is_partial_result(result) or is_reduced_result(result)
+
+        if not reduced:
+            for collector in self.__scenario.metric_collectors:
+                collector(latest_results, self.__backend)
+
+            return
+
+        # NOTE: user managers only see their own results, so results per second
+        # is collected from the partial aggregates of all user managers
+        if RESULTS_PER_SECOND_COLLECTOR in self.__scenario.metric_collectors:
+            RESULTS_PER_SECOND_COLLECTOR(latest_results, self.__backend)
+
+    def add_metric(self, name: str, value: float):
+        self.__backend.add_metric(name, value)
+
+    def get_metric_series(
+        self,
+        name: str,
+        from_timestamp: int = 0,
+        to_timestamp: int = 0,
+        step: int = 1,
+    ) -> List[MetricSeriesPoint]:
+        return self.__backend.get_metric_series(
+            name, from_timestamp, to_timestamp, step
+        )
+
+    def window_stats(
+        self, metric: str = "time_taken", seconds: int = 30
+    ) -> WindowStats:
+        return self.__window.stats(metric, seconds)
 
 
 class UserCommands(IUserCommands):
@@ -193,6 +421,14 @@ class UserCommands(IUserCommands):
 
         return has_available_work
 
+    def get_work_item(self, timeout_ms: Optional[int] = ONE_SEC_MS) -> Optional[str]:
+        item = self.__backend.get_work_item(timeout_ms)
+
+        if item is None:
+            return None
+
+        return item.decode()
+
     def run(self, *args, log_traceback=True, **kwargs):
         buffer = io.StringIO()
 
@@ -218,6 +454,7 @@ class UserCommands(IUserCommands):
             logs=logs,
             timestamp=datetime.now(),
             time_taken=time_taken,
+            user_id=self.__user_id,
         )
 
         self.__backend.add_user_result(result)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 import os
 import platform
 import uuid
@@ -6,8 +6,6 @@ import socket
 import subprocess  # nosec
 
 from pydantic import BaseModel
-from docker.errors import APIError, NotFound  # type: ignore
-import docker  # type: ignore
 
 from cicadad.util.constants import (
     CICADA_VERSION,
@@ -17,6 +15,10 @@ from cicadad.util.constants import (
 from cicadad import configs as configs_module
 from cicadad import templates as templates_module
 
+# NOTE: docker is slow to import and not needed to run tests in LOCAL mode
+if TYPE_CHECKING:
+    import docker  # type: ignore
+
 
 class Volume(BaseModel):
     source: str
@@ -50,7 +52,7 @@ def get_free_port() -> int:
     return sock.getsockname()[1]
 
 
-def docker_network_exists(client: docker.DockerClient, network: str):
+def docker_network_exists(client: "docker.DockerClient", network: str):
     """Check if network exists
 
     Args:
@@ -60,14 +62,16 @@ def docker_network_exists(client: docker.DockerClient, network: str):
     Returns:
         bool: Network exists
     """
+    from docker.errors import NotFound  # type: ignore
+
     try:
         client.networks.get(network)
         return True
-    except docker.errors.NotFound:
+    except NotFound:
         return False
 
 
-def create_docker_network(client: docker.DockerClient, network: str):
+def create_docker_network(client: "docker.DockerClient", network: str):
     """Create docker network
 
     Args:
@@ -77,6 +81,8 @@ def create_docker_network(client: docker.DockerClient, network: str):
     Raises:
         RuntimeError: Raised if network could not be created
     """
+    from docker.errors import APIError  # type: ignore
+
     try:
         client.networks.create(network)
     except APIError as err:
@@ -84,7 +90,7 @@ def create_docker_network(client: docker.DockerClient, network: str):
 
 
 def configure_docker_network(
-    client: docker.DockerClient,
+    client: "docker.DockerClient",
     network: str,
     create_network: bool,
 ):
@@ -105,7 +111,7 @@ def configure_docker_network(
             raise ValueError(f"Docker network {network} not configured")
 
 
-def pull_docker_image(client: docker.DockerClient, image: str):
+def pull_docker_image(client: "docker.DockerClient", image: str):
     """Pulls image from remote
 
     Args:
@@ -121,7 +127,7 @@ def pull_docker_image(client: docker.DockerClient, image: str):
 
 
 def create_docker_container(
-    client: docker.DockerClient,
+    client: "docker.DockerClient",
     args: DockerServerArgs,
 ):
     """
@@ -140,7 +146,7 @@ def create_docker_container(
         Docker container object
     """
     # NOTE: client may need more config options (probably get from env)
-    # client: docker.DockerClient = docker.from_env()
+    # client: "docker.DockerClient" = docker.from_env()
 
     configure_docker_network(client, args.network, args.create_network)
 
@@ -161,6 +167,8 @@ def create_docker_container(
     else:
         port_map = {}
 
+    from docker.errors import APIError  # type: ignore
+
     try:
         # Start container
         # LOGGER.debug("Starting Docker container with image %s", image)
@@ -179,7 +187,7 @@ def create_docker_container(
         raise RuntimeError(f"Unable to create container: {err}")
 
 
-def get_docker_container(client: docker.DockerClient, name: str):
+def get_docker_container(client: "docker.DockerClient", name: str):
     """Get a docker container by name
 
     Args:
@@ -189,6 +197,8 @@ def get_docker_container(client: docker.DockerClient, name: str):
     Returns:
         Optional[Container]: Container or none if not found
     """
+    from docker.errors import NotFound  # type: ignore
+
     try:
         return client.containers.get(name)
     except NotFound:
@@ -204,6 +214,8 @@ def container_is_running(container: Any):
     Returns:
         bool: Container is running
     """
+    from docker.errors import APIError  # type: ignore
+
     try:
         container.top()
         return True
@@ -223,7 +235,7 @@ def container_logs(container: Any) -> str:
     return container.logs().decode()
 
 
-def stop_docker_container_by_name(client: docker.DockerClient, container_id: str):
+def stop_docker_container_by_name(client: "docker.DockerClient", container_id: str):
     """Find container by name and stop it
 
     Args:
@@ -245,7 +257,7 @@ def stop_docker_container(container: Any):
         container.stop(timeout=3)
 
 
-def remove_docker_container_by_name(client: docker.DockerClient, container_id: str):
+def remove_docker_container_by_name(client: "docker.DockerClient", container_id: str):
     """Find a docker container by name and remove it
 
     Args:
@@ -267,7 +279,7 @@ def remove_docker_container(container: Any):
         container.remove()
 
 
-def build_docker_image(client: docker.DockerClient, path: str, dockerfile: str):
+def build_docker_image(client: "docker.DockerClient", path: str, dockerfile: str):
     """Build a docker image given path and path to dockerfile and add to local
     registry
 
@@ -284,6 +296,8 @@ def build_docker_image(client: docker.DockerClient, path: str, dockerfile: str):
     """
     tag = f"cicada-test-container-{str(uuid.uuid4())[:8]}"
 
+    from docker.errors import APIError  # type: ignore
+
     try:
         client.images.build(tag=tag, path=path, dockerfile=dockerfile)
         return tag
@@ -291,7 +305,9 @@ def build_docker_image(client: docker.DockerClient, path: str, dockerfile: str):
         raise RuntimeError(f"Unable to build Cicada image: {err}")
 
 
-def docker_container_up(client: docker.DockerClient, name: str, args: DockerServerArgs):
+def docker_container_up(
+    client: "docker.DockerClient", name: str, args: DockerServerArgs
+):
     """Check if docker container is running, start container is not running
 
     Args:
@@ -313,7 +329,7 @@ def docker_container_up(client: docker.DockerClient, name: str, args: DockerServ
     return container
 
 
-def docker_container_down_by_name(client: docker.DockerClient, name: str):
+def docker_container_down_by_name(client: "docker.DockerClient", name: str):
     """Stop and remove container if it is found
 
     Args:
@@ -337,7 +353,7 @@ def docker_container_down(container: Any):
         remove_docker_container(container)
 
 
-def clean_docker_containers(client: docker.DockerClient, label: str):
+def clean_docker_containers(client: "docker.DockerClient", label: str):
     """Stop and remove containers given a list of labels
 
     Args:
@@ -351,7 +367,7 @@ def clean_docker_containers(client: docker.DockerClient, label: str):
         docker_container_down(container)
 
 
-def docker_redis_up(client: docker.DockerClient, network: str):
+def docker_redis_up(client: "docker.DockerClient", network: str):
     """Start Redis container
 
     Args:
@@ -382,7 +398,7 @@ def docker_redis_up(client: docker.DockerClient, network: str):
     return docker_container_up(client, "cicada-distributed-redis", args)
 
 
-def docker_redis_down(client: docker.DockerClient):
+def docker_redis_down(client: "docker.DockerClient"):
     """Stop redis container
 
     Args:
@@ -391,7 +407,7 @@ def docker_redis_down(client: docker.DockerClient):
     docker_container_down_by_name(client, "cicada-distributed-redis")
 
 
-def docker_backend_up(client: docker.DockerClient, network: str):
+def docker_backend_up(client: "docker.DockerClient", network: str):
     """Start Backend CLient container.
 
     Args:
@@ -425,7 +441,7 @@ def docker_backend_up(client: docker.DockerClient, network: str):
     return docker_container_up(client, "cicada-distributed-backend", args)
 
 
-def docker_backend_down(client: docker.DockerClient):
+def docker_backend_down(client: "docker.DockerClient"):
     """Stop backend container
 
     Args:
@@ -7,9 +7,17 @@ from cicadad.core.types import (
     LoadModelFn,
     UserLoopFn,
     ResultAggregatorFn,
+    ResultMergerFn,
+    ResultReducerFn,
     ResultVerifierFn,
     OutputTransformerFn,
 )
+from cicadad.core.guards import (
+    DEFAULT_GUARD_MIN_COUNT,
+    DEFAULT_GUARD_WINDOW,
+    AbortCondition,
+)
+from cicadad.core.reduction import DEFAULT_REDUCED_SAMPLE_RATE
 from cicadad.core.scenario import Scenario
 from cicadad.core.engine import Engine
 
@@ -73,6 +81,45 @@ def users_per_instance(users_per_instance: int):
     return wrapper
 
 
+def priority(priority: int):
+    """Set order scenario is started in when several scenarios are ready to run.
+
+    Scenarios with a higher priority are started first. Defaults to 0.
+
+    Args:
+        priority (int): Priority of scenario
+    """
+
+    def wrapper(fn):
+        _set_scenario_attribute(fn, "priority", priority)
+
+        return fn
+
+    return wrapper
+
+
+def cacheable(ttl: float, env: Optional[List[str]] = None):
+    """Reuse result of scenario when its code and inputs are unchanged.
+
+    Successful results are cached on the disk of the test runner, keyed by the
+    source of the scenario function, its tags, the outputs of its dependencies
+    and the listed environment variables. On a cache hit the scenario is not
+    started at all.
+
+    Args:
+        ttl (float): Seconds a cached result can be reused for
+        env (List[str], optional): Environment variables that change the result. Defaults to None.
+    """
+
+    def wrapper(fn):
+        _set_scenario_attribute(fn, "cache_ttl", ttl)
+        _set_scenario_attribute(fn, "cache_env", env or [])
+
+        return fn
+
+    return wrapper
+
+
 def load_model(load_model_fn: LoadModelFn):
     """Handle how scenario is run with regards to starting users and administering work.
 
@@ -126,6 +173,33 @@ def result_aggregator(aggregator_fn: ResultAggregatorFn):
     return wrapper
 
 
+def result_reducer(
+    reducer_fn: ResultReducerFn,
+    merger_fn: ResultMergerFn,
+    sample_rate: float = DEFAULT_REDUCED_SAMPLE_RATE,
+):
+    """Aggregate results in each user manager and merge partial aggregates in scenario.
+
+    User managers also run metric collectors and only send partial aggregates,
+    with per second counts and histograms of results, failed results and a sample
+    of successful results to the scenario.
+
+    Args:
+        reducer_fn (ResultReducerFn): Creates partial aggregate in user manager
+        merger_fn (ResultMergerFn): Merges partial aggregate into scenario aggregate
+        sample_rate (float, optional): Fraction of successful results to send. Defaults to 0.01.
+    """
+
+    def wrapper(fn):
+        _set_scenario_attribute(fn, "result_reducer", reducer_fn)
+        _set_scenario_attribute(fn, "result_merger", merger_fn)
+        _set_scenario_attribute(fn, "reduced_sample_rate", sample_rate)
+
+        return fn
+
+    return wrapper
+
+
 def result_verifier(verifier_fn: ResultVerifierFn):
     """Create error messages for errors found in a list of results.
 
@@ -143,6 +217,38 @@ def result_verifier(verifier_fn: ResultVerifierFn):
     return wrapper
 
 
+def abort_if(
+    condition: AbortCondition,
+    window: int = DEFAULT_GUARD_WINDOW,
+    min_count: int = DEFAULT_GUARD_MIN_COUNT,
+):
+    """Stop scenario when a condition on recent results is met.
+
+    Conditions are checked each time the load model collects results, e.g.
+    @abort_if(error_rate > 0.2, window=30) or @abort_if(p99 > 2.0) with
+    statistics imported from cicadad.core.guards.
+
+    Args:
+        condition (AbortCondition): Comparison of a statistic to a threshold
+        window (int, optional): Seconds of results to check. Defaults to 30.
+        min_count (int, optional): Results needed in window before condition
+            is checked. Defaults to 10.
+    """
+
+    def wrapper(fn):
+        conditions = _get_scenario_attribute(fn, "abort_conditions")
+        entry = [condition.configure(window=window, min_count=min_count)]
+
+        if conditions is None:
+            _set_scenario_attribute(fn, "abort_conditions", entry)
+        else:
+            _set_scenario_attribute(fn, "abort_conditions", conditions + entry)
+
+        return fn
+
+    return wrapper
+
+
 def output_transformer(transformer_fn: OutputTransformerFn):
     """Transform the aggregated result of the scenario after load model is called.
 
@@ -1,24 +1,60 @@
 import traceback
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import atexit
+import os
+import signal
 
-from distributed.client import Client, fire_and_forget  # type: ignore
 import click
 
-from cicadad.core.types import IBackendBuilder, TestEvent, TestStatus
+from cicadad.core.cache import ScenarioCache
+from cicadad.core.pool import (
+    UserManagerRequest,
+    fork_service,
+    serve_user_manager_host,
+    serve_user_manager_pool,
+)
+from cicadad.core.types import IBackendAPI, IBackendBuilder, TestEvent, TestStatus
 from cicadad.core.scenario import Scenario
-from cicadad.core.runners import scenario_runner, test_runner, user_scheduler
+from cicadad.core.runners import (
+    flush_user_results,
+    scenario_runner,
+    schedule_new_users,
+    test_runner,
+    user_scheduler,
+)
 from cicadad.services.backend import (
     BackendBuilder,
     UserBufferActor,
+    UserManagerBackend,
 )
-from cicadad.util.context import decode_context
+from cicadad.services.export import ParquetResultExporter
+from cicadad.util.context import decode_context, resolve_context
 from cicadad.util.constants import (
+    CACHE_DIR_ENV_VAR,
     DEFAULT_BACKEND_ADDRESS,
+    DEFAULT_CACHE_DIR,
     DEFAULT_CONTEXT_STRING,
+    EXPORT_RESULTS_ENV_VAR,
+    MAX_CONCURRENCY_ENV_VAR,
 )
 
 
+def start_local_cluster() -> Tuple[str, Callable[[], None]]:
+    """Start a Dask cluster on this machine for user managers to share.
+
+    Returns:
+        Tuple[str, Callable[[], None]]: Address of scheduler and function to close cluster
+    """
+    from distributed.deploy.local import LocalCluster  # type: ignore
+
+    cluster = LocalCluster()
+
+    def close():
+        cluster.close()
+
+    return cluster.scheduler_address, close
+
+
 class Engine:
     def __init__(self, backend_builder: Optional[IBackendBuilder] = None) -> None:
         """Entrypoint for Cicada tests. Links tests to Cicada infrastructure"""
@@ -67,6 +103,8 @@ class Engine:
         tags: List[str],
         test_id: str,
         backend_address: str,
+        max_concurrency: Optional[int] = None,
+        cache_dir: str = DEFAULT_CACHE_DIR,
     ):
         """Startup function when test container is created. Starts hub server.
 
@@ -74,6 +112,9 @@ class Engine:
             tags: (List[str]): List of tags to filter scenarios by
             test_id: ID of test to event back to client
             backend_address (str): Address of backend client to receive scenario results
+            max_concurrency (int, optional): Max scenarios running at once. Defaults to None.
+            cache_dir (str, optional): Directory of cacheable scenario results.
+                Defaults to ~/.cache/cicada.
         """
         backend = self.__backend_builder.make_test_backend(
             test_id=test_id, address=backend_address
@@ -83,6 +124,8 @@ class Engine:
             scenarios=self.__scenarios.values(),
             tags=list(tags),
             backend=backend,
+            max_concurrency=max_concurrency,
+            cache=ScenarioCache(cache_dir),
         )
 
     def run_scenario(
@@ -104,18 +147,31 @@ class Engine:
             encoded_context (str): Context from test containing previous results
         """
         scenario = self.__scenarios[scenario_name]
-        context = decode_context(encoded_context)
+        context = self.__resolve_context(encoded_context, backend_address)
 
         backend = self.__backend_builder.make_scenario_backend(
             test_id=test_id, scenario_id=scenario_id, address=backend_address
         )
 
+        export_dir = os.getenv(EXPORT_RESULTS_ENV_VAR)
+
         scenario_runner(
             scenario=scenario,
             test_id=test_id,
             scenario_id=scenario_id,
             backend=backend,
             context=context,
+            exporter=(
+                ParquetResultExporter(
+                    export_dir,
+                    scenario.name,
+                    scenario_id,
+                    sample_rate=scenario.reduced_sample_rate,
+                    test_id=test_id,
+                )
+                if export_dir
+                else None
+            ),
         )
 
     def run_user(
@@ -124,6 +180,7 @@ class Engine:
         user_manager_id: str,
         backend_address: str,
         encoded_context: str,
+        scheduler_address: Optional[str] = None,
     ):
         """Startup function when user is started. Runs scenario user loop.
 
@@ -132,10 +189,15 @@ class Engine:
             user_manager_id (str): Unique ID of user manager assigned by scenario
             backend_address (str): Address of backend client to receive work and save results
             encoded_context (str): Context from test containing previous results
+            scheduler_address (str, optional): Dask scheduler to run users on. Starts
+                a local cluster if not provided. Defaults to None.
         """
+        # NOTE: only user managers need dask, so it is not imported by other commands
+        from distributed.client import Client, fire_and_forget  # type: ignore
+
         scenario = self.__scenarios[scenario_name]
-        context = decode_context(encoded_context)
-        client = Client()
+        context = self.__resolve_context(encoded_context, backend_address)
+        client = Client(scheduler_address)
 
         # Create buffer actor
         buffer_fut = client.submit(
@@ -156,7 +218,7 @@ class Engine:
             address=backend_address,
         )
 
-        atexit.register(lambda: backend.send_user_results())
+        atexit.register(lambda: flush_user_results(scenario, backend))
 
         user_scheduler(
             client,
@@ -165,6 +227,107 @@ class Engine:
             context,
         )
 
+    def run_user_pool(self, address: str, logdir: Optional[str] = None):
+        """Startup function for a warm pool of user managers. Forks user managers
+        on request instead of starting a new process for each one.
+
+        Args:
+            address (str): unix:<path> or <host>:<port> to listen for requests on
+            logdir (str, optional): Directory to write user manager logs to. Defaults to None.
+        """
+        # NOTE: import dask once here instead of in every user manager. Importing
+        # does not start any threads, so it is safe to fork afterwards
+        import distributed.client  # type: ignore # noqa: F401
+        import distributed.threadpoolexecutor  # type: ignore # noqa: F401
+
+        # NOTE: starting a local cluster takes most of the startup time of a user
+        # manager, so one is started for the pool and user managers connect to it
+        cluster_pid, scheduler_address = fork_service(start_local_cluster)
+
+        try:
+            serve_user_manager_pool(
+                lambda name, user_manager_id, backend_address, encoded_context: (
+                    self.run_user(
+                        scenario_name=name,
+                        user_manager_id=user_manager_id,
+                        backend_address=backend_address,
+                        encoded_context=encoded_context,
+                        scheduler_address=scheduler_address,
+                    )
+                ),
+                address,
+                logdir,
+            )
+        finally:
+            # NOTE: cluster process is reaped by the pool if it exited on its own
+            try:
+                os.kill(cluster_pid, signal.SIGTERM)
+                os.waitpid(cluster_pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+
+    def run_user_host(self, address: str):
+        """Startup function for a host of user managers. Runs user managers from
+        any scenario of the test in this process, sharing one Dask client, one
+        backend API per backend address and one loop flushing user results.
+
+        Args:
+            address (str): unix:<path> or <host>:<port> to listen for requests on
+        """
+        from distributed.client import Client, fire_and_forget  # type: ignore
+
+        client = Client()
+        backend_apis: Dict[str, IBackendAPI] = {}
+        backend_api_maker = self.__backend_builder.get_backend_api_maker()
+
+        def get_backend_api(backend_address: str) -> IBackendAPI:
+            if backend_address not in backend_apis:
+                backend_apis[backend_address] = backend_api_maker(backend_address)
+
+            return backend_apis[backend_address]
+
+        def make_user_manager(request: UserManagerRequest):
+            scenario = self.__scenarios[request.name]  # type: ignore
+            backend_api = get_backend_api(request.backend_address)  # type: ignore
+            context = resolve_context(
+                decode_context(request.encoded_context),  # type: ignore
+                backend_api.get_context_value,
+            )
+
+            buffer_fut = client.submit(
+                UserBufferActor,
+                user_manager_id=request.user_manager_id,
+                backend_address=request.backend_address,
+                backend_api_maker=backend_api_maker,
+                actor=True,
+            )
+
+            buffer = buffer_fut.result()
+
+            fire_and_forget(buffer_fut)
+
+            backend = UserManagerBackend(
+                request.user_manager_id, buffer, backend_api  # type: ignore
+            )
+
+            def step():
+                schedule_new_users(client, scenario, backend, context)
+                flush_user_results(scenario, backend)
+
+            return step
+
+        try:
+            serve_user_manager_host(make_user_manager, address)
+        finally:
+            client.close()
+
+    def __resolve_context(self, encoded_context: str, backend_address: str) -> Any:
+        backend_api = self.__backend_builder.get_backend_api_maker()(backend_address)
+
+        return resolve_context(
+            decode_context(encoded_context), backend_api.get_context_value
+        )
+
 
 @click.group()
 @click.pass_context
@@ -177,18 +340,40 @@ def engine_cli(ctx):
 @click.option("--tag", "-t", type=str, multiple=True, default=[])
 @click.option("--test-id", type=str, required=True)
 @click.option("--backend-address", type=str, default=DEFAULT_BACKEND_ADDRESS)
+@click.option(
+    "--max-concurrency",
+    type=int,
+    default=None,
+    envvar=MAX_CONCURRENCY_ENV_VAR,
+    help="Max scenarios running at once",
+)
+@click.option(
+    "--cache-dir",
+    type=str,
+    default=DEFAULT_CACHE_DIR,
+    envvar=CACHE_DIR_ENV_VAR,
+    help="Directory to cache results of cacheable scenarios in",
+)
 def run_test(
     ctx,
     tag,
     test_id,
     backend_address,
+    max_concurrency,
+    cache_dir,
 ):
     engine: Engine = ctx.obj
 
     engine.__test_id = test_id
     engine.__backend_address = backend_address
 
-    engine.run_test(tags=tag, test_id=test_id, backend_address=backend_address)
+    engine.run_test(
+        tags=tag,
+        test_id=test_id,
+        backend_address=backend_address,
+        max_concurrency=max_concurrency,
+        cache_dir=cache_dir,
+    )
 
 
 @engine_cli.command()
@@ -246,3 +431,41 @@ def run_user(
         backend_address=backend_address,
         encoded_context=encoded_context,
     )
+
+
+@engine_cli.command()
+@click.pass_context
+@click.option(
+    "--address",
+    type=str,
+    required=True,
+    help="unix:<path> or <host>:<port> to listen for user manager requests on",
+)
+@click.option(
+    "--logdir",
+    type=str,
+    default=None,
+    help="Directory to write user manager logs to",
+)
+def run_user_pool(
+    ctx,
+    address,
+    logdir,
+):
+    engine: Engine = ctx.obj
+
+    engine.run_user_pool(address=address, logdir=logdir)
+
+
+@engine_cli.command()
+@click.pass_context
+@click.option(
+    "--address",
+    type=str,
+    required=True,
+    help="unix:<path> or <host>:<port> to listen for user manager requests on",
+)
+def run_user_host(ctx, address):
+    engine: Engine = ctx.obj
+
+    engine.run_user_host(address=address)
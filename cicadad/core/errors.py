@@ -0,0 +1,147 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+import re
+
+from cicadad.core.types import ErrorGroup
+
+DEFAULT_MAX_ERROR_GROUPS = 100
+DEFAULT_MAX_ERROR_SAMPLES = 3
+DEFAULT_MAX_ERROR_SAMPLE_LENGTH = 4096
+DEFAULT_ERROR_MEMORY_BUDGET = 1024 * 1024
+OVERFLOW_FINGERPRINT = "<other errors>"
+
+# NOTE: order matters, IDs and addresses contain numbers
+VARIABLE_PATTERNS = [
+    (
+        re.compile(
+            r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+        ),
+        "<id>",
+    ),
+    (re.compile(r"0x[0-9a-fA-F]+"), "<address>"),
+    (re.compile(r"\d+(\.\d+)?"), "<n>"),
+]
+
+
+def error_fingerprint(error: str) -> str:
+    """Get template of error message, used to group repeats of the same error.
+
+    The template is the first non-empty line of the error, usually the exception
+    type and message, with IDs, addresses and numbers replaced by placeholders.
+
+    Args:
+        error (str): Error string created by result verifier
+
+    Returns:
+        str: Error fingerprint
+    """
+    first_line = next(
+        (line.strip() for line in error.splitlines() if line.strip() != ""), ""
+    )
+
+    for pattern, placeholder in VARIABLE_PATTERNS:
+        first_line = pattern.sub(placeholder, first_line)
+
+    return first_line
+
+
+class ErrorCollector:
+    def __init__(
+        self,
+        max_groups: int = DEFAULT_MAX_ERROR_GROUPS,
+        max_samples: int = DEFAULT_MAX_ERROR_SAMPLES,
+        max_sample_length: int = DEFAULT_MAX_ERROR_SAMPLE_LENGTH,
+        memory_budget: int = DEFAULT_ERROR_MEMORY_BUDGET,
+    ) -> None:
+        """Groups errors reported by a scenario by fingerprint.
+
+        Every error is counted, but only a few samples are kept per group, and
+        samples stop being kept once the memory budget is used.
+
+        Args:
+            max_groups (int, optional): Max distinct groups, further errors are
+                counted in a single overflow group. Defaults to 100.
+            max_samples (int, optional): Samples kept per group. Defaults to 3.
+            max_sample_length (int, optional): Max characters per sample. Defaults to 4096.
+            memory_budget (int, optional): Max characters kept across all samples.
+                Defaults to 1MB.
+        """
+        self.__max_groups = max_groups
+        self.__max_samples = max_samples
+        self.__max_sample_length = max_sample_length
+        self.__memory_budget = memory_budget
+
+        self.__groups: Dict[str, ErrorGroup] = {}
+        self.__num_errors = 0
+        self.__memory_used = 0
+
+    @property
+    def num_errors(self) -> int:
+        return self.__num_errors
+
+    @property
+    def groups(self) -> List[ErrorGroup]:
+        return list(self.__groups.values())
+
+    def add_errors(self, errors: List[str], now: Optional[datetime] = None):
+        """Count errors and keep samples of them.
+
+        Args:
+            errors (List[str]): Errors created by result verifier
+            now (datetime, optional): Time errors were seen. Defaults to current time.
+        """
+        seen = now or datetime.now()
+
+        for error in errors:
+            self.__num_errors += 1
+            fingerprint = error_fingerprint(error)
+
+            if (
+                fingerprint not in self.__groups
+                and len(self.__groups) >= self.__max_groups
+            ):
+                fingerprint = OVERFLOW_FINGERPRINT
+
+            group = self.__groups.get(fingerprint)
+
+            if group is None:
+                group = ErrorGroup(
+                    fingerprint=fingerprint,
+                    count=0,
+                    first_seen=seen,
+                    last_seen=seen,
+                )
+                self.__groups[fingerprint] = group
+
+            group.count += 1
+            group.last_seen = seen
+
+            sample = error[: self.__max_sample_length]
+
+            if (
+                len(group.samples) < self.__max_samples
+                and self.__memory_used + len(sample) <= self.__memory_budget
+            ):
+                group.samples.append(sample)
+                self.__memory_used += len(sample)
+
+    def format_groups(self) -> List[str]:
+        """Create one error string per group, using the first sample of the group.
+
+        Returns:
+            List[str]: Error strings
+        """
+        error_strings = []
+
+        for group in self.__groups.values():
+            error_string = group.samples[0] if group.samples else group.fingerprint
+
+            if group.count > 1:
+                error_string += (
+                    f"\n(raised {group.count} times, first seen {group.first_seen}, "
+                    f"last seen {group.last_seen})"
+                )
+
+            error_strings.append(error_string)
+
+        return error_strings
@@ -0,0 +1,162 @@
+from typing import Callable, Dict, List, Optional
+import operator
+
+from cicadad.core.types import WindowStats
+
+DEFAULT_GUARD_WINDOW = 30
+DEFAULT_GUARD_MIN_COUNT = 10
+
+OPERATORS: Dict[str, Callable[[float, float], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+
+class ScenarioAbortedError(Exception):
+    """Raised in load model when an abort condition of the scenario is met."""
+
+
+class AbortCondition:
+    def __init__(
+        self,
+        statistic: str,
+        metric: str,
+        comparison: str,
+        threshold: float,
+        window: int = DEFAULT_GUARD_WINDOW,
+        min_count: int = DEFAULT_GUARD_MIN_COUNT,
+    ) -> None:
+        """Condition on recent results that stops a scenario when met.
+
+        Created by comparing a WindowStatistic to a threshold, e.g. error_rate > 0.2
+
+        Args:
+            statistic (str): Field of WindowStats to compare
+            metric (str): Result column statistic is calculated for
+            comparison (str): One of >, >=, <, <=
+            threshold (float): Value to compare statistic to
+            window (int, optional): Seconds of results to check. Defaults to 30.
+            min_count (int, optional): Results needed in window before condition
+                is checked. Defaults to 10.
+        """
+        self.statistic = statistic
+        self.metric = metric
+        self.comparison = comparison
+        self.threshold = threshold
+        self.window = window
+        self.min_count = min_count
+
+    def configure(self, window: int, min_count: int) -> "AbortCondition":
+        return AbortCondition(
+            statistic=self.statistic,
+            metric=self.metric,
+            comparison=self.comparison,
+            threshold=self.threshold,
+            window=window,
+            min_count=min_count,
+        )
+
+    def evaluate(self, stats: WindowStats) -> Optional[str]:
+        """Check condition against statistics of recent results.
+
+        Args:
+            stats (WindowStats): Statistics for window of condition
+
+        Returns:
+            Optional[str]: Reason for aborting if condition is met
+        """
+        value = getattr(stats, self.statistic)
+
+        if stats.count < self.min_count or value is None:
+            return None
+
+        if not OPERATORS[self.comparison](value, self.threshold):
+            return None
+
+        return (
+            f"{self.statistic} {self.comparison} {self.threshold} "
+            f"over last {self.window}s (was {value:.4g})"
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.statistic} {self.comparison} {self.threshold}"
+
+
+class WindowStatistic:
+    def __init__(self, statistic: str, metric: str = "time_taken") -> None:
+        """Statistic of recent results that can be compared to create an AbortCondition.
+
+        Args:
+            statistic (str): Field of WindowStats
+            metric (str, optional): Result column for percentiles. Defaults to "time_taken".
+        """
+        self.__statistic = statistic
+        self.__metric = metric
+
+    def of(self, metric: str) -> "WindowStatistic":
+        """Get same statistic for another result column, e.g. p99.of("output")."""
+        return WindowStatistic(self.__statistic, metric)
+
+    def __compare(self, comparison: str, threshold: float) -> AbortCondition:
+        return AbortCondition(self.__statistic, self.__metric, comparison, threshold)
+
+    def __gt__(self, threshold: float) -> AbortCondition:  # type: ignore
+        return self.__compare(">", threshold)
+
+    def __ge__(self, threshold: float) -> AbortCondition:  # type: ignore
+        return self.__compare(">=", threshold)
+
+    def __lt__(self, threshold: float) -> AbortCondition:  # type: ignore
+        return self.__compare("<", threshold)
+
+    def __le__(self, threshold: float) -> AbortCondition:  # type: ignore
+        return self.__compare("<=", threshold)
+
+
+error_rate = WindowStatistic("error_rate")
+throughput = WindowStatistic("throughput")
+p50 = WindowStatistic("p50")
+p90 = WindowStatistic("p90")
+p95 = WindowStatistic("p95")
+p99 = WindowStatistic("p99")
+
+
+class ScenarioGuard:
+    def __init__(self, conditions: List[AbortCondition]) -> None:
+        """Checks abort conditions of a scenario each time results are collected.
+
+        Shared between the pools of a scenario, so every pool stops once any
+        pool meets a condition.
+
+        Args:
+            conditions (List[AbortCondition]): Conditions to check
+        """
+        self.__conditions = conditions
+        self.__reason: Optional[str] = None
+
+    @property
+    def reason(self) -> Optional[str]:
+        return self.__reason
+
+    def check(self, window_stats: Callable[[str, int], WindowStats]):
+        """Raise if scenario has been aborted or an abort condition is met.
+
+        Args:
+            window_stats (Callable[[str, int], WindowStats]): Get statistics by
+                metric and window size
+
+        Raises:
+            ScenarioAbortedError: Scenario should stop
+        """
+        for condition in self.__conditions:
+            if self.__reason is not None:
+                break
+
+            self.__reason = condition.evaluate(
+                window_stats(condition.metric, condition.window)
+            )
+
+        if self.__reason is not None:
+            raise ScenarioAbortedError(f"Scenario aborted: {self.__reason}")
@@ -0,0 +1,467 @@
+from typing import Callable, Dict, Optional, Tuple
+import json
+import os
+import signal
+import socketserver
+import sys
+import time
+import traceback
+
+from pydantic import BaseModel
+
+START_USER_MANAGER = "start"
+STOP_USER_MANAGER = "stop"
+CHECK_USER_MANAGER = "check"
+SHUTDOWN_POOL = "shutdown"
+UNIX_ADDRESS_PREFIX = "unix:"
+
+RunUserFn = Callable[[str, str, str, str], None]
+StepFn = Callable[[], None]
+# NOTE: starts service and returns its address and a function to close it
+StartServiceFn = Callable[[], Tuple[str, Callable[[], None]]]
+
+
+class ReusableTCPServer(socketserver.TCPServer):
+    allow_reuse_address = True
+
+
+class UserManagerRequest(BaseModel):
+    """Request sent to a user manager pool, one JSON line per connection."""
+
+    command: str
+    user_manager_id: Optional[str] = None
+    name: Optional[str] = None
+    backend_address: Optional[str] = None
+    encoded_context: Optional[str] = None
+    env: Dict[str, str] = {}
+
+
+class UserManagerPool(object):
+    def __init__(
+        self,
+        run_user: RunUserFn,
+        logdir: Optional[str] = None,
+        after_fork: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Forks user managers from a process that has already imported the test.
+
+        Forked user managers skip starting Python and importing the test file
+        and its dependencies, so they can start running users right away.
+
+        Args:
+            run_user (RunUserFn): Run user manager given scenario name, user
+                manager ID, backend address and encoded context
+            logdir (str, optional): Directory to write user manager logs to. Defaults to None.
+            after_fork (Callable[[], None], optional): Called in user manager after
+                fork, used to close resources of the pool. Defaults to None.
+        """
+        self.__run_user = run_user
+        self.__logdir = logdir
+        self.__after_fork = after_fork
+        self.__processes: Dict[str, int] = {}
+        self.closed = False
+
+    @property
+    def user_manager_ids(self):
+        return list(self.__processes)
+
+    def handle(self, request: UserManagerRequest) -> dict:
+        """Handle a request to the pool.
+
+        Args:
+            request (UserManagerRequest): Request to handle
+
+        Raises:
+            ValueError: Unknown command
+
+        Returns:
+            dict: Response to send back
+        """
+        self.reap()
+
+        if request.command == START_USER_MANAGER:
+            return {"pid": self.start(request)}
+        elif request.command == STOP_USER_MANAGER:
+            return {"stopped": self.stop(request.user_manager_id)}
+        elif request.command == CHECK_USER_MANAGER:
+            return {"running": request.user_manager_id in self.__processes}
+        elif request.command == SHUTDOWN_POOL:
+            self.shutdown()
+
+            return {"stopped": True}
+
+        raise ValueError(f"Unknown command: {request.command}")
+
+    def start(self, request: UserManagerRequest) -> int:
+        """Fork a user manager.
+
+        Args:
+            request (UserManagerRequest): Start request
+
+        Returns:
+            int: PID of user manager
+        """
+        pid = os.fork()
+
+        if pid == 0:
+            # NOTE: does not return
+            self.__run_child(request)
+
+        self.__processes[request.user_manager_id] = pid  # type: ignore
+
+        return pid
+
+    def stop(self, user_manager_id: Optional[str]) -> bool:
+        """Kill a user manager, like stopping a user manager process.
+
+        Args:
+            user_manager_id (str): ID of user manager
+
+        Returns:
+            bool: User manager was running
+        """
+        pid = self.__processes.pop(user_manager_id, None)  # type: ignore
+
+        if pid is None:
+            return False
+
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            return False
+
+        return True
+
+    def shutdown(self):
+        """Kill all user managers and stop handling requests."""
+        for user_manager_id in self.user_manager_ids:
+            self.stop(user_manager_id)
+
+        self.reap()
+        self.closed = True
+
+    def reap(self):
+        """Collect exit status of finished user managers."""
+        pids = {pid: name for name, pid in self.__processes.items()}
+
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+
+            if pid == 0:
+                return
+
+            if pid in pids:
+                del self.__processes[pids[pid]]
+
+    def __run_child(self, request: UserManagerRequest):
+        exit_code = 0
+
+        try:
+            if self.__after_fork is not None:
+                self.__after_fork()
+
+            if self.__logdir is not None:
+                os.makedirs(self.__logdir, exist_ok=True)
+
+                log_fd = os.open(
+                    os.path.join(self.__logdir, f"{request.user_manager_id}.log"),
+                    os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                    0o644,
+                )
+
+                os.dup2(log_fd, sys.stdout.fileno())
+                os.dup2(log_fd, sys.stderr.fileno())
+                os.close(log_fd)
+
+            os.environ.update(request.env)
+
+            self.__run_user(
+                request.name,  # type: ignore
+                request.user_manager_id,  # type: ignore
+                request.backend_address,  # type: ignore
+                request.encoded_context,  # type: ignore
+            )
+        except BaseException:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+            # NOTE: never return to the request loop of the pool
+            os._exit(exit_code)
+
+
+class UserManagerHost(object):
+    def __init__(
+        self, make_user_manager: Callable[[UserManagerRequest], StepFn]
+    ) -> None:
+        """Runs several user managers in one process.
+
+        Each user manager is a step function that starts its new users and
+        flushes their results. Steps of all user managers are run from one loop,
+        so they share the executor, backend connection and result flusher of the
+        host instead of each starting their own.
+
+        Args:
+            make_user_manager (Callable[[UserManagerRequest], StepFn]): Create
+                step function of user manager from start request
+        """
+        self.__make_user_manager = make_user_manager
+        self.__user_managers: Dict[str, StepFn] = {}
+        self.closed = False
+
+    @property
+    def user_manager_ids(self):
+        return list(self.__user_managers)
+
+    def handle(self, request: UserManagerRequest) -> dict:
+        """Handle a request to the host, same as requests to a pool.
+
+        Args:
+            request (UserManagerRequest): Request to handle
+
+        Raises:
+            ValueError: Unknown command
+
+        Returns:
+            dict: Response to send back
+        """
+        if request.command == START_USER_MANAGER:
+            self.start(request)
+
+            return {"pid": os.getpid()}
+        elif request.command == STOP_USER_MANAGER:
+            return {"stopped": self.stop(request.user_manager_id)}
+        elif request.command == CHECK_USER_MANAGER:
+            return {"running": request.user_manager_id in self.__user_managers}
+        elif request.command == SHUTDOWN_POOL:
+            self.shutdown()
+
+            return {"stopped": True}
+
+        raise ValueError(f"Unknown command: {request.command}")
+
+    def start(self, request: UserManagerRequest):
+        """Add a user manager to the host.
+
+        Args:
+            request (UserManagerRequest): Start request
+        """
+        user_manager_id: str = request.user_manager_id  # type: ignore
+
+        self.__user_managers[user_manager_id] = self.__make_user_manager(request)
+
+    def stop(self, user_manager_id: Optional[str]) -> bool:
+        """Remove a user manager from the host after flushing its results.
+
+        Users of the user manager are stopped by the scenario before the user
+        manager is stopped, so they are left to finish on their own.
+
+        Args:
+            user_manager_id (str): ID of user manager
+
+        Returns:
+            bool: User manager was running
+        """
+        step = self.__user_managers.pop(user_manager_id, None)  # type: ignore
+
+        if step is None:
+            return False
+
+        self.__run_step(step)
+
+        return True
+
+    def shutdown(self):
+        """Stop all user managers and stop handling requests."""
+        for user_manager_id in self.user_manager_ids:
+            self.stop(user_manager_id)
+
+        self.closed = True
+
+    def step(self):
+        """Run step of each user manager once."""
+        for step in list(self.__user_managers.values()):
+            self.__run_step(step)
+
+    def __run_step(self, step: StepFn):
+        # NOTE: error in one user manager should not stop others in host
+        try:
+            step()
+        except Exception:
+            traceback.print_exc()
+
+
+def fork_service(
+    start_service: StartServiceFn, check_interval: float = 1
+) -> Tuple[int, str]:
+    """Fork a process running a service shared by user managers of a pool, such
+    as a Dask cluster.
+
+    The service runs in its own process, so the pool stays single threaded and
+    safe to fork. The service is closed when the process is terminated or the
+    pool process exits.
+
+    Args:
+        start_service (StartServiceFn): Start service and return its address and
+            a function to close it
+        check_interval (float, optional): Seconds between checks that pool is
+            still running. Defaults to 1.
+
+    Raises:
+        RuntimeError: Service failed to start
+
+    Returns:
+        Tuple[int, str]: PID of service process and address of service
+    """
+    read_fd, write_fd = os.pipe()
+    pool_pid = os.getpid()
+    pid = os.fork()
+
+    if pid == 0:
+        os.close(read_fd)
+        exit_code = 0
+
+        try:
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+            service_address, close_service = start_service()
+
+            # NOTE: pool can terminate service as soon as it has the address
+            try:
+                os.write(write_fd, service_address.encode("utf-8"))
+                os.close(write_fd)
+
+                while os.getppid() == pool_pid:
+                    time.sleep(check_interval)
+            finally:
+                signal.signal(signal.SIGTERM, signal.SIG_IGN)
+                close_service()
+        except SystemExit:
+            pass
+        except BaseException:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+            # NOTE: never return to the pool
+            os._exit(exit_code)
+
+    os.close(write_fd)
+
+    with os.fdopen(read_fd, "rb") as reader:
+        service_address = reader.read().decode("utf-8")
+
+    if service_address == "":
+        os.waitpid(pid, 0)
+
+        raise RuntimeError("Service of user manager pool failed to start")
+
+    return pid, service_address
+
+
+def make_pool_server(
+    address: str, handler: Callable[[UserManagerRequest], dict]
+) -> socketserver.BaseServer:
+    """Create server for user manager pool requests.
+
+    Args:
+        address (str): unix:<path> or <host>:<port> to listen on
+        handler (Callable[[UserManagerRequest], dict]): Handle request and
+            return response
+
+    Returns:
+        socketserver.BaseServer: Server listening on address
+    """
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            try:
+                response = handler(UserManagerRequest.parse_raw(self.rfile.readline()))
+            except Exception as e:
+                response = {"error": str(e)}
+
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+    if address.startswith(UNIX_ADDRESS_PREFIX):
+        path = address.replace(UNIX_ADDRESS_PREFIX, "", 1)
+
+        # NOTE: socket file is left behind if a previous pool was killed
+        if os.path.exists(path):
+            os.unlink(path)
+
+        return socketserver.UnixStreamServer(path, RequestHandler)
+
+    host, port = address.rsplit(":", 1)
+
+    return ReusableTCPServer((host, int(port)), RequestHandler)
+
+
+def serve_user_manager_pool(
+    run_user: RunUserFn, address: str, logdir: Optional[str] = None
+):
+    """Fork user managers on requests until the pool is shut down.
+
+    Requests are handled one at a time, so the pool never forks while another
+    thread is running.
+
+    Args:
+        run_user (RunUserFn): Run user manager given scenario name, user manager ID,
+            backend address and encoded context
+        address (str): unix:<path> or <host>:<port> to listen on
+        logdir (str, optional): Directory to write user manager logs to. Defaults to None.
+    """
+    server: Optional[socketserver.BaseServer] = None
+
+    def close_server():
+        if server is not None:
+            server.server_close()
+
+    pool = UserManagerPool(run_user, logdir, after_fork=close_server)
+    server = make_pool_server(address, pool.handle)
+
+    try:
+        while not pool.closed:
+            server.handle_request()
+    finally:
+        pool.shutdown()
+        server.server_close()
+
+
+def serve_user_manager_host(
+    make_user_manager: Callable[[UserManagerRequest], StepFn],
+    address: str,
+    interval: float = 1,
+):
+    """Run user managers on requests until the host is shut down.
+
+    Requests and user manager steps are handled from the same thread, so user
+    managers do not need to lock anything they share.
+
+    Args:
+        make_user_manager (Callable[[UserManagerRequest], StepFn]): Create step
+            function of user manager from start request
+        address (str): unix:<path> or <host>:<port> to listen on
+        interval (float, optional): Seconds between steps of user managers. Defaults to 1.
+    """
+    host = UserManagerHost(make_user_manager)
+    server = make_pool_server(address, host.handle)
+    next_step = time.monotonic()
+
+    try:
+        while not host.closed:
+            server.timeout = max(next_step - time.monotonic(), 0)
+            server.handle_request()
+
+            if time.monotonic() >= next_step:
+                host.step()
+                next_step = time.monotonic() + interval
+    finally:
+        host.shutdown()
+        server.server_close()
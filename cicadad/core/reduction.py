@@ -0,0 +1,154 @@
+from datetime import datetime
+from typing import Any, Dict, List
+import random
+import uuid
+
+from cicadad.core.types import (
+    MetricCollector,
+    MetricSummary,
+    ReducedResults,
+    Result,
+    ResultReducerFn,
+)
+from cicadad.metrics.console import RESULTS_PER_SECOND_COLLECTOR, summarize_values
+from cicadad.metrics.window import make_window_slot
+
+DEFAULT_REDUCED_SAMPLE_RATE = 0.01
+
+
+def merge_metric_summaries(
+    first: MetricSummary, second: MetricSummary
+) -> MetricSummary:
+    """Combine two summaries of the same metric.
+
+    Args:
+        first (MetricSummary): Earlier summary
+        second (MetricSummary): Later summary
+
+    Returns:
+        MetricSummary: Summary covering values of both summaries
+    """
+    return MetricSummary(
+        count=first.count + second.count,
+        sum=first.sum + second.sum,
+        min=min(first.min, second.min),
+        max=max(first.max, second.max),
+        last=second.last,
+        sum_of_squares=first.sum_of_squares + second.sum_of_squares,
+        histogram={
+            index: first.histogram.get(index, 0) + second.histogram.get(index, 0)
+            for index in set(first.histogram) | set(second.histogram)
+        },
+    )
+
+
+class MetricRecorder:
+    def __init__(self) -> None:
+        """Stands in for scenario backend when running metric collectors in a user
+        manager, summarizing metrics locally instead of sending each value."""
+        self.__values: Dict[str, List[float]] = {}
+        self.__summaries: Dict[str, MetricSummary] = {}
+
+    @property
+    def summaries(self) -> Dict[str, MetricSummary]:
+        summaries = dict(self.__summaries)
+
+        for name, values in self.__values.items():
+            summary = summarize_values(values)
+
+            if name in summaries:
+                summary = merge_metric_summaries(summaries[name], summary)
+
+            summaries[name] = summary
+
+        return summaries
+
+    def add_metric(self, name: str, value: float):
+        self.__values.setdefault(name, []).append(value)
+
+    def add_metric_summary(self, name: str, summary: MetricSummary):
+        if name in self.__summaries:
+            summary = merge_metric_summaries(self.__summaries[name], summary)
+
+        self.__summaries[name] = summary
+
+
+def reduce_results(
+    results: List[Result],
+    reducer: ResultReducerFn,
+    metric_collectors: List[MetricCollector],
+    sample_rate: float = DEFAULT_REDUCED_SAMPLE_RATE,
+) -> List[Result]:
+    """Replace results collected by a user manager with a partial aggregate.
+
+    Metric collectors are run against all results and sent as summaries with the
+    partial aggregate, along with a window slot of result counts and histograms.
+    Results per second are left to the scenario, which sees all user managers.
+    Failed results and a sample of successful results are kept so scenarios can
+    still verify errors and inspect raw results.
+
+    Args:
+        results (List[Result]): Results collected from users
+        reducer (ResultReducerFn): Function to create partial aggregate of results
+        metric_collectors (List[MetricCollector]): Collectors to summarize metrics with
+        sample_rate (float, optional): Fraction of successful results to keep. Defaults to 0.01.
+
+    Returns:
+        List[Result]: Partial aggregate followed by kept raw results
+    """
+    if results == []:
+        return []
+
+    recorder = MetricRecorder()
+
+    for collector in metric_collectors:
+        if collector is not RESULTS_PER_SECOND_COLLECTOR:
+            collector(results, recorder)  # type: ignore
+
+    failed = len([result for result in results if result.exception is not None])
+    timestamps = [
+        result.timestamp for result in results if result.timestamp is not None
+    ]
+
+    partial = Result(
+        id=str(uuid.uuid4()),
+        output=ReducedResults(
+            partial=reducer(None, results),
+            metrics=recorder.summaries,
+            window=make_window_slot(results),
+            last_timestamp=max(timestamps, default=None),
+        ),
+        exception=None,
+        logs="",
+        time_taken=None,
+        timestamp=min(timestamps, default=datetime.now()),
+        succeeded=len(results) - failed,
+        failed=failed,
+        reduced_count=len(results),
+    )
+
+    kept = [
+        result.copy(update={"reduced_count": 0})
+        for result in results
+        if result.exception is not None or random.random() < sample_rate  # nosec
+    ]
+
+    return [partial] + kept
+
+
+def is_partial_result(result: Any) -> bool:
+    """Check if result is a partial aggregate created by a user manager."""
+    return isinstance(result, Result) and bool(result.reduced_count)
+
+
+def is_reduced_result(result: Any) -> bool:
+    """Check if result is already counted in a partial aggregate."""
+    return isinstance(result, Result) and result.reduced_count == 0
+
+
+def result_count(result: Any) -> int:
+    """Get number of user results represented by a collected result."""
+    if isinstance(result, Result) and result.reduced_count is not None:
+        return result.reduced_count
+
+    return 1
@@ -1,17 +1,20 @@
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+import heapq
 import json
+import os
 import time
 import io
 import traceback
 import uuid
 
-from distributed.client import Client, fire_and_forget  # type: ignore
-from distributed.threadpoolexecutor import secede  # type: ignore
-
+from cicadad.core.cache import ScenarioCache, scenario_cache_key
 from cicadad.core.commands import ScenarioCommands, UserCommands
+from cicadad.core.guards import ScenarioGuard
+from cicadad.core.reduction import reduce_results
 from cicadad.core.scenario import Scenario
 from cicadad.core.types import (
+    IResultExporter,
     IScenarioBackend,
     ITestBackend,
     IUserBackend,
@@ -21,8 +24,19 @@ from cicadad.core.types import (
     TestEvent,
     TestStatus,
 )
+from cicadad.metrics.snapshot import evaluate_console_metrics
 from cicadad.util import printing
-from cicadad.util.context import encode_context
+from cicadad.util.constants import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_METRICS_DEADLINE,
+    DEFAULT_METRICS_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+)
+from cicadad.util.context import encode_context, make_context_refs
+
+# NOTE: distributed is slow to import and only needed by user managers
+if TYPE_CHECKING:
+    from distributed.client import Client  # type: ignore
 
 
 def filter_scenarios_by_tag(
@@ -47,14 +61,19 @@ def filter_scenarios_by_tag(
 
 def start_scenario(
     scenario: Scenario,
-    results: Dict[str, dict],
+    context_refs: Dict[str, str],
     backend: ITestBackend,
 ) -> str:
-    encoded_context = encode_context(results)
+    # NOTE: scenario only receives results of its dependencies, by reference
+    refs = {
+        dep.name: context_refs[dep.name]
+        for dep in scenario.dependencies
+        if dep.name in context_refs
+    }
 
     scenario_id = backend.create_scenario(
         scenario_name=scenario.name,
-        context=encoded_context,
+        context=encode_context(make_context_refs(refs)),
         users_per_instance=scenario.users_per_instance,
         tags=scenario.tags,
     )
@@ -66,7 +85,7 @@ def start_scenario(
                 scenario=scenario.name,
                 scenario_id=scenario_id,
                 message=f"Started scenario: {scenario.name} ({scenario_id})",
-                context=json.dumps(results),
+                context=json.dumps(refs),
             ),
         ),
     )
@@ -74,24 +93,247 @@ def start_scenario(
     return scenario_id
 
 
-def test_runner(scenarios: Iterable[Scenario], tags: List[str], backend: ITestBackend):
-    started: Dict[str, str] = {}
-    scenarios_by_id: Dict[str, Scenario] = {}
-    results: Dict[str, dict] = {}
+def critical_path(
+    scenarios: Iterable[Scenario], durations: Dict[str, float]
+) -> Tuple[List[str], float]:
+    """Find the chain of dependent scenarios that took the longest to run.
+
+    Args:
+        scenarios (Iterable[Scenario]): Scenarios in test
+        durations (Dict[str, float]): Seconds each scenario took to run
+
+    Returns:
+        Tuple[List[str], float]: Scenario names in order and total seconds of chain
+    """
+    by_name = {scenario.name: scenario for scenario in scenarios}
+    lengths: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+
+    def path_length(name: str) -> float:
+        if name not in lengths:
+            deps = [
+                dep.name for dep in by_name[name].dependencies if dep.name in by_name
+            ]
+            longest_dep = max(deps, key=path_length, default=None)
+
+            previous[name] = longest_dep
+            lengths[name] = durations.get(name, 0) + (
+                path_length(longest_dep) if longest_dep is not None else 0
+            )
+
+        return lengths[name]
+
+    last = max(by_name, key=path_length, default=None)
+    path: List[str] = []
+    current = last
+
+    while current is not None:
+        path.insert(0, current)
+        current = previous[current]
 
+    return path, lengths[last] if last is not None else 0
+
+
+def test_runner(
+    scenarios: Iterable[Scenario],
+    tags: List[str],
+    backend: ITestBackend,
+    max_concurrency: Optional[int] = None,
+    min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+    max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+    metrics_interval: float = DEFAULT_METRICS_INTERVAL,
+    cache: Optional[ScenarioCache] = None,
+    metrics_deadline: float = DEFAULT_METRICS_DEADLINE,
+):
+    """Run scenarios in order of their dependencies.
+
+    Scenarios are started as soon as their dependencies finish, highest priority
+    first, with at most max_concurrency running at once. Polling speeds up after
+    every change and backs off while nothing happens.
+
+    Args:
+        scenarios (Iterable[Scenario]): Scenarios in test
+        tags (List[str]): Tags to filter scenarios by
+        backend (ITestBackend): Backend for test
+        max_concurrency (int, optional): Max scenarios running at once. Defaults to None.
+        min_poll_interval (float, optional): Seconds between polls after a change. Defaults to 0.05.
+        max_poll_interval (float, optional): Seconds between polls when idle. Defaults to 1.
+        metrics_interval (float, optional): Seconds between console metric events. Defaults to 1.
+        cache (ScenarioCache, optional): Cache of cacheable scenario results. Defaults to None.
+        metrics_deadline (float, optional): Seconds to wait for console metrics. Defaults to 0.5.
+    """
     valid_scenarios = filter_scenarios_by_tag(scenarios, tags)
+    valid_names = {scenario.name for scenario in valid_scenarios}
+    by_name = {scenario.name: scenario for scenario in valid_scenarios}
+
+    results: Dict[str, dict] = {}
+    context_refs: Dict[str, str] = {}
+    running: Dict[str, str] = {}
+    start_times: Dict[str, float] = {}
+    durations: Dict[str, float] = {}
+    last_metrics: Dict[str, float] = {}
+    cache_keys: Dict[str, str] = {}
+
+    # NOTE: dependencies filtered out by tags can never finish
+    remaining_deps = {
+        scenario.name: {dep.name for dep in scenario.dependencies}
+        for scenario in valid_scenarios
+    }
+    dependents: Dict[str, List[str]] = {name: [] for name in valid_names}
 
-    # Start scenarios with no dependencies
     for scenario in valid_scenarios:
-        if scenario.dependencies == []:
-            scenario_id = start_scenario(
-                scenario=scenario,
-                results=results,
+        for dep in scenario.dependencies:
+            if dep.name in dependents:
+                dependents[dep.name].append(scenario.name)
+
+    # NOTE: ties are started in the order scenarios were added
+    order = {scenario.name: i for i, scenario in enumerate(valid_scenarios)}
+    ready: List[Tuple[int, int, str]] = []
+
+    def add_ready(name: str):
+        heapq.heappush(ready, (-by_name[name].priority, order[name], name))
+
+    def start_ready():
+        while ready != [] and (
+            max_concurrency is None or len(running) < max_concurrency
+        ):
+            _, _, name = heapq.heappop(ready)
+
+            if cache is not None and by_name[name].cache_ttl is not None:
+                cache_keys[name] = scenario_cache_key(
+                    by_name[name], results, os.environ
+                )
+                cached = cache.get(cache_keys[name])
+
+                if cached is not None:
+                    scenario_id = cache_keys[name][:8]
+
+                    # NOTE: listeners expect every finished scenario to have started
+                    backend.add_test_event(
+                        event=TestEvent(
+                            kind="SCENARIO_STARTED",
+                            payload=TestStatus(
+                                scenario=name,
+                                scenario_id=scenario_id,
+                                message=f"Using Cached Result: {name} ({scenario_id})",
+                                context=json.dumps({}),
+                            ),
+                        ),
+                    )
+
+                    finish(name, scenario_id, cached, f"Used Cached Result: {name}")
+                    continue
+
+            running[name] = start_scenario(
+                scenario=by_name[name],
+                context_refs=context_refs,
                 backend=backend,
             )
+            start_times[name] = time.monotonic()
+
+    def finish(name: str, scenario_id: str, result: dict, message: str):
+        results[name] = result
+
+        if result["exception"] is None and dependents.get(name, []) != []:
+            context_refs[name] = backend.save_context_value(result)
+
+        # NOTE: only results of scenarios that actually ran are saved, not cache hits
+        ttl = by_name[name].cache_ttl if name in by_name else None
+
+        if (
+            cache is not None
+            and ttl is not None
+            and name in running
+            and name in cache_keys
+            and result["exception"] is None
+        ):
+            cache.put(cache_keys[name], result, ttl)
+
+        durations[name] = time.monotonic() - start_times.get(name, time.monotonic())
+        running.pop(name, None)
+
+        backend.add_test_event(
+            event=TestEvent(
+                kind="SCENARIO_FINISHED",
+                payload=TestStatus(
+                    scenario=name,
+                    scenario_id=scenario_id,
+                    message=message,
+                    # NOTE: only send result of this scenario, earlier results were already sent
+                    context=json.dumps({name: result}),
+                ),
+            ),
+        )
+
+        for dependent in dependents[name]:
+            remaining_deps[dependent].discard(name)
+
+            if remaining_deps[dependent] != set():
+                continue
+
+            if all(
+                results[dep.name]["exception"] is None
+                for dep in by_name[dependent].dependencies
+            ):
+                add_ready(dependent)
+            else:
+                # has all dependencies but some are failed
+                skip(dependent)
+
+    def skip(name: str):
+        finish(
+            name,
+            str(uuid.uuid4())[:8],
+            json.loads(
+                Result(
+                    id=str(uuid.uuid4()),
+                    output=None,
+                    exception="Skipped",
+                    logs="",
+                    timestamp=datetime.now(),
+                ).json()
+            ),
+            f"Skipped Scenario: {name}",
+        )
+
+    def emit_metrics():
+        now = time.monotonic()
+        due = {}
+
+        for name, scenario_id in running.items():
+            displays = by_name[name].console_metric_displays
+
+            if displays is not None and (
+                now - last_metrics.get(name, -metrics_interval) >= metrics_interval
+            ):
+                last_metrics[name] = now
+                due[name] = (scenario_id, displays)
+
+        if due == {}:
+            return
+
+        # NOTE: one request for all scenarios, skipped if it takes too long so
+        # finished scenarios are still noticed
+        metrics = evaluate_console_metrics(
+            due,
+            lambda queries: backend.get_metrics_snapshot(
+                queries, timeout=metrics_deadline
+            ),
+        )
+
+        for name, values in (metrics or {}).items():
+            backend.add_test_event(
+                event=TestEvent(
+                    kind="SCENARIO_METRIC",
+                    payload=ScenarioMetric(scenario=name, metrics=values),
+                ),
+            )
+
+    for scenario in valid_scenarios:
+        if scenario.dependencies == []:
+            add_ready(scenario.name)
 
-            started[scenario.name] = scenario_id
-            scenarios_by_id[scenario_id] = scenario
+    start_ready()
 
     backend.add_test_event(
         event=TestEvent(
@@ -102,117 +344,71 @@ def test_runner(scenarios: Iterable[Scenario], tags: List[str], backend: ITestBa
         ),
     )
 
-    # listen to completed events and start scenarios with dependencies
+    for scenario in valid_scenarios:
+        missing_deps = remaining_deps[scenario.name] - valid_names
+
+        if scenario.name not in results and missing_deps != set():
+            skip(scenario.name)
+
+    poll_interval = min_poll_interval
+
+    # listen to completed scenarios and start scenarios with dependencies
     while len(results) != len(valid_scenarios):
-        for scenario_name in [sn for sn in started if sn not in results]:
-            scenario = scenarios_by_id[started[scenario_name]]
-
-            if scenario.console_metric_displays is not None:
-                backend.add_test_event(
-                    event=TestEvent(
-                        kind="SCENARIO_METRIC",
-                        payload=ScenarioMetric(
-                            scenario=scenario_name,
-                            metrics={
-                                name: display_fn(
-                                    name,
-                                    started[scenario_name],
-                                    backend.get_console_metrics_backend(),
-                                )
-                                for name, display_fn in scenario.console_metric_displays.items()
-                            },
-                        ),
-                    ),
-                )
+        start_ready()
+        changed = False
 
-            result = backend.move_scenario_result(
-                started[scenario_name],
-            )
+        emit_metrics()
+
+        for scenario_name, scenario_id in list(running.items()):
+            result = backend.move_scenario_result(scenario_id)
 
             if result is not None:
-                results[scenario_name] = result
-
-                backend.add_test_event(
-                    event=TestEvent(
-                        kind="SCENARIO_FINISHED",
-                        payload=TestStatus(
-                            scenario=scenario_name,
-                            scenario_id=started[scenario_name],
-                            message=f"Finished Scenario: {scenario_name}",
-                            context=json.dumps(results),
-                        ),
-                    ),
+                finish(
+                    scenario_name,
+                    scenario_id,
+                    result,
+                    f"Finished Scenario: {scenario_name}",
                 )
+                changed = True
             # NOTE: may be helpful to get two not running calls before canceling scenario
-            elif not backend.scenario_running(started[scenario_name]):
-                results[scenario_name] = json.loads(
-                    Result(
-                        id=str(uuid.uuid4()),
-                        output=None,
-                        exception="Scenario Exited",
-                        logs="",
-                        timestamp=datetime.now(),
-                    ).json()
-                )
-
-                backend.add_test_event(
-                    event=TestEvent(
-                        kind="SCENARIO_FINISHED",
-                        payload=TestStatus(
-                            scenario=scenario_name,
-                            scenario_id=started[scenario_name],
-                            message=f"Scenario Exited Unexpectedly: {scenario_name}",
-                            context=json.dumps(results),
-                        ),
+            elif not backend.scenario_running(scenario_id):
+                finish(
+                    scenario_name,
+                    scenario_id,
+                    json.loads(
+                        Result(
+                            id=str(uuid.uuid4()),
+                            output=None,
+                            exception="Scenario Exited",
+                            logs="",
+                            timestamp=datetime.now(),
+                        ).json()
                     ),
+                    f"Scenario Exited Unexpectedly: {scenario_name}",
                 )
+                changed = True
 
-        for scenario in [s for s in valid_scenarios if s.name not in started]:
-            if all(
-                dep.name in results and results[dep.name]["exception"] is None
-                for dep in scenario.dependencies
-            ):
-                scenario_id = start_scenario(
-                    scenario=scenario,
-                    results=results,
-                    backend=backend,
-                )
+        if changed:
+            # start dependents right away instead of waiting for next poll
+            poll_interval = min_poll_interval
+            continue
 
-                started[scenario.name] = scenario_id
-                scenarios_by_id[scenario_id] = scenario
-            elif all(dep.name in results for dep in scenario.dependencies):
-                # has all dependencies but some are failed
-                started[scenario.name] = str(uuid.uuid4())[:8]
-                results[scenario.name] = json.loads(
-                    Result(
-                        id=str(uuid.uuid4()),
-                        output=None,
-                        exception="Skipped",
-                        logs="",
-                        timestamp=datetime.now(),
-                    ).json()
-                )
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, max_poll_interval)
 
-                backend.add_test_event(
-                    event=TestEvent(
-                        kind="SCENARIO_FINISHED",
-                        payload=TestStatus(
-                            scenario=scenario.name,
-                            scenario_id=started[scenario.name],
-                            message=f"Skipped Scenario: {scenario.name}",
-                            context=json.dumps(results),
-                        ),
-                    ),
-                )
+    path, path_seconds = critical_path(valid_scenarios, durations)
+    message = f"Finished running {len(valid_scenarios)} Scenario(s)"
 
-        # NOTE: maybe make this configurable or shorter?
-        time.sleep(1)
+    if path != []:
+        message += f". Critical path ({path_seconds:.1f}s): " + " -> ".join(
+            f"{name} ({durations.get(name, 0):.1f}s)" for name in path
+        )
 
     backend.add_test_event(
         event=TestEvent(
             kind="TEST_FINISHED",
             payload=TestStatus(
-                message=f"Finished running {len(valid_scenarios)} Scenario(s)",
+                message=message,
             ),
         ),
     )
@@ -224,6 +420,7 @@ def scenario_runner(
     scenario_id: str,
     backend: IScenarioBackend,
     context: dict,
+    exporter: Optional[IResultExporter] = None,
 ):
     """Set up scenario environment and run scenario. Capture output and exceptions.
 
@@ -233,6 +430,8 @@ def scenario_runner(
         scenario_id (str): ID generated for scenario run
         backend (IScenarioBackend): backend methods available to scenario
         context (dict): Test context to pass to users
+        exporter (IResultExporter, optional): Writes collected user results to
+            files. Defaults to None.
     """
     scenario_commands = ScenarioCommands(
         scenario=scenario,
@@ -240,6 +439,8 @@ def scenario_runner(
         scenario_id=scenario_id,
         backend=backend,
         context=context,
+        guard=ScenarioGuard(scenario.abort_conditions),
+        exporter=exporter,
     )
 
     buffer = io.StringIO()
@@ -250,7 +451,10 @@ def scenario_runner(
 
     with printing.stdout_redirect(buffer):
         try:
-            scenario.load_model(scenario_commands, context)  # type: ignore
+            try:
+                scenario.load_model(scenario_commands, context)  # type: ignore
+            finally:
+                scenario_commands.close()
 
             if scenario.output_transformer is not None:
                 output = scenario.output_transformer(
@@ -265,7 +469,7 @@ def scenario_runner(
                 and scenario.raise_exception
             ):
                 error_strs = [
-                    f"{len(scenario_commands.errors)} error(s) were raised in scenario {scenario.name}:"
+                    f"{scenario_commands.num_errors} error(s) were raised in scenario {scenario.name}:"
                 ] + scenario_commands.errors
 
                 exception = AssertionError("\n".join(error_strs))
@@ -285,7 +489,14 @@ def scenario_runner(
     # NOTE: possible shutdown hook
     scenario_commands.scale_users(0)
 
-    failed = len(scenario_commands.errors)
+    if exporter is not None:
+        try:
+            exporter.close()
+        except Exception as e:
+            # NOTE: scenario result is still reported if export fails
+            print(f"Error exporting results: {e}")
+
+    failed = scenario_commands.num_errors
 
     backend.set_scenario_result(
         output=output,
@@ -294,11 +505,38 @@ def scenario_runner(
         time_taken=(end - start).total_seconds(),
         succeeded=scenario_commands.num_results_collected - failed,
         failed=failed,
+        max_users=scenario_commands.max_users,
+    )
+
+
+def flush_user_results(scenario: Scenario, backend: IUserManagerBackend):
+    """Send buffered user results, reducing them first if scenario has a reducer.
+
+    Args:
+        scenario (Scenario): User Scenario
+        backend (IUserManagerBackend): Backend implementation for user manager to use
+    """
+    if scenario.result_reducer is None:
+        backend.send_user_results()
+        return
+
+    results = backend.move_user_results()
+
+    if results == []:
+        return
+
+    backend.send_results(
+        reduce_results(
+            results,
+            scenario.result_reducer,
+            scenario.metric_collectors,
+            scenario.reduced_sample_rate,
+        )
     )
 
 
 def user_scheduler(
-    scheduler: Client,
+    scheduler: "Client",
     scenario: Scenario,
     backend: IUserManagerBackend,
     context: dict,
@@ -312,23 +550,40 @@ def user_scheduler(
         backend (IUserManagerBackend): Backend implementation for user manager to use
         context (dict): Test context
     """
-
     while True:
-        for user_id in backend.get_new_users():
-            fut = scheduler.submit(
-                user_runner,
-                scenario=scenario,
-                user_id=user_id,
-                backend=backend.get_user_backend(user_id),
-                context=context,
-                pure=False,
-            )
+        schedule_new_users(scheduler, scenario, backend, context)
+        flush_user_results(scenario, backend)
+        time.sleep(1)
 
-            # NOTE: may be better waiting for all futures to finish
-            fire_and_forget(fut)
 
-        backend.send_user_results()
-        time.sleep(1)
+def schedule_new_users(
+    scheduler: "Client",
+    scenario: Scenario,
+    backend: IUserManagerBackend,
+    context: dict,
+):
+    """Start users added to user manager since last checked.
+
+    Args:
+        scheduler (Client): Dask client to start users
+        scenario (Scenario): User Scenario
+        backend (IUserManagerBackend): Backend implementation for user manager to use
+        context (dict): Test context
+    """
+    from distributed.client import fire_and_forget  # type: ignore
+
+    for user_id in backend.get_new_users():
+        fut = scheduler.submit(
+            user_runner,
+            scenario=scenario,
+            user_id=user_id,
+            backend=backend.get_user_backend(user_id),
+            context=context,
+            pure=False,
+        )
+
+        # NOTE: may be better waiting for all futures to finish
+        fire_and_forget(fut)
 
 
 def user_runner(
@@ -345,6 +600,8 @@ def user_runner(
         backend (IUserBackend): Backend client to save results
         context (dict): Test context containing previous scenario results
     """
+    from distributed.threadpoolexecutor import secede  # type: ignore
+
     secede()
 
     user_commands = UserCommands(
@@ -1,11 +1,28 @@
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import time
 
 from pydantic import BaseModel, Field
 
-from cicadad.metrics.collectors import runtime_seconds, pass_or_fail, results_per_second
-from cicadad.metrics.console import console_stats, console_collector, console_percent
+from cicadad.metrics.console import (
+    DEFAULT_METRIC_COLLECTORS,
+    console_stats,
+    console_latest,
+    console_percent,
+)
+from cicadad.metrics.convergence import ConvergenceCriterion, ConvergenceEstimator
+from cicadad.util.constants import RESULT_LAG_METRIC
+
+from cicadad.core.guards import AbortCondition
+from cicadad.core.reduction import DEFAULT_REDUCED_SAMPLE_RATE, result_count
+from cicadad.core.traces import read_trace
+from cicadad.core.shapes import (
+    LoadShapeSpec,
+    load_shape_duration,
+    load_shape_level,
+    read_load_shape,
+)
 
 from cicadad.core.types import (
     ConsoleMetricDisplays,
@@ -16,6 +33,8 @@ from cicadad.core.types import (
     OutputTransformerFn,
     Result,
     ResultAggregatorFn,
+    ResultMergerFn,
+    ResultReducerFn,
     ResultVerifierFn,
     UserLoopFn,
 )
@@ -46,6 +65,37 @@ def while_has_work(polling_timeout_ms: int = 1000):
     return closure
 
 
+def while_has_work_items(polling_timeout_ms: int = 1000):
+    """Run user once for each work item received or continue polling.
+
+    The item is passed to the scenario function as the 'work_item' argument.
+
+    Args:
+        polling_timeout_ms (int): Time to wait for work item before cycling
+    """
+
+    def closure(user_commands: IUserCommands, context: dict):
+        while user_commands.is_up():
+            work_item = user_commands.get_work_item(polling_timeout_ms)
+
+            if work_item is None:
+                continue
+
+            start = datetime.now()
+            output, exception, logs = user_commands.run(
+                context=context, work_item=work_item
+            )
+            end = datetime.now()
+            user_commands.report_result(
+                output,
+                exception,
+                logs,
+                time_taken=(end - start).total_seconds(),
+            )
+
+    return closure
+
+
 def while_alive():
     """Run user if hasn't been shut down yet."""
 
@@ -108,6 +158,7 @@ def n_iterations(
     wait_period: int = 1,
     timeout: Optional[int] = 15,
     skip_scaledown: bool = False,
+    convergence: Optional[ConvergenceCriterion] = None,
 ):
     """Create a load model where a pool of users is called n times.
     Args:
@@ -116,6 +167,8 @@ def n_iterations(
         wait_period (int, optional): Time in seconds to between polling for results. Defaults to 1.
         timeout (Optional[int], optional): Time in seconds for scenario to complete before failing. Defaults to 15.
         skip_scaledown (bool): Skip scaledown of users after running load function
+        convergence (ConvergenceCriterion, optional): Stop before all iterations
+            are run once statistics are stable. Defaults to None.
     """
 
     def closure(scenario_commands: IScenarioCommands, context: dict):
@@ -125,6 +178,7 @@ def n_iterations(
         # wait for completion
         num_results = 0
         start_time = datetime.now()
+        estimator = ConvergenceEstimator(convergence) if convergence else None
 
         while num_results < iterations:
             if (
@@ -140,7 +194,19 @@ def n_iterations(
             scenario_commands.aggregate_results(latest_results)
             scenario_commands.verify_results(latest_results)
             scenario_commands.collect_datastore_metrics(latest_results)
-            num_results += len(latest_results)
+            num_results += sum(result_count(result) for result in latest_results)
+
+            if estimator is not None:
+                estimator.add_results(latest_results)
+
+                if estimator.converged and num_results < iterations:
+                    _report_convergence(
+                        scenario_commands,
+                        estimator,
+                        "iterations",
+                        iterations - num_results,
+                    )
+                    break
 
             time.sleep(wait_period)
 
@@ -152,6 +218,23 @@ def n_iterations(
     return closure
 
 
+def _report_convergence(
+    scenario_commands: IScenarioCommands,
+    estimator: ConvergenceEstimator,
+    unit: str,
+    saved: float,
+):
+    estimates = ", ".join(
+        f"{statistic}={value:.4g}" for statistic, value in estimator.estimates().items()
+    )
+
+    print(
+        f"Converged after {estimator.count} results ({estimates}), "
+        f"stopped {saved:.0f} {unit} early"
+    )
+    scenario_commands.add_metric(f"convergence_saved_{unit}", saved)
+
+
 def run_scenario_once(wait_period: int = 1, timeout: int = 15):
     """Run scenario one time with one user and retry on failure.
 
@@ -176,7 +259,7 @@ def run_scenario_once(wait_period: int = 1, timeout: int = 15):
             scenario_commands.verify_results(latest_results)
             scenario_commands.collect_datastore_metrics(latest_results)
 
-            error_count = len(scenario_commands.errors)
+            error_count = scenario_commands.num_errors
 
             if scenario_commands.num_results_collected > error_count:
                 break
@@ -195,6 +278,7 @@ def n_seconds(
     users: int,
     wait_period: int = 1,
     skip_scaledown=False,
+    convergence: Optional[ConvergenceCriterion] = None,
 ):
     """Run the scenario for a specified duration.
 
@@ -205,6 +289,8 @@ def n_seconds(
         users (int): Number of users to start for scenario
         wait_period (int, optional): Time in seconds to wait before polling for results. Defaults to 1.
         skip_scaledown (bool): Skip scaledown of users after running load function
+        convergence (ConvergenceCriterion, optional): Stop before duration is
+            reached once statistics are stable. Defaults to None.
     """
 
     def closure(scenario_commands: IScenarioCommands, context: dict):
@@ -212,6 +298,7 @@ def n_seconds(
 
         # collect results for specified seconds
         start_time = datetime.now()
+        estimator = ConvergenceEstimator(convergence) if convergence else None
 
         while True:
             latest_results = scenario_commands.get_latest_results()
@@ -223,6 +310,18 @@ def n_seconds(
             if datetime.now() > start_time + timedelta(seconds=seconds):
                 break
 
+            if estimator is not None:
+                estimator.add_results(latest_results)
+
+                if estimator.converged:
+                    _report_convergence(
+                        scenario_commands,
+                        estimator,
+                        "seconds",
+                        seconds - (datetime.now() - start_time).total_seconds(),
+                    )
+                    break
+
             time.sleep(wait_period)
 
         if skip_scaledown:
@@ -355,6 +454,312 @@ def ramp_users_to_threshold(
     return closure
 
 
+def pid_users_to_target(
+    target: float,
+    statistic: str = "p95",
+    initial_users: int = 1,
+    min_users: int = 1,
+    max_users: int = 100,
+    max_step: int = 10,
+    kp: float = 10,
+    ki: float = 2,
+    kd: float = 0,
+    window_seconds: int = 30,
+    period_duration: int = 10,
+    settle_periods: int = 3,
+    settle_tolerance: float = 0.05,
+    period_limit: Optional[int] = None,
+    update_aggregate: Callable[[int, Any], Any] = lambda n, agg: f"Users: {n}",
+    wait_period: int = 1,
+    skip_scaledown: bool = False,
+):
+    """Scale users with a PID controller until a windowed statistic settles at a target.
+
+    Use a latency percentile (p50, p90, p95, p99) or throughput as the statistic.
+    Error is measured relative to the target, so gains do not depend on its units.
+    Each period, the controller output is the number of users to add or remove.
+
+    The controller trajectory is saved to the pid_users, pid_measured and pid_error
+    metrics. Update aggregate with number of users determined by scenario.
+
+    Args:
+        target (float): Value of statistic to aim for
+        statistic (str, optional): WindowStats field to control. Defaults to "p95".
+        initial_users (int, optional): Users to start stage with. Defaults to 1.
+        min_users (int, optional): Least users controller can scale to. Defaults to 1.
+        max_users (int, optional): Most users controller can scale to. Defaults to 100.
+        max_step (int, optional): Most users added or removed in a period. Defaults to 10.
+        kp (float, optional): Proportional gain. Defaults to 10.
+        ki (float, optional): Integral gain. Defaults to 2.
+        kd (float, optional): Derivative gain. Defaults to 0.
+        window_seconds (int, optional): Time in seconds of results statistic is measured over. Defaults to 30.
+        period_duration (int, optional): Time in seconds between scaling events. Defaults to 10.
+        settle_periods (int, optional): Periods within tolerance of target before stopping. Defaults to 3.
+        settle_tolerance (float, optional): Relative error considered on target. Defaults to 0.05.
+        period_limit (Optional[int], optional): Amount of scaling events before stopping stage. Defaults to None.
+        update_aggregate (Callable[[int, Any], Any], optional): Update scenario aggregate with result of load model.
+        wait_period (int, optional): Time in seconds to wait before polling for results. Defaults to 1.
+        skip_scaledown (bool): Skip scaledown of users after running load function
+    """
+
+    def closure(scenario_commands: IScenarioCommands, context: dict):
+        scenario_commands.scale_users(initial_users)
+        period_count = 0
+        settled_count = 0
+        integral = float(0)
+        previous_error: Optional[float] = None
+        period_start = datetime.now()
+
+        while settled_count < settle_periods and (
+            period_limit is None or period_count < period_limit
+        ):
+            latest_results = scenario_commands.get_latest_results()
+
+            scenario_commands.aggregate_results(latest_results)
+            scenario_commands.verify_results(latest_results)
+            scenario_commands.collect_datastore_metrics(latest_results)
+
+            time.sleep(wait_period)
+
+            if datetime.now() < period_start + timedelta(seconds=period_duration):
+                continue
+
+            period_start = datetime.now()
+            measured = getattr(
+                scenario_commands.window_stats(seconds=window_seconds), statistic
+            )
+
+            if measured is None:
+                continue
+
+            error = (target - measured) / target
+            derivative = 0 if previous_error is None else error - previous_error
+            output = kp * error + ki * (integral + error) + kd * derivative
+            step = max(min(round(output), max_step), -max_step)
+            users = max(min(scenario_commands.num_users + step, max_users), min_users)
+
+            # NOTE: stop accumulating error while saturated to avoid windup
+            if users == scenario_commands.num_users + round(output):
+                integral += error
+
+            scenario_commands.scale_users(users)
+
+            scenario_commands.add_metric("pid_users", users)
+            scenario_commands.add_metric("pid_measured", measured)
+            scenario_commands.add_metric("pid_error", error)
+
+            if abs(error) <= settle_tolerance:
+                settled_count += 1
+            else:
+                settled_count = 0
+
+            previous_error = error
+            period_count += 1
+
+        scenario_commands.aggregated_results = update_aggregate(
+            scenario_commands.num_users, scenario_commands.aggregated_results
+        )
+
+        if skip_scaledown:
+            return
+
+        scenario_commands.scale_users(0)
+
+    return closure
+
+
+def load_shape(
+    path_or_spec: LoadShapeSpec,
+    arrival_rate: bool = False,
+    users: int = 1,
+    resolution: float = 0.1,
+    wait_period: int = 1,
+    skip_scaledown: bool = False,
+):
+    """Follow a piecewise schedule of steps, ramps, spikes, sine waves and holds.
+
+    Schedule is read from a YAML or CSV file or given as a list of segments. By
+    default, segment targets are numbers of users. If arrival_rate is set, targets
+    are units of work per second distributed to a fixed pool of users instead,
+    which should use the 'while_has_work' user loop.
+
+    Levels are computed from time elapsed since the start of the schedule, so time
+    spent scaling and collecting results does not add up over segments.
+
+    Args:
+        path_or_spec (LoadShapeSpec): Path to YAML/CSV file or list of segments
+        arrival_rate (bool, optional): Treat targets as work per second. Defaults to False.
+        users (int, optional): Number of users to start if arrival_rate is set. Defaults to 1.
+        resolution (float, optional): Time in seconds between updates to level. Defaults to 0.1.
+        wait_period (int, optional): Time in seconds to wait before polling for results. Defaults to 1.
+        skip_scaledown (bool): Skip scaledown of users after running load function
+    """
+    segments = read_load_shape(path_or_spec)
+    duration = load_shape_duration(segments)
+
+    def closure(scenario_commands: IScenarioCommands, context: dict):
+        if arrival_rate:
+            scenario_commands.scale_users(users)
+
+        initial = 0 if arrival_rate else scenario_commands.num_users
+        last_level = float(initial)
+        buffered_work = float(0)
+        previous_elapsed = float(0)
+        next_poll = float(0)
+        start_time = datetime.now()
+
+        while True:
+            elapsed = (datetime.now() - start_time).total_seconds()
+            level = load_shape_level(segments, elapsed, initial)
+
+            if level is None:
+                if arrival_rate:
+                    # Dispatch work due between last tick and end of schedule
+                    buffered_work += max(last_level, 0) * (duration - previous_elapsed)
+
+                    if round(buffered_work) > 0:
+                        scenario_commands.add_work(round(buffered_work))
+
+                break
+
+            if arrival_rate:
+                buffered_work += max(level, 0) * (elapsed - previous_elapsed)
+
+                if int(buffered_work) > 0:
+                    scenario_commands.add_work(int(buffered_work))
+                    buffered_work -= int(buffered_work)
+            elif max(round(level), 0) != scenario_commands.num_users:
+                scenario_commands.scale_users(max(round(level), 0))
+
+            previous_elapsed = elapsed
+            last_level = level
+
+            if elapsed >= next_poll:
+                latest_results = scenario_commands.get_latest_results(timeout_ms=None)
+
+                scenario_commands.aggregate_results(latest_results)
+                scenario_commands.verify_results(latest_results)
+                scenario_commands.collect_datastore_metrics(latest_results)
+
+                next_poll = elapsed + wait_period
+
+            # NOTE: sleep until next tick relative to start, skipping ticks if behind
+            next_tick = min((int(elapsed / resolution) + 1) * resolution, duration)
+            delay = next_tick - (datetime.now() - start_time).total_seconds()
+
+            if delay > 0:
+                time.sleep(delay)
+
+        if skip_scaledown:
+            return
+
+        scenario_commands.scale_users(0)
+
+    return closure
+
+
+def replay_trace(
+    path: str,
+    users: int,
+    speedup: float = 1,
+    max_batch_size: int = 10000,
+    resolution: float = 0.1,
+    wait_period: int = 1,
+    timeout: Optional[int] = 15,
+    skip_scaledown: bool = False,
+):
+    """Replay a recorded timeline of requests, such as a reduced access log.
+
+    Trace file rows are an offset in milliseconds and a request key (see
+    read_trace). The file is streamed from disk, and keys that are due are sent
+    to users as work items in bulk. Should be used with the 'while_has_work_items'
+    user loop.
+
+    Args:
+        path (str): Path to trace file
+        users (int): Number of users to start for scenario
+        speedup (float, optional): Factor to speed up trace by. Defaults to 1.
+        max_batch_size (int, optional): Most work items sent in a single call. Defaults to 10000.
+        resolution (float, optional): Most time in seconds between dispatching work items. Defaults to 0.1.
+        wait_period (int, optional): Time in seconds to wait before polling for results. Defaults to 1.
+        timeout (Optional[int], optional): Time in seconds to wait for results after trace ends. Defaults to 15.
+        skip_scaledown (bool): Skip scaledown of users after running load function
+    """
+
+    def closure(scenario_commands: IScenarioCommands, context: dict):
+        scenario_commands.scale_users(users)
+
+        rows = read_trace(path)
+        pending = next(rows, None)
+        dispatched = 0
+        collected = 0
+        next_poll = float(0)
+        start_time = datetime.now()
+
+        while pending is not None:
+            elapsed = (datetime.now() - start_time).total_seconds()
+            batch: List[str] = []
+
+            while pending is not None and pending[0] <= elapsed * 1000 * speedup:
+                batch.append(pending[1])
+                pending = next(rows, None)
+
+                if len(batch) >= max_batch_size:
+                    scenario_commands.add_work_items(batch)
+                    dispatched += len(batch)
+                    batch = []
+
+            if batch != []:
+                scenario_commands.add_work_items(batch)
+                dispatched += len(batch)
+
+            if elapsed >= next_poll:
+                latest_results = scenario_commands.get_latest_results(timeout_ms=None)
+
+                scenario_commands.aggregate_results(latest_results)
+                scenario_commands.verify_results(latest_results)
+                scenario_commands.collect_datastore_metrics(latest_results)
+
+                collected += sum(result_count(result) for result in latest_results)
+                next_poll = elapsed + wait_period
+
+            if pending is None:
+                break
+
+            # NOTE: wake for next tick or next row, relative to start to avoid drift
+            next_tick = min(
+                (int(elapsed / resolution) + 1) * resolution,
+                pending[0] / 1000 / speedup,
+            )
+            delay = next_tick - (datetime.now() - start_time).total_seconds()
+
+            if delay > 0:
+                time.sleep(delay)
+
+        # wait for results of remaining work items
+        drain_start = datetime.now()
+
+        while collected < dispatched and (
+            timeout is None or datetime.now() < drain_start + timedelta(seconds=timeout)
+        ):
+            latest_results = scenario_commands.get_latest_results()
+
+            scenario_commands.aggregate_results(latest_results)
+            scenario_commands.verify_results(latest_results)
+            scenario_commands.collect_datastore_metrics(latest_results)
+
+            collected += sum(result_count(result) for result in latest_results)
+
+            time.sleep(wait_period)
+
+        if skip_scaledown:
+            return
+
+        scenario_commands.scale_users(0)
+
+    return closure
+
+
 def load_stages(*stages: LoadModelFn) -> LoadModelFn:
     """Type of load model loop that allows multiple load models to be chained together.
 
@@ -371,6 +776,47 @@ def load_stages(*stages: LoadModelFn) -> LoadModelFn:
     return closure
 
 
+def parallel_stages(*stages: LoadModelFn, **named_stages: LoadModelFn) -> LoadModelFn:
+    """Type of load model loop that runs multiple load models at the same time.
+
+    Each stage controls a separate pool of users with its own work and results, so
+    one stage can hold steady load while another spikes. Unnamed stages are named
+    stage-0, stage-1, and so on. Results are tagged with the name of the stage.
+
+    Aggregated results of the scenario are a dict of stage name to the aggregated
+    results of that stage.
+
+    Returns:
+        [LoadModelFn]: Combined load model closure
+    """
+    all_stages: Dict[str, LoadModelFn] = {
+        f"stage-{i}": stage for i, stage in enumerate(stages)
+    }
+    all_stages.update(named_stages)
+
+    def closure(scenario_commands: IScenarioCommands, context: dict):
+        pools = {name: scenario_commands.pool(name) for name in all_stages}
+
+        with ThreadPoolExecutor(max_workers=max(len(all_stages), 1)) as executor:
+            futures = [
+                executor.submit(stage, pools[name], context)
+                for name, stage in all_stages.items()
+            ]
+
+        # NOTE: stop users in every pool before raising errors from any stage
+        for pool in pools.values():
+            pool.scale_users(0)
+
+        scenario_commands.aggregated_results = {
+            name: pool.aggregated_results for name, pool in pools.items()
+        }
+
+        for future in futures:
+            future.result()
+
+    return closure
+
+
 def basic_verification(latest_results: List[Result], include_logs=True):
     """Create error strings for each errored result.
 
@@ -412,20 +858,24 @@ class Scenario(BaseModel):
     load_model: Optional[LoadModelFn] = Field(run_scenario_once())
     dependencies: List["Scenario"] = []
     result_aggregator: Optional[ResultAggregatorFn]
+    result_reducer: Optional[ResultReducerFn]
+    result_merger: Optional[ResultMergerFn]
+    reduced_sample_rate: float = DEFAULT_REDUCED_SAMPLE_RATE
+    abort_conditions: List[AbortCondition] = []
     result_verifier: Optional[ResultVerifierFn] = Field(basic_verification)
     raise_exception: bool = True
     output_transformer: Optional[OutputTransformerFn]
     users_per_instance: int = 50
+    priority: int = 0
+    cache_ttl: Optional[float]
+    cache_env: List[str] = []
     # NOTE: may be useful to add these to list later to avoid a potential circular dependency
-    metric_collectors: List[MetricCollector] = [
-        console_collector("runtime", runtime_seconds),
-        console_collector("pass_or_fail", pass_or_fail),
-        console_collector("results_per_second", results_per_second),
-    ]
+    metric_collectors: List[MetricCollector] = DEFAULT_METRIC_COLLECTORS
     console_metric_displays: Optional[ConsoleMetricDisplays] = {
         "runtimes": console_stats("runtime"),
         "results_per_second": console_stats("results_per_second"),
         "success_rate": console_percent("pass_or_fail", 0.5),
+        "result_lag_seconds": console_latest(RESULT_LAG_METRIC),
     }
     tags: List[str] = []
 
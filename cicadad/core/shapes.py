@@ -0,0 +1,152 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+import csv
+import math
+import os
+
+from pydantic import BaseModel, validator
+
+LOAD_SHAPE_KINDS = ["step", "ramp", "spike", "sine", "hold"]
+
+
+class LoadShapeSegment(BaseModel):
+    """Piece of a load shape schedule.
+
+    * step: Jump to target and hold it
+    * ramp: Move linearly from previous level to target
+    * spike: Jump to target, then return to previous level after segment
+    * sine: Oscillate around target by amplitude every period
+    * hold: Keep previous level, target is ignored
+    """
+
+    kind: str
+    duration: float
+    target: float = 0
+    amplitude: float = 0
+    period: float = 0
+
+    @validator("kind")
+    def kind_is_known(cls, kind):
+        if kind not in LOAD_SHAPE_KINDS:
+            raise ValueError(
+                f"Unknown load shape kind '{kind}', expected one of {LOAD_SHAPE_KINDS}"
+            )
+
+        return kind
+
+    @validator("duration")
+    def duration_is_positive(cls, duration):
+        if duration <= 0:
+            raise ValueError("Load shape segment duration must be greater than 0")
+
+        return duration
+
+
+LoadShapeSpec = Union[str, List[Dict[str, Any]], List[LoadShapeSegment]]
+
+
+def read_load_shape(path_or_spec: LoadShapeSpec) -> List[LoadShapeSegment]:
+    """Parse load shape segments from a YAML or CSV file, or a list of segments.
+
+    YAML files contain a list of segments, and CSV files have a header row with
+    segment fields (kind, duration, target, amplitude, period).
+
+    Args:
+        path_or_spec (LoadShapeSpec): Path to file or list of segments
+
+    Returns:
+        List[LoadShapeSegment]: Parsed segments in order
+    """
+    if not isinstance(path_or_spec, str):
+        return [
+            (
+                segment
+                if isinstance(segment, LoadShapeSegment)
+                else LoadShapeSegment(**segment)
+            )
+            for segment in path_or_spec
+        ]
+
+    extension = os.path.splitext(path_or_spec)[1].lower()
+    rows: List[Dict[str, Any]]
+
+    with open(path_or_spec, newline="") as f:
+        if extension == ".csv":
+            # NOTE: skip empty cells so defaults are applied
+            rows = [
+                {key: value for key, value in row.items() if value not in (None, "")}
+                for row in csv.DictReader(f)
+            ]
+        elif extension in (".yaml", ".yml"):
+            # NOTE: PyYAML is installed as a dependency of dask
+            import yaml  # type: ignore
+
+            rows = yaml.safe_load(f) or []
+        else:
+            raise ValueError(
+                f"Unsupported load shape file '{path_or_spec}', expected .yaml, .yml or .csv"
+            )
+
+    return [LoadShapeSegment(**row) for row in rows]
+
+
+def load_shape_duration(segments: List[LoadShapeSegment]) -> float:
+    """Get total time in seconds covered by load shape.
+
+    Args:
+        segments (List[LoadShapeSegment]): Segments of load shape
+
+    Returns:
+        float: Sum of segment durations
+    """
+    return sum(segment.duration for segment in segments)
+
+
+def load_shape_level(
+    segments: List[LoadShapeSegment], elapsed: float, initial: float = 0
+) -> Optional[float]:
+    """Get level of load shape at a point in time.
+
+    Args:
+        segments (List[LoadShapeSegment]): Segments of load shape
+        elapsed (float): Time in seconds since load shape started
+        initial (float, optional): Level before first segment. Defaults to 0.
+
+    Returns:
+        Optional[float]: Level at elapsed time, None if load shape has ended
+    """
+    previous = initial
+    segment_start = float(0)
+
+    for segment in segments:
+        if elapsed < segment_start + segment.duration:
+            level, _ = _segment_level(segment, elapsed - segment_start, previous)
+            return level
+
+        _, previous = _segment_level(segment, segment.duration, previous)
+        segment_start += segment.duration
+
+    return None
+
+
+def _segment_level(
+    segment: LoadShapeSegment, offset: float, previous: float
+) -> Tuple[float, float]:
+    """Get level at offset into segment and level segment ends at."""
+    if segment.kind == "step":
+        return segment.target, segment.target
+    if segment.kind == "ramp":
+        progress = min(offset / segment.duration, 1)
+
+        return previous + (segment.target - previous) * progress, segment.target
+    if segment.kind == "spike":
+        return segment.target, previous
+    if segment.kind == "sine":
+        wave = (
+            0
+            if segment.period <= 0
+            else math.sin(2 * math.pi * offset / segment.period)
+        )
+
+        return segment.target + segment.amplitude * wave, segment.target
+
+    return previous, previous
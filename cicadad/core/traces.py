@@ -0,0 +1,46 @@
+from typing import Iterator, Tuple
+import mmap
+import os
+
+
+def read_trace(path: str) -> Iterator[Tuple[int, str]]:
+    """Stream rows of a request trace from disk through a memory map.
+
+    Each line of the file is an offset in milliseconds from the start of the trace
+    and a request key, separated by the first comma. Rows must be sorted by offset.
+    An optional header row and empty lines are skipped.
+
+    Args:
+        path (str): Path to trace file
+
+    Returns:
+        Iterator[Tuple[int, str]]: Offset in milliseconds and key of each row
+    """
+    with open(path, "rb") as f:
+        # NOTE: empty files cannot be memory mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            first_row = True
+
+            for line in iter(mm.readline, b""):
+                line = line.strip()
+
+                if line == b"":
+                    continue
+
+                offset, _, key = line.partition(b",")
+
+                try:
+                    offset_ms = int(offset)
+                except ValueError:
+                    if first_row:
+                        first_row = False
+                        continue
+
+                    raise ValueError(f"Invalid offset in trace row: {line!r}")
+
+                first_row = False
+
+                yield offset_ms, key.decode()
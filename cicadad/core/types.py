@@ -1,11 +1,24 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from distributed.client import Future  # type: ignore
 from pydantic.main import BaseModel
 
-from cicadad.util.constants import ONE_SEC_MS
+from cicadad.util.constants import DEFAULT_MAX_RESULT_BATCHES, ONE_SEC_MS
+
+# NOTE: distributed is slow to import and only needed by user managers
+if TYPE_CHECKING:
+    from distributed.client import Future  # type: ignore
 
 
 class Result(BaseModel):
@@ -19,6 +32,12 @@ class Result(BaseModel):
     time_taken: Optional[float]
     succeeded: Optional[int]
     failed: Optional[int]
+    pool: Optional[str] = None
+    user_id: Optional[str] = None
+    user_manager_id: Optional[str] = None
+    # NOTE: number of results merged into a partial aggregate by a user manager,
+    # 0 for raw results already counted in a partial aggregate
+    reduced_count: Optional[int] = None
 
     class Config:
         """Encode class as JSON."""
@@ -35,6 +54,74 @@ class UserEvent(BaseModel):
     payload: dict
 
 
+class MetricSeriesPoint(BaseModel):
+    """Statistics for metric values reported within a window of time."""
+
+    timestamp: int
+    count: int
+    sum: float
+    min: float
+    max: float
+    average: float
+    stddev: float
+
+
+class MetricQuery(BaseModel):
+    """Metric read by a console metric display, answered in a batch with others."""
+
+    kind: str  # one of total, last, rate, statistics, series
+    scenario_id: str
+    name: str
+    split_point: float = 0
+    from_timestamp: int = 0
+    to_timestamp: int = 0
+    step: int = 0
+
+    class Config:
+        """Needed to use queries as keys of a snapshot."""
+
+        frozen = True
+
+
+MetricsSnapshot = Dict[MetricQuery, Any]
+
+
+class WindowStats(BaseModel):
+    """Statistics for results collected by a scenario in a recent window of time."""
+
+    seconds: int
+    count: int
+    throughput: float
+    error_rate: float
+    min: Optional[float]
+    max: Optional[float]
+    p50: Optional[float]
+    p90: Optional[float]
+    p95: Optional[float]
+    p99: Optional[float]
+
+
+class WindowSlot(BaseModel):
+    """Counts and log bucket histograms of results collected in a second of a
+    ResultWindow, which can be merged without the results they were built from."""
+
+    count: int = 0
+    errors: int = 0
+    histograms: Dict[str, Dict[int, int]] = {}
+    mins: Dict[str, float] = {}
+    maxes: Dict[str, float] = {}
+
+
+class ErrorGroup(BaseModel):
+    """Repeats of an error reported by a scenario."""
+
+    fingerprint: str
+    count: int
+    first_seen: datetime
+    last_seen: datetime
+    samples: List[str] = []
+
+
 class IScenarioCommands(ABC):
     """Interface to decouple scenario commands from scenario."""
 
@@ -81,7 +168,34 @@ class IScenarioCommands(ABC):
     @property
     @abstractmethod
     def errors(self) -> List[str]:
-        """List of errors reported by users."""
+        """List of errors reported by users, one per group of repeated errors."""
+        pass
+
+    @property
+    @abstractmethod
+    def num_errors(self) -> int:
+        """Get number of errors reported by users, including repeats."""
+        pass
+
+    @property
+    @abstractmethod
+    def error_groups(self) -> List[ErrorGroup]:
+        """Get errors reported by users grouped by fingerprint."""
+        pass
+
+    @abstractmethod
+    def pool(self, name: str) -> "IScenarioCommands":
+        """Get commands for a separate pool of users in this scenario.
+
+        Each pool has its own users, work and results. Results collected by a
+        pool are tagged with its name.
+
+        Args:
+            name (str): Name of pool
+
+        Returns:
+            IScenarioCommands: Commands for pool
+        """
         pass
 
     @abstractmethod
@@ -119,6 +233,17 @@ class IScenarioCommands(ABC):
         """
         pass
 
+    @abstractmethod
+    def add_work_items(self, items: List[str]):
+        """Distribute items of work to users in scenario in a single call.
+
+        Each item is received by exactly one user through get_work_item.
+
+        Args:
+            items (List[str]): Items describing work for a single iteration
+        """
+        pass
+
     @abstractmethod
     def send_user_events(self, kind: str, payload: dict):
         """Send an event to all user in the user pool.
@@ -134,18 +259,29 @@ class IScenarioCommands(ABC):
         self,
         timeout_ms: Optional[int] = ONE_SEC_MS,
         limit: int = 500,
+        max_batches: int = DEFAULT_MAX_RESULT_BATCHES,
     ) -> List[Result]:
         """Gathers results produced by users.
 
+        Keeps fetching batches while they are full, and fetches the next batch in
+        the background if results are still waiting after max_batches.
+
         Args:
             timeout_ms (int, optional): Time to wait for results. Defaults to 1000.
-            limit (int): Max results to return. Defaults to 500
+            limit (int): Max results to return per batch. Defaults to 500
+            max_batches (int): Max batches to fetch in one call. Defaults to 20
 
         Returns:
             List[Result]: List of latest results collected
         """
         pass
 
+    @property
+    @abstractmethod
+    def result_lag(self) -> float:
+        """Get seconds the oldest result of the last collection waited to be collected."""
+        pass
+
     @abstractmethod
     def aggregate_results(self, latest_results: List[Result]) -> Any:
         """Run scenario aggregator function against latest gathered results and save aggregate.
@@ -179,6 +315,61 @@ class IScenarioCommands(ABC):
         """
         pass
 
+    @abstractmethod
+    def add_metric(self, name: str, value: float):
+        """Save a metric value for this scenario to the datastore.
+
+        Args:
+            name (str): Name of metric
+            value (float): Numeric value to report
+        """
+        pass
+
+    @abstractmethod
+    def get_metric_series(
+        self,
+        name: str,
+        from_timestamp: int = 0,
+        to_timestamp: int = 0,
+        step: int = 1,
+    ) -> List[MetricSeriesPoint]:
+        """Get statistics for a metric collected by this scenario over time.
+
+        Args:
+            name (str): Name of metric
+            from_timestamp (int): Unix time in seconds to start series at. Defaults to 0.
+            to_timestamp (int): Unix time in seconds to end series at. Defaults to now if 0.
+            step (int): Seconds covered by each point. Defaults to 1.
+
+        Returns:
+            List[MetricSeriesPoint]: Points with at least one value, ordered by time
+        """
+        pass
+
+    @abstractmethod
+    def close(self):
+        """Collect results still being fetched in the background and release
+        resources of commands. Called once the load model has finished."""
+        pass
+
+    @abstractmethod
+    def window_stats(
+        self, metric: str = "time_taken", seconds: int = 30
+    ) -> WindowStats:
+        """Get throughput, error rate and percentiles of results collected recently.
+
+        Only results returned by get_latest_results are counted.
+
+        Args:
+            metric (str): Result column to get percentiles for, either "time_taken"
+                or "output" if outputs are numeric. Defaults to "time_taken".
+            seconds (int): Size of window in seconds. Defaults to 30.
+
+        Returns:
+            WindowStats: Statistics for results in window
+        """
+        pass
+
 
 class IUserCommands(ABC):
     """Interface to decouple user commands from scenario."""
@@ -215,6 +406,18 @@ class IUserCommands(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_work_item(self, timeout_ms: Optional[int] = ONE_SEC_MS) -> Optional[str]:
+        """Get next item of work sent by add_work_items.
+
+        Args:
+            timeout_ms (int, optional): Time to wait for work item to appear before returning. Defaults to 1000.
+
+        Returns:
+            Optional[str]: Work item, or None if no items are available
+        """
+        pass
+
     @abstractmethod
     def run(self, *args, log_traceback=True, **kwargs) -> Tuple[Any, Exception, str]:
         """Run scenario function with arguments; capture exception and logs.
@@ -258,6 +461,28 @@ class ScenarioMetric(BaseModel):
     metrics: Dict[str, Optional[str]]
 
 
+class MetricSummary(BaseModel):
+    """Pre-aggregated summary of metric values collected in a single flush."""
+
+    count: int
+    sum: float
+    min: float
+    max: float
+    last: float
+    sum_of_squares: float
+    # NOTE: log bucket counts of values, so medians and rates can be estimated
+    histogram: Dict[int, int] = {}
+
+
+class ReducedResults(BaseModel):
+    """Partial aggregate and metrics of results reduced by a user manager."""
+
+    partial: Optional[Any]
+    metrics: Dict[str, MetricSummary] = {}
+    window: WindowSlot = WindowSlot()
+    last_timestamp: Optional[datetime] = None
+
+
 class TestEvent(BaseModel):
     """Store picled event from test to CLI."""
 
@@ -306,6 +531,18 @@ class ICLIBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def wait_for_backend(self, tries: int):
+        """Wait for backend to be ready to serve requests.
+
+        Args:
+            tries (int): Number of health checks allowed before giving up
+
+        Raises:
+            RuntimeError: Backend did not become ready
+        """
+        pass
+
 
 class IConsoleMetricsBackend(ABC):
     """Backend methods available to console metrics."""
@@ -353,6 +590,26 @@ class IConsoleMetricsBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_metric_series(
+        self,
+        scenario_id: str,
+        name: str,
+        from_timestamp: int,
+        to_timestamp: int,
+        step: int,
+    ) -> List[MetricSeriesPoint]:
+        """Get statistics for metric bucketed over time.
+
+        Args:
+            scenario_id (str): scenario to retrieve metrics for
+            name (str): name of metric
+            from_timestamp (int): unix seconds to start series at
+            to_timestamp (int): unix seconds to end series at, current time if 0
+            step (int): seconds covered by each point
+        """
+        pass
+
 
 class ITestBackend(ABC):
     """Decouples backend from calling test methods."""
@@ -397,6 +654,33 @@ class ITestBackend(ABC):
         # FEATURE: see if this can be changed to return "Result" or explain why
         pass
 
+    @abstractmethod
+    def get_metrics_snapshot(
+        self, queries: List[MetricQuery], timeout: Optional[float] = None
+    ) -> Optional[MetricsSnapshot]:
+        """Answer several console metric queries with a single request.
+
+        Args:
+            queries (List[MetricQuery]): Metrics to read
+            timeout (float, optional): Seconds to wait for snapshot. Defaults to None.
+
+        Returns:
+            Optional[MetricsSnapshot]: Value of each query found, None if timed out
+        """
+        pass
+
+    @abstractmethod
+    def save_context_value(self, value: Any) -> str:
+        """Store result passed to dependent scenarios once, keyed by content hash.
+
+        Args:
+            value (Any): JSON serializable value to store
+
+        Returns:
+            str: Content hash of value
+        """
+        pass
+
     @abstractmethod
     def get_console_metrics_backend(self) -> IConsoleMetricsBackend:
         """Get configured backend for created users.
@@ -422,6 +706,18 @@ class ITestBackend(ABC):
 class IScenarioBackend(ABC):
     """Backend methods available to scenario."""
 
+    @abstractmethod
+    def create_pool(self, name: str) -> "IScenarioBackend":
+        """Create a separate pool of users for scenario.
+
+        Args:
+            name (str): Name of pool
+
+        Returns:
+            IScenarioBackend: Backend for pool
+        """
+        pass
+
     @abstractmethod
     def create_users(self, amount: int) -> List[str]:
         """Create users for scenario.
@@ -452,6 +748,15 @@ class IScenarioBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def distribute_work_items(self, items: List[bytes]):
+        """Send items of work to user managers in scenario.
+
+        Args:
+            items (List[bytes]): Items to split across user managers
+        """
+        pass
+
     @abstractmethod
     def send_user_events(self, kind: str, payload: dict):
         """Send events to users in scenario.
@@ -486,6 +791,7 @@ class IScenarioBackend(ABC):
         time_taken: float,
         succeeded: int,
         failed: int,
+        max_users: int = 0,
     ):
         """Set result for scenario after completion.
 
@@ -496,6 +802,7 @@ class IScenarioBackend(ABC):
             time_taken (float): Elapsed time running scenario
             succeeded (int): Amount of succeeded attempts
             failed (int): Amount of failed attempts
+            max_users (int, optional): Most users running at once. Defaults to 0.
         """
         pass
 
@@ -509,11 +816,39 @@ class IScenarioBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def add_metric_summary(self, name: str, summary: MetricSummary):
+        """Send pre-aggregated metric values from scenario to datastore.
+
+        Args:
+            name (str): Name of metric to send
+            summary (MetricSummary): Summary of values to merge into metric totals
+        """
+        pass
+
+    @abstractmethod
+    def get_metric_series(
+        self,
+        name: str,
+        from_timestamp: int,
+        to_timestamp: int,
+        step: int,
+    ) -> List[MetricSeriesPoint]:
+        """Get statistics for metric reported by scenario bucketed over time.
+
+        Args:
+            name (str): Name of metric
+            from_timestamp (int): Unix seconds to start series at
+            to_timestamp (int): Unix seconds to end series at, current time if 0
+            step (int): Seconds covered by each point
+        """
+        pass
+
 
 class IUserBufferActor(ABC):
     """Actor to buffer work and events for users."""
 
-    def add_users(self, user_ids: List[str]) -> Future:
+    def add_users(self, user_ids: List[str]) -> "Future":
         """Add a user for tracking events and work.
 
         Args:
@@ -521,7 +856,7 @@ class IUserBufferActor(ABC):
         """
         pass
 
-    def get_user_events(self, user_id: str, kind: str) -> Future:
+    def get_user_events(self, user_id: str, kind: str) -> "Future":
         """Get events for a user in the user manager or refresh events.
 
         Args:
@@ -533,7 +868,7 @@ class IUserBufferActor(ABC):
         """
         pass
 
-    def get_user_work(self, user_id: str) -> Future:
+    def get_user_work(self, user_id: str) -> "Future":
         """Get work for user or refresh work for all users.
 
         Args:
@@ -544,7 +879,18 @@ class IUserBufferActor(ABC):
         """
         pass
 
-    def add_user_result(self, result: Result) -> Future:
+    def get_user_work_item(self, user_id: str) -> "Future":
+        """Get next work item shared by users or refresh work items.
+
+        Args:
+            user_id (str): User ID to get work item for
+
+        Returns:
+            Optional[bytes]: Work item if available
+        """
+        pass
+
+    def add_user_result(self, result: Result) -> "Future":
         """Add user result to buffer.
 
         Args:
@@ -552,10 +898,18 @@ class IUserBufferActor(ABC):
         """
         pass
 
-    def send_user_results(self) -> Future:
+    def send_user_results(self) -> "Future":
         """Flushes buffer of user results and sends them to datastore."""
         pass
 
+    def move_user_results(self) -> "Future":
+        """Flushes buffer of user results without sending them.
+
+        Returns:
+            List[Result]: Buffered user results
+        """
+        pass
+
 
 class IUserBackend(ABC):
     """Datastore methods available to user."""
@@ -584,6 +938,18 @@ class IUserBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_work_item(self, timeout_ms: Optional[int] = ONE_SEC_MS) -> Optional[bytes]:
+        """Get next work item for current user.
+
+        Args:
+            timeout_ms (int, optional): Time to wait for work item if none available. Defaults to 1000.
+
+        Returns:
+            Optional[bytes]: Work item if available
+        """
+        pass
+
     @abstractmethod
     def add_user_result(self, result: Result):
         """Report cycle result for user.
@@ -620,6 +986,42 @@ class IUserManagerBackend(ABC):
         """Flush buffer full of user results."""
         pass
 
+    @abstractmethod
+    def move_user_results(self) -> List[Result]:
+        """Flush buffer full of user results without sending them.
+
+        Returns:
+            List[Result]: Buffered user results
+        """
+        pass
+
+    @abstractmethod
+    def send_results(self, results: List[Result]):
+        """Send results to scenario.
+
+        Args:
+            results (List[Result]): Results to send
+        """
+        pass
+
+
+class IResultExporter(ABC):
+    """Writes user results collected by a scenario to files for later analysis."""
+
+    @abstractmethod
+    def add_results(self, results: List[Result]):
+        """Export results collected by scenario.
+
+        Args:
+            results (List[Result]): Latest user results
+        """
+        pass
+
+    @abstractmethod
+    def close(self):
+        """Write remaining results and index exported files."""
+        pass
+
 
 class IBackendAPI(ABC):
     @abstractmethod
@@ -643,6 +1045,10 @@ class IBackendAPI(ABC):
     ) -> str:
         pass
 
+    @abstractmethod
+    def create_scenario_pool(self, scenario_id: str, name: str) -> str:
+        pass
+
     @abstractmethod
     def create_users(
         self,
@@ -668,6 +1074,10 @@ class IBackendAPI(ABC):
     def check_test_instance(self, test_id: str, instance_id: str):
         pass
 
+    @abstractmethod
+    def check_health(self, timeout: float):
+        pass
+
     @abstractmethod
     def add_test_event(self, test_id: str, event: TestEvent):
         pass
@@ -690,6 +1100,7 @@ class IBackendAPI(ABC):
         time_taken: float,
         succeeded: int,
         failed: int,
+        max_users: int = 0,
     ):
         pass
 
@@ -701,6 +1112,14 @@ class IBackendAPI(ABC):
     def move_scenario_result(self, scenario_id: str) -> Optional[dict]:
         pass
 
+    @abstractmethod
+    def set_context_value(self, value_hash: str, value: bytes):
+        pass
+
+    @abstractmethod
+    def get_context_value(self, value_hash: str) -> Optional[bytes]:
+        pass
+
     @abstractmethod
     def distribute_work(self, scenario_id: str, amount: int):
         pass
@@ -709,6 +1128,14 @@ class IBackendAPI(ABC):
     def get_user_work(self, user_manager_id: str) -> int:
         pass
 
+    @abstractmethod
+    def distribute_work_items(self, scenario_id: str, items: List[bytes]):
+        pass
+
+    @abstractmethod
+    def get_user_work_items(self, user_manager_id: str) -> List[bytes]:
+        pass
+
     @abstractmethod
     def add_user_event(self, scenario_id: str, kind: str, payload: dict):
         pass
@@ -721,6 +1148,10 @@ class IBackendAPI(ABC):
     def add_metric(self, scenario_id: str, name: str, value: float):
         pass
 
+    @abstractmethod
+    def add_metric_summary(self, scenario_id: str, name: str, summary: MetricSummary):
+        pass
+
     @abstractmethod
     def get_metric_total(self, scenario_id: str, name: str) -> Optional[float]:
         pass
@@ -739,6 +1170,23 @@ class IBackendAPI(ABC):
     def get_metric_statistics(self, scenario_id: str, name: str) -> Optional[dict]:
         pass
 
+    @abstractmethod
+    def get_metric_series(
+        self,
+        scenario_id: str,
+        name: str,
+        from_timestamp: int,
+        to_timestamp: int,
+        step: int,
+    ) -> List[MetricSeriesPoint]:
+        pass
+
+    @abstractmethod
+    def get_metrics_snapshot(
+        self, queries: List[MetricQuery], timeout: Optional[float] = None
+    ) -> Optional[List[Any]]:
+        pass
+
 
 class IBackendBuilder(ABC):
     """Interface for class that generates backend implementations in Engine."""
@@ -804,6 +1252,12 @@ LoadModelFn = Callable[[IScenarioCommands, dict], None]
 ResultAggregatorFn = Callable[
     [Optional[Any], List[Result]], Any
 ]  # NOTE: takes previous result, list of results. output result should be JSON serializable
+ResultReducerFn = Callable[
+    [Optional[Any], List[Result]], Any
+]  # NOTE: takes previous partial aggregate, list of results. Runs in user manager
+ResultMergerFn = Callable[
+    [Optional[Any], Any], Any
+]  # NOTE: takes previous aggregate, partial aggregate from a user manager
 ResultVerifierFn = Callable[
     [List[Result]], List[str]
 ]  # NOTE: returns list of error strings
@@ -1,7 +1,8 @@
+from datetime import datetime
 from typing import List
 import math
 
-from cicadad.core.types import Result
+from cicadad.core.types import ReducedResults, Result
 
 
 def runtime_seconds(latest_results: List[Result]) -> List[float]:
@@ -34,28 +35,33 @@ def pass_or_fail(latest_results: List[Result]) -> List[float]:
 def results_per_second(latest_results: List[Result]) -> List[float]:
     """Determine number of results collected in one second.
 
+    Partial aggregates sent by user managers are counted as the results they
+    reduced, over the time between their first and last result.
+
     Args:
         latest_results (List[Result]): Most recently collected user results
 
     Returns:
         List[float]: Single element array containing number of results per second
     """
-    if len(latest_results) < 2:
-        return []
+    count = 0
+    timestamps: List[datetime] = []
 
-    min_timestamp = latest_results[0].timestamp
-    max_timestamp = latest_results[0].timestamp
+    for result in latest_results:
+        count += 1 if result.reduced_count is None else result.reduced_count
 
-    if min_timestamp is None or max_timestamp is None:
-        return []
+        if result.timestamp is not None:
+            timestamps.append(result.timestamp)
 
-    for result in latest_results:
-        if result.timestamp is not None and result.timestamp < min_timestamp:
-            min_timestamp = result.timestamp
+        if (
+            isinstance(result.output, ReducedResults)
+            and result.output.last_timestamp is not None
+        ):
+            timestamps.append(result.output.last_timestamp)
 
-        if result.timestamp is not None and result.timestamp > max_timestamp:
-            max_timestamp = result.timestamp
+    if count < 2 or timestamps == []:
+        return []
 
-    seconds = math.ceil((max_timestamp - min_timestamp).total_seconds())
+    seconds = math.ceil((max(timestamps) - min(timestamps)).total_seconds())
 
-    return [len(latest_results) / seconds]
+    return [count / max(seconds, 1)]
@@ -0,0 +1,234 @@
+from typing import Dict, List, Optional, Sequence
+import math
+
+from pydantic import BaseModel
+from rich.table import Table
+from rich import box
+
+from cicadad.util.console import format_number
+
+DEFAULT_COMPARE_WINDOW = 5
+COMPARE_PERCENTILES = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+
+
+class ScenarioSummary(BaseModel):
+    """Throughput and latency of a scenario run, with samples per window of time."""
+
+    count: int
+    duration: float
+    throughput: float
+    percentiles: Dict[str, Optional[float]]
+    window_throughput: List[float]
+    window_latency: List[float]
+
+
+class CompareTolerances(BaseModel):
+    """Allowed change from baseline before a metric is reported as a regression.
+
+    Changes are relative to the baseline value. A change over the tolerance is
+    only a regression if windowed samples are also significantly worse under a
+    Mann-Whitney U test, unless there are too few windows to test.
+    """
+
+    throughput: float = 0.1
+    latency: float = 0.1
+    alpha: float = 0.05
+    min_windows: int = 3
+
+
+class MetricComparison(BaseModel):
+    """Change of one metric of a scenario between a baseline and current run."""
+
+    scenario: str
+    metric: str
+    baseline: Optional[float]
+    current: Optional[float]
+    change: Optional[float]
+    p_value: Optional[float]
+    regressed: bool
+
+
+def mann_whitney_greater(first: Sequence[float], second: Sequence[float]) -> float:
+    """One-sided Mann-Whitney U test that values of first tend to be greater.
+
+    Uses the normal approximation with tie and continuity corrections.
+
+    Args:
+        first (Sequence[float]): Samples expected to be greater
+        second (Sequence[float]): Samples to compare against
+
+    Returns:
+        float: p-value
+    """
+    n1 = len(first)
+    n2 = len(second)
+    values = sorted(
+        [(value, 0) for value in first] + [(value, 1) for value in second],
+        key=lambda pair: pair[0],
+    )
+
+    rank_sum = 0.0
+    tie_term = 0.0
+    i = 0
+
+    while i < len(values):
+        j = i
+
+        while j < len(values) and values[j][0] == values[i][0]:
+            j += 1
+
+        # NOTE: tied values share the average of their ranks
+        rank = (i + j + 1) / 2
+        rank_sum += rank * sum(1 for _, group in values[i:j] if group == 0)
+        tie_term += (j - i) ** 3 - (j - i)
+        i = j
+
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+
+    if variance <= 0:
+        return 1.0
+
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+
+    # NOTE: upper tail of standard normal distribution
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _relative_change(baseline: Optional[float], current: Optional[float]):
+    if baseline is None or current is None or baseline == 0:
+        return None
+
+    return (current - baseline) / abs(baseline)
+
+
+def compare_scenario(
+    scenario: str,
+    baseline: ScenarioSummary,
+    current: ScenarioSummary,
+    tolerances: CompareTolerances,
+) -> List[MetricComparison]:
+    """Compare throughput and latency percentiles of a scenario to a baseline.
+
+    Args:
+        scenario (str): Name of scenario
+        baseline (ScenarioSummary): Summary of baseline run
+        current (ScenarioSummary): Summary of current run
+        tolerances (CompareTolerances): Allowed changes
+
+    Returns:
+        List[MetricComparison]: Comparison of each metric
+    """
+
+    def p_value(worse: List[float], better: List[float]) -> Optional[float]:
+        if min(len(worse), len(better)) < tolerances.min_windows:
+            return None
+
+        return mann_whitney_greater(worse, better)
+
+    def regressed(change: Optional[float], tolerance: float, p: Optional[float]):
+        return (
+            change is not None
+            and change > tolerance
+            and (p is None or p < tolerances.alpha)
+        )
+
+    comparisons = []
+
+    throughput_change = _relative_change(baseline.throughput, current.throughput)
+    throughput_p = p_value(baseline.window_throughput, current.window_throughput)
+
+    comparisons.append(
+        MetricComparison(
+            scenario=scenario,
+            metric="throughput",
+            baseline=baseline.throughput,
+            current=current.throughput,
+            change=throughput_change,
+            p_value=throughput_p,
+            # NOTE: lower throughput is worse
+            regressed=regressed(
+                None if throughput_change is None else -throughput_change,
+                tolerances.throughput,
+                throughput_p,
+            ),
+        )
+    )
+
+    latency_p = p_value(current.window_latency, baseline.window_latency)
+
+    for name in COMPARE_PERCENTILES:
+        change = _relative_change(
+            baseline.percentiles.get(name), current.percentiles.get(name)
+        )
+
+        comparisons.append(
+            MetricComparison(
+                scenario=scenario,
+                metric=f"latency_{name}",
+                baseline=baseline.percentiles.get(name),
+                current=current.percentiles.get(name),
+                change=change,
+                p_value=latency_p,
+                regressed=regressed(change, tolerances.latency, latency_p),
+            )
+        )
+
+    return comparisons
+
+
+def compare_runs(
+    baseline: Dict[str, ScenarioSummary],
+    current: Dict[str, ScenarioSummary],
+    tolerances: CompareTolerances,
+) -> List[MetricComparison]:
+    """Compare scenarios found in both a baseline and current run.
+
+    Args:
+        baseline (Dict[str, ScenarioSummary]): Summaries of baseline run by scenario
+        current (Dict[str, ScenarioSummary]): Summaries of current run by scenario
+        tolerances (CompareTolerances): Allowed changes
+
+    Returns:
+        List[MetricComparison]: Comparison of each metric of each scenario
+    """
+    return [
+        comparison
+        for scenario in current
+        if scenario in baseline
+        for comparison in compare_scenario(
+            scenario, baseline[scenario], current[scenario], tolerances
+        )
+    ]
+
+
+class ComparisonDisplay(object):
+    def __init__(self, comparisons: List[MetricComparison]) -> None:
+        self.comparisons = comparisons
+
+    def get_renderable(self):
+        table = Table(
+            "scenario",
+            "metric",
+            "baseline",
+            "current",
+            "change",
+            "p-value",
+            title="Comparison to baseline",
+            box=box.HORIZONTALS,
+            show_lines=False,
+        )
+
+        for comparison in self.comparisons:
+            table.add_row(
+                comparison.scenario,
+                comparison.metric,
+                format_number(comparison.baseline),
+                format_number(comparison.current),
+                ("-" if comparison.change is None else f"{comparison.change:+.1%}"),
+                format_number(comparison.p_value),
+                style="red" if comparison.regressed else None,
+            )
+
+        return table
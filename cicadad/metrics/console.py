@@ -1,11 +1,15 @@
 from typing import List
+import time
 
 from cicadad.core.types import (
     IConsoleMetricsBackend,
     IScenarioBackend,
+    MetricSummary,
     Result,
     ConsoleCollectorFn,
 )
+from cicadad.metrics.collectors import pass_or_fail, results_per_second, runtime_seconds
+from cicadad.metrics.window import make_histogram
 
 
 def console_collector(name: str, collector: ConsoleCollectorFn):
@@ -25,6 +29,62 @@ def console_collector(name: str, collector: ConsoleCollectorFn):
     return collect_metric
 
 
+def console_summary_collector(name: str, collector: ConsoleCollectorFn):
+    """Send a single pre-aggregated summary of collected values to backend.
+
+    Unlike console_collector, only one call is made to the backend per collection,
+    regardless of the number of values. Median and rate of summarized values are
+    estimated from log buckets, accurate to about half a percent.
+
+    Args:
+        name (str): Name of metric
+        collector (ConsoleCollectorFn): Function to convert results to list of metric values
+    """
+
+    def collect_metric(results: List[Result], backend: IScenarioBackend):
+        values = list(collector(results))
+
+        if not values:
+            return
+
+        backend.add_metric_summary(name, summarize_values(values))
+
+    return collect_metric
+
+
+def summarize_values(values: List[float]) -> MetricSummary:
+    """Create summary of metric values that can be merged with other summaries.
+
+    Args:
+        values (List[float]): Metric values, at least one
+
+    Returns:
+        MetricSummary: Summary of values
+    """
+    return MetricSummary(
+        count=len(values),
+        sum=sum(values),
+        min=min(values),
+        max=max(values),
+        last=values[-1],
+        sum_of_squares=sum(value * value for value in values),
+        histogram=make_histogram(values),
+    )
+
+
+# NOTE: user managers cannot see results of other user managers, so scenarios
+# with a result reducer run this one on the partial aggregates they collect
+RESULTS_PER_SECOND_COLLECTOR = console_collector(
+    "results_per_second", results_per_second
+)
+
+DEFAULT_METRIC_COLLECTORS = [
+    console_collector("runtime", runtime_seconds),
+    console_collector("pass_or_fail", pass_or_fail),
+    RESULTS_PER_SECOND_COLLECTOR,
+]
+
+
 def console_stats(metric_name: str):
     """Get stats for metric values from datastore.
 
@@ -59,6 +119,82 @@ def console_stats(metric_name: str):
     return get
 
 
+def console_summary_stats(metric_name: str):
+    """Get stats for metric values added as summaries from datastore.
+
+    * Min
+    * Average
+    * Stddev
+    * Max
+    * Len (Number of results for this metric)
+
+    Args:
+        metric_name (str): Name of saved metric
+    """
+
+    def get(
+        display_name: str,
+        scenario_id: str,
+        backend: IConsoleMetricsBackend,
+    ):
+        stats = backend.get_metric_statistics(scenario_id, metric_name)
+
+        if stats is None:
+            return None
+
+        return (
+            f"Min: {round(stats['min'], 3)}, "
+            f"Average: {round(stats['average'], 3)}, "
+            f"Stddev: {round(stats['stddev'], 3)}, "
+            f"Max: {round(stats['max'], 3)}, "
+            f"Len: {stats['len']}"
+        )
+
+    return get
+
+
+def console_window_stats(metric_name: str, seconds: int = 10):
+    """Get stats for metric values reported in the last few seconds from datastore.
+
+    * Min
+    * Average
+    * Max
+    * Len (Number of results for this metric in window)
+
+    Args:
+        metric_name (str): Name of saved metric
+        seconds (int): Size of window in seconds. Defaults to 10.
+    """
+
+    def get(
+        display_name: str,
+        scenario_id: str,
+        backend: IConsoleMetricsBackend,
+    ):
+        points = backend.get_metric_series(
+            scenario_id,
+            metric_name,
+            int(time.time()) - seconds,
+            0,
+            seconds,
+        )
+
+        if points == []:
+            return None
+
+        count = sum(point.count for point in points)
+        total = sum(point.sum for point in points)
+
+        return (
+            f"Min: {round(min(point.min for point in points), 3)}, "
+            f"Average: {round(total / count, 3)}, "
+            f"Max: {round(max(point.max for point in points), 3)}, "
+            f"Len: {count}"
+        )
+
+    return get
+
+
 def console_count(metric_name: str):
     """Get total of all values for a metric in datastore.
 
@@ -0,0 +1,339 @@
+from typing import Dict, List, Optional, Union
+import math
+import time
+
+from pydantic import BaseModel, validator
+
+from cicadad.core.types import Result
+
+CONVERGENCE_STATISTICS = ["mean", "p50", "p90", "p95", "p99"]
+
+# NOTE: coefficients of Acklam's rational approximation of the normal quantile,
+# accurate to about 1e-9
+_QUANTILE_A = [
+    -3.969683028665376e01,
+    2.209460984245205e02,
+    -2.759285104469687e02,
+    1.383577518672690e02,
+    -3.066479806614716e01,
+    2.506628277459239e00,
+]
+_QUANTILE_B = [
+    -5.447609879822406e01,
+    1.615858368580409e02,
+    -1.556989798598866e02,
+    6.680131188771972e01,
+    -1.328068155288572e01,
+]
+_QUANTILE_C = [
+    -7.784894002430293e-03,
+    -3.223964580411365e-01,
+    -2.400758277161838e00,
+    -2.549732539343734e00,
+    4.374664141464968e00,
+    2.938163982698783e00,
+]
+_QUANTILE_D = [
+    7.784695709041462e-03,
+    3.224671290700398e-01,
+    2.445134137142996e00,
+    3.754408661907416e00,
+]
+_QUANTILE_LOW = 0.02425
+
+
+def _polynomial(coefficients: List[float], x: float) -> float:
+    value = 0.0
+
+    for coefficient in coefficients:
+        value = value * x + coefficient
+
+    return value
+
+
+def normal_quantile(p: float) -> float:
+    """Get value of standard normal distribution below which a fraction p falls.
+
+    Args:
+        p (float): Probability, between 0 and 1 exclusive
+
+    Raises:
+        ValueError: Probability is not between 0 and 1
+
+    Returns:
+        float: Quantile of standard normal distribution
+    """
+    if not 0 < p < 1:
+        raise ValueError(f"Probability must be between 0 and 1, got {p}")
+
+    if p < _QUANTILE_LOW:
+        q = math.sqrt(-2 * math.log(p))
+
+        return _polynomial(_QUANTILE_C, q) / (_polynomial(_QUANTILE_D, q) * q + 1)
+
+    if p > 1 - _QUANTILE_LOW:
+        return -normal_quantile(1 - p)
+
+    q = p - 0.5
+    r = q * q
+
+    return _polynomial(_QUANTILE_A, r) * q / (_polynomial(_QUANTILE_B, r) * r + 1)
+
+
+class RunningMoments:
+    def __init__(self) -> None:
+        """Mean and variance of a stream of values, updated one value at a time."""
+        self.count = 0
+        self.mean = 0.0
+        self.__m2 = 0.0
+
+    @property
+    def variance(self) -> float:
+        return self.__m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def add(self, value: float):
+        # NOTE: Welford's algorithm, stable for long streams of similar values
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.__m2 += delta * (value - self.mean)
+
+
+class StreamingQuantile:
+    def __init__(self, quantile: float) -> None:
+        """Estimate of a quantile of a stream using five markers (P-squared algorithm).
+
+        Args:
+            quantile (float): Quantile to estimate, between 0 and 1
+        """
+        self.__quantile = quantile
+        self.__heights: List[float] = []
+        self.__positions = [1, 2, 3, 4, 5]
+        self.__desired = [
+            1,
+            1 + 2 * quantile,
+            1 + 4 * quantile,
+            3 + 2 * quantile,
+            5,
+        ]
+        self.__increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    @property
+    def count(self) -> int:
+        return len(self.__heights) if len(self.__heights) < 5 else self.__positions[4]
+
+    @property
+    def value(self) -> Optional[float]:
+        if self.__heights == []:
+            return None
+
+        if len(self.__heights) < 5:
+            ordered = sorted(self.__heights)
+            return ordered[min(int(self.__quantile * len(ordered)), len(ordered) - 1)]
+
+        return self.__heights[2]
+
+    def add(self, value: float):
+        heights = self.__heights
+
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if heights[i] <= value < heights[i + 1])
+
+        for i in range(cell + 1, 5):
+            self.__positions[i] += 1
+
+        for i in range(5):
+            self.__desired[i] += self.__increments[i]
+
+        # adjust middle markers toward their desired positions
+        for i in range(1, 4):
+            offset = self.__desired[i] - self.__positions[i]
+
+            if (offset >= 1 and self.__positions[i + 1] - self.__positions[i] > 1) or (
+                offset <= -1 and self.__positions[i - 1] - self.__positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self.__parabolic(i, step)
+
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self.__linear(i, step)
+
+                heights[i] = height
+                self.__positions[i] += step
+
+    def __parabolic(self, i: int, step: int) -> float:
+        n = self.__positions
+        q = self.__heights
+
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def __linear(self, i: int, step: int) -> float:
+        n = self.__positions
+        q = self.__heights
+
+        return q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+
+
+class ConvergenceCriterion(BaseModel):
+    """Settings for ending a load model once statistics of a metric are stable.
+
+    Results are split into windows of window_seconds. Each statistic is estimated
+    per window, and a confidence interval is built from the window estimates
+    (batch means). A statistic has converged when the interval is narrower than
+    relative_width of its value, and the average of the last stable_windows
+    windows is within flat_tolerance of the average of the windows before them.
+    """
+
+    metric: str = "time_taken"
+    statistics: List[str] = ["mean", "p95"]
+    relative_width: float = 0.02
+    confidence: float = 0.95
+    window_seconds: float = 10
+    stable_windows: int = 3
+    flat_tolerance: float = 0.02
+    min_results: int = 100
+
+    @validator("statistics", each_item=True)
+    def statistic_is_known(cls, statistic):
+        if statistic not in CONVERGENCE_STATISTICS:
+            raise ValueError(
+                f"Unknown statistic '{statistic}', expected one of {CONVERGENCE_STATISTICS}"
+            )
+
+        return statistic
+
+
+class ConvergenceEstimator:
+    def __init__(self, criterion: ConvergenceCriterion) -> None:
+        """Tracks whether statistics of a result stream have converged.
+
+        Args:
+            criterion (ConvergenceCriterion): Settings for convergence
+        """
+        self.__criterion = criterion
+        self.__z = normal_quantile((1 + criterion.confidence) / 2)
+        self.__overall = RunningMoments()
+        self.__window_start: Optional[float] = None
+        self.__window_estimators = self.__new_window()
+        self.__window_values: Dict[str, List[float]] = {
+            statistic: [] for statistic in criterion.statistics
+        }
+        self.__converged = False
+
+    @property
+    def converged(self) -> bool:
+        return self.__converged
+
+    @property
+    def count(self) -> int:
+        return self.__overall.count
+
+    def estimates(self) -> Dict[str, float]:
+        """Get average of window estimates for each statistic.
+
+        Returns:
+            Dict[str, float]: Estimate of each statistic with at least one window
+        """
+        return {
+            statistic: sum(values) / len(values)
+            for statistic, values in self.__window_values.items()
+            if values != []
+        }
+
+    def add_results(self, results: List[Result], now: Optional[float] = None):
+        """Add successful results to estimators and check convergence at the end
+        of each window.
+
+        Args:
+            results (List[Result]): Latest results collected
+            now (float, optional): Unix time results were collected. Defaults to current time.
+        """
+        current = time.time() if now is None else now
+
+        if self.__window_start is None:
+            self.__window_start = current
+
+        if current - self.__window_start >= self.__criterion.window_seconds:
+            self.__close_window()
+            self.__window_start = current
+
+        for result in results:
+            if not isinstance(result, Result) or result.exception is not None:
+                continue
+
+            value = getattr(result, self.__criterion.metric, None)
+
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                continue
+
+            self.__overall.add(value)
+
+            for estimator in self.__window_estimators.values():
+                estimator.add(value)
+
+    def __new_window(self) -> Dict[str, Union[RunningMoments, StreamingQuantile]]:
+        return {
+            statistic: (
+                RunningMoments()
+                if statistic == "mean"
+                else StreamingQuantile(int(statistic[1:]) / 100)
+            )
+            for statistic in self.__criterion.statistics
+        }
+
+    def __close_window(self):
+        for statistic, estimator in self.__window_estimators.items():
+            if estimator.count == 0:
+                continue
+
+            if isinstance(estimator, RunningMoments):
+                self.__window_values[statistic].append(estimator.mean)
+            elif estimator.value is not None:
+                self.__window_values[statistic].append(estimator.value)
+
+        self.__window_estimators = self.__new_window()
+
+        self.__converged = self.__overall.count >= self.__criterion.min_results and all(
+            self.__statistic_converged(values)
+            for values in self.__window_values.values()
+        )
+
+    def __statistic_converged(self, values: List[float]) -> bool:
+        stable_windows = self.__criterion.stable_windows
+
+        if len(values) < 2 * stable_windows:
+            return False
+
+        moments = RunningMoments()
+
+        for value in values:
+            moments.add(value)
+
+        if moments.mean == 0:
+            return False
+
+        half_width = self.__z * math.sqrt(moments.variance / moments.count)
+
+        recent = sum(values[-stable_windows:]) / stable_windows
+        previous_start = len(values) - 2 * stable_windows
+        previous = sum(values[previous_start:-stable_windows]) / stable_windows
+
+        return (
+            half_width / abs(moments.mean) < self.__criterion.relative_width
+            and abs(recent - previous) / abs(moments.mean)
+            <= self.__criterion.flat_tolerance
+        )
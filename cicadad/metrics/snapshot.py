@@ -0,0 +1,209 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from cicadad.core.types import (
+    ConsoleMetricDisplays,
+    IConsoleMetricsBackend,
+    MetricQuery,
+    MetricSeriesPoint,
+    MetricsSnapshot,
+)
+
+
+class MetricQueryRecorder(IConsoleMetricsBackend):
+    def __init__(self) -> None:
+        """Stands in for console metrics backend to find out which metrics
+        displays read, without reading them."""
+        self.__queries: Dict[MetricQuery, None] = {}
+        self.__calls: List[MetricQuery] = []
+
+    @property
+    def queries(self) -> List[MetricQuery]:
+        return list(self.__queries)
+
+    @property
+    def calls(self) -> List[MetricQuery]:
+        """Get every query in order it was made, including repeats."""
+        return self.__calls[:]
+
+    def get_metric_statistics(self, scenario_id: str, name: str) -> Optional[dict]:
+        self.__record(
+            MetricQuery(kind="statistics", scenario_id=scenario_id, name=name)
+        )
+        return None
+
+    def get_metric_total(self, scenario_id: str, name: str) -> Optional[float]:
+        self.__record(MetricQuery(kind="total", scenario_id=scenario_id, name=name))
+        return None
+
+    def get_last_metric(self, scenario_id: str, name: str) -> Optional[float]:
+        self.__record(MetricQuery(kind="last", scenario_id=scenario_id, name=name))
+        return None
+
+    def get_metric_rate(
+        self, scenario_id: str, name: str, split_point: float
+    ) -> Optional[float]:
+        self.__record(
+            MetricQuery(
+                kind="rate",
+                scenario_id=scenario_id,
+                name=name,
+                split_point=split_point,
+            )
+        )
+        return None
+
+    def get_metric_series(
+        self,
+        scenario_id: str,
+        name: str,
+        from_timestamp: int,
+        to_timestamp: int,
+        step: int,
+    ) -> List[MetricSeriesPoint]:
+        self.__record(
+            MetricQuery(
+                kind="series",
+                scenario_id=scenario_id,
+                name=name,
+                from_timestamp=from_timestamp,
+                to_timestamp=to_timestamp,
+                step=step,
+            )
+        )
+        return []
+
+    def __record(self, query: MetricQuery):
+        # NOTE: dict keeps queries in order they were made without repeats
+        self.__queries[query] = None
+        self.__calls.append(query)
+
+
+class SnapshotMetricsBackend(IConsoleMetricsBackend):
+    def __init__(
+        self, snapshot: MetricsSnapshot, calls: Optional[List[MetricQuery]] = None
+    ) -> None:
+        """Answers console metric displays from a snapshot instead of the backend.
+
+        If calls recorded by a MetricQueryRecorder are given, each call is answered
+        with the response to the recorded call in the same position, as long as it
+        reads the same metric. Arguments displays compute on each run, such as
+        series windows based on the current time, do not need to match.
+
+        Metrics missing from the snapshot are reported as not found.
+
+        Args:
+            snapshot (MetricsSnapshot): Values of queried metrics
+            calls (List[MetricQuery], optional): Queries in order displays made
+                them when recorded. Defaults to None.
+        """
+        self.__snapshot = snapshot
+        self.__calls = calls or []
+        self.__position = 0
+
+    def get_metric_statistics(self, scenario_id: str, name: str) -> Optional[dict]:
+        return self.__answer(
+            MetricQuery(kind="statistics", scenario_id=scenario_id, name=name)
+        )
+
+    def get_metric_total(self, scenario_id: str, name: str) -> Optional[float]:
+        return self.__answer(
+            MetricQuery(kind="total", scenario_id=scenario_id, name=name)
+        )
+
+    def get_last_metric(self, scenario_id: str, name: str) -> Optional[float]:
+        return self.__answer(
+            MetricQuery(kind="last", scenario_id=scenario_id, name=name)
+        )
+
+    def get_metric_rate(
+        self, scenario_id: str, name: str, split_point: float
+    ) -> Optional[float]:
+        return self.__answer(
+            MetricQuery(
+                kind="rate",
+                scenario_id=scenario_id,
+                name=name,
+                split_point=split_point,
+            )
+        )
+
+    def get_metric_series(
+        self,
+        scenario_id: str,
+        name: str,
+        from_timestamp: int,
+        to_timestamp: int,
+        step: int,
+    ) -> List[MetricSeriesPoint]:
+        return self.__answer(
+            MetricQuery(
+                kind="series",
+                scenario_id=scenario_id,
+                name=name,
+                from_timestamp=from_timestamp,
+                to_timestamp=to_timestamp,
+                step=step,
+            ),
+            [],
+        )
+
+    def __answer(self, query: MetricQuery, default: Any = None) -> Any:
+        if self.__position < len(self.__calls):
+            recorded = self.__calls[self.__position]
+            self.__position += 1
+
+            if (recorded.kind, recorded.scenario_id, recorded.name) == (
+                query.kind,
+                query.scenario_id,
+                query.name,
+            ):
+                query = recorded
+
+        return self.__snapshot.get(query, default)
+
+
+def evaluate_console_metrics(
+    scenarios: Dict[str, Tuple[str, ConsoleMetricDisplays]],
+    get_snapshot: Callable[[List[MetricQuery]], Optional[MetricsSnapshot]],
+) -> Optional[Dict[str, Dict[str, Optional[str]]]]:
+    """Evaluate console metric displays of several scenarios from one snapshot.
+
+    Displays are first run against a recorder to find the metrics they read,
+    then all metrics are fetched at once and displays are run again, with each
+    call answered by the response to the call recorded in the same position.
+
+    Args:
+        scenarios (Dict[str, Tuple[str, ConsoleMetricDisplays]]): Scenario ID and
+            displays for each scenario name
+        get_snapshot (Callable[[List[MetricQuery]], Optional[MetricsSnapshot]]):
+            Fetch values of metric queries, None if not available in time
+
+    Returns:
+        Optional[Dict[str, Dict[str, Optional[str]]]]: Display values for each
+            scenario name, None if snapshot was not available
+    """
+    recorder = MetricQueryRecorder()
+
+    for scenario_id, displays in scenarios.values():
+        for name, display_fn in displays.items():
+            try:
+                display_fn(name, scenario_id, recorder)
+            except Exception:  # nosec
+                # NOTE: displays are run again against snapshot, errors surface there
+                pass
+
+    queries = recorder.queries
+    snapshot = get_snapshot(queries) if queries != [] else {}
+
+    if snapshot is None:
+        return None
+
+    backend = SnapshotMetricsBackend(snapshot, recorder.calls)
+
+    return {
+        scenario_name: {
+            name: display_fn(name, scenario_id, backend)
+            for name, display_fn in displays.items()
+        }
+        for scenario_name, (scenario_id, displays) in scenarios.items()
+    }
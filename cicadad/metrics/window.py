@@ -0,0 +1,257 @@
+from typing import Dict, List, Optional, Tuple
+import math
+import time
+
+from cicadad.core.types import Result, WindowSlot, WindowStats
+
+# NOTE: values are grouped into buckets growing by 1%, so percentiles are
+# accurate to about half a percent regardless of how many results are collected
+BUCKET_GROWTH = 1.01
+MIN_BUCKET_VALUE = 1e-9
+DEFAULT_WINDOW_CAPACITY = 300
+
+
+def bucket_index(value: float) -> int:
+    """Get index of log bucket a value falls in."""
+    return math.floor(math.log(max(value, MIN_BUCKET_VALUE), BUCKET_GROWTH))
+
+
+def bucket_value(index: int) -> float:
+    """Get midpoint of log bucket."""
+    return BUCKET_GROWTH ** (index + 0.5)
+
+
+def make_histogram(values: List[float]) -> Dict[int, int]:
+    """Count values in each log bucket.
+
+    Args:
+        values (List[float]): Values to count
+
+    Returns:
+        Dict[int, int]: Number of values in each bucket, by bucket index
+    """
+    histogram: Dict[int, int] = {}
+
+    for value in values:
+        index = bucket_index(value)
+        histogram[index] = histogram.get(index, 0) + 1
+
+    return histogram
+
+
+def _add_slot_value(slot: WindowSlot, metric: str, value: float):
+    histogram = slot.histograms.setdefault(metric, {})
+    index = bucket_index(value)
+
+    histogram[index] = histogram.get(index, 0) + 1
+    slot.mins[metric] = min(slot.mins.get(metric, value), value)
+    slot.maxes[metric] = max(slot.maxes.get(metric, value), value)
+
+
+def merge_window_slots(first: WindowSlot, second: WindowSlot):
+    """Add counts and histograms of second slot to first slot.
+
+    Args:
+        first (WindowSlot): Slot to update
+        second (WindowSlot): Slot to merge into first slot
+    """
+    first.count += second.count
+    first.errors += second.errors
+
+    for metric, histogram in second.histograms.items():
+        merged = first.histograms.setdefault(metric, {})
+
+        for index, bucket_count in histogram.items():
+            merged[index] = merged.get(index, 0) + bucket_count
+
+    for metric, minimum in second.mins.items():
+        first.mins[metric] = min(first.mins.get(metric, minimum), minimum)
+
+    for metric, maximum in second.maxes.items():
+        first.maxes[metric] = max(first.maxes.get(metric, maximum), maximum)
+
+
+def make_window_slot(results: List[Result]) -> WindowSlot:
+    """Summarize results for a ResultWindow.
+
+    Tracks the time_taken of each result, as well as the output if it is numeric.
+
+    Args:
+        results (List[Result]): Results collected from users
+
+    Returns:
+        WindowSlot: Counts and histograms of results
+    """
+    slot = WindowSlot()
+
+    for result in results:
+        slot.count += 1
+
+        if result.exception is not None:
+            slot.errors += 1
+
+        if isinstance(result.time_taken, (int, float)):
+            _add_slot_value(slot, "time_taken", result.time_taken)
+
+        if isinstance(result.output, (int, float)) and not isinstance(
+            result.output, bool
+        ):
+            _add_slot_value(slot, "output", result.output)
+
+    return slot
+
+
+class ResultWindow:
+    def __init__(self, capacity: int = DEFAULT_WINDOW_CAPACITY) -> None:
+        """Ring buffer of per second result statistics collected by a scenario.
+
+        Each result is added in constant time and queries only touch one slot per
+        second in the window, so load models can check it on every poll.
+
+        Args:
+            capacity (int, optional): Max seconds of results to keep. Defaults to 300.
+        """
+        self.__capacity = capacity
+        self.__slots: List[Optional[Tuple[int, WindowSlot]]] = [None] * capacity
+        self.__first_second: Optional[int] = None
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    def add_results(self, results: List[Result], now: Optional[float] = None):
+        """Record results collected at a point in time.
+
+        Tracks the time_taken of each result, as well as the output if it is numeric.
+
+        Args:
+            results (List[Result]): Results collected from users
+            now (float, optional): Unix time results were collected. Defaults to current time.
+        """
+        if results == []:
+            return
+
+        self.add_slot(make_window_slot(results), now)
+
+    def add_slot(self, slot: WindowSlot, now: Optional[float] = None):
+        """Record results summarized elsewhere, such as by a user manager.
+
+        Args:
+            slot (WindowSlot): Counts and histograms of results
+            now (float, optional): Unix time results were collected. Defaults to current time.
+        """
+        if slot.count < 1:
+            return
+
+        second = int(time.time() if now is None else now)
+
+        if self.__first_second is None:
+            self.__first_second = second
+
+        merge_window_slots(self.__get_slot(second), slot)
+
+    def stats(
+        self,
+        metric: str = "time_taken",
+        seconds: int = 30,
+        now: Optional[float] = None,
+    ) -> WindowStats:
+        """Get statistics for results collected in the last few seconds.
+
+        Args:
+            metric (str, optional): Result column to get percentiles for. Defaults to "time_taken".
+            seconds (int, optional): Size of window, up to capacity. Defaults to 30.
+            now (float, optional): Unix time window ends at. Defaults to current time.
+
+        Returns:
+            WindowStats: Statistics for results in window
+        """
+        current_second = int(time.time() if now is None else now)
+        seconds = max(min(seconds, self.__capacity), 1)
+
+        count = 0
+        errors = 0
+        histogram: Dict[int, int] = {}
+        minimum: Optional[float] = None
+        maximum: Optional[float] = None
+
+        for second in range(current_second - seconds + 1, current_second + 1):
+            entry = self.__slots[second % self.__capacity]
+
+            if entry is None or entry[0] != second:
+                continue
+
+            slot = entry[1]
+
+            count += slot.count
+            errors += slot.errors
+
+            for index, bucket_count in slot.histograms.get(metric, {}).items():
+                histogram[index] = histogram.get(index, 0) + bucket_count
+
+            if metric in slot.mins:
+                if minimum is None or slot.mins[metric] < minimum:
+                    minimum = slot.mins[metric]
+
+                if maximum is None or slot.maxes[metric] > maximum:
+                    maximum = slot.maxes[metric]
+
+        # NOTE: do not count time before first result was collected
+        elapsed = seconds
+
+        if self.__first_second is not None:
+            elapsed = max(min(seconds, current_second - self.__first_second + 1), 1)
+
+        percentiles = self.__get_percentiles(
+            histogram, [50, 90, 95, 99], minimum, maximum
+        )
+
+        return WindowStats(
+            seconds=seconds,
+            count=count,
+            throughput=count / elapsed,
+            error_rate=errors / count if count > 0 else 0,
+            min=minimum,
+            max=maximum,
+            p50=percentiles[0],
+            p90=percentiles[1],
+            p95=percentiles[2],
+            p99=percentiles[3],
+        )
+
+    def __get_slot(self, second: int) -> WindowSlot:
+        entry = self.__slots[second % self.__capacity]
+
+        if entry is None or entry[0] != second:
+            entry = (second, WindowSlot())
+            self.__slots[second % self.__capacity] = entry
+
+        return entry[1]
+
+    def __get_percentiles(
+        self,
+        histogram: Dict[int, int],
+        percents: List[float],
+        minimum: Optional[float],
+        maximum: Optional[float],
+    ) -> List[Optional[float]]:
+        if minimum is None or maximum is None:
+            return [None for _ in percents]
+
+        total = sum(histogram.values())
+        indexes = sorted(histogram)
+        percentiles: List[Optional[float]] = []
+
+        for percent in percents:
+            rank = math.ceil(total * percent / 100)
+            seen = 0
+
+            for index in indexes:
+                seen += histogram[index]
+
+                if seen >= rank:
+                    # Bucket midpoint may fall outside of observed values
+                    percentiles.append(min(max(bucket_value(index), minimum), maximum))
+                    break
+
+        return percentiles
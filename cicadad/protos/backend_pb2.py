@@ -21,7 +21,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   syntax='proto3',
   serialized_options=b'Z$github.com/cicadatesting/backend/api',
   create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\x1c\x63icadad/protos/backend.proto\x12\x07\x62\x61\x63kend\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1egoogle/protobuf/wrappers.proto\"\xb3\x01\n\x11\x43reateTestRequest\x12\x16\n\x0e\x62\x61\x63kendAddress\x18\x01 \x01(\t\x12\x1a\n\x12schedulingMetadata\x18\x02 \x01(\t\x12\x0c\n\x04tags\x18\x03 \x03(\t\x12\x30\n\x03\x65nv\x18\x04 \x03(\x0b\x32#.backend.CreateTestRequest.EnvEntry\x1a*\n\x08\x45nvEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"$\n\x12\x43reateTestResponse\x12\x0e\n\x06testID\x18\x01 \x01(\t\"v\n\x15\x43reateScenarioRequest\x12\x0e\n\x06testID\x18\x01 \x01(\t\x12\x14\n\x0cscenarioName\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontext\x18\x03 \x01(\t\x12\x18\n\x10usersPerInstance\x18\x04 \x01(\x05\x12\x0c\n\x04tags\x18\x05 \x03(\t\",\n\x16\x43reateScenarioResponse\x12\x12\n\nscenarioID\x18\x01 \x01(\t\"H\n\x12\x43reateUsersRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0e\n\x06testID\x18\x02 \x01(\t\x12\x0e\n\x06\x61mount\x18\x03 \x01(\x05\"6\n\x10StopUsersRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x05\"+\n\x19\x43leanTestInstancesRequest\x12\x0e\n\x06testID\x18\x01 \x01(\t\">\n\x18\x43heckTestInstanceRequest\x12\x0e\n\x06testID\x18\x01 \x01(\t\x12\x12\n\ninstanceID\x18\x02 \x01(\t\",\n\x19\x43heckTestInstanceResponse\x12\x0f\n\x07running\x18\x01 \x01(\x08\"-\n\x13\x43reateUsersResponse\x12\x16\n\x0euserManagerIDs\x18\x01 \x03(\t\"&\n\x05\x45vent\x12\x0c\n\x04kind\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\"<\n\x0f\x41\x64\x64\x45ventRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x1d\n\x05\x65vent\x18\x02 \x01(\x0b\x32\x0e.backend.Event\",\n\x10GetEventsRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04kind\x18\x02 \x01(\t\"(\n\x06\x45vents\x12\x1e\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x0e.backend.Event\"?\n\x15\x41\x64\x64UserResultsRequest\x12\x15\n\ruserManagerID\x18\x01 \x01(\t\x12\x0f\n\x07results\x18\x02 \x03(\x0c\"\xd1\x01\n\x18SetScenarioResultRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12,\n\x06output\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12/\n\texception\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x0c\n\x04logs\x18\x04 \x01(\t\x12\x11\n\ttimeTaken\x18\x05 \x01(\x01\x12\x11\n\tsucceeded\x18\x06 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x07 \x01(\x05\";\n\x16MoveUserResultsRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\"*\n\x17MoveUserResultsResponse\x12\x0f\n\x07results\x18\x01 \x03(\x0c\"/\n\x19MoveScenarioResultRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\"\xde\x01\n\x1aMoveScenarioResultResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12,\n\x06output\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12/\n\texception\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x0c\n\x04logs\x18\x04 \x01(\t\x12\x11\n\ttimestamp\x18\x05 \x01(\t\x12\x11\n\ttimeTaken\x18\x06 \x01(\x01\x12\x11\n\tsucceeded\x18\x07 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x08 \x01(\x05\";\n\x15\x44istributeWorkRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x05\"+\n\x12GetUserWorkRequest\x12\x15\n\ruserManagerID\x18\x01 \x01(\t\"#\n\x13GetUserWorkResponse\x12\x0c\n\x04work\x18\x01 \x01(\x05\"C\n\x10\x41\x64\x64MetricRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05value\x18\x03 \x01(\x01\"4\n\x10GetMetricRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"L\n\x14GetMetricRateRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nsplitPoint\x18\x03 \x01(\x01\"$\n\x13MetricTotalResponse\x12\r\n\x05total\x18\x01 \x01(\x01\"\"\n\x12LastMetricResponse\x12\x0c\n\x04last\x18\x01 \x01(\x01\"(\n\x12MetricRateResponse\x12\x12\n\npercentage\x18\x01 \x01(\x01\"b\n\x18MetricStatisticsResponse\x12\x0b\n\x03min\x18\x01 \x01(\x01\x12\x0b\n\x03max\x18\x02 \x01(\x01\x12\x0e\n\x06median\x18\x03 \x01(\x01\x12\x0f\n\x07\x61verage\x18\x04 \x01(\x01\x12\x0b\n\x03len\x18\x05 \x01(\x03\x32\xb2\x0c\n\x07\x42\x61\x63kend\x12\x45\n\nCreateTest\x12\x1a.backend.CreateTestRequest\x1a\x1b.backend.CreateTestResponse\x12Q\n\x0e\x43reateScenario\x12\x1e.backend.CreateScenarioRequest\x1a\x1f.backend.CreateScenarioResponse\x12H\n\x0b\x43reateUsers\x12\x1b.backend.CreateUsersRequest\x1a\x1c.backend.CreateUsersResponse\x12>\n\tStopUsers\x12\x19.backend.StopUsersRequest\x1a\x16.google.protobuf.Empty\x12P\n\x12\x43leanTestInstances\x12\".backend.CleanTestInstancesRequest\x1a\x16.google.protobuf.Empty\x12Z\n\x11\x43heckTestInstance\x12!.backend.CheckTestInstanceRequest\x1a\".backend.CheckTestInstanceResponse\x12@\n\x0c\x41\x64\x64TestEvent\x12\x18.backend.AddEventRequest\x1a\x16.google.protobuf.Empty\x12;\n\rGetTestEvents\x12\x19.backend.GetEventsRequest\x1a\x0f.backend.Events\x12H\n\x0e\x41\x64\x64UserResults\x12\x1e.backend.AddUserResultsRequest\x1a\x16.google.protobuf.Empty\x12N\n\x11SetScenarioResult\x12!.backend.SetScenarioResultRequest\x1a\x16.google.protobuf.Empty\x12T\n\x0fMoveUserResults\x12\x1f.backend.MoveUserResultsRequest\x1a .backend.MoveUserResultsResponse\x12]\n\x12MoveScenarioResult\x12\".backend.MoveScenarioResultRequest\x1a#.backend.MoveScenarioResultResponse\x12H\n\x0e\x44istributeWork\x12\x1e.backend.DistributeWorkRequest\x1a\x16.google.protobuf.Empty\x12H\n\x0bGetUserWork\x12\x1b.backend.GetUserWorkRequest\x1a\x1c.backend.GetUserWorkResponse\x12@\n\x0c\x41\x64\x64UserEvent\x12\x18.backend.AddEventRequest\x1a\x16.google.protobuf.Empty\x12;\n\rGetUserEvents\x12\x19.backend.GetEventsRequest\x1a\x0f.backend.Events\x12>\n\tAddMetric\x12\x19.backend.AddMetricRequest\x1a\x16.google.protobuf.Empty\x12I\n\x0eGetMetricTotal\x12\x19.backend.GetMetricRequest\x1a\x1c.backend.MetricTotalResponse\x12G\n\rGetLastMetric\x12\x19.backend.GetMetricRequest\x1a\x1b.backend.LastMetricResponse\x12K\n\rGetMetricRate\x12\x1d.backend.GetMetricRateRequest\x1a\x1b.backend.MetricRateResponse\x12S\n\x13GetMetricStatistics\x12\x19.backend.GetMetricRequest\x1a!.backend.MetricStatisticsResponseB&Z$github.com/cicadatesting/backend/apib\x06proto3'
+  serialized_pb=b'\n\x1c\x63icadad/protos/backend.proto\x12\x07\x62\x61\x63kend\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1egoogle/protobuf/wrappers.proto\"\xb3\x01\n\x11\x43reateTestRequest\x12\x16\n\x0e\x62\x61\x63kendAddress\x18\x01 \x01(\t\x12\x1a\n\x12schedulingMetadata\x18\x02 \x01(\t\x12\x0c\n\x04tags\x18\x03 \x03(\t\x12\x30\n\x03\x65nv\x18\x04 \x03(\x0b\x32#.backend.CreateTestRequest.EnvEntry\x1a*\n\x08\x45nvEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"$\n\x12\x43reateTestResponse\x12\x0e\n\x06testID\x18\x01 \x01(\t\"v\n\x15\x43reateScenarioRequest\x12\x0e\n\x06testID\x18\x01 \x01(\t\x12\x14\n\x0cscenarioName\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontext\x18\x03 \x01(\t\x12\x18\n\x10usersPerInstance\x18\x04 \x01(\x05\x12\x0c\n\x04tags\x18\x05 \x03(\t\",\n\x16\x43reateScenarioResponse\x12\x12\n\nscenarioID\x18\x01 \x01(\t\"=\n\x19\x43reateScenarioPoolRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"5\n\x16SetContextValueRequest\x12\x0c\n\x04hash\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c\"&\n\x16GetContextValueRequest\x12\x0c\n\x04hash\x18\x01 \x01(\t\"(\n\x17GetContextValueResponse\x12\r\n\x05value\x18\x01 \x01(\x0c\"H\n\x12\x43reateUsersRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0e\n\x06testID\x18\x02 \x01(\t\x12\x0e\n\x06\x61mount\x18\x03 \x01(\x05\"6\n\x10StopUsersRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x05\"+\n\x19\x43leanTestInstancesRequest\x12\x0e\n\x06testID\x18\x01 \x01(\t\">\n\x18\x43heckTestInstanceRequest\x12\x0e\n\x06testID\x18\x01 \x01(\t\x12\x12\n\ninstanceID\x18\x02 \x01(\t\",\n\x19\x43heckTestInstanceResponse\x12\x0f\n\x07running\x18\x01 \x01(\x08\"-\n\x13\x43reateUsersResponse\x12\x16\n\x0euserManagerIDs\x18\x01 \x03(\t\"&\n\x05\x45vent\x12\x0c\n\x04kind\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\"<\n\x0f\x41\x64\x64\x45ventRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x1d\n\x05\x65vent\x18\x02 \x01(\x0b\x32\x0e.backend.Event\",\n\x10GetEventsRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04kind\x18\x02 \x01(\t\"(\n\x06\x45vents\x12\x1e\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x0e.backend.Event\"?\n\x15\x41\x64\x64UserResultsRequest\x12\x15\n\ruserManagerID\x18\x01 \x01(\t\x12\x0f\n\x07results\x18\x02 \x03(\x0c\"\xe3\x01\n\x18SetScenarioResultRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12,\n\x06output\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12/\n\texception\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x0c\n\x04logs\x18\x04 \x01(\t\x12\x11\n\ttimeTaken\x18\x05 \x01(\x01\x12\x11\n\tsucceeded\x18\x06 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x07 \x01(\x05\x12\x10\n\x08maxUsers\x18\x08 \x01(\x05\";\n\x16MoveUserResultsRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\"*\n\x17MoveUserResultsResponse\x12\x0f\n\x07results\x18\x01 \x03(\x0c\"/\n\x19MoveScenarioResultRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\"\xf0\x01\n\x1aMoveScenarioResultResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12,\n\x06output\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12/\n\texception\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x0c\n\x04logs\x18\x04 \x01(\t\x12\x11\n\ttimestamp\x18\x05 \x01(\t\x12\x11\n\ttimeTaken\x18\x06 \x01(\x01\x12\x11\n\tsucceeded\x18\x07 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x08 \x01(\x05\x12\x10\n\x08maxUsers\x18\t \x01(\x05\";\n\x15\x44istributeWorkRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x05\"+\n\x12GetUserWorkRequest\x12\x15\n\ruserManagerID\x18\x01 \x01(\t\"#\n\x13GetUserWorkResponse\x12\x0c\n\x04work\x18\x01 \x01(\x05\"?\n\x1a\x44istributeWorkItemsRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\r\n\x05items\x18\x02 \x03(\x0c\")\n\x18GetUserWorkItemsResponse\x12\r\n\x05items\x18\x01 \x03(\x0c\"C\n\x10\x41\x64\x64MetricRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05value\x18\x03 \x01(\x01\"\x8b\x02\n\x17\x41\x64\x64MetricSummaryRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05\x63ount\x18\x03 \x01(\x03\x12\x0b\n\x03sum\x18\x04 \x01(\x01\x12\x0b\n\x03min\x18\x05 \x01(\x01\x12\x0b\n\x03max\x18\x06 \x01(\x01\x12\x0c\n\x04last\x18\x07 \x01(\x01\x12\x14\n\x0csumOfSquares\x18\x08 \x01(\x01\x12\x42\n\thistogram\x18\t \x03(\x0b\x32/.backend.AddMetricSummaryRequest.HistogramEntry\x1a\x30\n\x0eHistogramEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\"4\n\x10GetMetricRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"t\n\x16GetMetricSeriesRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rfromTimestamp\x18\x03 \x01(\x03\x12\x13\n\x0btoTimestamp\x18\x04 \x01(\x03\x12\x0c\n\x04step\x18\x05 \x01(\x03\"L\n\x14GetMetricRateRequest\x12\x12\n\nscenarioID\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nsplitPoint\x18\x03 \x01(\x01\"$\n\x13MetricTotalResponse\x12\r\n\x05total\x18\x01 \x01(\x01\"\"\n\x12LastMetricResponse\x12\x0c\n\x04last\x18\x01 \x01(\x01\"(\n\x12MetricRateResponse\x12\x12\n\npercentage\x18\x01 \x01(\x01\"r\n\x18MetricStatisticsResponse\x12\x0b\n\x03min\x18\x01 \x01(\x01\x12\x0b\n\x03max\x18\x02 \x01(\x01\x12\x0e\n\x06median\x18\x03 \x01(\x01\x12\x0f\n\x07\x61verage\x18\x04 \x01(\x01\x12\x0b\n\x03len\x18\x05 \x01(\x03\x12\x0e\n\x06stddev\x18\x06 \x01(\x01\"}\n\x11MetricSeriesPoint\x12\x11\n\ttimestamp\x18\x01 \x01(\x03\x12\r\n\x05\x63ount\x18\x02 \x01(\x03\x12\x0b\n\x03sum\x18\x03 \x01(\x01\x12\x0b\n\x03min\x18\x04 \x01(\x01\x12\x0b\n\x03max\x18\x05 \x01(\x01\x12\x0f\n\x07\x61verage\x18\x06 \x01(\x01\x12\x0e\n\x06stddev\x18\x07 \x01(\x01\"B\n\x14MetricSeriesResponse\x12*\n\x06points\x18\x01 \x03(\x0b\x32\x1a.backend.MetricSeriesPoint\"\x8b\x01\n\x0bMetricQuery\x12\x0c\n\x04kind\x18\x01 \x01(\t\x12\x12\n\nscenarioID\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x12\n\nsplitPoint\x18\x04 \x01(\x01\x12\x15\n\rfromTimestamp\x18\x05 \x01(\x03\x12\x13\n\x0btoTimestamp\x18\x06 \x01(\x03\x12\x0c\n\x04step\x18\x07 \x01(\x03\"\x94\x01\n\x11MetricQueryResult\x12\r\n\x05\x66ound\x18\x01 \x01(\x08\x12\r\n\x05value\x18\x02 \x01(\x01\x12\x35\n\nstatistics\x18\x03 \x01(\x0b\x32!.backend.MetricStatisticsResponse\x12*\n\x06points\x18\x04 \x03(\x0b\x32\x1a.backend.MetricSeriesPoint\"B\n\x19GetMetricsSnapshotRequest\x12%\n\x07queries\x18\x01 \x03(\x0b\x32\x14.backend.MetricQuery\"I\n\x1aGetMetricsSnapshotResponse\x12+\n\x07results\x18\x01 \x03(\x0b\x32\x1a.backend.MetricQueryResult2\x96\x12\n\x07\x42\x61\x63kend\x12\x45\n\nCreateTest\x12\x1a.backend.CreateTestRequest\x1a\x1b.backend.CreateTestResponse\x12Q\n\x0e\x43reateScenario\x12\x1e.backend.CreateScenarioRequest\x1a\x1f.backend.CreateScenarioResponse\x12Y\n\x12\x43reateScenarioPool\x12\".backend.CreateScenarioPoolRequest\x1a\x1f.backend.CreateScenarioResponse\x12H\n\x0b\x43reateUsers\x12\x1b.backend.CreateUsersRequest\x1a\x1c.backend.CreateUsersResponse\x12>\n\tStopUsers\x12\x19.backend.StopUsersRequest\x1a\x16.google.protobuf.Empty\x12P\n\x12\x43leanTestInstances\x12\".backend.CleanTestInstancesRequest\x1a\x16.google.protobuf.Empty\x12Z\n\x11\x43heckTestInstance\x12!.backend.CheckTestInstanceRequest\x1a\".backend.CheckTestInstanceResponse\x12@\n\x0c\x41\x64\x64TestEvent\x12\x18.backend.AddEventRequest\x1a\x16.google.protobuf.Empty\x12;\n\rGetTestEvents\x12\x19.backend.GetEventsRequest\x1a\x0f.backend.Events\x12H\n\x0e\x41\x64\x64UserResults\x12\x1e.backend.AddUserResultsRequest\x1a\x16.google.protobuf.Empty\x12N\n\x11SetScenarioResult\x12!.backend.SetScenarioResultRequest\x1a\x16.google.protobuf.Empty\x12T\n\x0fMoveUserResults\x12\x1f.backend.MoveUserResultsRequest\x1a .backend.MoveUserResultsResponse\x12]\n\x12MoveScenarioResult\x12\".backend.MoveScenarioResultRequest\x1a#.backend.MoveScenarioResultResponse\x12J\n\x0fSetContextValue\x12\x1f.backend.SetContextValueRequest\x1a\x16.google.protobuf.Empty\x12T\n\x0fGetContextValue\x12\x1f.backend.GetContextValueRequest\x1a .backend.GetContextValueResponse\x12H\n\x0e\x44istributeWork\x12\x1e.backend.DistributeWorkRequest\x1a\x16.google.protobuf.Empty\x12H\n\x0bGetUserWork\x12\x1b.backend.GetUserWorkRequest\x1a\x1c.backend.GetUserWorkResponse\x12R\n\x13\x44istributeWorkItems\x12#.backend.DistributeWorkItemsRequest\x1a\x16.google.protobuf.Empty\x12R\n\x10GetUserWorkItems\x12\x1b.backend.GetUserWorkRequest\x1a!.backend.GetUserWorkItemsResponse\x12@\n\x0c\x41\x64\x64UserEvent\x12\x18.backend.AddEventRequest\x1a\x16.google.protobuf.Empty\x12;\n\rGetUserEvents\x12\x19.backend.GetEventsRequest\x1a\x0f.backend.Events\x12>\n\tAddMetric\x12\x19.backend.AddMetricRequest\x1a\x16.google.protobuf.Empty\x12L\n\x10\x41\x64\x64MetricSummary\x12 .backend.AddMetricSummaryRequest\x1a\x16.google.protobuf.Empty\x12I\n\x0eGetMetricTotal\x12\x19.backend.GetMetricRequest\x1a\x1c.backend.MetricTotalResponse\x12G\n\rGetLastMetric\x12\x19.backend.GetMetricRequest\x1a\x1b.backend.LastMetricResponse\x12K\n\rGetMetricRate\x12\x1d.backend.GetMetricRateRequest\x1a\x1b.backend.MetricRateResponse\x12S\n\x13GetMetricStatistics\x12\x19.backend.GetMetricRequest\x1a!.backend.MetricStatisticsResponse\x12Q\n\x0fGetMetricSeries\x12\x1f.backend.GetMetricSeriesRequest\x1a\x1d.backend.MetricSeriesResponse\x12]\n\x12GetMetricsSnapshot\x12\".backend.GetMetricsSnapshotRequest\x1a#.backend.GetMetricsSnapshotResponse\x12=\n\x0b\x43heckHealth\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.EmptyB&Z$github.com/cicadatesting/backend/apib\x06proto3'
   ,
   dependencies=[google_dot_protobuf_dot_empty__pb2.DESCRIPTOR,google_dot_protobuf_dot_wrappers__pb2.DESCRIPTOR,])
 
@@ -243,6 +243,148 @@ _CREATESCENARIORESPONSE = _descriptor.Descriptor(
 )
 
 
+_CREATESCENARIOPOOLREQUEST = _descriptor.Descriptor(
+  name='CreateScenarioPoolRequest',
+  full_name='backend.CreateScenarioPoolRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='scenarioID', full_name='backend.CreateScenarioPoolRequest.scenarioID', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='backend.CreateScenarioPoolRequest.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=488,
+  serialized_end=549,
+)
+
+
+_SETCONTEXTVALUEREQUEST = _descriptor.Descriptor(
+  name='SetContextValueRequest',
+  full_name='backend.SetContextValueRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='hash', full_name='backend.SetContextValueRequest.hash', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='backend.SetContextValueRequest.value', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=551,
+  serialized_end=604,
+)
+
+
+_GETCONTEXTVALUEREQUEST = _descriptor.Descriptor(
+  name='GetContextValueRequest',
+  full_name='backend.GetContextValueRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='hash', full_name='backend.GetContextValueRequest.hash', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=606,
+  serialized_end=644,
+)
+
+
+_GETCONTEXTVALUERESPONSE = _descriptor.Descriptor(
+  name='GetContextValueResponse',
+  full_name='backend.GetContextValueResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='value', full_name='backend.GetContextValueResponse.value', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=646,
+  serialized_end=686,
+)
+
+
 _CREATEUSERSREQUEST = _descriptor.Descriptor(
   name='CreateUsersRequest',
   full_name='backend.CreateUsersRequest',
@@ -284,8 +426,8 @@ _CREATEUSERSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=488,
-  serialized_end=560,
+  serialized_start=688,
+  serialized_end=760,
 )
 
 
@@ -323,8 +465,8 @@ _STOPUSERSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=562,
-  serialized_end=616,
+  serialized_start=762,
+  serialized_end=816,
 )
 
 
@@ -355,8 +497,8 @@ _CLEANTESTINSTANCESREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=618,
-  serialized_end=661,
+  serialized_start=818,
+  serialized_end=861,
 )
 
 
@@ -394,8 +536,8 @@ _CHECKTESTINSTANCEREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=663,
-  serialized_end=725,
+  serialized_start=863,
+  serialized_end=925,
 )
 
 
@@ -426,8 +568,8 @@ _CHECKTESTINSTANCERESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=727,
-  serialized_end=771,
+  serialized_start=927,
+  serialized_end=971,
 )
 
 
@@ -458,8 +600,8 @@ _CREATEUSERSRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=773,
-  serialized_end=818,
+  serialized_start=973,
+  serialized_end=1018,
 )
 
 
@@ -497,8 +639,8 @@ _EVENT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=820,
-  serialized_end=858,
+  serialized_start=1020,
+  serialized_end=1058,
 )
 
 
@@ -536,8 +678,8 @@ _ADDEVENTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=860,
-  serialized_end=920,
+  serialized_start=1060,
+  serialized_end=1120,
 )
 
 
@@ -575,8 +717,8 @@ _GETEVENTSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=922,
-  serialized_end=966,
+  serialized_start=1122,
+  serialized_end=1166,
 )
 
 
@@ -607,8 +749,8 @@ _EVENTS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=968,
-  serialized_end=1008,
+  serialized_start=1168,
+  serialized_end=1208,
 )
 
 
@@ -646,8 +788,8 @@ _ADDUSERRESULTSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1010,
-  serialized_end=1073,
+  serialized_start=1210,
+  serialized_end=1273,
 )
 
 
@@ -708,6 +850,13 @@ _SETSCENARIORESULTREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='maxUsers', full_name='backend.SetScenarioResultRequest.maxUsers', index=7,
+      number=8, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -720,8 +869,8 @@ _SETSCENARIORESULTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1076,
-  serialized_end=1285,
+  serialized_start=1276,
+  serialized_end=1503,
 )
 
 
@@ -759,8 +908,8 @@ _MOVEUSERRESULTSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1287,
-  serialized_end=1346,
+  serialized_start=1505,
+  serialized_end=1564,
 )
 
 
@@ -791,8 +940,8 @@ _MOVEUSERRESULTSRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1348,
-  serialized_end=1390,
+  serialized_start=1566,
+  serialized_end=1608,
 )
 
 
@@ -823,8 +972,8 @@ _MOVESCENARIORESULTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1392,
-  serialized_end=1439,
+  serialized_start=1610,
+  serialized_end=1657,
 )
 
 
@@ -892,6 +1041,13 @@ _MOVESCENARIORESULTRESPONSE = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='maxUsers', full_name='backend.MoveScenarioResultResponse.maxUsers', index=8,
+      number=9, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -904,8 +1060,8 @@ _MOVESCENARIORESULTRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1442,
-  serialized_end=1664,
+  serialized_start=1660,
+  serialized_end=1900,
 )
 
 
@@ -943,8 +1099,8 @@ _DISTRIBUTEWORKREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1666,
-  serialized_end=1725,
+  serialized_start=1902,
+  serialized_end=1961,
 )
 
 
@@ -975,8 +1131,8 @@ _GETUSERWORKREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1727,
-  serialized_end=1770,
+  serialized_start=1963,
+  serialized_end=2006,
 )
 
 
@@ -1007,37 +1163,30 @@ _GETUSERWORKRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1772,
-  serialized_end=1807,
+  serialized_start=2008,
+  serialized_end=2043,
 )
 
 
-_ADDMETRICREQUEST = _descriptor.Descriptor(
-  name='AddMetricRequest',
-  full_name='backend.AddMetricRequest',
+_DISTRIBUTEWORKITEMSREQUEST = _descriptor.Descriptor(
+  name='DistributeWorkItemsRequest',
+  full_name='backend.DistributeWorkItemsRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='scenarioID', full_name='backend.AddMetricRequest.scenarioID', index=0,
+      name='scenarioID', full_name='backend.DistributeWorkItemsRequest.scenarioID', index=0,
       number=1, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='name', full_name='backend.AddMetricRequest.name', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='backend.AddMetricRequest.value', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
+      name='items', full_name='backend.DistributeWorkItemsRequest.items', index=1,
+      number=2, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
@@ -1053,30 +1202,23 @@ _ADDMETRICREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1809,
-  serialized_end=1876,
+  serialized_start=2045,
+  serialized_end=2108,
 )
 
 
-_GETMETRICREQUEST = _descriptor.Descriptor(
-  name='GetMetricRequest',
-  full_name='backend.GetMetricRequest',
+_GETUSERWORKITEMSRESPONSE = _descriptor.Descriptor(
+  name='GetUserWorkItemsResponse',
+  full_name='backend.GetUserWorkItemsResponse',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='scenarioID', full_name='backend.GetMetricRequest.scenarioID', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='name', full_name='backend.GetMetricRequest.name', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
+      name='items', full_name='backend.GetUserWorkItemsResponse.items', index=0,
+      number=1, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
@@ -1092,35 +1234,35 @@ _GETMETRICREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1878,
-  serialized_end=1930,
+  serialized_start=2110,
+  serialized_end=2151,
 )
 
 
-_GETMETRICRATEREQUEST = _descriptor.Descriptor(
-  name='GetMetricRateRequest',
-  full_name='backend.GetMetricRateRequest',
+_ADDMETRICREQUEST = _descriptor.Descriptor(
+  name='AddMetricRequest',
+  full_name='backend.AddMetricRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='scenarioID', full_name='backend.GetMetricRateRequest.scenarioID', index=0,
+      name='scenarioID', full_name='backend.AddMetricRequest.scenarioID', index=0,
       number=1, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='name', full_name='backend.GetMetricRateRequest.name', index=1,
+      name='name', full_name='backend.AddMetricRequest.name', index=1,
       number=2, type=9, cpp_type=9, label=1,
       has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='splitPoint', full_name='backend.GetMetricRateRequest.splitPoint', index=2,
+      name='value', full_name='backend.AddMetricRequest.value', index=2,
       number=3, type=1, cpp_type=5, label=1,
       has_default_value=False, default_value=float(0),
       message_type=None, enum_type=None, containing_type=None,
@@ -1138,23 +1280,30 @@ _GETMETRICRATEREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1932,
-  serialized_end=2008,
+  serialized_start=2153,
+  serialized_end=2220,
 )
 
 
-_METRICTOTALRESPONSE = _descriptor.Descriptor(
-  name='MetricTotalResponse',
-  full_name='backend.MetricTotalResponse',
+_ADDMETRICSUMMARYREQUEST_HISTOGRAMENTRY = _descriptor.Descriptor(
+  name='HistogramEntry',
+  full_name='backend.AddMetricSummaryRequest.HistogramEntry',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='total', full_name='backend.MetricTotalResponse.total', index=0,
-      number=1, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
+      name='key', full_name='backend.AddMetricSummaryRequest.HistogramEntry.key', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='backend.AddMetricSummaryRequest.HistogramEntry.value', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
@@ -1164,36 +1313,91 @@ _METRICTOTALRESPONSE = _descriptor.Descriptor(
   nested_types=[],
   enum_types=[
   ],
-  serialized_options=None,
+  serialized_options=b'8\001',
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2010,
-  serialized_end=2046,
+  serialized_start=2442,
+  serialized_end=2490,
 )
 
-
-_LASTMETRICRESPONSE = _descriptor.Descriptor(
-  name='LastMetricResponse',
-  full_name='backend.LastMetricResponse',
+_ADDMETRICSUMMARYREQUEST = _descriptor.Descriptor(
+  name='AddMetricSummaryRequest',
+  full_name='backend.AddMetricSummaryRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='last', full_name='backend.LastMetricResponse.last', index=0,
-      number=1, type=1, cpp_type=5, label=1,
+      name='scenarioID', full_name='backend.AddMetricSummaryRequest.scenarioID', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='backend.AddMetricSummaryRequest.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='backend.AddMetricSummaryRequest.count', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='sum', full_name='backend.AddMetricSummaryRequest.sum', index=3,
+      number=4, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='min', full_name='backend.AddMetricSummaryRequest.min', index=4,
+      number=5, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max', full_name='backend.AddMetricSummaryRequest.max', index=5,
+      number=6, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='last', full_name='backend.AddMetricSummaryRequest.last', index=6,
+      number=7, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='sumOfSquares', full_name='backend.AddMetricSummaryRequest.sumOfSquares', index=7,
+      number=8, type=1, cpp_type=5, label=1,
       has_default_value=False, default_value=float(0),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='histogram', full_name='backend.AddMetricSummaryRequest.histogram', index=8,
+      number=9, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
-  nested_types=[],
+  nested_types=[_ADDMETRICSUMMARYREQUEST_HISTOGRAMENTRY, ],
   enum_types=[
   ],
   serialized_options=None,
@@ -1202,83 +1406,596 @@ _LASTMETRICRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2048,
-  serialized_end=2082,
+  serialized_start=2223,
+  serialized_end=2490,
 )
 
 
-_METRICRATERESPONSE = _descriptor.Descriptor(
-  name='MetricRateResponse',
-  full_name='backend.MetricRateResponse',
+_GETMETRICREQUEST = _descriptor.Descriptor(
+  name='GetMetricRequest',
+  full_name='backend.GetMetricRequest',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='percentage', full_name='backend.MetricRateResponse.percentage', index=0,
-      number=1, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
+      name='scenarioID', full_name='backend.GetMetricRequest.scenarioID', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
+    _descriptor.FieldDescriptor(
+      name='name', full_name='backend.GetMetricRequest.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2492,
+  serialized_end=2544,
+)
+
+
+_GETMETRICSERIESREQUEST = _descriptor.Descriptor(
+  name='GetMetricSeriesRequest',
+  full_name='backend.GetMetricSeriesRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='scenarioID', full_name='backend.GetMetricSeriesRequest.scenarioID', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='backend.GetMetricSeriesRequest.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='fromTimestamp', full_name='backend.GetMetricSeriesRequest.fromTimestamp', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='toTimestamp', full_name='backend.GetMetricSeriesRequest.toTimestamp', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='step', full_name='backend.GetMetricSeriesRequest.step', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2546,
+  serialized_end=2662,
+)
+
+
+_GETMETRICRATEREQUEST = _descriptor.Descriptor(
+  name='GetMetricRateRequest',
+  full_name='backend.GetMetricRateRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='scenarioID', full_name='backend.GetMetricRateRequest.scenarioID', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='backend.GetMetricRateRequest.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='splitPoint', full_name='backend.GetMetricRateRequest.splitPoint', index=2,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2664,
+  serialized_end=2740,
+)
+
+
+_METRICTOTALRESPONSE = _descriptor.Descriptor(
+  name='MetricTotalResponse',
+  full_name='backend.MetricTotalResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='total', full_name='backend.MetricTotalResponse.total', index=0,
+      number=1, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2742,
+  serialized_end=2778,
+)
+
+
+_LASTMETRICRESPONSE = _descriptor.Descriptor(
+  name='LastMetricResponse',
+  full_name='backend.LastMetricResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='last', full_name='backend.LastMetricResponse.last', index=0,
+      number=1, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2780,
+  serialized_end=2814,
+)
+
+
+_METRICRATERESPONSE = _descriptor.Descriptor(
+  name='MetricRateResponse',
+  full_name='backend.MetricRateResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='percentage', full_name='backend.MetricRateResponse.percentage', index=0,
+      number=1, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2816,
+  serialized_end=2856,
+)
+
+
+_METRICSTATISTICSRESPONSE = _descriptor.Descriptor(
+  name='MetricStatisticsResponse',
+  full_name='backend.MetricStatisticsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='min', full_name='backend.MetricStatisticsResponse.min', index=0,
+      number=1, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max', full_name='backend.MetricStatisticsResponse.max', index=1,
+      number=2, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='median', full_name='backend.MetricStatisticsResponse.median', index=2,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='average', full_name='backend.MetricStatisticsResponse.average', index=3,
+      number=4, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='len', full_name='backend.MetricStatisticsResponse.len', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stddev', full_name='backend.MetricStatisticsResponse.stddev', index=5,
+      number=6, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2858,
+  serialized_end=2972,
+)
+
+
+_METRICSERIESPOINT = _descriptor.Descriptor(
+  name='MetricSeriesPoint',
+  full_name='backend.MetricSeriesPoint',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='backend.MetricSeriesPoint.timestamp', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='backend.MetricSeriesPoint.count', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='sum', full_name='backend.MetricSeriesPoint.sum', index=2,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='min', full_name='backend.MetricSeriesPoint.min', index=3,
+      number=4, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max', full_name='backend.MetricSeriesPoint.max', index=4,
+      number=5, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='average', full_name='backend.MetricSeriesPoint.average', index=5,
+      number=6, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stddev', full_name='backend.MetricSeriesPoint.stddev', index=6,
+      number=7, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2974,
+  serialized_end=3099,
+)
+
+
+_METRICSERIESRESPONSE = _descriptor.Descriptor(
+  name='MetricSeriesResponse',
+  full_name='backend.MetricSeriesResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='points', full_name='backend.MetricSeriesResponse.points', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3101,
+  serialized_end=3167,
+)
+
+
+_METRICQUERY = _descriptor.Descriptor(
+  name='MetricQuery',
+  full_name='backend.MetricQuery',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='kind', full_name='backend.MetricQuery.kind', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='scenarioID', full_name='backend.MetricQuery.scenarioID', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='backend.MetricQuery.name', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='splitPoint', full_name='backend.MetricQuery.splitPoint', index=3,
+      number=4, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='fromTimestamp', full_name='backend.MetricQuery.fromTimestamp', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='toTimestamp', full_name='backend.MetricQuery.toTimestamp', index=5,
+      number=6, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='step', full_name='backend.MetricQuery.step', index=6,
+      number=7, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
   serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2084,
-  serialized_end=2124,
+  serialized_start=3170,
+  serialized_end=3309,
 )
 
 
-_METRICSTATISTICSRESPONSE = _descriptor.Descriptor(
-  name='MetricStatisticsResponse',
-  full_name='backend.MetricStatisticsResponse',
+_METRICQUERYRESULT = _descriptor.Descriptor(
+  name='MetricQueryResult',
+  full_name='backend.MetricQueryResult',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='min', full_name='backend.MetricStatisticsResponse.min', index=0,
-      number=1, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
+      name='found', full_name='backend.MetricQueryResult.found', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='max', full_name='backend.MetricStatisticsResponse.max', index=1,
+      name='value', full_name='backend.MetricQueryResult.value', index=1,
       number=2, type=1, cpp_type=5, label=1,
       has_default_value=False, default_value=float(0),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='median', full_name='backend.MetricStatisticsResponse.median', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
+      name='statistics', full_name='backend.MetricQueryResult.statistics', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='average', full_name='backend.MetricStatisticsResponse.average', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
+      name='points', full_name='backend.MetricQueryResult.points', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3312,
+  serialized_end=3460,
+)
+
+
+_GETMETRICSSNAPSHOTREQUEST = _descriptor.Descriptor(
+  name='GetMetricsSnapshotRequest',
+  full_name='backend.GetMetricsSnapshotRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
     _descriptor.FieldDescriptor(
-      name='len', full_name='backend.MetricStatisticsResponse.len', index=4,
-      number=5, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
+      name='queries', full_name='backend.GetMetricsSnapshotRequest.queries', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3462,
+  serialized_end=3528,
+)
+
+
+_GETMETRICSSNAPSHOTRESPONSE = _descriptor.Descriptor(
+  name='GetMetricsSnapshotResponse',
+  full_name='backend.GetMetricsSnapshotResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='results', full_name='backend.GetMetricsSnapshotResponse.results', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
@@ -1294,8 +2011,8 @@ _METRICSTATISTICSRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2126,
-  serialized_end=2224,
+  serialized_start=3530,
+  serialized_end=3603,
 )
 
 _CREATETESTREQUEST_ENVENTRY.containing_type = _CREATETESTREQUEST
@@ -1306,10 +2023,21 @@ _SETSCENARIORESULTREQUEST.fields_by_name['output'].message_type = google_dot_pro
 _SETSCENARIORESULTREQUEST.fields_by_name['exception'].message_type = google_dot_protobuf_dot_wrappers__pb2._STRINGVALUE
 _MOVESCENARIORESULTRESPONSE.fields_by_name['output'].message_type = google_dot_protobuf_dot_wrappers__pb2._STRINGVALUE
 _MOVESCENARIORESULTRESPONSE.fields_by_name['exception'].message_type = google_dot_protobuf_dot_wrappers__pb2._STRINGVALUE
+_ADDMETRICSUMMARYREQUEST_HISTOGRAMENTRY.containing_type = _ADDMETRICSUMMARYREQUEST
+_ADDMETRICSUMMARYREQUEST.fields_by_name['histogram'].message_type = _ADDMETRICSUMMARYREQUEST_HISTOGRAMENTRY
+_METRICSERIESRESPONSE.fields_by_name['points'].message_type = _METRICSERIESPOINT
+_METRICQUERYRESULT.fields_by_name['statistics'].message_type = _METRICSTATISTICSRESPONSE
+_METRICQUERYRESULT.fields_by_name['points'].message_type = _METRICSERIESPOINT
+_GETMETRICSSNAPSHOTREQUEST.fields_by_name['queries'].message_type = _METRICQUERY
+_GETMETRICSSNAPSHOTRESPONSE.fields_by_name['results'].message_type = _METRICQUERYRESULT
 DESCRIPTOR.message_types_by_name['CreateTestRequest'] = _CREATETESTREQUEST
 DESCRIPTOR.message_types_by_name['CreateTestResponse'] = _CREATETESTRESPONSE
 DESCRIPTOR.message_types_by_name['CreateScenarioRequest'] = _CREATESCENARIOREQUEST
 DESCRIPTOR.message_types_by_name['CreateScenarioResponse'] = _CREATESCENARIORESPONSE
+DESCRIPTOR.message_types_by_name['CreateScenarioPoolRequest'] = _CREATESCENARIOPOOLREQUEST
+DESCRIPTOR.message_types_by_name['SetContextValueRequest'] = _SETCONTEXTVALUEREQUEST
+DESCRIPTOR.message_types_by_name['GetContextValueRequest'] = _GETCONTEXTVALUEREQUEST
+DESCRIPTOR.message_types_by_name['GetContextValueResponse'] = _GETCONTEXTVALUERESPONSE
 DESCRIPTOR.message_types_by_name['CreateUsersRequest'] = _CREATEUSERSREQUEST
 DESCRIPTOR.message_types_by_name['StopUsersRequest'] = _STOPUSERSREQUEST
 DESCRIPTOR.message_types_by_name['CleanTestInstancesRequest'] = _CLEANTESTINSTANCESREQUEST
@@ -1329,13 +2057,23 @@ DESCRIPTOR.message_types_by_name['MoveScenarioResultResponse'] = _MOVESCENARIORE
 DESCRIPTOR.message_types_by_name['DistributeWorkRequest'] = _DISTRIBUTEWORKREQUEST
 DESCRIPTOR.message_types_by_name['GetUserWorkRequest'] = _GETUSERWORKREQUEST
 DESCRIPTOR.message_types_by_name['GetUserWorkResponse'] = _GETUSERWORKRESPONSE
+DESCRIPTOR.message_types_by_name['DistributeWorkItemsRequest'] = _DISTRIBUTEWORKITEMSREQUEST
+DESCRIPTOR.message_types_by_name['GetUserWorkItemsResponse'] = _GETUSERWORKITEMSRESPONSE
 DESCRIPTOR.message_types_by_name['AddMetricRequest'] = _ADDMETRICREQUEST
+DESCRIPTOR.message_types_by_name['AddMetricSummaryRequest'] = _ADDMETRICSUMMARYREQUEST
 DESCRIPTOR.message_types_by_name['GetMetricRequest'] = _GETMETRICREQUEST
+DESCRIPTOR.message_types_by_name['GetMetricSeriesRequest'] = _GETMETRICSERIESREQUEST
 DESCRIPTOR.message_types_by_name['GetMetricRateRequest'] = _GETMETRICRATEREQUEST
 DESCRIPTOR.message_types_by_name['MetricTotalResponse'] = _METRICTOTALRESPONSE
 DESCRIPTOR.message_types_by_name['LastMetricResponse'] = _LASTMETRICRESPONSE
 DESCRIPTOR.message_types_by_name['MetricRateResponse'] = _METRICRATERESPONSE
 DESCRIPTOR.message_types_by_name['MetricStatisticsResponse'] = _METRICSTATISTICSRESPONSE
+DESCRIPTOR.message_types_by_name['MetricSeriesPoint'] = _METRICSERIESPOINT
+DESCRIPTOR.message_types_by_name['MetricSeriesResponse'] = _METRICSERIESRESPONSE
+DESCRIPTOR.message_types_by_name['MetricQuery'] = _METRICQUERY
+DESCRIPTOR.message_types_by_name['MetricQueryResult'] = _METRICQUERYRESULT
+DESCRIPTOR.message_types_by_name['GetMetricsSnapshotRequest'] = _GETMETRICSSNAPSHOTREQUEST
+DESCRIPTOR.message_types_by_name['GetMetricsSnapshotResponse'] = _GETMETRICSSNAPSHOTRESPONSE
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 CreateTestRequest = _reflection.GeneratedProtocolMessageType('CreateTestRequest', (_message.Message,), {
@@ -1374,6 +2112,34 @@ CreateScenarioResponse = _reflection.GeneratedProtocolMessageType('CreateScenari
   })
 _sym_db.RegisterMessage(CreateScenarioResponse)
 
+CreateScenarioPoolRequest = _reflection.GeneratedProtocolMessageType('CreateScenarioPoolRequest', (_message.Message,), {
+  'DESCRIPTOR' : _CREATESCENARIOPOOLREQUEST,
+  '__module__' : 'cicadad.protos.backend_pb2'
+  # @@protoc_insertion_point(class_scope:backend.CreateScenarioPoolRequest)
+  })
+_sym_db.RegisterMessage(CreateScenarioPoolRequest)
+
+SetContextValueRequest = _reflection.GeneratedProtocolMessageType('SetContextValueRequest', (_message.Message,), {
+  'DESCRIPTOR' : _SETCONTEXTVALUEREQUEST,
+  '__module__' : 'cicadad.protos.backend_pb2'
+  # @@protoc_insertion_point(class_scope:backend.SetContextValueRequest)
+  })
+_sym_db.RegisterMessage(SetContextValueRequest)
+
+GetContextValueRequest = _reflection.GeneratedProtocolMessageType('GetContextValueRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETCONTEXTVALUEREQUEST,
+  '__module__' : 'cicadad.protos.backend_pb2'
+  # @@protoc_insertion_point(class_scope:backend.GetContextValueRequest)
+  })
+_sym_db.RegisterMessage(GetContextValueRequest)
+
+GetContextValueResponse = _reflection.GeneratedProtocolMessageType('GetContextValueResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETCONTEXTVALUERESPONSE,
+  '__module__' : 'cicadad.protos.backend_pb2'
+  # @@protoc_insertion_point(class_scope:backend.GetContextValueResponse)
+  })
+_sym_db.RegisterMessage(GetContextValueResponse)
+
 CreateUsersRequest = _reflection.GeneratedProtocolMessageType('CreateUsersRequest', (_message.Message,), {
   'DESCRIPTOR' : _CREATEUSERSREQUEST,
   '__module__' : 'cicadad.protos.backend_pb2'
@@ -1507,6 +2273,20 @@ GetUserWorkResponse = _reflection.GeneratedProtocolMessageType('GetUserWorkRespo
   })
 _sym_db.RegisterMessage(GetUserWorkResponse)
 
+DistributeWorkItemsRequest = _reflection.GeneratedProtocolMessageType('DistributeWorkItemsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _DISTRIBUTEWORKITEMSREQUEST,
+  '__module__' : 'cicadad.protos.backend_pb2'
+  # @@protoc_insertion_point(class_scope:backend.DistributeWorkItemsRequest)
+  })
+_sym_db.RegisterMessage(DistributeWorkItemsRequest)
+
+GetUserWorkItemsResponse = _reflection.GeneratedProtocolMessageType('GetUserWorkItemsResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETUSERWORKITEMSRESPONSE,
+  '__module__' : 'cicadad.protos.backend_pb2'
+  # @@protoc_insertion_point(class_scope:backend.GetUserWorkItemsResponse)
+  })
+_sym_db.RegisterMessage(GetUserWorkItemsResponse)
+
 AddMetricRequest = _reflection.GeneratedProtocolMessageType('AddMetricRequest', (_message.Message,), {
   'DESCRIPTOR' : _ADDMETRICREQUEST,
   '__module__' : 'cicadad.protos.backend_pb2'
@@ -1514,6 +2294,21 @@ AddMetricRequest = _reflection.GeneratedProtocolMessageType('AddMetricRequest',
   })
 _sym_db.RegisterMessage(AddMetricRequest)
 
+AddMetricSummaryRequest = _reflection.GeneratedProtocolMessageType('AddMetricSummaryRequest', (_message.Message,), {
+
+  'HistogramEntry' : _reflection.GeneratedProtocolMessageType('HistogramEntry', (_message.Message,), {
+    'DESCRIPTOR' : _ADDMETRICSUMMARYREQUEST_HISTOGRAMENTRY,
+    '__module__' : 'cicadad.protos.backend_pb2'
+    # @@protoc_insertion_point(class_scope:backend.AddMetricSummaryRequest.HistogramEntry)
+    })
+  ,
+  'DESCRIPTOR' : _ADDMETRICSUMMARYREQUEST,
+  '__module__' : 'cicadad.protos.backend_pb2'
+  # @@protoc_insertion_point(class_scope:backend.AddMetricSummaryRequest)
+  })
+_sym_db.RegisterMessage(AddMetricSummaryRequest)
+_sym_db.RegisterMessage(AddMetricSummaryRequest.HistogramEntry)
+
 GetMetricRequest = _reflection.GeneratedProtocolMessageType('GetMetricRequest', (_message.Message,), {
   'DESCRIPTOR' : _GETMETRICREQUEST,
   '__module__' : 'cicadad.protos.backend_pb2'
@@ -1521,6 +2316,13 @@ GetMetricRequest = _reflection.GeneratedProtocolMessageType('GetMetricRequest',
   })
 _sym_db.RegisterMessage(GetMetricRequest)
 
+GetMetricSeriesRequest = _reflection.GeneratedProtocolMessageType('GetMetricSeriesRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETMETRICSERIESREQUEST,
+  '__module__' : 'cicadad.protos.backend_pb2'
+  # @@protoc_insertion_point(class_scope:backend.GetMetricSeriesRequest)
+  })
+_sym_db.RegisterMessage(GetMetricSeriesRequest)
+
 GetMetricRateRequest = _reflection.GeneratedProtocolMessageType('GetMetricRateRequest', (_message.Message,), {
   'DESCRIPTOR' : _GETMETRICRATEREQUEST,
   '__module__' : 'cicadad.protos.backend_pb2'
@@ -1556,9 +2358,52 @@ MetricStatisticsResponse = _reflection.GeneratedProtocolMessageType('MetricStati
   })
 _sym_db.RegisterMessage(MetricStatisticsResponse)
 
+MetricSeriesPoint = _reflection.GeneratedProtocolMessageType('MetricSeriesPoint', (_message.Message,), {
+  'DESCRIPTOR' : _METRICSERIESPOINT,
+  '__module__' : 'cicadad.protos.backend_pb2'
+  # @@protoc_insertion_point(class_scope:backend.MetricSeriesPoint)
+  })
+_sym_db.RegisterMessage(MetricSeriesPoint)
+
+MetricSeriesResponse = _reflection.GeneratedProtocolMessageType('MetricSeriesResponse', (_message.Message,), {
+  'DESCRIPTOR' : _METRICSERIESRESPONSE,
+  '__module__' : 'cicadad.protos.backend_pb2'
+  # @@protoc_insertion_point(class_scope:backend.MetricSeriesResponse)
+  })
+_sym_db.RegisterMessage(MetricSeriesResponse)
+
+MetricQuery = _reflection.GeneratedProtocolMessageType('MetricQuery', (_message.Message,), {
+  'DESCRIPTOR' : _METRICQUERY,
+  '__module__' : 'cicadad.protos.backend_pb2'
+  # @@protoc_insertion_point(class_scope:backend.MetricQuery)
+  })
+_sym_db.RegisterMessage(MetricQuery)
+
+MetricQueryResult = _reflection.GeneratedProtocolMessageType('MetricQueryResult', (_message.Message,), {
+  'DESCRIPTOR' : _METRICQUERYRESULT,
+  '__module__' : 'cicadad.protos.backend_pb2'
+  # @@protoc_insertion_point(class_scope:backend.MetricQueryResult)
+  })
+_sym_db.RegisterMessage(MetricQueryResult)
+
+GetMetricsSnapshotRequest = _reflection.GeneratedProtocolMessageType('GetMetricsSnapshotRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETMETRICSSNAPSHOTREQUEST,
+  '__module__' : 'cicadad.protos.backend_pb2'
+  # @@protoc_insertion_point(class_scope:backend.GetMetricsSnapshotRequest)
+  })
+_sym_db.RegisterMessage(GetMetricsSnapshotRequest)
+
+GetMetricsSnapshotResponse = _reflection.GeneratedProtocolMessageType('GetMetricsSnapshotResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETMETRICSSNAPSHOTRESPONSE,
+  '__module__' : 'cicadad.protos.backend_pb2'
+  # @@protoc_insertion_point(class_scope:backend.GetMetricsSnapshotResponse)
+  })
+_sym_db.RegisterMessage(GetMetricsSnapshotResponse)
+
 
 DESCRIPTOR._options = None
 _CREATETESTREQUEST_ENVENTRY._options = None
+_ADDMETRICSUMMARYREQUEST_HISTOGRAMENTRY._options = None
 
 _BACKEND = _descriptor.ServiceDescriptor(
   name='Backend',
@@ -1567,8 +2412,8 @@ _BACKEND = _descriptor.ServiceDescriptor(
   index=0,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=2227,
-  serialized_end=3813,
+  serialized_start=3606,
+  serialized_end=5932,
   methods=[
   _descriptor.MethodDescriptor(
     name='CreateTest',
@@ -1590,10 +2435,20 @@ _BACKEND = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='CreateScenarioPool',
+    full_name='backend.Backend.CreateScenarioPool',
+    index=2,
+    containing_service=None,
+    input_type=_CREATESCENARIOPOOLREQUEST,
+    output_type=_CREATESCENARIORESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='CreateUsers',
     full_name='backend.Backend.CreateUsers',
-    index=2,
+    index=3,
     containing_service=None,
     input_type=_CREATEUSERSREQUEST,
     output_type=_CREATEUSERSRESPONSE,
@@ -1603,7 +2458,7 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='StopUsers',
     full_name='backend.Backend.StopUsers',
-    index=3,
+    index=4,
     containing_service=None,
     input_type=_STOPUSERSREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
@@ -1613,7 +2468,7 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='CleanTestInstances',
     full_name='backend.Backend.CleanTestInstances',
-    index=4,
+    index=5,
     containing_service=None,
     input_type=_CLEANTESTINSTANCESREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
@@ -1623,7 +2478,7 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='CheckTestInstance',
     full_name='backend.Backend.CheckTestInstance',
-    index=5,
+    index=6,
     containing_service=None,
     input_type=_CHECKTESTINSTANCEREQUEST,
     output_type=_CHECKTESTINSTANCERESPONSE,
@@ -1633,7 +2488,7 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='AddTestEvent',
     full_name='backend.Backend.AddTestEvent',
-    index=6,
+    index=7,
     containing_service=None,
     input_type=_ADDEVENTREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
@@ -1643,7 +2498,7 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetTestEvents',
     full_name='backend.Backend.GetTestEvents',
-    index=7,
+    index=8,
     containing_service=None,
     input_type=_GETEVENTSREQUEST,
     output_type=_EVENTS,
@@ -1653,7 +2508,7 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='AddUserResults',
     full_name='backend.Backend.AddUserResults',
-    index=8,
+    index=9,
     containing_service=None,
     input_type=_ADDUSERRESULTSREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
@@ -1663,7 +2518,7 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='SetScenarioResult',
     full_name='backend.Backend.SetScenarioResult',
-    index=9,
+    index=10,
     containing_service=None,
     input_type=_SETSCENARIORESULTREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
@@ -1673,7 +2528,7 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='MoveUserResults',
     full_name='backend.Backend.MoveUserResults',
-    index=10,
+    index=11,
     containing_service=None,
     input_type=_MOVEUSERRESULTSREQUEST,
     output_type=_MOVEUSERRESULTSRESPONSE,
@@ -1683,17 +2538,37 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='MoveScenarioResult',
     full_name='backend.Backend.MoveScenarioResult',
-    index=11,
+    index=12,
     containing_service=None,
     input_type=_MOVESCENARIORESULTREQUEST,
     output_type=_MOVESCENARIORESULTRESPONSE,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='SetContextValue',
+    full_name='backend.Backend.SetContextValue',
+    index=13,
+    containing_service=None,
+    input_type=_SETCONTEXTVALUEREQUEST,
+    output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetContextValue',
+    full_name='backend.Backend.GetContextValue',
+    index=14,
+    containing_service=None,
+    input_type=_GETCONTEXTVALUEREQUEST,
+    output_type=_GETCONTEXTVALUERESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='DistributeWork',
     full_name='backend.Backend.DistributeWork',
-    index=12,
+    index=15,
     containing_service=None,
     input_type=_DISTRIBUTEWORKREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
@@ -1703,17 +2578,37 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetUserWork',
     full_name='backend.Backend.GetUserWork',
-    index=13,
+    index=16,
     containing_service=None,
     input_type=_GETUSERWORKREQUEST,
     output_type=_GETUSERWORKRESPONSE,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='DistributeWorkItems',
+    full_name='backend.Backend.DistributeWorkItems',
+    index=17,
+    containing_service=None,
+    input_type=_DISTRIBUTEWORKITEMSREQUEST,
+    output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetUserWorkItems',
+    full_name='backend.Backend.GetUserWorkItems',
+    index=18,
+    containing_service=None,
+    input_type=_GETUSERWORKREQUEST,
+    output_type=_GETUSERWORKITEMSRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='AddUserEvent',
     full_name='backend.Backend.AddUserEvent',
-    index=14,
+    index=19,
     containing_service=None,
     input_type=_ADDEVENTREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
@@ -1723,7 +2618,7 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetUserEvents',
     full_name='backend.Backend.GetUserEvents',
-    index=15,
+    index=20,
     containing_service=None,
     input_type=_GETEVENTSREQUEST,
     output_type=_EVENTS,
@@ -1733,17 +2628,27 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='AddMetric',
     full_name='backend.Backend.AddMetric',
-    index=16,
+    index=21,
     containing_service=None,
     input_type=_ADDMETRICREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='AddMetricSummary',
+    full_name='backend.Backend.AddMetricSummary',
+    index=22,
+    containing_service=None,
+    input_type=_ADDMETRICSUMMARYREQUEST,
+    output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='GetMetricTotal',
     full_name='backend.Backend.GetMetricTotal',
-    index=17,
+    index=23,
     containing_service=None,
     input_type=_GETMETRICREQUEST,
     output_type=_METRICTOTALRESPONSE,
@@ -1753,7 +2658,7 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetLastMetric',
     full_name='backend.Backend.GetLastMetric',
-    index=18,
+    index=24,
     containing_service=None,
     input_type=_GETMETRICREQUEST,
     output_type=_LASTMETRICRESPONSE,
@@ -1763,7 +2668,7 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetMetricRate',
     full_name='backend.Backend.GetMetricRate',
-    index=19,
+    index=25,
     containing_service=None,
     input_type=_GETMETRICRATEREQUEST,
     output_type=_METRICRATERESPONSE,
@@ -1773,13 +2678,43 @@ _BACKEND = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetMetricStatistics',
     full_name='backend.Backend.GetMetricStatistics',
-    index=20,
+    index=26,
     containing_service=None,
     input_type=_GETMETRICREQUEST,
     output_type=_METRICSTATISTICSRESPONSE,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='GetMetricSeries',
+    full_name='backend.Backend.GetMetricSeries',
+    index=27,
+    containing_service=None,
+    input_type=_GETMETRICSERIESREQUEST,
+    output_type=_METRICSERIESRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetMetricsSnapshot',
+    full_name='backend.Backend.GetMetricsSnapshot',
+    index=28,
+    containing_service=None,
+    input_type=_GETMETRICSSNAPSHOTREQUEST,
+    output_type=_GETMETRICSSNAPSHOTRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='CheckHealth',
+    full_name='backend.Backend.CheckHealth',
+    index=29,
+    containing_service=None,
+    input_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
+    output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_BACKEND)
 
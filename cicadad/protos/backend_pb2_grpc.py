@@ -25,6 +25,11 @@ class BackendStub(object):
                 request_serializer=cicadad_dot_protos_dot_backend__pb2.CreateScenarioRequest.SerializeToString,
                 response_deserializer=cicadad_dot_protos_dot_backend__pb2.CreateScenarioResponse.FromString,
                 )
+        self.CreateScenarioPool = channel.unary_unary(
+                '/backend.Backend/CreateScenarioPool',
+                request_serializer=cicadad_dot_protos_dot_backend__pb2.CreateScenarioPoolRequest.SerializeToString,
+                response_deserializer=cicadad_dot_protos_dot_backend__pb2.CreateScenarioResponse.FromString,
+                )
         self.CreateUsers = channel.unary_unary(
                 '/backend.Backend/CreateUsers',
                 request_serializer=cicadad_dot_protos_dot_backend__pb2.CreateUsersRequest.SerializeToString,
@@ -75,6 +80,16 @@ class BackendStub(object):
                 request_serializer=cicadad_dot_protos_dot_backend__pb2.MoveScenarioResultRequest.SerializeToString,
                 response_deserializer=cicadad_dot_protos_dot_backend__pb2.MoveScenarioResultResponse.FromString,
                 )
+        self.SetContextValue = channel.unary_unary(
+                '/backend.Backend/SetContextValue',
+                request_serializer=cicadad_dot_protos_dot_backend__pb2.SetContextValueRequest.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                )
+        self.GetContextValue = channel.unary_unary(
+                '/backend.Backend/GetContextValue',
+                request_serializer=cicadad_dot_protos_dot_backend__pb2.GetContextValueRequest.SerializeToString,
+                response_deserializer=cicadad_dot_protos_dot_backend__pb2.GetContextValueResponse.FromString,
+                )
         self.DistributeWork = channel.unary_unary(
                 '/backend.Backend/DistributeWork',
                 request_serializer=cicadad_dot_protos_dot_backend__pb2.DistributeWorkRequest.SerializeToString,
@@ -85,6 +100,16 @@ class BackendStub(object):
                 request_serializer=cicadad_dot_protos_dot_backend__pb2.GetUserWorkRequest.SerializeToString,
                 response_deserializer=cicadad_dot_protos_dot_backend__pb2.GetUserWorkResponse.FromString,
                 )
+        self.DistributeWorkItems = channel.unary_unary(
+                '/backend.Backend/DistributeWorkItems',
+                request_serializer=cicadad_dot_protos_dot_backend__pb2.DistributeWorkItemsRequest.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                )
+        self.GetUserWorkItems = channel.unary_unary(
+                '/backend.Backend/GetUserWorkItems',
+                request_serializer=cicadad_dot_protos_dot_backend__pb2.GetUserWorkRequest.SerializeToString,
+                response_deserializer=cicadad_dot_protos_dot_backend__pb2.GetUserWorkItemsResponse.FromString,
+                )
         self.AddUserEvent = channel.unary_unary(
                 '/backend.Backend/AddUserEvent',
                 request_serializer=cicadad_dot_protos_dot_backend__pb2.AddEventRequest.SerializeToString,
@@ -100,6 +125,11 @@ class BackendStub(object):
                 request_serializer=cicadad_dot_protos_dot_backend__pb2.AddMetricRequest.SerializeToString,
                 response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
                 )
+        self.AddMetricSummary = channel.unary_unary(
+                '/backend.Backend/AddMetricSummary',
+                request_serializer=cicadad_dot_protos_dot_backend__pb2.AddMetricSummaryRequest.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                )
         self.GetMetricTotal = channel.unary_unary(
                 '/backend.Backend/GetMetricTotal',
                 request_serializer=cicadad_dot_protos_dot_backend__pb2.GetMetricRequest.SerializeToString,
@@ -120,6 +150,21 @@ class BackendStub(object):
                 request_serializer=cicadad_dot_protos_dot_backend__pb2.GetMetricRequest.SerializeToString,
                 response_deserializer=cicadad_dot_protos_dot_backend__pb2.MetricStatisticsResponse.FromString,
                 )
+        self.GetMetricSeries = channel.unary_unary(
+                '/backend.Backend/GetMetricSeries',
+                request_serializer=cicadad_dot_protos_dot_backend__pb2.GetMetricSeriesRequest.SerializeToString,
+                response_deserializer=cicadad_dot_protos_dot_backend__pb2.MetricSeriesResponse.FromString,
+                )
+        self.GetMetricsSnapshot = channel.unary_unary(
+                '/backend.Backend/GetMetricsSnapshot',
+                request_serializer=cicadad_dot_protos_dot_backend__pb2.GetMetricsSnapshotRequest.SerializeToString,
+                response_deserializer=cicadad_dot_protos_dot_backend__pb2.GetMetricsSnapshotResponse.FromString,
+                )
+        self.CheckHealth = channel.unary_unary(
+                '/backend.Backend/CheckHealth',
+                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                )
 
 
 class BackendServicer(object):
@@ -137,6 +182,12 @@ class BackendServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def CreateScenarioPool(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CreateUsers(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -197,6 +248,18 @@ class BackendServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SetContextValue(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetContextValue(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def DistributeWork(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -209,6 +272,18 @@ class BackendServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def DistributeWorkItems(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetUserWorkItems(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def AddUserEvent(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -227,6 +302,12 @@ class BackendServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def AddMetricSummary(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetMetricTotal(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -251,6 +332,24 @@ class BackendServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetMetricSeries(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetMetricsSnapshot(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CheckHealth(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_BackendServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -264,6 +363,11 @@ def add_BackendServicer_to_server(servicer, server):
                     request_deserializer=cicadad_dot_protos_dot_backend__pb2.CreateScenarioRequest.FromString,
                     response_serializer=cicadad_dot_protos_dot_backend__pb2.CreateScenarioResponse.SerializeToString,
             ),
+            'CreateScenarioPool': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateScenarioPool,
+                    request_deserializer=cicadad_dot_protos_dot_backend__pb2.CreateScenarioPoolRequest.FromString,
+                    response_serializer=cicadad_dot_protos_dot_backend__pb2.CreateScenarioResponse.SerializeToString,
+            ),
             'CreateUsers': grpc.unary_unary_rpc_method_handler(
                     servicer.CreateUsers,
                     request_deserializer=cicadad_dot_protos_dot_backend__pb2.CreateUsersRequest.FromString,
@@ -314,6 +418,16 @@ def add_BackendServicer_to_server(servicer, server):
                     request_deserializer=cicadad_dot_protos_dot_backend__pb2.MoveScenarioResultRequest.FromString,
                     response_serializer=cicadad_dot_protos_dot_backend__pb2.MoveScenarioResultResponse.SerializeToString,
             ),
+            'SetContextValue': grpc.unary_unary_rpc_method_handler(
+                    servicer.SetContextValue,
+                    request_deserializer=cicadad_dot_protos_dot_backend__pb2.SetContextValueRequest.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
+            'GetContextValue': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetContextValue,
+                    request_deserializer=cicadad_dot_protos_dot_backend__pb2.GetContextValueRequest.FromString,
+                    response_serializer=cicadad_dot_protos_dot_backend__pb2.GetContextValueResponse.SerializeToString,
+            ),
             'DistributeWork': grpc.unary_unary_rpc_method_handler(
                     servicer.DistributeWork,
                     request_deserializer=cicadad_dot_protos_dot_backend__pb2.DistributeWorkRequest.FromString,
@@ -324,6 +438,16 @@ def add_BackendServicer_to_server(servicer, server):
                     request_deserializer=cicadad_dot_protos_dot_backend__pb2.GetUserWorkRequest.FromString,
                     response_serializer=cicadad_dot_protos_dot_backend__pb2.GetUserWorkResponse.SerializeToString,
             ),
+            'DistributeWorkItems': grpc.unary_unary_rpc_method_handler(
+                    servicer.DistributeWorkItems,
+                    request_deserializer=cicadad_dot_protos_dot_backend__pb2.DistributeWorkItemsRequest.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
+            'GetUserWorkItems': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUserWorkItems,
+                    request_deserializer=cicadad_dot_protos_dot_backend__pb2.GetUserWorkRequest.FromString,
+                    response_serializer=cicadad_dot_protos_dot_backend__pb2.GetUserWorkItemsResponse.SerializeToString,
+            ),
             'AddUserEvent': grpc.unary_unary_rpc_method_handler(
                     servicer.AddUserEvent,
                     request_deserializer=cicadad_dot_protos_dot_backend__pb2.AddEventRequest.FromString,
@@ -339,6 +463,11 @@ def add_BackendServicer_to_server(servicer, server):
                     request_deserializer=cicadad_dot_protos_dot_backend__pb2.AddMetricRequest.FromString,
                     response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
             ),
+            'AddMetricSummary': grpc.unary_unary_rpc_method_handler(
+                    servicer.AddMetricSummary,
+                    request_deserializer=cicadad_dot_protos_dot_backend__pb2.AddMetricSummaryRequest.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
             'GetMetricTotal': grpc.unary_unary_rpc_method_handler(
                     servicer.GetMetricTotal,
                     request_deserializer=cicadad_dot_protos_dot_backend__pb2.GetMetricRequest.FromString,
@@ -359,6 +488,21 @@ def add_BackendServicer_to_server(servicer, server):
                     request_deserializer=cicadad_dot_protos_dot_backend__pb2.GetMetricRequest.FromString,
                     response_serializer=cicadad_dot_protos_dot_backend__pb2.MetricStatisticsResponse.SerializeToString,
             ),
+            'GetMetricSeries': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMetricSeries,
+                    request_deserializer=cicadad_dot_protos_dot_backend__pb2.GetMetricSeriesRequest.FromString,
+                    response_serializer=cicadad_dot_protos_dot_backend__pb2.MetricSeriesResponse.SerializeToString,
+            ),
+            'GetMetricsSnapshot': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMetricsSnapshot,
+                    request_deserializer=cicadad_dot_protos_dot_backend__pb2.GetMetricsSnapshotRequest.FromString,
+                    response_serializer=cicadad_dot_protos_dot_backend__pb2.GetMetricsSnapshotResponse.SerializeToString,
+            ),
+            'CheckHealth': grpc.unary_unary_rpc_method_handler(
+                    servicer.CheckHealth,
+                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'backend.Backend', rpc_method_handlers)
@@ -403,6 +547,23 @@ class Backend(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def CreateScenarioPool(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/backend.Backend/CreateScenarioPool',
+            cicadad_dot_protos_dot_backend__pb2.CreateScenarioPoolRequest.SerializeToString,
+            cicadad_dot_protos_dot_backend__pb2.CreateScenarioResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def CreateUsers(request,
             target,
@@ -573,6 +734,40 @@ class Backend(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def SetContextValue(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/backend.Backend/SetContextValue',
+            cicadad_dot_protos_dot_backend__pb2.SetContextValueRequest.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetContextValue(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/backend.Backend/GetContextValue',
+            cicadad_dot_protos_dot_backend__pb2.GetContextValueRequest.SerializeToString,
+            cicadad_dot_protos_dot_backend__pb2.GetContextValueResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def DistributeWork(request,
             target,
@@ -607,6 +802,40 @@ class Backend(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def DistributeWorkItems(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/backend.Backend/DistributeWorkItems',
+            cicadad_dot_protos_dot_backend__pb2.DistributeWorkItemsRequest.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetUserWorkItems(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/backend.Backend/GetUserWorkItems',
+            cicadad_dot_protos_dot_backend__pb2.GetUserWorkRequest.SerializeToString,
+            cicadad_dot_protos_dot_backend__pb2.GetUserWorkItemsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def AddUserEvent(request,
             target,
@@ -658,6 +887,23 @@ class Backend(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def AddMetricSummary(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/backend.Backend/AddMetricSummary',
+            cicadad_dot_protos_dot_backend__pb2.AddMetricSummaryRequest.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def GetMetricTotal(request,
             target,
@@ -725,3 +971,54 @@ class Backend(object):
             cicadad_dot_protos_dot_backend__pb2.MetricStatisticsResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetMetricSeries(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/backend.Backend/GetMetricSeries',
+            cicadad_dot_protos_dot_backend__pb2.GetMetricSeriesRequest.SerializeToString,
+            cicadad_dot_protos_dot_backend__pb2.MetricSeriesResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetMetricsSnapshot(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/backend.Backend/GetMetricsSnapshot',
+            cicadad_dot_protos_dot_backend__pb2.GetMetricsSnapshotRequest.SerializeToString,
+            cicadad_dot_protos_dot_backend__pb2.GetMetricsSnapshotResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def CheckHealth(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/backend.Backend/CheckHealth',
+            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -1,13 +1,13 @@
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional
+from collections import deque
 import time
 import pickle  # nosec
 import json
 import random
-from distributed.client import Future  # type: ignore
 
 import grpc  # type: ignore
 
-from google.protobuf import wrappers_pb2
+from google.protobuf import empty_pb2, wrappers_pb2
 
 from cicadad.core.types import (
     IBackendAPI,
@@ -19,6 +19,10 @@ from cicadad.core.types import (
     IUserBackend,
     IUserBufferActor,
     IUserManagerBackend,
+    MetricQuery,
+    MetricSeriesPoint,
+    MetricsSnapshot,
+    MetricSummary,
     Result,
     ScenarioMetric,
     TestEvent,
@@ -26,7 +30,18 @@ from cicadad.core.types import (
     UserEvent,
 )
 from cicadad.protos import backend_pb2, backend_pb2_grpc
-from cicadad.util.constants import DEFAULT_BACKEND_ADDRESS, ONE_SEC_MS
+from cicadad.util.backoff import exponential_backoff
+from cicadad.util.constants import (
+    BACKEND_READY_INITIAL_WAIT,
+    BACKEND_READY_MAX_WAIT,
+    BACKEND_READY_TIMEOUT,
+    DEFAULT_BACKEND_ADDRESS,
+    ONE_SEC_MS,
+)
+from cicadad.util.context import hash_context_value
+
+if TYPE_CHECKING:
+    from distributed.client import Future  # type: ignore
 
 
 class CLIBackend(ICLIBackend):
@@ -51,6 +66,18 @@ class CLIBackend(ICLIBackend):
     def clean_test_instances(self, test_id: str):
         self.__backend_api.clean_test_instances(test_id)
 
+    def wait_for_backend(self, tries: int):
+        try:
+            exponential_backoff(
+                lambda: self.__backend_api.check_health(BACKEND_READY_TIMEOUT),
+                grpc.RpcError,
+                tries,
+                initial_wait=BACKEND_READY_INITIAL_WAIT,
+                max_wait=BACKEND_READY_MAX_WAIT,
+            )
+        except RuntimeError as e:
+            raise RuntimeError("Backend did not become ready") from e
+
 
 class UserBufferActor(IUserBufferActor):
     """Actor to buffer work and events for users."""
@@ -66,9 +93,10 @@ class UserBufferActor(IUserBufferActor):
 
         self.__user_events: Dict[str, List[UserEvent]] = {}
         self.__user_work: Dict[str, int] = {}
+        self.__work_items: Deque[bytes] = deque()
         self.__results: List[Result] = []
 
-    def add_users(self, user_ids: List[str]) -> Future:
+    def add_users(self, user_ids: List[str]) -> "Future":
         """Add a user for tracking events and work.
 
         Args:
@@ -78,7 +106,7 @@ class UserBufferActor(IUserBufferActor):
             self.__user_events[user_id] = []
             self.__user_work[user_id] = 0
 
-    def get_user_events(self, user_id: str, kind: str) -> Future:
+    def get_user_events(self, user_id: str, kind: str) -> "Future":
         """Get events for a user in the user manager or refresh events.
 
         Args:
@@ -105,7 +133,7 @@ class UserBufferActor(IUserBufferActor):
 
         return user_events
 
-    def get_user_work(self, user_id: str) -> Future:
+    def get_user_work(self, user_id: str) -> "Future":
         """Get work for user or refresh work for all users.
 
         Args:
@@ -138,21 +166,55 @@ class UserBufferActor(IUserBufferActor):
 
         return user_work
 
-    def add_user_result(self, result: Result) -> Future:
+    def get_user_work_item(self, user_id: str) -> "Future":
+        """Get next work item shared by users or refresh work items.
+
+        Args:
+            user_id (str): User ID to get work item for
+
+        Returns:
+            Optional[bytes]: Work item if available
+        """
+        if user_id not in self.__user_work:
+            return None
+
+        if not self.__work_items:
+            self.__work_items.extend(
+                self.__backend_api.get_user_work_items(self.__user_manager_id)
+            )
+
+        if not self.__work_items:
+            return None
+
+        return self.__work_items.popleft()
+
+    def add_user_result(self, result: Result) -> "Future":
         """Add user result to buffer.
 
         Args:
             result (Result): User result
         """
+        result.user_manager_id = self.__user_manager_id
         self.__results.append(result)
 
-    def send_user_results(self) -> Future:
+    def send_user_results(self) -> "Future":
         """Flushes buffer of user results and sends them to datastore."""
         # TODO: user results should be less than 1MB
         self.__backend_api.add_user_results(self.__user_manager_id, self.__results)
 
         self.__results = []
 
+    def move_user_results(self) -> "Future":
+        """Flushes buffer of user results without sending them.
+
+        Returns:
+            List[Result]: Buffered user results
+        """
+        results = self.__results
+        self.__results = []
+
+        return results
+
 
 class UserBackend(IUserBackend):
     def __init__(self, user_id: str, buffer: IUserBufferActor):
@@ -171,6 +233,15 @@ class UserBackend(IUserBackend):
 
         return work
 
+    def get_work_item(self, timeout_ms: Optional[int] = ONE_SEC_MS) -> Optional[bytes]:
+        item = self.__buffer.get_user_work_item(self.__user_id).result()
+
+        if item is None and timeout_ms is not None:
+            time.sleep(timeout_ms / ONE_SEC_MS)
+            item = self.__buffer.get_user_work_item(self.__user_id).result()
+
+        return item
+
     def add_user_result(self, result: Result):
         self.__buffer.add_user_result(result).result()
 
@@ -202,14 +273,36 @@ class UserManagerBackend(IUserManagerBackend):
     def send_user_results(self):
         self.__buffer.send_user_results().result()
 
+    def move_user_results(self) -> List[Result]:
+        return self.__buffer.move_user_results().result()
+
+    def send_results(self, results: List[Result]):
+        self.__backend_api.add_user_results(self.__user_manager_id, results)
+
 
 class ScenarioBackend(IScenarioBackend):
     def __init__(
-        self, test_id: str, scenario_id: str, backend_api: IBackendAPI
+        self,
+        test_id: str,
+        scenario_id: str,
+        backend_api: IBackendAPI,
+        metrics_scenario_id: Optional[str] = None,
     ) -> None:
         self.__test_id = test_id
         self.__scenario_id = scenario_id
         self.__backend_api = backend_api
+        # NOTE: pools save metrics under the scenario they were created in
+        self.__metrics_scenario_id = metrics_scenario_id or scenario_id
+
+    def create_pool(self, name: str) -> IScenarioBackend:
+        pool_id = self.__backend_api.create_scenario_pool(self.__scenario_id, name)
+
+        return ScenarioBackend(
+            test_id=self.__test_id,
+            scenario_id=pool_id,
+            backend_api=self.__backend_api,
+            metrics_scenario_id=self.__metrics_scenario_id,
+        )
 
     def create_users(self, amount: int) -> List[str]:
         return self.__backend_api.create_users(
@@ -222,6 +315,11 @@ class ScenarioBackend(IScenarioBackend):
     def distribute_work(self, n: int):
         self.__backend_api.distribute_work(scenario_id=self.__scenario_id, amount=n)
 
+    def distribute_work_items(self, items: List[bytes]):
+        self.__backend_api.distribute_work_items(
+            scenario_id=self.__scenario_id, items=items
+        )
+
     def send_user_events(self, kind: str, payload: dict):
         self.__backend_api.add_user_event(
             scenario_id=self.__scenario_id, kind=kind, payload=payload
@@ -251,6 +349,7 @@ class ScenarioBackend(IScenarioBackend):
         time_taken: float,
         succeeded: int,
         failed: int,
+        max_users: int = 0,
     ):
         self.__backend_api.set_scenario_result(
             scenario_id=self.__scenario_id,
@@ -260,11 +359,28 @@ class ScenarioBackend(IScenarioBackend):
             time_taken=time_taken,
             succeeded=succeeded,
             failed=failed,
+            max_users=max_users,
         )
 
     def add_metric(self, name: str, value: float):
         self.__backend_api.add_metric(
-            scenario_id=self.__scenario_id, name=name, value=value
+            scenario_id=self.__metrics_scenario_id, name=name, value=value
+        )
+
+    def add_metric_summary(self, name: str, summary: MetricSummary):
+        self.__backend_api.add_metric_summary(
+            scenario_id=self.__metrics_scenario_id, name=name, summary=summary
+        )
+
+    def get_metric_series(
+        self,
+        name: str,
+        from_timestamp: int,
+        to_timestamp: int,
+        step: int,
+    ) -> List[MetricSeriesPoint]:
+        return self.__backend_api.get_metric_series(
+            self.__metrics_scenario_id, name, from_timestamp, to_timestamp, step
         )
 
 
@@ -286,6 +402,18 @@ class ConsoleMetricsBackend(IConsoleMetricsBackend):
     ) -> Optional[float]:
         return self.__backend_api.get_metric_rate(scenario_id, name, split_point)
 
+    def get_metric_series(
+        self,
+        scenario_id: str,
+        name: str,
+        from_timestamp: int,
+        to_timestamp: int,
+        step: int,
+    ) -> List[MetricSeriesPoint]:
+        return self.__backend_api.get_metric_series(
+            scenario_id, name, from_timestamp, to_timestamp, step
+        )
+
 
 class TestBackend(ITestBackend):
     def __init__(self, test_id: str, backend_api: IBackendAPI) -> None:
@@ -313,6 +441,24 @@ class TestBackend(ITestBackend):
     def move_scenario_result(self, scenario_id: str) -> Optional[dict]:
         return self.__backend_api.move_scenario_result(scenario_id)
 
+    def get_metrics_snapshot(
+        self, queries: List[MetricQuery], timeout: Optional[float] = None
+    ) -> Optional[MetricsSnapshot]:
+        values = self.__backend_api.get_metrics_snapshot(queries, timeout)
+
+        if values is None:
+            return None
+
+        return {
+            query: value for query, value in zip(queries, values) if value is not None
+        }
+
+    def save_context_value(self, value: Any) -> str:
+        value_hash, data = hash_context_value(value)
+        self.__backend_api.set_context_value(value_hash, data)
+
+        return value_hash
+
     def get_console_metrics_backend(self) -> IConsoleMetricsBackend:
         return ConsoleMetricsBackend(self.__backend_api)
 
@@ -420,6 +566,18 @@ class DefaultBackendAPI(IBackendAPI):
 
             return response.scenarioID
 
+    def create_scenario_pool(self, scenario_id: str, name: str) -> str:
+        with self.__get_channel() as channel:
+            stub = backend_pb2_grpc.BackendStub(channel)
+            request = backend_pb2.CreateScenarioPoolRequest(
+                scenarioID=scenario_id,
+                name=name,
+            )
+
+            response = stub.CreateScenarioPool(request)
+
+            return response.scenarioID
+
     def create_users(self, test_id: str, scenario_id: str, amount: int) -> List[str]:
         with self.__get_channel() as channel:
             stub = backend_pb2_grpc.BackendStub(channel)
@@ -458,6 +616,12 @@ class DefaultBackendAPI(IBackendAPI):
 
             return response.running
 
+    def check_health(self, timeout: float):
+        with self.__get_channel() as channel:
+            stub = backend_pb2_grpc.BackendStub(channel)
+
+            stub.CheckHealth(empty_pb2.Empty(), timeout=timeout)
+
     def add_test_event(self, test_id: str, event: TestEvent):
         with self.__get_channel() as channel:
             stub = backend_pb2_grpc.BackendStub(channel)
@@ -513,6 +677,7 @@ class DefaultBackendAPI(IBackendAPI):
         time_taken: float,
         succeeded: int,
         failed: int,
+        max_users: int = 0,
     ):
         with self.__get_channel() as channel:
             stub = backend_pb2_grpc.BackendStub(channel)
@@ -526,6 +691,7 @@ class DefaultBackendAPI(IBackendAPI):
                 timeTaken=time_taken,
                 succeeded=succeeded,
                 failed=failed,
+                maxUsers=max_users,
             )
 
             stub.SetScenarioResult(request)
@@ -564,6 +730,7 @@ class DefaultBackendAPI(IBackendAPI):
                     "time_taken": response.timeTaken,
                     "succeeded": response.succeeded,
                     "failed": response.failed,
+                    "max_users": response.maxUsers,
                 }
             except grpc.RpcError as err:
                 if err.code() == grpc.StatusCode.NOT_FOUND:
@@ -571,6 +738,28 @@ class DefaultBackendAPI(IBackendAPI):
                 else:
                     raise err
 
+    def set_context_value(self, value_hash: str, value: bytes):
+        with self.__get_channel() as channel:
+            stub = backend_pb2_grpc.BackendStub(channel)
+            request = backend_pb2.SetContextValueRequest(hash=value_hash, value=value)
+
+            stub.SetContextValue(request)
+
+    def get_context_value(self, value_hash: str) -> Optional[bytes]:
+        with self.__get_channel() as channel:
+            try:
+                stub = backend_pb2_grpc.BackendStub(channel)
+                request = backend_pb2.GetContextValueRequest(hash=value_hash)
+
+                response = stub.GetContextValue(request)
+
+                return response.value
+            except grpc.RpcError as err:
+                if err.code() == grpc.StatusCode.NOT_FOUND:
+                    return None
+                else:
+                    raise err
+
     def distribute_work(self, scenario_id: str, amount: int):
         with self.__get_channel() as channel:
             stub = backend_pb2_grpc.BackendStub(channel)
@@ -589,6 +778,24 @@ class DefaultBackendAPI(IBackendAPI):
 
             return response.work
 
+    def distribute_work_items(self, scenario_id: str, items: List[bytes]):
+        with self.__get_channel() as channel:
+            stub = backend_pb2_grpc.BackendStub(channel)
+            request = backend_pb2.DistributeWorkItemsRequest(
+                scenarioID=scenario_id, items=items
+            )
+
+            stub.DistributeWorkItems(request)
+
+    def get_user_work_items(self, user_manager_id: str) -> List[bytes]:
+        with self.__get_channel() as channel:
+            stub = backend_pb2_grpc.BackendStub(channel)
+            request = backend_pb2.GetUserWorkRequest(userManagerID=user_manager_id)
+
+            response = stub.GetUserWorkItems(request)
+
+            return list(response.items)
+
     def add_user_event(self, scenario_id: str, kind: str, payload: dict):
         with self.__get_channel() as channel:
             stub = backend_pb2_grpc.BackendStub(channel)
@@ -627,6 +834,23 @@ class DefaultBackendAPI(IBackendAPI):
 
             stub.AddMetric(request)
 
+    def add_metric_summary(self, scenario_id: str, name: str, summary: MetricSummary):
+        with self.__get_channel() as channel:
+            stub = backend_pb2_grpc.BackendStub(channel)
+            request = backend_pb2.AddMetricSummaryRequest(
+                scenarioID=scenario_id,
+                name=name,
+                count=summary.count,
+                sum=summary.sum,
+                min=summary.min,
+                max=summary.max,
+                last=summary.last,
+                sumOfSquares=summary.sum_of_squares,
+                histogram=summary.histogram,
+            )
+
+            stub.AddMetricSummary(request)
+
     def get_metric_total(self, scenario_id: str, name: str) -> Optional[float]:
         with self.__get_channel() as channel:
             try:
@@ -702,9 +926,107 @@ class DefaultBackendAPI(IBackendAPI):
                     "median": response.median,
                     "average": response.average,
                     "len": response.len,
+                    "stddev": response.stddev,
                 }
             except grpc.RpcError as err:
                 if err.code() == grpc.StatusCode.NOT_FOUND:
                     return None
                 else:
                     raise err
+
+    def get_metric_series(
+        self,
+        scenario_id: str,
+        name: str,
+        from_timestamp: int,
+        to_timestamp: int,
+        step: int,
+    ) -> List[MetricSeriesPoint]:
+        with self.__get_channel() as channel:
+            stub = backend_pb2_grpc.BackendStub(channel)
+            request = backend_pb2.GetMetricSeriesRequest(
+                scenarioID=scenario_id,
+                name=name,
+                fromTimestamp=from_timestamp,
+                toTimestamp=to_timestamp,
+                step=step,
+            )
+
+            response = stub.GetMetricSeries(request)
+
+            return [
+                MetricSeriesPoint(
+                    timestamp=point.timestamp,
+                    count=point.count,
+                    sum=point.sum,
+                    min=point.min,
+                    max=point.max,
+                    average=point.average,
+                    stddev=point.stddev,
+                )
+                for point in response.points
+            ]
+
+    def get_metrics_snapshot(
+        self, queries: List[MetricQuery], timeout: Optional[float] = None
+    ) -> Optional[List[Any]]:
+        with self.__get_channel() as channel:
+            try:
+                stub = backend_pb2_grpc.BackendStub(channel)
+                request = backend_pb2.GetMetricsSnapshotRequest(
+                    queries=[
+                        backend_pb2.MetricQuery(
+                            kind=query.kind,
+                            scenarioID=query.scenario_id,
+                            name=query.name,
+                            splitPoint=query.split_point,
+                            fromTimestamp=query.from_timestamp,
+                            toTimestamp=query.to_timestamp,
+                            step=query.step,
+                        )
+                        for query in queries
+                    ]
+                )
+
+                response = stub.GetMetricsSnapshot(request, timeout=timeout)
+            except grpc.RpcError as err:
+                if err.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                    return None
+                else:
+                    raise err
+
+            return [
+                _metric_query_value(query, result)
+                for query, result in zip(queries, response.results)
+            ]
+
+
+def _metric_query_value(query: MetricQuery, result) -> Any:
+    if not result.found:
+        return None
+
+    if query.kind == "statistics":
+        return {
+            "min": result.statistics.min,
+            "max": result.statistics.max,
+            "median": result.statistics.median,
+            "average": result.statistics.average,
+            "len": result.statistics.len,
+            "stddev": result.statistics.stddev,
+        }
+
+    if query.kind == "series":
+        return [
+            MetricSeriesPoint(
+                timestamp=point.timestamp,
+                count=point.count,
+                sum=point.sum,
+                min=point.min,
+                max=point.max,
+                average=point.average,
+                stddev=point.stddev,
+            )
+            for point in result.points
+        ]
+
+    return result.value
@@ -0,0 +1,346 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import json
+import os
+import threading
+
+from cicadad.core.errors import error_fingerprint
+from cicadad.core.reduction import is_reduced_result
+from cicadad.core.types import IResultExporter, Result
+from cicadad.metrics.compare import (
+    COMPARE_PERCENTILES,
+    DEFAULT_COMPARE_WINDOW,
+    ScenarioSummary,
+)
+
+DEFAULT_EXPORT_ROW_GROUP_SIZE = 50000
+EXPORT_INDEX_FILE = "index.jsonl"
+EXPORT_COLUMNS = [
+    "timestamp",
+    "latency",
+    "success",
+    "error_type",
+    "user_id",
+    "user_manager_id",
+    "scenario",
+    "weight",
+]
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow  # type: ignore
+        import pyarrow.compute  # type: ignore
+        import pyarrow.parquet  # type: ignore
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required to export results: pip install cicadad[export]"
+        ) from e
+
+    return pyarrow
+
+
+def error_type(exception: Any) -> Optional[str]:
+    """Get type of error reported in a user result.
+
+    Args:
+        exception (Any): Exception of result
+
+    Returns:
+        Optional[str]: Exception class name, or fingerprint of error messages
+    """
+    if exception is None:
+        return None
+
+    if isinstance(exception, BaseException):
+        return type(exception).__name__
+
+    return error_fingerprint(str(exception))
+
+
+class ParquetResultExporter(IResultExporter):
+    def __init__(
+        self,
+        directory: str,
+        scenario_name: str,
+        scenario_id: str,
+        row_group_size: int = DEFAULT_EXPORT_ROW_GROUP_SIZE,
+        sample_rate: float = 1.0,
+        test_id: Optional[str] = None,
+    ) -> None:
+        """Streams user results of a scenario to a Parquet file.
+
+        Files are partitioned by scenario, as <directory>/scenario=<name>/<id>.parquet.
+        At most row_group_size results are buffered before a row group is written,
+        and each file is listed in <directory>/index.jsonl once closed.
+
+        When user managers reduce results, only failures and a sample of
+        successful results reach the scenario. Sampled results are exported with
+        a weight of the number of results they stand in for.
+
+        Requires pyarrow (pip install cicadad[export]).
+
+        Args:
+            directory (str): Directory to export results to
+            scenario_name (str): Name of scenario
+            scenario_id (str): ID of scenario run
+            row_group_size (int, optional): Results per row group. Defaults to 50000.
+            sample_rate (float, optional): Fraction of successful results kept by
+                user managers when reducing results. Defaults to 1.
+            test_id (str, optional): ID of test run, recorded in index so runs
+                exported to the same directory can be told apart. Defaults to None.
+        """
+        pyarrow = _import_pyarrow()
+
+        self.__pa = pyarrow
+        self.__pq = pyarrow.parquet
+        self.__directory = directory
+        self.__scenario_name = scenario_name
+        self.__scenario_id = scenario_id
+        self.__test_id = test_id
+        self.__row_group_size = row_group_size
+        self.__sample_weight = 1 / sample_rate
+        self.__path = os.path.join(
+            f"scenario={scenario_name}", f"{scenario_id}.parquet"
+        )
+        self.__schema = pyarrow.schema(
+            [
+                ("timestamp", pyarrow.timestamp("us")),
+                ("latency", pyarrow.float64()),
+                ("success", pyarrow.bool_()),
+                ("error_type", pyarrow.string()),
+                ("user_id", pyarrow.string()),
+                ("user_manager_id", pyarrow.string()),
+                ("scenario", pyarrow.string()),
+                ("weight", pyarrow.float64()),
+            ]
+        )
+
+        self.__lock = threading.Lock()
+        self.__writer = None
+        self.__columns: Dict[str, List[Any]] = {name: [] for name in EXPORT_COLUMNS}
+        self.__rows = 0
+        self.__row_groups = 0
+        self.__errors = 0
+        self.__first_timestamp: Optional[datetime] = None
+        self.__last_timestamp: Optional[datetime] = None
+
+    def add_results(self, results: List[Result]):
+        # NOTE: pools of a scenario collect results in separate threads
+        with self.__lock:
+            for result in results:
+                self.__add_result(result)
+
+                if len(self.__columns["timestamp"]) >= self.__row_group_size:
+                    self.__write_row_group()
+
+    def close(self):
+        with self.__lock:
+            if self.__columns["timestamp"] != []:
+                self.__write_row_group()
+
+            if self.__writer is None:
+                return
+
+            self.__writer.close()
+            self.__writer = None
+
+            with open(os.path.join(self.__directory, EXPORT_INDEX_FILE), "a") as index:
+                # NOTE: single appended line, so scenarios can share the index
+                index.write(
+                    json.dumps(
+                        {
+                            "test_id": self.__test_id,
+                            "scenario": self.__scenario_name,
+                            "scenario_id": self.__scenario_id,
+                            "path": self.__path,
+                            "rows": self.__rows,
+                            "row_groups": self.__row_groups,
+                            "errors": self.__errors,
+                            "first_timestamp": self.__first_timestamp,
+                            "last_timestamp": self.__last_timestamp,
+                        },
+                        default=str,
+                    )
+                    + "\n"
+                )
+
+    def __add_result(self, result: Result):
+        columns = self.__columns
+
+        columns["timestamp"].append(result.timestamp)
+        columns["latency"].append(result.time_taken)
+        columns["success"].append(result.exception is None)
+        columns["error_type"].append(error_type(result.exception))
+        columns["user_id"].append(result.user_id)
+        columns["user_manager_id"].append(result.user_manager_id)
+        columns["scenario"].append(self.__scenario_name)
+        columns["weight"].append(
+            self.__sample_weight
+            if is_reduced_result(result) and result.exception is None
+            else 1.0
+        )
+
+        if result.exception is not None:
+            self.__errors += 1
+
+        if isinstance(result.timestamp, datetime):
+            if (
+                self.__first_timestamp is None
+                or result.timestamp < self.__first_timestamp
+            ):
+                self.__first_timestamp = result.timestamp
+
+            if (
+                self.__last_timestamp is None
+                or result.timestamp > self.__last_timestamp
+            ):
+                self.__last_timestamp = result.timestamp
+
+    def __write_row_group(self):
+        if self.__writer is None:
+            path = os.path.join(self.__directory, self.__path)
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self.__writer = self.__pq.ParquetWriter(path, self.__schema)
+
+        table = self.__pa.table(self.__columns, schema=self.__schema)
+
+        self.__writer.write_table(table, row_group_size=self.__row_group_size)
+
+        self.__rows += table.num_rows
+        self.__row_groups += 1
+        self.__columns = {name: [] for name in EXPORT_COLUMNS}
+
+
+def read_export_index(
+    directory: str, test_id: Optional[str] = None
+) -> Dict[str, List[str]]:
+    """Get exported files of each scenario of a test run from index of export directory.
+
+    Directories can be reused by later runs, which append to the same index, so
+    only files of one run are returned.
+
+    Args:
+        directory (str): Directory results were exported to
+        test_id (str, optional): Test run to get files of. Defaults to run indexed last.
+
+    Returns:
+        Dict[str, List[str]]: Paths of files relative to directory by scenario name
+    """
+    entries = []
+
+    with open(os.path.join(directory, EXPORT_INDEX_FILE)) as index:
+        for line in index:
+            if line.strip() == "":
+                continue
+
+            entries.append(json.loads(line))
+
+    if test_id is None and entries != []:
+        test_id = entries[-1].get("test_id")
+
+    paths: Dict[str, List[str]] = {}
+
+    for entry in entries:
+        if entry.get("test_id") == test_id:
+            paths.setdefault(entry["scenario"], []).append(entry["path"])
+
+    return paths
+
+
+def load_export_summaries(
+    directory: str,
+    window_seconds: float = DEFAULT_COMPARE_WINDOW,
+    test_id: Optional[str] = None,
+) -> Dict[str, ScenarioSummary]:
+    """Summarize throughput and latency of each scenario of a test run in an export directory.
+
+    Only the timestamp, latency, success and weight columns are read, and all
+    aggregation is done by Arrow compute functions. Sampled results are counted
+    by their weight.
+
+    Args:
+        directory (str): Directory results were exported to
+        window_seconds (float, optional): Seconds per windowed sample. Defaults to 5.
+        test_id (str, optional): Test run to summarize. Defaults to run indexed last.
+
+    Returns:
+        Dict[str, ScenarioSummary]: Summary of each scenario
+    """
+    pyarrow = _import_pyarrow()
+
+    return {
+        scenario: _summarize_table(
+            pyarrow,
+            pyarrow.concat_tables(
+                [
+                    pyarrow.parquet.read_table(
+                        os.path.join(directory, path),
+                        columns=["timestamp", "latency", "success", "weight"],
+                    )
+                    for path in paths
+                ]
+            ),
+            window_seconds,
+        )
+        for scenario, paths in read_export_index(directory, test_id).items()
+    }
+
+
+def _summarize_table(pyarrow, table, window_seconds: float) -> ScenarioSummary:
+    pc = pyarrow.compute
+
+    table = table.filter(pc.is_valid(table["timestamp"]))
+    micros = pc.cast(table["timestamp"], pyarrow.int64())
+    start = pc.min(micros).as_py() or 0
+    end = pc.max(micros).as_py() or 0
+    duration = (end - start) / 1e6
+
+    table = table.append_column(
+        "window",
+        pc.divide(pc.subtract(micros, start), max(int(window_seconds * 1e6), 1)),
+    )
+
+    counts = table.group_by("window").aggregate([("weight", "sum")])
+    succeeded = table.filter(table["success"])
+    latencies = succeeded.group_by("window").aggregate(
+        [("latency", "approximate_median")]
+    )
+
+    window_counts = sorted(
+        zip(counts["window"].to_pylist(), counts["weight_sum"].to_pylist())
+    )
+    window_latencies = sorted(
+        zip(
+            latencies["window"].to_pylist(),
+            latencies["latency_approximate_median"].to_pylist(),
+        )
+    )
+
+    # NOTE: last window is usually cut short by the end of the scenario
+    if len(window_counts) > 2:
+        last_window = window_counts[-1][0]
+        window_counts = window_counts[:-1]
+        window_latencies = [w for w in window_latencies if w[0] != last_window]
+
+    quantiles = (
+        pc.quantile(
+            succeeded["latency"], q=list(COMPARE_PERCENTILES.values())
+        ).to_pylist()
+        if succeeded.num_rows > 0
+        else [None] * len(COMPARE_PERCENTILES)
+    )
+
+    count = pc.sum(table["weight"]).as_py() or 0
+
+    return ScenarioSummary(
+        count=round(count),
+        duration=duration,
+        throughput=count / duration if duration > 0 else count,
+        percentiles=dict(zip(COMPARE_PERCENTILES, quantiles)),
+        window_throughput=[count / window_seconds for _, count in window_counts],
+        window_latency=[
+            latency for _, latency in window_latencies if latency is not None
+        ],
+    )
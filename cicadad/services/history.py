@@ -0,0 +1,301 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+import json
+import os
+import sqlite3
+import subprocess  # nosec
+
+from pydantic import BaseModel
+from rich.table import Table
+from rich import box
+
+from cicadad.metrics.compare import ScenarioSummary
+from cicadad.util.console import format_number
+
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    test_id TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    git_sha TEXT,
+    tags TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS scenario_runs (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    scenario TEXT NOT NULL,
+    passed INTEGER NOT NULL,
+    p50 REAL,
+    p95 REAL,
+    p99 REAL,
+    throughput REAL,
+    succeeded INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    max_users INTEGER NOT NULL,
+    time_taken REAL,
+    PRIMARY KEY (run_id, scenario)
+);
+
+CREATE INDEX IF NOT EXISTS scenario_runs_scenario
+    ON scenario_runs (scenario, run_id DESC);
+"""
+
+
+class ScenarioRunSummary(BaseModel):
+    """Compact summary of one scenario in a test run."""
+
+    scenario: str
+    passed: bool
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+    throughput: Optional[float] = None
+    succeeded: int = 0
+    failed: int = 0
+    max_users: int = 0
+    time_taken: Optional[float] = None
+
+
+class ScenarioRecord(ScenarioRunSummary):
+    """Summary of a scenario along with the run it was recorded in."""
+
+    run_id: int
+    test_id: str
+    started_at: datetime
+    git_sha: Optional[str]
+    tags: List[str]
+
+
+def summarize_run(
+    context: Dict[str, dict], export_summaries: Dict[str, ScenarioSummary]
+) -> List[ScenarioRunSummary]:
+    """Summarize results of scenarios in a finished test.
+
+    Latency percentiles are only known for scenarios with exported results.
+    Otherwise throughput is estimated from the number of collected results.
+
+    Args:
+        context (Dict[str, dict]): Results of finished scenarios by name
+        export_summaries (Dict[str, ScenarioSummary]): Summaries of exported results
+
+    Returns:
+        List[ScenarioRunSummary]: Summary of each scenario
+    """
+    summaries = []
+
+    for scenario, result in context.items():
+        succeeded = result.get("succeeded") or 0
+        failed = result.get("failed") or 0
+        time_taken = result.get("time_taken")
+        exported = export_summaries.get(scenario)
+
+        if exported is not None:
+            percentiles = exported.percentiles
+            throughput: Optional[float] = exported.throughput
+        else:
+            percentiles = {}
+            throughput = (succeeded + failed) / time_taken if time_taken else None
+
+        summaries.append(
+            ScenarioRunSummary(
+                scenario=scenario,
+                passed=result.get("exception") is None,
+                p50=percentiles.get("p50"),
+                p95=percentiles.get("p95"),
+                p99=percentiles.get("p99"),
+                throughput=throughput,
+                succeeded=succeeded,
+                failed=failed,
+                max_users=result.get("max_users") or 0,
+                time_taken=time_taken,
+            )
+        )
+
+    return summaries
+
+
+def get_git_sha(path: str = ".") -> Optional[str]:
+    """Get commit checked out in a git working tree.
+
+    Args:
+        path (str, optional): Directory inside working tree. Defaults to ".".
+
+    Returns:
+        Optional[str]: Commit SHA, None if not in a git repo or git is not installed
+    """
+    try:
+        return subprocess.run(  # nosec
+            ["git", "rev-parse", "HEAD"],
+            cwd=path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            universal_newlines=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class RunHistory(object):
+    def __init__(self, path: str) -> None:
+        """Local SQLite database of scenario summaries from past test runs.
+
+        Args:
+            path (str): Path of database file, created if it does not exist
+        """
+        path = os.path.expanduser(path)
+        directory = os.path.dirname(path)
+
+        if directory != "":
+            os.makedirs(directory, exist_ok=True)
+
+        self.__connection = sqlite3.connect(path)
+        self.__connection.executescript(HISTORY_SCHEMA)
+
+    def add_run(
+        self,
+        test_id: str,
+        started_at: datetime,
+        git_sha: Optional[str],
+        tags: List[str],
+        summaries: List[ScenarioRunSummary],
+    ) -> int:
+        """Record summaries of scenarios in a test run.
+
+        Args:
+            test_id (str): ID of test
+            started_at (datetime): Time test was started
+            git_sha (Optional[str]): Commit test was run from
+            tags (List[str]): Tags test was run with
+            summaries (List[ScenarioRunSummary]): Summary of each scenario
+
+        Returns:
+            int: ID of run in history
+        """
+        with self.__connection:
+            cursor = self.__connection.execute(
+                "INSERT INTO runs (test_id, started_at, git_sha, tags) "
+                "VALUES (?, ?, ?, ?)",
+                (test_id, started_at.isoformat(), git_sha, json.dumps(list(tags))),
+            )
+            run_id: int = cursor.lastrowid  # type: ignore
+
+            self.__connection.executemany(
+                "INSERT INTO scenario_runs (run_id, scenario, passed, p50, p95, p99, "
+                "throughput, succeeded, failed, max_users, time_taken) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        summary.scenario,
+                        summary.passed,
+                        summary.p50,
+                        summary.p95,
+                        summary.p99,
+                        summary.throughput,
+                        summary.succeeded,
+                        summary.failed,
+                        summary.max_users,
+                        summary.time_taken,
+                    )
+                    for summary in summaries
+                ],
+            )
+
+        return run_id
+
+    def scenario_trend(self, scenario: str, limit: int = 10) -> List[ScenarioRecord]:
+        """Get summaries of a scenario from its most recent runs.
+
+        Args:
+            scenario (str): Name of scenario
+            limit (int, optional): Number of runs to get. Defaults to 10.
+
+        Returns:
+            List[ScenarioRecord]: Summaries ordered from oldest to newest run
+        """
+        rows = self.__connection.execute(
+            "SELECT s.run_id, r.test_id, r.started_at, r.git_sha, r.tags, "
+            "s.scenario, s.passed, s.p50, s.p95, s.p99, s.throughput, "
+            "s.succeeded, s.failed, s.max_users, s.time_taken "
+            "FROM scenario_runs s JOIN runs r ON r.id = s.run_id "
+            "WHERE s.scenario = ? ORDER BY s.run_id DESC LIMIT ?",
+            (scenario, limit),
+        ).fetchall()
+
+        return [
+            ScenarioRecord(
+                run_id=row[0],
+                test_id=row[1],
+                started_at=row[2],
+                git_sha=row[3],
+                tags=json.loads(row[4]),
+                scenario=row[5],
+                passed=bool(row[6]),
+                p50=row[7],
+                p95=row[8],
+                p99=row[9],
+                throughput=row[10],
+                succeeded=row[11],
+                failed=row[12],
+                max_users=row[13],
+                time_taken=row[14],
+            )
+            for row in reversed(rows)
+        ]
+
+    def scenarios(self) -> Dict[str, int]:
+        """Get names of recorded scenarios.
+
+        Returns:
+            Dict[str, int]: Number of recorded runs by scenario name
+        """
+        return dict(
+            self.__connection.execute(
+                "SELECT scenario, COUNT(*) FROM scenario_runs "
+                "GROUP BY scenario ORDER BY scenario"
+            ).fetchall()
+        )
+
+    def close(self):
+        self.__connection.close()
+
+
+class HistoryDisplay(object):
+    def __init__(self, scenario: str, records: List[ScenarioRecord]) -> None:
+        self.scenario = scenario
+        self.records = records
+
+    def get_renderable(self):
+        table = Table(
+            "run",
+            "started",
+            "git sha",
+            "p50",
+            "p95",
+            "p99",
+            "throughput",
+            "succeeded",
+            "failed",
+            "max users",
+            title=f"{self.scenario} history",
+            box=box.HORIZONTALS,
+            show_lines=False,
+        )
+
+        for record in self.records:
+            table.add_row(
+                str(record.run_id),
+                record.started_at.strftime("%Y-%m-%d %H:%M"),
+                (record.git_sha or "-")[:8],
+                format_number(record.p50),
+                format_number(record.p95),
+                format_number(record.p99),
+                format_number(record.throughput),
+                str(record.succeeded),
+                str(record.failed),
+                str(record.max_users),
+                style=None if record.passed else "red",
+            )
+
+        return table
@@ -1,4 +1,4 @@
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 import time
 
 
@@ -6,8 +6,9 @@ def exponential_backoff(
     get_client_fn: Callable[[], Any],
     error_class: Any,
     tries: int,
-    initial_wait: int = 2,
-    multiplier: int = 2,
+    initial_wait: float = 2,
+    multiplier: float = 2,
+    max_wait: Optional[float] = None,
 ):
     """Get a client using an exponential backoff
 
@@ -15,8 +16,9 @@ def exponential_backoff(
         get_client_fn (Callable): Function to get client.
         error_class (Any): Class to check exceptions against to determine if it should retry.
         tries (int): Number of attempts allowed to get client.
-        initial_wait (int, optional): Time in seconds for first wait after a failure. Defaults to 2.
-        multiplier (int, optional): Amount to multiply wait time by after each failure. Defaults to 2.
+        initial_wait (float, optional): Time in seconds for first wait after a failure. Defaults to 2.
+        multiplier (float, optional): Amount to multiply wait time by after each failure. Defaults to 2.
+        max_wait (float, optional): Longest time in seconds to wait between attempts. Defaults to None.
 
     Raises:
         e: Exception if not an instance of error_class.
@@ -33,10 +35,16 @@ def exponential_backoff(
             return get_client_fn()
         except Exception as e:
             if isinstance(e, error_class):
-                time.sleep(wait)
-
                 remaining_tries -= 1
+
+                # NOTE: no need to wait once there are no tries left
+                if remaining_tries > 0:
+                    time.sleep(wait)
+
                 wait *= multiplier
+
+                if max_wait is not None:
+                    wait = min(wait, max_wait)
             else:
                 raise e
 
@@ -1,4 +1,5 @@
-from typing import Dict
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
 
 from rich.align import Align
 from rich.panel import Panel
@@ -11,6 +12,34 @@ from rich.table import Table
 from rich import box
 
 
+class CachedRenderable(ABC):
+    def __init__(self) -> None:
+        """Keeps last renderable until the data it was built from changes.
+
+        Subclasses build renderables in render and call mark_changed when their
+        data changes. Version can be compared by parents to see if they need to
+        rebuild.
+        """
+        self.version = 0
+        self.__renderable = None
+        self.__rendered_version: Optional[int] = None
+
+    def mark_changed(self):
+        self.version += 1
+
+    def get_renderable(self):
+        if self.__rendered_version != self.version:
+            self.__renderable = self.render()
+            self.__rendered_version = self.version
+
+        return self.__renderable
+
+    @abstractmethod
+    def render(self):
+        """Build renderable from current data."""
+        pass
+
+
 class TaskDisplay(object):
     def __init__(self, task_name: str, task_id: str):
         self.task_name = task_name
@@ -29,15 +58,20 @@ class TaskDisplay(object):
         return self.renderable
 
 
-class MetricDisplay(object):
+class MetricDisplay(CachedRenderable):
     def __init__(self, scenario: str) -> None:
+        super().__init__()
+
         self.scenario = scenario
         self.metrics: Dict[str, str] = {}
 
     def update_metrics(self, metrics: Dict[str, str]):
-        self.metrics = metrics
+        # NOTE: metrics are sent every interval, usually with the same values
+        if metrics != self.metrics:
+            self.metrics = dict(metrics)
+            self.mark_changed()
 
-    def get_renderable(self):
+    def render(self):
         table = Table(
             "name",
             "value",
@@ -52,21 +86,31 @@ class MetricDisplay(object):
         return table
 
 
-class TasksPanel(object):
+def format_number(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.4g}"
+
+
+class TasksPanel(CachedRenderable):
     def __init__(self) -> None:
+        super().__init__()
+
         self.tasks: Dict[str, TaskDisplay] = {}
 
     def add_running_task(self, name: str, scenario_id: str):
         self.tasks[name] = TaskDisplay(name, scenario_id)
+        self.mark_changed()
 
     def update_task_success(self, name: str):
-        self.tasks[name].set_succeeded()
+        if name in self.tasks:
+            self.tasks[name].set_succeeded()
+            self.mark_changed()
 
     def update_task_failed(self, name: str):
         if name in self.tasks:
             self.tasks[name].set_failed()
+            self.mark_changed()
 
-    def get_renderable(self):
+    def render(self):
         if self.tasks == {}:
             return None
         else:
@@ -75,23 +119,31 @@ class TasksPanel(object):
             )
 
 
-class MetricsPanel(object):
+class MetricsPanel(CachedRenderable):
     def __init__(self) -> None:
+        super().__init__()
+
         self.displays: Dict[str, MetricDisplay] = {}
 
     def add_metric(self, scenario: str, metrics: Dict[str, str]):
         if scenario not in self.displays:
             self.displays[scenario] = MetricDisplay(scenario)
+            self.mark_changed()
 
         display = self.displays[scenario]
+        version = display.version
 
         display.update_metrics(metrics)
 
+        if display.version != version:
+            self.mark_changed()
+
     def remove_metric(self, scenario: str):
         if scenario in self.displays:
             del self.displays[scenario]
+            self.mark_changed()
 
-    def get_renderable(self):
+    def render(self):
         if self.displays == {}:
             return None
 
@@ -101,18 +153,30 @@ class MetricsPanel(object):
         )
 
 
-class LivePanel(object):
+class LivePanel(CachedRenderable):
     def __init__(
         self,
         test_name: str,
         tasks_panel: TasksPanel,
         metrics_panel: MetricsPanel,
     ):
+        super().__init__()
+
         self.test_name = test_name
         self.tasks_panel = tasks_panel
         self.metrics_panel = metrics_panel
+        self.__panel_versions = (tasks_panel.version, metrics_panel.version)
 
     def get_renderable(self):
+        panel_versions = (self.tasks_panel.version, self.metrics_panel.version)
+
+        if panel_versions != self.__panel_versions:
+            self.__panel_versions = panel_versions
+            self.mark_changed()
+
+        return super().get_renderable()
+
+    def render(self):
         tasks_panel_rendered = self.tasks_panel.get_renderable()
         metrics_panel_rendered = self.metrics_panel.get_renderable()
 
@@ -10,6 +10,9 @@ DOCKER_SCHEDULING_MODE = "DOCKER"
 KUBE_SCHEDULING_MODE = "KUBE"
 DEFAULT_SCHEDULING_MODE = LOCAL_SCHEDULING_MODE
 
+LIVE_OUTPUT = "live"
+JSONL_OUTPUT = "jsonl"
+
 DEFAULT_CONTEXT_STRING = base64.b64encode(json.dumps({}).encode("ascii")).decode(
     "ascii"
 )
@@ -24,4 +27,26 @@ CONTAINER_BACKEND_ADDRESS = "cicada-distributed-backend:8283"
 
 DEFAULT_BACKEND_ADDRESS = LOCALHOST_BACKEND_ADDRESS
 
+DEFAULT_BACKEND_READY_TRIES = 30
+BACKEND_READY_TIMEOUT = 0.5
+BACKEND_READY_INITIAL_WAIT = 0.02
+BACKEND_READY_MAX_WAIT = 0.5
+
 ONE_SEC_MS = 1000
+
+DEFAULT_MAX_RESULT_BATCHES = 20
+RESULT_LAG_METRIC = "result_lag"
+
+DEFAULT_MIN_POLL_INTERVAL = 0.05
+DEFAULT_MAX_POLL_INTERVAL = 1
+DEFAULT_METRICS_INTERVAL = 1
+DEFAULT_METRICS_DEADLINE = 0.5
+MAX_CONCURRENCY_ENV_VAR = "CICADA_MAX_CONCURRENT_SCENARIOS"
+
+DEFAULT_CACHE_DIR = "~/.cache/cicada"
+CACHE_DIR_ENV_VAR = "CICADA_CACHE_DIR"
+EXPORT_RESULTS_ENV_VAR = "CICADA_EXPORT_RESULTS_DIR"
+
+DEFAULT_HISTORY_DB = ".cicada/history.db"
+HISTORY_DB_ENV_VAR = "CICADA_HISTORY_DB"
+DEFAULT_HISTORY_RUNS = 10
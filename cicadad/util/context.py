@@ -1,7 +1,10 @@
-from typing import Any
+from typing import Any, Callable, Dict, Optional, Tuple
 import base64
+import hashlib
 import json
 
+CONTEXT_REFS_KEY = "__context_refs__"
+
 
 def encode_context(context: Any) -> str:
     """Encode a context as a base64 string
@@ -29,3 +32,62 @@ def decode_context(encoded_context: str) -> Any:
     )
 
     return json.loads(decoded_context_bytes.decode("ascii"))
+
+
+def hash_context_value(value: Any) -> Tuple[str, bytes]:
+    """Serialize a context value and hash its content.
+
+    Keys are sorted so equal values always get the same hash.
+
+    Args:
+        value (any): Context value. Must be json serializable
+
+    Returns:
+        Tuple[str, bytes]: Hex SHA-256 hash of value and serialized value
+    """
+    data = json.dumps(value, sort_keys=True).encode("utf-8")
+
+    return hashlib.sha256(data).hexdigest(), data
+
+
+def make_context_refs(refs: Dict[str, str]) -> dict:
+    """Create context that refers to stored values instead of containing them.
+
+    Args:
+        refs (Dict[str, str]): Map of context keys to content hashes
+
+    Returns:
+        dict: Context to encode and pass to scenario
+    """
+    return {CONTEXT_REFS_KEY: refs}
+
+
+def resolve_context(context: Any, get_value: Callable[[str], Optional[bytes]]) -> Any:
+    """Replace references in a context with the values they refer to.
+
+    Contexts without references are returned as is.
+
+    Args:
+        context (any): Decoded context
+        get_value (Callable[[str], Optional[bytes]]): Get stored value by hash
+
+    Raises:
+        ValueError: A referenced value is not stored
+
+    Returns:
+        any: Resolved context
+    """
+    if not isinstance(context, dict) or set(context) != {CONTEXT_REFS_KEY}:
+        return context
+
+    resolved = {}
+
+    for key, value_hash in context[CONTEXT_REFS_KEY].items():
+        data = get_value(value_hash)
+
+        if data is None:
+            raise ValueError(f"Context value for '{key}' not found: {value_hash}")
+
+        resolved[key] = json.loads(data.decode("utf-8"))
+
+    return resolved
@@ -1,6 +1,8 @@
 from contextlib import contextmanager
-from typing import TextIO
+from datetime import datetime
+from typing import Any, Dict, TextIO
 import io
+import json
 import sys
 
 
@@ -65,3 +67,29 @@ def stdout_redirect(buffer: io.TextIOBase):
         yield
     finally:
         sys.stdout = old_stdout
+
+
+class JSONLinesWriter:
+    def __init__(self, stream: TextIO):
+        """Write records to a stream as newline-delimited JSON, one per line
+
+        Args:
+            stream (TextIO): Stream to write records to (like sys.stdout)
+        """
+        self.stream = stream
+
+    def write(self, record_type: str, record: Dict[str, Any]):
+        """Write record and flush so readers tailing the stream see it right away
+
+        Args:
+            record_type (str): Kind of record, added as "type" field
+            record (Dict[str, Any]): JSON serializable fields of record
+        """
+        self.stream.write(
+            json.dumps(
+                {"type": record_type, "time": datetime.now().isoformat(), **record},
+                default=str,
+            )
+            + "\n"
+        )
+        self.stream.flush()
@@ -0,0 +1,47 @@
+from unittest.mock import Mock
+
+from cicadad.core.cache import ScenarioCache, scenario_cache_key
+from cicadad.core.scenario import Scenario
+
+
+def seed():
+    return 42
+
+
+def test_scenario_cache_key_inputs():
+    dep = Scenario(name="dep", fn=Mock())
+    s = Scenario(name="s", fn=seed, dependencies=[dep], cache_env=["REGION"])
+
+    key = scenario_cache_key(s, {"dep": {"output": 1}}, {"REGION": "a"})
+
+    assert key == scenario_cache_key(
+        s, {"dep": {"output": 1, "logs": "other"}}, {"REGION": "a", "OTHER": "b"}
+    )
+    assert key != scenario_cache_key(s, {"dep": {"output": 2}}, {"REGION": "a"})
+    assert key != scenario_cache_key(s, {"dep": {"output": 1}}, {"REGION": "b"})
+
+    s.tags = ["new"]
+
+    assert key != scenario_cache_key(s, {"dep": {"output": 1}}, {"REGION": "a"})
+
+
+def test_scenario_cache_put_get(tmp_path):
+    now = Mock(return_value=100)
+    cache = ScenarioCache(str(tmp_path / "cache"), clock=now)
+    result = {"output": 42, "exception": None}
+
+    assert cache.get("abc") is None
+
+    cache.put("abc", result, ttl=10)
+
+    assert cache.get("abc") == result
+
+    now.return_value = 111
+
+    assert cache.get("abc") is None
+
+
+def test_scenario_cache_unreadable(tmp_path):
+    (tmp_path / "abc.json").write_text("{not json")
+
+    assert ScenarioCache(str(tmp_path)).get("abc") is None
@@ -0,0 +1,74 @@
+from unittest.mock import Mock, patch
+import json
+
+from click.testing import CliRunner
+
+from cicadad.core import cli, runners, types
+from cicadad.core.scenario import Scenario
+from cicadad.util import constants
+
+
+def run_test_events(scenarios, cache) -> list:
+    backend = Mock()
+    backend.create_scenario.return_value = "id-fresh"
+    backend.move_scenario_result.return_value = {"output": 1, "exception": None}
+
+    with patch("cicadad.core.runners.time.sleep"), patch(
+        "cicadad.core.runners.scenario_cache_key",
+        side_effect=lambda scenario, results, env: f"key-{scenario.name}",
+    ):
+        runners.test_runner(scenarios, [], backend, cache=cache)
+
+    return [c[2]["event"] for c in backend.add_test_event.mock_calls] + [
+        types.TestEvent(kind="TEST_FINISHED", payload=types.TestStatus(message="done"))
+    ]
+
+
+@patch("cicadad.core.cli.time.sleep")
+@patch("cicadad.core.cli.cleanup")
+@patch("cicadad.core.cli.start_test_instance", return_value="t-123")
+@patch("cicadad.core.cli.CLIBackend")
+def test_run_cached_scenario(backend_mock, start_mock, cleanup_mock, sleep_mock):
+    cached = Scenario(
+        name="cached", fn=Mock(), console_metric_displays=None, cache_ttl=60
+    )
+    fresh = Scenario(
+        name="fresh", fn=Mock(), console_metric_displays=None, cache_ttl=60
+    )
+
+    cache = Mock()
+    cache.get.side_effect = lambda key: (
+        {"output": 2, "exception": None} if key == "key-cached" else None
+    )
+
+    backend_mock.return_value.get_test_events.return_value = run_test_events(
+        [cached, fresh], cache
+    )
+
+    result = CliRunner().invoke(
+        cli.cli,
+        [
+            "run",
+            "--mode",
+            constants.DOCKER_SCHEDULING_MODE,
+            "--image",
+            "test-image",
+            "--output",
+            "jsonl",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    events = [
+        (line["kind"], line["payload"]["scenario"])
+        for line in lines
+        if line["type"] == "event"
+    ]
+
+    # NOTE: cached scenario is reported as started before it is finished
+    assert events.index(("SCENARIO_STARTED", "cached")) < events.index(
+        ("SCENARIO_FINISHED", "cached")
+    )
+    assert lines[-1]["passed"] == ["cached", "fresh"]
@@ -1,7 +1,12 @@
-from unittest.mock import Mock
+from datetime import datetime, timedelta
+from unittest.mock import Mock, call
+
+from pytest import raises
 
 from cicadad.core import commands
-from cicadad.core.types import Result
+from cicadad.core.guards import ScenarioAbortedError, ScenarioGuard, error_rate
+from cicadad.core.types import MetricSummary, ReducedResults, Result, WindowSlot
+from cicadad.metrics.console import DEFAULT_METRIC_COLLECTORS
 
 
 def test_scale_users():
@@ -22,6 +27,23 @@ def test_scale_users():
     assert sc.num_users == 0
 
 
+def test_max_users():
+    scenario = Mock()
+    backend = Mock()
+    test_id = "abc"
+    scenario_id = "def"
+    context = {}
+
+    sc = commands.ScenarioCommands(scenario, test_id, scenario_id, backend, context)
+
+    sc.scale_users(10)
+    sc.scale_users(4)
+    sc.pool("other").scale_users(3)
+
+    assert sc.num_users == 4
+    assert sc.max_users == 13
+
+
 def test_stop_users_too_many():
     scenario = Mock()
     backend = Mock()
@@ -54,6 +76,209 @@ def test_get_latest_results():
     assert sc.num_results_collected == 3
 
 
+def test_get_latest_results_drains_full_batches():
+    scenario = Mock()
+    backend = Mock()
+
+    sc = commands.ScenarioCommands(scenario, "abc", "def", backend, {})
+
+    backend.move_user_results.side_effect = [
+        [Result(id="1"), Result(id="2")],
+        [Result(id="3"), Result(id="4")],
+        [Result(id="5")],
+    ]
+
+    results = sc.get_latest_results(limit=2)
+
+    assert [result.id for result in results] == ["1", "2", "3", "4", "5"]
+    assert backend.move_user_results.mock_calls == [
+        call(2, 1000),
+        call(2, None),
+        call(2, None),
+    ]
+
+
+def test_get_latest_results_exports_user_results():
+    scenario = Mock()
+    backend = Mock()
+    exporter = Mock()
+
+    sc = commands.ScenarioCommands(
+        scenario, "abc", "def", backend, {}, exporter=exporter
+    )
+
+    raw = Result(id="1")
+    partial = Result(
+        id="2",
+        output=ReducedResults(partial=None),
+        reduced_count=10,
+    )
+    sample = Result(id="3", reduced_count=0)
+
+    backend.move_user_results.return_value = [partial, sample, raw]
+
+    sc.get_latest_results()
+
+    # NOTE: exporter weights samples by the results they stand in for
+    exporter.add_results.assert_called_once_with([sample, raw])
+
+
+def test_window_stats_reduced_results():
+    scenario = Mock()
+    backend = Mock()
+
+    sc = commands.ScenarioCommands(scenario, "abc", "def", backend, {})
+
+    failures = [
+        Result(id=str(i), exception="boom", time_taken=1, reduced_count=0)
+        for i in range(100)
+    ]
+    samples = [Result(id=str(i), time_taken=1, reduced_count=0) for i in range(99)]
+    partial = Result(
+        id="partial",
+        output=ReducedResults(
+            partial=None,
+            window=WindowSlot(
+                count=10000,
+                errors=100,
+                histograms={"time_taken": {0: 10000}},
+                mins={"time_taken": 1},
+                maxes={"time_taken": 1},
+            ),
+        ),
+        succeeded=9900,
+        failed=100,
+        reduced_count=10000,
+    )
+
+    backend.move_user_results.return_value = [partial] + failures + samples
+
+    sc.get_latest_results()
+    stats = sc.window_stats()
+
+    assert stats.count == 10000
+    assert stats.error_rate == 0.01
+    assert stats.p50 == 1
+    assert sc.num_results_collected == 10000
+
+
+def test_get_latest_results_prefetch():
+    scenario = Mock()
+    backend = Mock()
+
+    sc = commands.ScenarioCommands(scenario, "abc", "def", backend, {})
+
+    backend.move_user_results.side_effect = [
+        [Result(id="1"), Result(id="2")],
+        [Result(id="3")],
+    ]
+
+    first = sc.get_latest_results(limit=2, max_batches=1)
+    second = sc.get_latest_results(limit=2, max_batches=1)
+
+    assert [result.id for result in first] == ["1", "2"]
+    assert [result.id for result in second] == ["3"]
+    assert backend.move_user_results.call_count == 2
+
+
+def test_close_collects_prefetched_results():
+    scenario = Mock(result_aggregator=None, result_verifier=None, metric_collectors=[])
+    backend = Mock()
+    exporter = Mock()
+
+    sc = commands.ScenarioCommands(
+        scenario, "abc", "def", backend, {}, exporter=exporter
+    )
+
+    backend.move_user_results.side_effect = [
+        [Result(id="1"), Result(id="2")],
+        [Result(id="3", output=3)],
+    ]
+
+    sc.get_latest_results(limit=2, max_batches=1)
+    sc.close()
+
+    assert sc.num_results_collected == 3
+    assert sc.aggregated_results == 3
+    assert exporter.add_results.call_args[0][0][0].id == "3"
+
+    # NOTE: nothing left to collect, executor is already shut down
+    sc.close()
+
+    assert backend.move_user_results.call_count == 2
+
+
+def test_result_lag():
+    scenario = Mock()
+    backend = Mock()
+
+    sc = commands.ScenarioCommands(scenario, "abc", "def", backend, {})
+
+    backend.move_user_results.return_value = [
+        Result(id="1", timestamp=datetime.now() - timedelta(seconds=5)),
+        Result(id="2", timestamp=datetime.now()),
+    ]
+
+    sc.get_latest_results()
+
+    assert 5 <= sc.result_lag < 6
+    backend.add_metric.assert_called_once_with("result_lag", sc.result_lag)
+
+
+def test_get_latest_results_abort():
+    scenario = Mock()
+    backend = Mock()
+
+    scenario.result_aggregator = lambda previous, latest: len(latest)
+    scenario.result_verifier = lambda latest: [str(r.exception) for r in latest]
+    scenario.metric_collectors = [Mock()]
+
+    backend.create_pool.return_value = Mock(move_user_results=Mock(return_value=[]))
+
+    guard = ScenarioGuard([(error_rate > 0.5).configure(window=10, min_count=2)])
+    sc = commands.ScenarioCommands(scenario, "abc", "def", backend, {}, guard=guard)
+
+    backend.move_user_results.return_value = [
+        Result(id="1", exception="boom"),
+        Result(id="2", exception="boom"),
+    ]
+
+    with raises(ScenarioAbortedError):
+        sc.get_latest_results()
+
+    # NOTE: batch that aborted scenario is still counted
+    assert sc.aggregated_results == 2
+    assert [group.count for group in sc.error_groups] == [2]
+    scenario.metric_collectors[0].assert_called_once()
+
+    # NOTE: pools share guard of scenario
+    with raises(ScenarioAbortedError):
+        sc.pool("spike").get_latest_results()
+
+
+def test_pool():
+    scenario = Mock()
+    backend = Mock()
+    pool_backend = Mock()
+
+    backend.create_pool.return_value = pool_backend
+    pool_backend.move_user_results.return_value = [
+        Result(id="1", output=1),
+        Result(id="2", output=2),
+    ]
+
+    sc = commands.ScenarioCommands(scenario, "abc", "def", backend, {})
+
+    pool = sc.pool("spike")
+    results = pool.get_latest_results()
+
+    assert sc.pool("spike") is pool
+    backend.create_pool.assert_called_once_with("spike")
+    assert [result.pool for result in results] == ["spike", "spike"]
+    assert pool.num_results_collected == 2
+    assert sc.num_results_collected == 2
+
+
 def test_aggregate_results():
     scenario = Mock()
     backend = Mock()
@@ -80,6 +305,57 @@ def test_aggregate_results():
     assert sc.aggregated_results == 6
 
 
+def test_aggregate_partial_results():
+    scenario = Mock()
+    backend = Mock()
+
+    sc = commands.ScenarioCommands(scenario, "abc", "def", backend, {})
+
+    scenario.result_merger = lambda previous, partial: (previous or 0) + partial
+    scenario.result_verifier = Mock(return_value=[])
+    scenario.metric_collectors = DEFAULT_METRIC_COLLECTORS + [Mock()]
+
+    summary = MetricSummary(count=1, sum=1, min=1, max=1, last=1, sum_of_squares=1)
+    now = datetime.now()
+    results = [
+        Result(
+            id="1",
+            output=ReducedResults(
+                partial=2,
+                metrics={"foo": summary},
+                last_timestamp=now + timedelta(seconds=2),
+            ),
+            timestamp=now,
+            reduced_count=2,
+        ),
+        Result(id="2", output=5, exception="boom", time_taken=3, reduced_count=0),
+    ]
+
+    backend.move_user_results.return_value = results
+
+    latest_results = sc.get_latest_results()
+
+    assert sc.aggregate_results(latest_results) == 2
+    assert sc.num_results_collected == 2
+
+    sc.verify_results(latest_results)
+    scenario.result_verifier.assert_called_once_with([results[1]])
+
+    sc.collect_datastore_metrics(latest_results)
+
+    backend.add_metric_summary.assert_called_once_with("foo", summary)
+
+    # NOTE: only results per second is collected by scenario, other collectors
+    # were already run by user manager
+    scenario.metric_collectors[-1].assert_not_called()
+    assert backend.add_metric.mock_calls[-1] == call("results_per_second", 1)
+    assert [
+        c
+        for c in backend.add_metric.mock_calls
+        if c[1][0] in ["runtime", "pass_or_fail"]
+    ] == []
+
+
 def test_aggregate_results_default():
     scenario = Mock()
     backend = Mock()
@@ -115,6 +391,21 @@ def test_verify_results():
     assert sc.verify_results([False, True]) == ["error"]
 
 
+def test_verify_results_grouped():
+    scenario = Mock()
+    backend = Mock()
+
+    sc = commands.ScenarioCommands(scenario, "abc", "def", backend, {})
+
+    scenario.result_verifier = lambda results: [f"error {r}" for r in results]
+
+    sc.verify_results([1, 2, 3])
+
+    assert sc.num_errors == 3
+    assert len(sc.errors) == 1
+    assert sc.error_groups[0].count == 3
+
+
 def test_is_up():
     scenario = Mock()
     user_id = "abc"
@@ -227,3 +518,50 @@ def test_run_exception():
     assert isinstance(exception, ValueError)
     assert str(exception) == "some error"
     assert logs == ""
+
+
+def test_window_stats():
+    scenario = Mock()
+    backend = Mock()
+    test_id = "abc"
+    scenario_id = "def"
+    context = {}
+
+    sc = commands.ScenarioCommands(scenario, test_id, scenario_id, backend, context)
+
+    backend.move_user_results.return_value = [
+        Result(time_taken=1),
+        Result(time_taken=2, exception="foo"),
+    ]
+
+    sc.get_latest_results()
+
+    stats = sc.window_stats("time_taken", 10)
+
+    assert stats.count == 2
+    assert stats.error_rate == 0.5
+    assert stats.max == 2
+
+
+def test_add_work_items():
+    scenario = Mock()
+    backend = Mock()
+
+    sc = commands.ScenarioCommands(scenario, "abc", "def", backend, {})
+
+    sc.add_work_items(["a", "b"])
+
+    backend.distribute_work_items.assert_called_once_with([b"a", b"b"])
+
+
+def test_get_work_item():
+    scenario = Mock()
+    backend = Mock()
+    user_id = "abc"
+
+    uc = commands.UserCommands(scenario, user_id, backend)
+
+    backend.get_work_item.side_effect = [b"a", None]
+
+    assert uc.get_work_item() == "a"
+    assert uc.get_work_item() is None
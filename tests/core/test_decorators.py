@@ -1,6 +1,6 @@
 from unittest.mock import Mock
 
-from cicadad.core import decorators, scenario
+from cicadad.core import decorators, guards, scenario
 from cicadad.metrics.collectors import runtime_seconds
 from cicadad.metrics.console import console_collector, console_stats
 
@@ -171,4 +171,21 @@ def test_add_console_metrics_displays():
     def test_fn():
         return 42
 
-    assert len(test_fn.console_metric_displays) == 4
+    assert len(test_fn.console_metric_displays) == 5
+
+
+def test_abort_if():
+    e = Mock()
+
+    @decorators.scenario(e)
+    @decorators.abort_if(guards.p99 > 2)
+    @decorators.abort_if(guards.error_rate > 0.2, window=60, min_count=1)
+    def test_fn():
+        return 42
+
+    assert [repr(c) for c in test_fn.abort_conditions] == [
+        "error_rate > 0.2",
+        "p99 > 2",
+    ]
+    assert [c.window for c in test_fn.abort_conditions] == [60, 30]
+    assert [c.min_count for c in test_fn.abort_conditions] == [1, 10]
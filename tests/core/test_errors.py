@@ -0,0 +1,75 @@
+from datetime import datetime
+
+from cicadad.core import errors
+
+
+def test_error_fingerprint():
+    assert (
+        errors.error_fingerprint(
+            "\n* <class 'ValueError'>: user 12 failed at 0x7f3a\nsome logs"
+        )
+        == "* <class 'ValueError'>: user <n> failed at <address>"
+    )
+
+
+def test_error_fingerprint_id():
+    assert (
+        errors.error_fingerprint(
+            "KeyError: 'c9b8f4e2-3a1d-4c5b-9e8f-0a1b2c3d4e5f' missing"
+        )
+        == "KeyError: '<id>' missing"
+    )
+
+
+def test_add_errors_groups():
+    collector = errors.ErrorCollector(max_samples=2)
+
+    first = datetime(2021, 1, 1)
+    last = datetime(2021, 1, 2)
+
+    collector.add_errors(["error 1", "error 2", "other"], now=first)
+    collector.add_errors(["error 3"], now=last)
+
+    assert collector.num_errors == 4
+    assert [(g.fingerprint, g.count) for g in collector.groups] == [
+        ("error <n>", 3),
+        ("other", 1),
+    ]
+
+    group = collector.groups[0]
+
+    assert group.samples == ["error 1", "error 2"]
+    assert group.first_seen == first
+    assert group.last_seen == last
+
+
+def test_add_errors_max_groups():
+    collector = errors.ErrorCollector(max_groups=1)
+
+    collector.add_errors(["a", "b", "c"])
+
+    assert [(g.fingerprint, g.count) for g in collector.groups] == [
+        ("a", 1),
+        (errors.OVERFLOW_FINGERPRINT, 2),
+    ]
+
+
+def test_add_errors_memory_budget():
+    collector = errors.ErrorCollector(max_sample_length=4, memory_budget=6)
+
+    collector.add_errors(["a: long error", "b: error", "c"])
+
+    assert [g.samples for g in collector.groups] == [["a: l"], [], ["c"]]
+    assert collector.num_errors == 3
+
+
+def test_format_groups():
+    collector = errors.ErrorCollector()
+    seen = datetime(2021, 1, 1)
+
+    collector.add_errors(["error 1", "error 2", "other"], now=seen)
+
+    assert collector.format_groups() == [
+        f"error 1\n(raised 2 times, first seen {seen}, last seen {seen})",
+        "other",
+    ]
@@ -0,0 +1,86 @@
+from unittest.mock import Mock
+
+from pytest import raises
+
+from cicadad.core import guards
+from cicadad.core.types import WindowStats
+
+
+def make_stats(**kwargs):
+    stats = dict(
+        seconds=30,
+        count=100,
+        throughput=10,
+        error_rate=0,
+        min=None,
+        max=None,
+        p50=None,
+        p90=None,
+        p95=None,
+        p99=None,
+    )
+    stats.update(kwargs)
+
+    return WindowStats(**stats)
+
+
+def test_condition():
+    condition = guards.error_rate > 0.2
+
+    assert condition.statistic == "error_rate"
+    assert condition.comparison == ">"
+    assert condition.threshold == 0.2
+    assert condition.evaluate(make_stats(error_rate=0.1)) is None
+    assert (
+        condition.evaluate(make_stats(error_rate=0.5))
+        == "error_rate > 0.2 over last 30s (was 0.5)"
+    )
+
+
+def test_condition_reflected():
+    condition = 5 > guards.throughput
+
+    assert condition.comparison == "<"
+    assert condition.evaluate(make_stats(throughput=1)) is not None
+
+
+def test_condition_metric():
+    condition = guards.p99.of("output") >= 2
+
+    assert condition.metric == "output"
+    assert condition.evaluate(make_stats(p99=2)) is not None
+
+
+def test_condition_min_count():
+    condition = (guards.error_rate > 0.2).configure(window=10, min_count=10)
+
+    assert condition.evaluate(make_stats(count=5, error_rate=1)) is None
+
+
+def test_condition_missing_statistic():
+    condition = guards.p99 > 2
+
+    assert condition.evaluate(make_stats(p99=None)) is None
+
+
+def test_guard_check():
+    guard = guards.ScenarioGuard([(guards.p99 > 2).configure(10, 1)])
+    window_stats = Mock(return_value=make_stats(p99=1))
+
+    guard.check(window_stats)
+
+    window_stats.assert_called_once_with("time_taken", 10)
+    assert guard.reason is None
+
+    window_stats.return_value = make_stats(p99=3)
+
+    with raises(guards.ScenarioAbortedError):
+        guard.check(window_stats)
+
+    # NOTE: stays aborted for other pools checking guard
+    window_stats.return_value = make_stats(p99=1)
+
+    with raises(guards.ScenarioAbortedError):
+        guard.check(window_stats)
+
+    assert guard.reason == "p99 > 2 over last 10s (was 3)"
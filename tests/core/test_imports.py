@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+# NOTE: modules that take a noticeable share of startup time to import
+HEAVY_MODULES = ["distributed", "dask", "docker", "blessed", "configobj", "pyarrow"]
+
+
+def imported_modules(statement: str) -> list:
+    # NOTE: fresh interpreter, modules imported by other tests would leak otherwise
+    output = subprocess.run(  # nosec
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {statement}; "
+            f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))",
+        ],
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    ).stdout
+
+    return output.split()
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import cicadad.core.cli",
+        "import cicadad.core.engine",
+        "import cicadad.core.decorators",
+        "from cicadad.core.engine import engine_cli",
+    ],
+)
+def test_entry_points_import_only_what_they_need(statement):
+    assert imported_modules(statement) == []
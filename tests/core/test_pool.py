@@ -0,0 +1,201 @@
+from unittest.mock import Mock, patch
+import json
+import os
+import socket
+import threading
+
+from pytest import raises
+
+from cicadad.core import pool
+
+
+def make_request(user_manager_id="um-1", **kwargs):
+    return pool.UserManagerRequest(
+        command=pool.START_USER_MANAGER,
+        user_manager_id=user_manager_id,
+        name="s",
+        backend_address="localhost:8283",
+        encoded_context="e30=",
+        **kwargs,
+    )
+
+
+@patch("cicadad.core.pool.os.waitpid", side_effect=ChildProcessError())
+@patch("cicadad.core.pool.os.kill")
+@patch("cicadad.core.pool.os.fork", return_value=123)
+def test_pool_start_stop(fork, kill, waitpid):
+    run_user = Mock()
+    user_manager_pool = pool.UserManagerPool(run_user)
+
+    assert user_manager_pool.handle(make_request()) == {"pid": 123}
+    assert user_manager_pool.handle(
+        pool.UserManagerRequest(command=pool.CHECK_USER_MANAGER, user_manager_id="um-1")
+    ) == {"running": True}
+    assert user_manager_pool.handle(
+        pool.UserManagerRequest(command=pool.STOP_USER_MANAGER, user_manager_id="um-1")
+    ) == {"stopped": True}
+    assert user_manager_pool.user_manager_ids == []
+
+    kill.assert_called_once_with(123, pool.signal.SIGKILL)
+    run_user.assert_not_called()
+
+
+@patch("cicadad.core.pool.os.waitpid", side_effect=[(123, 0), (0, 0)])
+@patch("cicadad.core.pool.os.fork", return_value=123)
+def test_pool_reaps_finished_user_managers(fork, waitpid):
+    user_manager_pool = pool.UserManagerPool(Mock())
+
+    user_manager_pool.start(make_request())
+
+    assert user_manager_pool.handle(
+        pool.UserManagerRequest(command=pool.CHECK_USER_MANAGER, user_manager_id="um-1")
+    ) == {"running": False}
+
+
+@patch("cicadad.core.pool.os.waitpid", side_effect=ChildProcessError())
+@patch("cicadad.core.pool.os.kill")
+@patch("cicadad.core.pool.os.fork", side_effect=[1, 2])
+def test_pool_shutdown(fork, kill, waitpid):
+    user_manager_pool = pool.UserManagerPool(Mock())
+
+    user_manager_pool.start(make_request())
+    user_manager_pool.start(make_request("um-2"))
+    user_manager_pool.handle(pool.UserManagerRequest(command=pool.SHUTDOWN_POOL))
+
+    assert kill.call_count == 2
+    assert user_manager_pool.closed
+
+
+def test_pool_unknown_command():
+    with raises(ValueError):
+        pool.UserManagerPool(Mock()).handle(pool.UserManagerRequest(command="bad"))
+
+
+@patch("cicadad.core.pool.os._exit", side_effect=SystemExit)
+@patch("cicadad.core.pool.os.fork", return_value=0)
+def test_pool_child_runs_user_manager(fork, exit_fn):
+    env = []
+    run_user = Mock(side_effect=lambda *args: env.append(os.getenv("CICADA_POOL")))
+    after_fork = Mock()
+    user_manager_pool = pool.UserManagerPool(run_user, after_fork=after_fork)
+
+    with patch.dict(os.environ), raises(SystemExit):
+        user_manager_pool.start(make_request(env={"CICADA_POOL": "1"}))
+
+    assert env == ["1"]
+
+    after_fork.assert_called_once()
+    run_user.assert_called_once_with("s", "um-1", "localhost:8283", "e30=")
+    exit_fn.assert_called_once_with(0)
+
+
+@patch("cicadad.core.pool.os._exit", side_effect=SystemExit)
+@patch("cicadad.core.pool.os.fork", return_value=0)
+def test_pool_child_failed(fork, exit_fn):
+    run_user = Mock(side_effect=RuntimeError("failed"))
+
+    with raises(SystemExit):
+        pool.UserManagerPool(run_user).start(make_request())
+
+    exit_fn.assert_called_once_with(1)
+
+
+def test_pool_server(tmp_path):
+    address = f"unix:{tmp_path / 'pool.sock'}"
+    handler = Mock(side_effect=[{"running": False}, ValueError("bad")])
+    server = pool.make_pool_server(address, handler)
+    thread = threading.Thread(target=lambda: [server.handle_request() for _ in "ab"])
+
+    thread.start()
+
+    def send(request: dict) -> dict:
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(str(tmp_path / "pool.sock"))
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+            return json.loads(client.makefile().readline())
+
+    try:
+        assert send({"command": "check", "user_manager_id": "um-1"}) == {
+            "running": False
+        }
+        assert send({"command": "start"}) == {"error": "bad"}
+    finally:
+        thread.join()
+        server.server_close()
+
+    assert handler.call_args_list[0][0][0].user_manager_id == "um-1"
+
+
+def test_fork_service(tmp_path):
+    closed = tmp_path / "closed"
+
+    def start_service():
+        return "localhost:8786", lambda: closed.write_text("closed")
+
+    pid, address = pool.fork_service(start_service, check_interval=0.01)
+
+    os.kill(pid, pool.signal.SIGTERM)
+    _, status = os.waitpid(pid, 0)
+
+    assert address == "localhost:8786"
+    assert os.WEXITSTATUS(status) == 0
+    assert closed.read_text() == "closed"
+
+
+def test_fork_service_failed():
+    def start_service():
+        raise RuntimeError("failed")
+
+    with raises(RuntimeError):
+        pool.fork_service(start_service)
+
+
+@patch("cicadad.core.pool.os.getpid", return_value=42)
+def test_host_start_stop(getpid):
+    step = Mock()
+    make_user_manager = Mock(return_value=step)
+    host = pool.UserManagerHost(make_user_manager)
+
+    assert host.handle(make_request()) == {"pid": 42}
+    assert host.user_manager_ids == ["um-1"]
+    make_user_manager.assert_called_once()
+
+    host.step()
+
+    assert host.handle(
+        pool.UserManagerRequest(command=pool.STOP_USER_MANAGER, user_manager_id="um-1")
+    ) == {"stopped": True}
+    assert host.handle(
+        pool.UserManagerRequest(command=pool.CHECK_USER_MANAGER, user_manager_id="um-1")
+    ) == {"running": False}
+
+    # NOTE: stopping user manager flushes its results one last time
+    assert step.call_count == 2
+
+
+def test_host_step_continues_after_error():
+    failing_step = Mock(side_effect=RuntimeError("failed"))
+    step = Mock()
+    host = pool.UserManagerHost(Mock(side_effect=[failing_step, step]))
+
+    host.start(make_request("um-1"))
+    host.start(make_request("um-2"))
+    host.step()
+
+    failing_step.assert_called_once()
+    step.assert_called_once()
+
+
+def test_host_shutdown():
+    step = Mock()
+    host = pool.UserManagerHost(Mock(return_value=step))
+
+    host.start(make_request())
+
+    assert host.handle(pool.UserManagerRequest(command=pool.SHUTDOWN_POOL)) == {
+        "stopped": True
+    }
+    assert host.closed
+    assert host.user_manager_ids == []
+    step.assert_called_once()
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from cicadad.core import reduction
+from cicadad.core.types import MetricSummary, ReducedResults, Result
+from cicadad.metrics.console import DEFAULT_METRIC_COLLECTORS, console_collector
+from cicadad.metrics.window import make_histogram, make_window_slot
+
+
+def test_merge_metric_summaries():
+    first = MetricSummary(
+        count=2, sum=3, min=1, max=2, last=2, sum_of_squares=5, histogram={0: 1, 69: 1}
+    )
+    second = MetricSummary(
+        count=1, sum=4, min=4, max=4, last=4, sum_of_squares=16, histogram={139: 1}
+    )
+
+    assert reduction.merge_metric_summaries(first, second) == MetricSummary(
+        count=3,
+        sum=7,
+        min=1,
+        max=4,
+        last=4,
+        sum_of_squares=21,
+        histogram={0: 1, 69: 1, 139: 1},
+    )
+
+
+def test_metric_recorder():
+    recorder = reduction.MetricRecorder()
+
+    recorder.add_metric("foo", 1)
+    recorder.add_metric("foo", 3)
+
+    assert recorder.summaries["foo"] == MetricSummary(
+        count=2,
+        sum=4,
+        min=1,
+        max=3,
+        last=3,
+        sum_of_squares=10,
+        histogram=make_histogram([1, 3]),
+    )
+
+
+@patch("cicadad.core.reduction.random.random")
+def test_reduce_results(random_mock):
+    random_mock.side_effect = [0.5, 0.001]
+
+    now = datetime.now()
+    results = [
+        Result(id="1", output=1, time_taken=1, timestamp=now),
+        Result(id="2", output=2, time_taken=2, timestamp=now + timedelta(seconds=1)),
+        Result(id="3", exception="boom", time_taken=3),
+    ]
+
+    reduced = reduction.reduce_results(
+        results,
+        lambda previous, latest: len(latest),
+        [console_collector("time", lambda rs: [r.time_taken for r in rs])],
+        sample_rate=0.01,
+    )
+
+    partial = reduced[0]
+
+    assert partial.reduced_count == 3
+    assert partial.succeeded == 2
+    assert partial.failed == 1
+    assert partial.timestamp == now
+    assert partial.output == ReducedResults(
+        partial=3,
+        metrics={
+            "time": MetricSummary(
+                count=3,
+                sum=6,
+                min=1,
+                max=3,
+                last=3,
+                sum_of_squares=14,
+                histogram=make_histogram([1, 2, 3]),
+            )
+        },
+        window=make_window_slot(results),
+        last_timestamp=now + timedelta(seconds=1),
+    )
+    assert partial.output.window.count == 3
+    assert partial.output.window.errors == 1
+    assert [result.id for result in reduced[1:]] == ["2", "3"]
+    assert [result.reduced_count for result in reduced[1:]] == [0, 0]
+
+
+def test_reduce_results_empty():
+    assert reduction.reduce_results([], lambda p, r: None, []) == []
+
+
+def test_result_count():
+    assert reduction.result_count(Result(id="1")) == 1
+    assert reduction.result_count(Result(id="1", reduced_count=0)) == 0
+    assert reduction.result_count(Result(id="1", reduced_count=5)) == 5
+    assert reduction.result_count(1) == 1
+
+
+def test_reduce_results_skips_results_per_second():
+    collector = Mock()
+
+    reduced = reduction.reduce_results(
+        [Result(id="1", time_taken=1)],
+        lambda previous, latest: None,
+        DEFAULT_METRIC_COLLECTORS + [collector],
+    )
+
+    # NOTE: results per second is collected by scenario
+    assert set(reduced[0].output.metrics) == {"runtime", "pass_or_fail"}
+    collector.assert_called_once()
@@ -1,7 +1,10 @@
 from datetime import datetime
 from unittest.mock import Mock, patch
+import json
+
 from cicadad.core import runners
 from cicadad.core.scenario import Scenario
+from cicadad.util.context import decode_context, make_context_refs
 
 
 def test_filter_scenarios():
@@ -66,11 +69,133 @@ def test_test_runner():
 
     backend.move_scenario_result.side_effect = [r1, r2]
     backend.create_scenario.side_effect = ["s1", "s2", "s3"]
+    backend.save_context_value.return_value = "hash-s1"
 
     runners.test_runner(ss, tags, backend)
 
     assert backend.add_test_event.call_count == 8
     assert backend.create_scenario.call_count == 2
+    # NOTE: failed s2 result is not stored, s3 is skipped
+    backend.save_context_value.assert_called_once_with(r1)
+    assert decode_context(
+        backend.create_scenario.mock_calls[1][2]["context"]
+    ) == make_context_refs({"s1": "hash-s1"})
+
+
+@patch("cicadad.core.runners.time.sleep")
+def test_test_runner_context_deltas(sleep_mock):
+    s1 = Scenario(name="s1", fn=Mock(), console_metric_displays=None)
+    s2 = Scenario(name="s2", fn=Mock(), console_metric_displays=None)
+
+    backend = Mock()
+    r1 = {"output": 1, "exception": None}
+    r2 = {"output": 2, "exception": None}
+
+    backend.create_scenario.side_effect = ["id-s1", "id-s2"]
+    backend.move_scenario_result.side_effect = [r1, r2]
+
+    runners.test_runner([s1, s2], [], backend)
+
+    finished = [
+        c[2]["event"].payload.context
+        for c in backend.add_test_event.mock_calls
+        if c[2]["event"].kind == "SCENARIO_FINISHED"
+    ]
+
+    assert [json.loads(context) for context in finished] == [{"s1": r1}, {"s2": r2}]
+    # NOTE: no dependents, nothing to store
+    backend.save_context_value.assert_not_called()
+
+
+@patch("cicadad.core.runners.time.sleep")
+def test_test_runner_max_concurrency(sleep_mock):
+    low = Scenario(name="low", fn=Mock(), console_metric_displays=None)
+    high = Scenario(name="high", fn=Mock(), console_metric_displays=None, priority=10)
+    last = Scenario(
+        name="last", fn=Mock(), console_metric_displays=None, dependencies=[low]
+    )
+
+    backend = Mock()
+    result = {"output": None, "exception": None}
+
+    backend.create_scenario.side_effect = ["id-high", "id-low", "id-last"]
+    backend.save_context_value.return_value = "hash-low"
+    backend.move_scenario_result.side_effect = [None, result, result, result]
+
+    runners.test_runner([low, high, last], [], backend, max_concurrency=1)
+
+    assert [c[2]["scenario_name"] for c in backend.create_scenario.mock_calls] == [
+        "high",
+        "low",
+        "last",
+    ]
+    assert [c[1][0] for c in backend.move_scenario_result.mock_calls] == [
+        "id-high",
+        "id-high",
+        "id-low",
+        "id-last",
+    ]
+    # NOTE: only slept while waiting on first result
+    assert sleep_mock.call_count == 1
+
+
+@patch("cicadad.core.runners.time.sleep")
+def test_test_runner_missing_dependency(sleep_mock):
+    dep = Scenario(name="dep", fn=Mock(), tags=["other"])
+    s = Scenario(name="s", fn=Mock(), tags=["mine"], dependencies=[dep])
+
+    backend = Mock()
+
+    runners.test_runner([dep, s], ["mine"], backend)
+
+    backend.create_scenario.assert_not_called()
+    assert (
+        backend.add_test_event.mock_calls[1][2]["event"].payload.message
+        == "Skipped Scenario: s"
+    )
+
+
+@patch("cicadad.core.runners.time.sleep")
+def test_test_runner_cache(sleep_mock):
+    cached = Scenario(
+        name="cached", fn=Mock(), console_metric_displays=None, cache_ttl=60
+    )
+    fresh = Scenario(
+        name="fresh", fn=Mock(), console_metric_displays=None, cache_ttl=60
+    )
+
+    backend = Mock()
+    cache = Mock()
+    result = {"output": 1, "exception": None}
+
+    cache.get.side_effect = lambda key: result if key == "key-cached" else None
+    backend.create_scenario.return_value = "id-fresh"
+    backend.move_scenario_result.return_value = result
+
+    with patch(
+        "cicadad.core.runners.scenario_cache_key",
+        side_effect=lambda scenario, results, env: f"key-{scenario.name}",
+    ):
+        runners.test_runner([cached, fresh], [], backend, cache=cache)
+
+    assert [c[2]["scenario_name"] for c in backend.create_scenario.mock_calls] == [
+        "fresh"
+    ]
+    cache.put.assert_called_once_with("key-fresh", result, 60)
+
+
+def test_critical_path():
+    a = Scenario(name="a", fn=Mock())
+    b = Scenario(name="b", fn=Mock())
+    c = Scenario(name="c", fn=Mock(), dependencies=[a, b])
+    d = Scenario(name="d", fn=Mock(), dependencies=[c])
+
+    path, seconds = runners.critical_path(
+        [a, b, c, d], {"a": 1, "b": 5, "c": 2, "d": 1}
+    )
+
+    assert path == ["b", "c", "d"]
+    assert seconds == 8
 
 
 def test_run_scenario():
@@ -139,6 +264,7 @@ def test_run_scenario_exception(scenario_commands_mock):
     scenario_commands = scenario_commands_mock.return_value
 
     scenario_commands.errors = ["some error"]
+    scenario_commands.num_errors = 1
     scenario_commands.aggregated_results = None
 
     s.output_transformer = None
@@ -162,3 +288,31 @@ def test_run_scenario_exception(scenario_commands_mock):
         type(backend.set_scenario_result.mock_calls[0][2]["exception"])
         == AssertionError
     )
+
+
+def test_flush_user_results():
+    s = Mock()
+    backend = Mock()
+
+    s.result_reducer = None
+
+    runners.flush_user_results(s, backend)
+
+    backend.send_user_results.assert_called_once()
+    backend.send_results.assert_not_called()
+
+
+@patch("cicadad.core.runners.reduce_results")
+def test_flush_user_results_reduced(reduce_results_mock):
+    s = Mock()
+    backend = Mock()
+
+    backend.move_user_results.return_value = [1, 2]
+
+    runners.flush_user_results(s, backend)
+
+    reduce_results_mock.assert_called_once_with(
+        [1, 2], s.result_reducer, s.metric_collectors, s.reduced_sample_rate
+    )
+    backend.send_results.assert_called_once_with(reduce_results_mock.return_value)
+    backend.send_user_results.assert_not_called()
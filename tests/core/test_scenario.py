@@ -1,7 +1,8 @@
-from unittest.mock import Mock, patch, call
+from unittest.mock import Mock, PropertyMock, patch, call
 from pytest import raises
 
 from cicadad.core import scenario as scenario_module
+from cicadad.metrics.convergence import ConvergenceCriterion
 
 
 def test_while_has_work():
@@ -20,6 +21,23 @@ def test_while_has_work():
     assert uc.report_result.call_count == 1
 
 
+def test_while_has_work_items():
+    closure = scenario_module.while_has_work_items(500)
+
+    uc = Mock()
+    ctx = {}
+
+    uc.is_up.side_effect = [True, True, False]
+    uc.get_work_item.side_effect = ["a", None]
+    uc.run.return_value = 42, None, ""
+
+    closure(uc, ctx)
+
+    uc.get_work_item.assert_called_with(500)
+    uc.run.assert_called_once_with(context=ctx, work_item="a")
+    assert uc.report_result.call_count == 1
+
+
 def test_while_alive():
     closure = scenario_module.while_alive()
 
@@ -93,6 +111,47 @@ def test_n_seconds():
     assert sc.scale_users.mock_calls[0] == call(2)
 
 
+@patch("cicadad.core.scenario.time.sleep")
+@patch("cicadad.core.scenario.ConvergenceEstimator")
+def test_n_seconds_convergence(estimator_mock, sleep_mock):
+    estimator = estimator_mock.return_value
+    type(estimator).converged = PropertyMock(side_effect=[False, True])
+    estimator.estimates.return_value = {"mean": 1}
+
+    closure = scenario_module.n_seconds(
+        600, 2, convergence=ConvergenceCriterion(window_seconds=1)
+    )
+
+    sc = Mock()
+
+    sc.get_latest_results.side_effect = [[1], [2, 3]]
+
+    closure(sc, {})
+
+    assert estimator.add_results.mock_calls == [call([1]), call([2, 3])]
+    assert sc.add_metric.mock_calls[0][1][0] == "convergence_saved_seconds"
+    assert sc.add_metric.mock_calls[0][1][1] > 590
+    assert sc.scale_users.mock_calls[-1] == call(0)
+
+
+@patch("cicadad.core.scenario.time.sleep")
+@patch("cicadad.core.scenario.ConvergenceEstimator")
+def test_n_iterations_convergence(estimator_mock, sleep_mock):
+    estimator = estimator_mock.return_value
+    estimator.converged = True
+    estimator.estimates.return_value = {}
+
+    closure = scenario_module.n_iterations(10, 2, convergence=ConvergenceCriterion())
+
+    sc = Mock()
+
+    sc.get_latest_results.side_effect = [[1, 2, 3]]
+
+    closure(sc, {})
+
+    sc.add_metric.assert_called_once_with("convergence_saved_iterations", 7)
+
+
 def test_n_users_ramping_add_users():
     # NOTE: depends on real time
     closure = scenario_module.n_users_ramping(6, 5)
@@ -163,6 +222,143 @@ def test_n_users_ramping_stop_users():
     assert sc.stop_users_calls == 4
 
 
+@patch("cicadad.core.scenario.time")
+def test_pid_users_to_target(time_mock):
+    closure = scenario_module.pid_users_to_target(
+        1,
+        initial_users=10,
+        max_step=5,
+        kp=10,
+        ki=0,
+        period_duration=0,
+        settle_periods=2,
+    )
+
+    class ScenarioCommandsMock:
+        def __init__(self):
+            self.num_users = 0
+            self.aggregated_results = None
+            self.metrics = []
+
+        def scale_users(self, n):
+            self.num_users = n
+
+        def window_stats(self, seconds):
+            # latency grows by 0.1 seconds per user
+            return Mock(p95=self.num_users / 10)
+
+        def add_metric(self, name, value):
+            self.metrics.append((name, value))
+
+    sc = ScenarioCommandsMock()
+    ctx = {}
+
+    sc.get_latest_results = Mock()
+    sc.aggregate_results = Mock()
+    sc.verify_results = Mock()
+    sc.collect_datastore_metrics = Mock()
+
+    closure(sc, ctx)
+
+    assert sc.num_users == 0
+    assert sc.aggregated_results == "Users: 10"
+    assert ("pid_users", 10) in sc.metrics
+
+
+@patch("cicadad.core.scenario.time")
+def test_pid_users_to_target_max_step(time_mock):
+    closure = scenario_module.pid_users_to_target(
+        100,
+        statistic="throughput",
+        initial_users=1,
+        max_users=12,
+        max_step=5,
+        period_duration=0,
+        period_limit=3,
+        skip_scaledown=True,
+    )
+
+    sc = Mock()
+    ctx = {}
+
+    sc.num_users = 1
+    sc.window_stats.return_value = Mock(throughput=1)
+
+    def scale_users(n):
+        sc.num_users = n
+
+    sc.scale_users.side_effect = scale_users
+
+    closure(sc, ctx)
+
+    assert sc.scale_users.mock_calls == [call(1), call(6), call(11), call(12)]
+
+
+@patch("cicadad.core.scenario.time")
+def test_load_shape(time_mock):
+    # NOTE: depends on real time
+    closure = scenario_module.load_shape(
+        [
+            {"kind": "step", "duration": 0.2, "target": 5},
+            {"kind": "step", "duration": 0.2, "target": 2},
+        ]
+    )
+
+    sc = Mock()
+    ctx = {}
+
+    sc.num_users = 0
+
+    def scale_users(n):
+        sc.num_users = n
+
+    sc.scale_users.side_effect = scale_users
+
+    closure(sc, ctx)
+
+    assert sc.scale_users.mock_calls == [call(5), call(2), call(0)]
+    sc.get_latest_results.assert_called_with(timeout_ms=None)
+
+
+@patch("cicadad.core.scenario.time")
+def test_load_shape_arrival_rate(time_mock):
+    # NOTE: depends on real time
+    closure = scenario_module.load_shape(
+        [{"kind": "step", "duration": 0.5, "target": 100}],
+        arrival_rate=True,
+        users=3,
+    )
+
+    sc = Mock()
+    ctx = {}
+
+    closure(sc, ctx)
+
+    work = sum(c.args[0] for c in sc.add_work.mock_calls)
+
+    assert sc.scale_users.mock_calls == [call(3), call(0)]
+    assert work == 50
+
+
+@patch("cicadad.core.scenario.time")
+def test_replay_trace(time_mock, tmp_path):
+    # NOTE: depends on real time
+    path = tmp_path / "trace.csv"
+    path.write_text("0,a\n0,b\n0,c\n200,d\n")
+
+    closure = scenario_module.replay_trace(str(path), 2, speedup=2, max_batch_size=2)
+
+    sc = Mock()
+    ctx = {}
+
+    sc.get_latest_results.side_effect = [[1, 2], [3], [4]]
+
+    closure(sc, ctx)
+
+    assert sc.add_work_items.mock_calls == [call(["a", "b"]), call(["c"]), call(["d"])]
+    assert sc.scale_users.mock_calls == [call(2), call(0)]
+
+
 def test_load_stages():
     # NOTE: depends on real time
     s1 = scenario_module.n_seconds(2, 2, skip_scaledown=True)
@@ -181,3 +377,52 @@ def test_load_stages():
     assert sc.scale_users.mock_calls[0] == call(2)
     assert sc.scale_users.mock_calls[1] == call(4)
     assert sc.scale_users.mock_calls[2] == call(0)
+
+
+def test_parallel_stages():
+    sc = Mock()
+    ctx = {}
+    pools = {}
+
+    def pool(name):
+        pools[name] = Mock()
+        return pools[name]
+
+    sc.pool.side_effect = pool
+
+    s1 = Mock()
+    s2 = Mock()
+
+    closure = scenario_module.parallel_stages(s1, spike=s2)
+
+    closure(sc, ctx)
+
+    s1.assert_called_once_with(pools["stage-0"], ctx)
+    s2.assert_called_once_with(pools["spike"], ctx)
+    pools["stage-0"].scale_users.assert_called_once_with(0)
+    pools["spike"].scale_users.assert_called_once_with(0)
+    assert sc.aggregated_results == {
+        "stage-0": pools["stage-0"].aggregated_results,
+        "spike": pools["spike"].aggregated_results,
+    }
+
+
+def test_parallel_stages_error():
+    sc = Mock()
+    pools = {}
+
+    def pool(name):
+        pools[name] = Mock()
+        return pools[name]
+
+    sc.pool.side_effect = pool
+
+    closure = scenario_module.parallel_stages(
+        Mock(side_effect=ValueError("bad stage")), Mock()
+    )
+
+    with raises(ValueError):
+        closure(sc, {})
+
+    pools["stage-0"].scale_users.assert_called_once_with(0)
+    pools["stage-1"].scale_users.assert_called_once_with(0)
@@ -0,0 +1,63 @@
+from pytest import approx, raises
+
+from cicadad.core import shapes
+
+
+def test_load_shape_level():
+    segments = shapes.read_load_shape(
+        [
+            {"kind": "step", "duration": 10, "target": 5},
+            {"kind": "ramp", "duration": 10, "target": 15},
+            {"kind": "spike", "duration": 5, "target": 50},
+            {"kind": "hold", "duration": 5},
+            {
+                "kind": "sine",
+                "duration": 20,
+                "target": 10,
+                "amplitude": 5,
+                "period": 20,
+            },
+        ]
+    )
+
+    assert shapes.load_shape_duration(segments) == 50
+    assert shapes.load_shape_level(segments, 0) == 5
+    assert shapes.load_shape_level(segments, 15) == 10
+    assert shapes.load_shape_level(segments, 22) == 50
+    assert shapes.load_shape_level(segments, 27) == 15
+    assert shapes.load_shape_level(segments, 35) == approx(15)
+    assert shapes.load_shape_level(segments, 50) is None
+
+
+def test_load_shape_level_initial():
+    segments = shapes.read_load_shape([{"kind": "ramp", "duration": 10, "target": 0}])
+
+    assert shapes.load_shape_level(segments, 5, initial=10) == 5
+
+
+def test_read_load_shape_csv(tmp_path):
+    path = tmp_path / "shape.csv"
+    path.write_text("kind,duration,target\nstep,10,5\nhold,5,\n")
+
+    segments = shapes.read_load_shape(str(path))
+
+    assert [segment.kind for segment in segments] == ["step", "hold"]
+    assert segments[0].target == 5
+    assert segments[1].target == 0
+
+
+def test_read_load_shape_yaml(tmp_path):
+    path = tmp_path / "shape.yaml"
+    path.write_text(
+        "- kind: ramp\n  duration: 30\n  target: 100\n- kind: hold\n  duration: 60\n"
+    )
+
+    segments = shapes.read_load_shape(str(path))
+
+    assert shapes.load_shape_duration(segments) == 90
+    assert segments[0].target == 100
+
+
+def test_read_load_shape_invalid_kind():
+    with raises(ValueError, match="Unknown load shape kind"):
+        shapes.read_load_shape([{"kind": "square", "duration": 1}])
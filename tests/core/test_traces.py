@@ -0,0 +1,27 @@
+from pytest import raises
+
+from cicadad.core import traces
+
+
+def test_read_trace(tmp_path):
+    path = tmp_path / "trace.csv"
+    path.write_text("offset_ms,key\n0,GET /\n\n10,GET /a,b\n25,POST /c\n")
+
+    rows = list(traces.read_trace(str(path)))
+
+    assert rows == [(0, "GET /"), (10, "GET /a,b"), (25, "POST /c")]
+
+
+def test_read_trace_empty(tmp_path):
+    path = tmp_path / "trace.csv"
+    path.write_text("")
+
+    assert list(traces.read_trace(str(path))) == []
+
+
+def test_read_trace_invalid_offset(tmp_path):
+    path = tmp_path / "trace.csv"
+    path.write_text("0,a\nfoo,b\n")
+
+    with raises(ValueError, match="Invalid offset"):
+        list(traces.read_trace(str(path)))
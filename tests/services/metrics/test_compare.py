@@ -0,0 +1,101 @@
+from cicadad.metrics import compare
+
+
+def make_summary(throughput: float, latency: float) -> compare.ScenarioSummary:
+    return compare.ScenarioSummary(
+        count=int(throughput * 60),
+        duration=60,
+        throughput=throughput,
+        percentiles={"p50": latency, "p95": latency * 2, "p99": latency * 3},
+        window_throughput=[throughput + i % 3 for i in range(12)],
+        window_latency=[latency + 0.001 * (i % 3) for i in range(12)],
+    )
+
+
+def test_mann_whitney_greater():
+    # NOTE: matches asymptotic one-sided test with continuity correction
+    assert round(compare.mann_whitney_greater([4, 5, 6], [1, 2, 3]), 4) == 0.0404
+    assert compare.mann_whitney_greater([1, 2, 3], [4, 5, 6]) > 0.9
+    assert compare.mann_whitney_greater([1, 1, 1], [1, 1, 1]) == 1.0
+
+
+def test_compare_runs_latency_regression():
+    comparisons = compare.compare_runs(
+        {"s1": make_summary(100, 0.1)},
+        {"s1": make_summary(100, 0.2)},
+        compare.CompareTolerances(),
+    )
+
+    regressed = {c.metric: c.regressed for c in comparisons}
+
+    assert regressed == {
+        "throughput": False,
+        "latency_p50": True,
+        "latency_p95": True,
+        "latency_p99": True,
+    }
+
+
+def test_compare_runs_throughput_regression():
+    comparisons = compare.compare_runs(
+        {"s1": make_summary(100, 0.1)},
+        {"s1": make_summary(50, 0.1)},
+        compare.CompareTolerances(),
+    )
+
+    assert [c.metric for c in comparisons if c.regressed] == ["throughput"]
+
+
+def test_compare_runs_within_tolerance():
+    comparisons = compare.compare_runs(
+        {"s1": make_summary(100, 0.1)},
+        {"s1": make_summary(95, 0.105), "s2": make_summary(1, 1)},
+        compare.CompareTolerances(),
+    )
+
+    # NOTE: scenarios missing from baseline are not compared
+    assert {c.scenario for c in comparisons} == {"s1"}
+    assert not any(c.regressed for c in comparisons)
+
+
+def test_compare_runs_not_significant():
+    baseline = make_summary(100, 0.1)
+    current = make_summary(100, 0.2)
+
+    current.window_latency = baseline.window_latency
+
+    comparisons = compare.compare_runs(
+        {"s1": baseline}, {"s1": current}, compare.CompareTolerances()
+    )
+
+    assert not any(c.regressed for c in comparisons)
+
+
+def test_comparison_display():
+    comparison_display = compare.ComparisonDisplay(
+        [
+            compare.MetricComparison(
+                scenario="s1",
+                metric="throughput",
+                baseline=100,
+                current=80,
+                change=-0.2,
+                p_value=0.01,
+                regressed=True,
+            ),
+            compare.MetricComparison(
+                scenario="s1",
+                metric="latency_p99",
+                baseline=None,
+                current=0.5,
+                change=None,
+                p_value=None,
+                regressed=False,
+            ),
+        ]
+    )
+
+    table = comparison_display.get_renderable()
+
+    assert table.row_count == 2
+    assert table.rows[0].style == "red"
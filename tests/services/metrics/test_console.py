@@ -1,5 +1,6 @@
 from unittest.mock import Mock, patch
 
+from cicadad.core.types import MetricSeriesPoint
 from cicadad.metrics import console
 
 
@@ -9,6 +10,35 @@ def sample_collector(latest_results):
     ]
 
 
+def test_console_summary_collector():
+    backend = Mock()
+
+    collector = console.console_summary_collector("foo", lambda results: [1, 2, 3])
+
+    collector([], backend)
+
+    name, summary = backend.add_metric_summary.call_args.args
+
+    assert name == "foo"
+    assert summary.count == 3
+    assert summary.sum == 6
+    assert summary.min == 1
+    assert summary.max == 3
+    assert summary.last == 3
+    assert summary.sum_of_squares == 14
+    assert sum(summary.histogram.values()) == 3
+
+
+def test_console_summary_collector_empty():
+    backend = Mock()
+
+    collector = console.console_summary_collector("foo", lambda results: [])
+
+    collector([], backend)
+
+    assert not backend.add_metric_summary.called
+
+
 def test_console_stats():
     backend = Mock()
 
@@ -42,6 +72,61 @@ def test_console_stats_none():
     assert metrics_string is None, "Metrics string not equal to expected"
 
 
+def test_console_summary_stats():
+    backend = Mock()
+
+    backend.get_metric_statistics.return_value = {
+        "min": 1.23456,
+        "median": 0,
+        "max": 1.23456,
+        "average": 1.23456,
+        "len": 1,
+        "stddev": 0.12345,
+    }
+
+    console_summary_stats = console.console_summary_stats("foo")
+
+    metrics_string = console_summary_stats("foo", "bar", backend)
+
+    assert (
+        metrics_string
+        == "Min: 1.235, Average: 1.235, Stddev: 0.123, Max: 1.235, Len: 1"
+    ), "Metrics string not equal to expected"
+
+
+def test_console_window_stats():
+    backend = Mock()
+
+    backend.get_metric_series.return_value = [
+        MetricSeriesPoint(
+            timestamp=0, count=2, sum=3, min=1, max=2, average=1.5, stddev=0.5
+        ),
+        MetricSeriesPoint(
+            timestamp=10, count=1, sum=4, min=4, max=4, average=4, stddev=0
+        ),
+    ]
+
+    console_window_stats = console.console_window_stats("foo")
+
+    metrics_string = console_window_stats("foo", "bar", backend)
+
+    assert (
+        metrics_string == "Min: 1.0, Average: 2.333, Max: 4.0, Len: 3"
+    ), "Metrics string not equal to expected"
+
+
+def test_console_window_stats_none():
+    backend = Mock()
+
+    backend.get_metric_series.return_value = []
+
+    console_window_stats = console.console_window_stats("foo")
+
+    metrics_string = console_window_stats("foo", "bar", backend)
+
+    assert metrics_string is None, "Metrics string not equal to expected"
+
+
 def test_console_count():
     backend = Mock()
 
@@ -0,0 +1,117 @@
+import random
+
+from pytest import approx, raises
+
+from cicadad.core.types import Result
+from cicadad.metrics import convergence
+
+
+def test_normal_quantile():
+    assert convergence.normal_quantile(0.5) == approx(0)
+    assert convergence.normal_quantile(0.975) == approx(1.959964, abs=1e-6)
+    assert convergence.normal_quantile(0.995) == approx(2.575829, abs=1e-6)
+    assert convergence.normal_quantile(0.001) == approx(-3.090232, abs=1e-6)
+
+    with raises(ValueError):
+        convergence.normal_quantile(1)
+
+
+def test_running_moments():
+    moments = convergence.RunningMoments()
+
+    for value in [2, 4, 4, 4, 5, 5, 7, 9]:
+        moments.add(value)
+
+    assert moments.count == 8
+    assert moments.mean == 5
+    assert round(moments.variance, 4) == round(32 / 7, 4)
+
+
+def test_streaming_quantile_small():
+    quantile = convergence.StreamingQuantile(0.5)
+
+    assert quantile.value is None
+
+    for value in [3, 1, 2]:
+        quantile.add(value)
+
+    assert quantile.value == 2
+
+
+def test_streaming_quantile():
+    rng = random.Random(1)
+    quantile = convergence.StreamingQuantile(0.95)
+
+    for _ in range(10000):
+        quantile.add(rng.uniform(0, 100))
+
+    assert quantile.count == 10000
+    assert 93 < quantile.value < 97
+
+
+def test_criterion_unknown_statistic():
+    with raises(ValueError):
+        convergence.ConvergenceCriterion(statistics=["p42"])
+
+
+def make_results(rng, n, spread=0.01):
+    return [
+        Result(id=str(i), time_taken=1 + rng.uniform(-spread, spread)) for i in range(n)
+    ]
+
+
+def test_converged():
+    rng = random.Random(1)
+    estimator = convergence.ConvergenceEstimator(
+        convergence.ConvergenceCriterion(window_seconds=1, stable_windows=2)
+    )
+
+    for second in range(4):
+        estimator.add_results(make_results(rng, 50), now=second)
+
+    assert not estimator.converged
+
+    estimator.add_results([], now=4)
+
+    assert estimator.converged
+    assert estimator.count == 200
+    assert round(estimator.estimates()["mean"], 1) == 1
+
+
+def test_not_converged_trend():
+    rng = random.Random(1)
+    estimator = convergence.ConvergenceEstimator(
+        convergence.ConvergenceCriterion(window_seconds=1, stable_windows=2)
+    )
+
+    for second in range(10):
+        estimator.add_results(
+            [Result(id="1", time_taken=1 + second * 0.1 + rng.uniform(0, 0.01))] * 50,
+            now=second,
+        )
+
+    assert not estimator.converged
+
+
+def test_min_results():
+    rng = random.Random(1)
+    estimator = convergence.ConvergenceEstimator(
+        convergence.ConvergenceCriterion(
+            window_seconds=1, stable_windows=2, min_results=1000
+        )
+    )
+
+    for second in range(6):
+        estimator.add_results(make_results(rng, 50), now=second)
+
+    assert not estimator.converged
+
+
+def test_skips_failed_results():
+    estimator = convergence.ConvergenceEstimator(convergence.ConvergenceCriterion())
+
+    estimator.add_results(
+        [Result(id="1", time_taken=1, exception="boom"), Result(id="2"), 3], now=0
+    )
+
+    assert estimator.count == 0
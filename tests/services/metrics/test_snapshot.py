@@ -0,0 +1,86 @@
+from unittest.mock import Mock
+
+from cicadad.core.types import MetricQuery
+from cicadad.metrics import console, snapshot
+
+
+def test_evaluate_console_metrics():
+    displays = {
+        "runtimes": console.console_stats("runtime"),
+        "success_rate": console.console_percent("pass_or_fail", 0.5),
+        "lag": console.console_latest("result_lag"),
+    }
+    values = {
+        MetricQuery(kind="statistics", scenario_id="s1", name="runtime"): {
+            "min": 1,
+            "median": 2,
+            "average": 2,
+            "max": 3,
+            "len": 3,
+        },
+        MetricQuery(
+            kind="rate", scenario_id="s1", name="pass_or_fail", split_point=0.5
+        ): 1,
+        MetricQuery(kind="last", scenario_id="s2", name="result_lag"): 0.25,
+    }
+    get_snapshot = Mock(return_value=values)
+
+    metrics = snapshot.evaluate_console_metrics(
+        {"first": ("s1", displays), "second": ("s2", displays)}, get_snapshot
+    )
+
+    # NOTE: all metrics of all scenarios are read in one call
+    get_snapshot.assert_called_once()
+    assert len(get_snapshot.call_args.args[0]) == 6
+    assert metrics == {
+        "first": {
+            "runtimes": "Min: 1, Median: 2, Average: 2, Max: 3, Len: 3",
+            "success_rate": "1",
+            "lag": None,
+        },
+        "second": {"runtimes": None, "success_rate": None, "lag": "0.25"},
+    }
+
+
+def test_evaluate_console_metrics_timed_out():
+    displays = {"lag": console.console_latest("result_lag")}
+
+    assert (
+        snapshot.evaluate_console_metrics(
+            {"first": ("s1", displays)}, Mock(return_value=None)
+        )
+        is None
+    )
+
+
+def test_snapshot_metrics_backend_missing_series():
+    backend = snapshot.SnapshotMetricsBackend({})
+
+    assert backend.get_metric_series("s1", "runtime", 0, 0, 10) == []
+
+
+def test_evaluate_console_metrics_replays_calls():
+    now = iter([100, 101])
+
+    # NOTE: window moves between recording and replay, like a display using time
+    def window_display(name, scenario_id, backend):
+        start = next(now)
+        points = backend.get_metric_series(scenario_id, "runtime", start, 0, 1)
+
+        return str(len(points))
+
+    query = MetricQuery(
+        kind="series",
+        scenario_id="s1",
+        name="runtime",
+        from_timestamp=100,
+        to_timestamp=0,
+        step=1,
+    )
+
+    metrics = snapshot.evaluate_console_metrics(
+        {"first": ("s1", {"window": window_display})},
+        Mock(return_value={query: [Mock(), Mock()]}),
+    )
+
+    assert metrics == {"first": {"window": "2"}}
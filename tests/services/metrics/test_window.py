@@ -0,0 +1,73 @@
+from cicadad.core.types import Result
+from cicadad.metrics.window import ResultWindow, make_window_slot
+
+
+def test_window_stats():
+    window = ResultWindow()
+
+    window.add_results(
+        [Result(time_taken=i / 100, output=i) for i in range(1, 101)], now=100
+    )
+    window.add_results([Result(exception="foo", time_taken=2)], now=101)
+
+    stats = window.stats("time_taken", 10, now=101)
+
+    assert stats.count == 101
+    assert stats.throughput == 101 / 2
+    assert stats.error_rate == 1 / 101
+    assert stats.min == 0.01
+    assert stats.max == 2
+    assert abs(stats.p50 - 0.51) < 0.01
+    assert abs(stats.p95 - 0.96) < 0.01
+
+
+def test_window_stats_slots():
+    results = [Result(time_taken=i / 100, output=i) for i in range(1, 101)]
+    window = ResultWindow()
+    merged = ResultWindow()
+
+    window.add_results(results + [Result(exception="foo", time_taken=2)], now=100)
+    merged.add_slot(make_window_slot(results[:50]), now=100)
+    merged.add_slot(make_window_slot(results[50:]), now=100)
+    merged.add_slot(make_window_slot([Result(exception="foo", time_taken=2)]), now=100)
+
+    assert merged.stats("time_taken", 10, now=100) == window.stats(
+        "time_taken", 10, now=100
+    )
+    assert merged.stats("output", 10, now=100) == window.stats("output", 10, now=100)
+
+
+def test_window_stats_output():
+    window = ResultWindow()
+
+    window.add_results([Result(output=i) for i in range(1, 11)], now=100)
+
+    stats = window.stats("output", 10, now=100)
+
+    assert stats.min == 1
+    assert stats.max == 10
+    assert abs(stats.p90 - 9) < 0.1
+
+
+def test_window_stats_expired():
+    window = ResultWindow(capacity=10)
+
+    window.add_results([Result(time_taken=1)], now=100)
+    window.add_results([Result(time_taken=2)], now=115)
+
+    stats = window.stats("time_taken", 30, now=115)
+
+    assert stats.seconds == 10
+    assert stats.count == 1
+    assert stats.min == 2
+
+
+def test_window_stats_empty():
+    window = ResultWindow()
+
+    stats = window.stats("time_taken", 10, now=100)
+
+    assert stats.count == 0
+    assert stats.throughput == 0
+    assert stats.error_rate == 0
+    assert stats.p95 is None
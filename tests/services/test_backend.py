@@ -0,0 +1,32 @@
+from unittest.mock import Mock, patch
+
+import grpc  # type: ignore
+from pytest import raises
+
+from cicadad.services.backend import CLIBackend
+
+
+class UnavailableError(grpc.RpcError):
+    pass
+
+
+@patch("cicadad.util.backoff.time.sleep")
+def test_wait_for_backend(sleep):
+    backend_api = Mock()
+    backend_api.check_health.side_effect = [UnavailableError(), None]
+
+    CLIBackend(backend_api).wait_for_backend(3)
+
+    assert backend_api.check_health.call_count == 2
+    sleep.assert_called_once()
+
+
+@patch("cicadad.util.backoff.time.sleep")
+def test_wait_for_backend_not_ready(sleep):
+    backend_api = Mock()
+    backend_api.check_health.side_effect = UnavailableError()
+
+    with raises(RuntimeError, match="Backend did not become ready"):
+        CLIBackend(backend_api).wait_for_backend(3)
+
+    assert backend_api.check_health.call_count == 3
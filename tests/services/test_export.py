@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta
+import json
+
+import pytest
+
+from cicadad.core.types import Result
+from cicadad.services import export
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def make_result(i: int, exception=None) -> Result:
+    return Result(
+        id=str(i),
+        exception=exception,
+        timestamp=datetime(2022, 1, 1) + timedelta(seconds=i),
+        time_taken=0.1 * i,
+        user_id=f"user-{i % 2}",
+        user_manager_id="manager-1",
+    )
+
+
+def test_error_type():
+    assert export.error_type(None) is None
+    assert export.error_type(ValueError("bad")) == "ValueError"
+    assert export.error_type("timeout after 30s") == "timeout after <n>s"
+
+
+def test_parquet_result_exporter(tmp_path):
+    exporter = export.ParquetResultExporter(
+        str(tmp_path), "s1", "abc", row_group_size=2, test_id="t-1"
+    )
+
+    exporter.add_results([make_result(1), make_result(2), make_result(3)])
+    exporter.add_results([make_result(4, ValueError("bad"))])
+    exporter.close()
+
+    parquet_file = pq.ParquetFile(tmp_path / "scenario=s1" / "abc.parquet")
+    table = parquet_file.read()
+
+    assert parquet_file.num_row_groups == 2
+    assert table.column_names == export.EXPORT_COLUMNS
+    assert table.column("success").to_pylist() == [True, True, True, False]
+    assert table.column("error_type").to_pylist() == [None, None, None, "ValueError"]
+    assert table.column("user_manager_id").to_pylist() == ["manager-1"] * 4
+
+    index = [
+        json.loads(line)
+        for line in (tmp_path / export.EXPORT_INDEX_FILE).read_text().splitlines()
+    ]
+
+    assert index == [
+        {
+            "test_id": "t-1",
+            "scenario": "s1",
+            "scenario_id": "abc",
+            "path": "scenario=s1/abc.parquet",
+            "rows": 4,
+            "row_groups": 2,
+            "errors": 1,
+            "first_timestamp": "2022-01-01 00:00:01",
+            "last_timestamp": "2022-01-01 00:00:04",
+        }
+    ]
+
+
+def test_parquet_result_exporter_no_results(tmp_path):
+    exporter = export.ParquetResultExporter(str(tmp_path), "s1", "abc")
+
+    exporter.close()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_load_export_summaries(tmp_path):
+    exporter = export.ParquetResultExporter(str(tmp_path), "s1", "abc")
+
+    exporter.add_results(
+        [make_result(i) for i in range(1, 31)] + [make_result(31, ValueError("bad"))]
+    )
+    exporter.close()
+
+    summaries = export.load_export_summaries(str(tmp_path), window_seconds=10)
+    summary = summaries["s1"]
+
+    assert list(summaries) == ["s1"]
+    assert summary.count == 31
+    assert summary.duration == 30
+    # NOTE: last window is dropped
+    assert summary.window_throughput == [1.0, 1.0, 1.0]
+    assert len(summary.window_latency) == 3
+    assert round(summary.percentiles["p50"], 3) == 1.55
+
+
+def test_load_export_summaries_sampled(tmp_path):
+    exporter = export.ParquetResultExporter(str(tmp_path), "s1", "abc", sample_rate=0.1)
+
+    sampled = [make_result(i).copy(update={"reduced_count": 0}) for i in range(1, 31)]
+    failure = make_result(31, ValueError("bad")).copy(update={"reduced_count": 0})
+
+    exporter.add_results(sampled + [failure])
+    exporter.close()
+
+    summary = export.load_export_summaries(str(tmp_path), window_seconds=10)["s1"]
+
+    # NOTE: each sampled success stands in for 10 results, failures are all kept
+    assert summary.count == 301
+    assert summary.window_throughput == [10.0, 10.0, 10.0]
+
+
+def test_load_export_summaries_latest_run(tmp_path):
+    for test_id, scenario_id, count in [("t-1", "abc", 10), ("t-2", "def", 20)]:
+        exporter = export.ParquetResultExporter(
+            str(tmp_path), "s1", scenario_id, test_id=test_id
+        )
+
+        exporter.add_results([make_result(i) for i in range(1, count + 1)])
+        exporter.close()
+
+    # NOTE: directory was reused, only one run is summarized
+    assert export.read_export_index(str(tmp_path)) == {
+        "s1": ["scenario=s1/def.parquet"]
+    }
+    assert export.load_export_summaries(str(tmp_path))["s1"].count == 20
+    assert export.load_export_summaries(str(tmp_path), test_id="t-1")["s1"].count == 10
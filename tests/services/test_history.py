@@ -0,0 +1,165 @@
+from datetime import datetime
+from unittest.mock import patch
+import subprocess
+
+from pytest import approx
+
+from cicadad.metrics.compare import ScenarioSummary
+from cicadad.services import history
+
+
+def test_summarize_run():
+    context = {
+        "exported": {
+            "exception": None,
+            "time_taken": 10,
+            "succeeded": 90,
+            "failed": 10,
+            "max_users": 5,
+        },
+        "not_exported": {
+            "exception": "some error",
+            "time_taken": 4,
+            "succeeded": 6,
+            "failed": 2,
+            "max_users": 2,
+        },
+    }
+    export_summaries = {
+        "exported": ScenarioSummary(
+            count=100,
+            duration=9.5,
+            throughput=12.5,
+            percentiles={"p50": 0.1, "p95": 0.2, "p99": None},
+            window_throughput=[],
+            window_latency=[],
+        )
+    }
+
+    summaries = history.summarize_run(context, export_summaries)
+
+    assert summaries[0].scenario == "exported"
+    assert summaries[0].passed
+    assert summaries[0].throughput == 12.5
+    assert summaries[0].p95 == 0.2
+    assert summaries[0].p99 is None
+    assert summaries[0].max_users == 5
+    assert summaries[1].scenario == "not_exported"
+    assert not summaries[1].passed
+    assert summaries[1].throughput == 2
+    assert summaries[1].p50 is None
+
+
+def test_summarize_run_no_time_taken():
+    summaries = history.summarize_run(
+        {"s": {"exception": None, "time_taken": None}}, {}
+    )
+
+    assert summaries[0].throughput is None
+    assert summaries[0].succeeded == 0
+    assert summaries[0].max_users == 0
+
+
+def test_get_git_sha_not_repo():
+    with patch.object(
+        history.subprocess,
+        "run",
+        side_effect=subprocess.CalledProcessError(128, ["git"]),
+    ):
+        assert history.get_git_sha() is None
+
+
+def test_run_history_trend(tmp_path):
+    run_history = history.RunHistory(str(tmp_path / "nested" / "history.db"))
+
+    for i in range(3):
+        run_history.add_run(
+            f"t{i}",
+            datetime(2021, 1, i + 1),
+            f"sha{i}",
+            ["tag"],
+            [
+                history.ScenarioRunSummary(
+                    scenario="s1", passed=True, p95=0.1 * (i + 1), succeeded=i
+                ),
+                history.ScenarioRunSummary(scenario="s2", passed=i != 1),
+            ],
+        )
+
+    records = run_history.scenario_trend("s1", limit=2)
+
+    assert [record.test_id for record in records] == ["t1", "t2"]
+    assert records[-1].git_sha == "sha2"
+    assert records[-1].tags == ["tag"]
+    assert records[-1].started_at == datetime(2021, 1, 3)
+    assert records[-1].p95 == approx(0.3)
+    assert records[-1].succeeded == 2
+    assert [r.passed for r in run_history.scenario_trend("s2")] == [
+        True,
+        False,
+        True,
+    ]
+    assert run_history.scenarios() == {"s1": 3, "s2": 3}
+    assert run_history.scenario_trend("missing") == []
+
+    run_history.close()
+
+
+def test_run_history_persists(tmp_path):
+    path = str(tmp_path / "history.db")
+
+    run_history = history.RunHistory(path)
+    run_history.add_run(
+        "t1",
+        datetime(2021, 1, 1),
+        None,
+        [],
+        [history.ScenarioRunSummary(scenario="s1", passed=True)],
+    )
+    run_history.close()
+
+    run_history = history.RunHistory(path)
+
+    assert run_history.scenarios() == {"s1": 1}
+
+    run_history.close()
+
+
+def test_history_display():
+    history_display = history.HistoryDisplay(
+        "s1",
+        [
+            history.ScenarioRecord(
+                run_id=1,
+                test_id="t1",
+                started_at=datetime(2021, 1, 1),
+                git_sha=None,
+                tags=[],
+                scenario="s1",
+                passed=True,
+                throughput=10.0,
+            ),
+            history.ScenarioRecord(
+                run_id=2,
+                test_id="t2",
+                started_at=datetime(2021, 1, 2),
+                git_sha="0123456789abcdef",
+                tags=["a"],
+                scenario="s1",
+                passed=False,
+                p50=0.1,
+                p95=0.2,
+                p99=0.3,
+                throughput=8.0,
+                succeeded=70,
+                failed=10,
+                max_users=5,
+            ),
+        ],
+    )
+
+    table = history_display.get_renderable()
+
+    assert table.row_count == 2
+    assert table.rows[0].style is None
+    assert table.rows[1].style == "red"
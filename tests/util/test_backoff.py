@@ -0,0 +1,36 @@
+from unittest.mock import Mock, call, patch
+
+from pytest import raises
+
+from cicadad.util import backoff
+
+
+@patch("cicadad.util.backoff.time.sleep")
+def test_exponential_backoff_retries(sleep):
+    get_client_fn = Mock(side_effect=[ValueError(), ValueError(), "client"])
+
+    assert backoff.exponential_backoff(get_client_fn, ValueError, 5) == "client"
+    assert sleep.mock_calls == [call(2), call(4)]
+
+
+@patch("cicadad.util.backoff.time.sleep")
+def test_exponential_backoff_max_wait(sleep):
+    get_client_fn = Mock(side_effect=ValueError())
+
+    with raises(RuntimeError):
+        backoff.exponential_backoff(
+            get_client_fn, ValueError, 5, initial_wait=0.1, max_wait=0.3
+        )
+
+    assert get_client_fn.call_count == 5
+    assert sleep.mock_calls == [call(0.1), call(0.2), call(0.3), call(0.3)]
+
+
+@patch("cicadad.util.backoff.time.sleep")
+def test_exponential_backoff_other_error(sleep):
+    get_client_fn = Mock(side_effect=KeyError())
+
+    with raises(KeyError):
+        backoff.exponential_backoff(get_client_fn, ValueError, 5)
+
+    sleep.assert_not_called()
@@ -83,6 +83,15 @@ def test_tasks_panel_running_failed():
     assert isinstance(tasks_panel.get_renderable().renderable.renderables[0], str)
 
 
+def test_tasks_panel_unknown_task():
+    tasks_panel = console.TasksPanel()
+
+    tasks_panel.update_task_success("task_name")
+    tasks_panel.update_task_failed("task_name")
+
+    assert tasks_panel.get_renderable() is None
+
+
 def test_metrics_panel_empty():
     metrics_panel = console.MetricsPanel()
 
@@ -117,3 +126,54 @@ def test_live_panel_populated():
     tasks_panel.add_running_task("task_name", "abc")
 
     assert isinstance(live_panel.get_renderable(), Panel)
+
+
+def test_metrics_display_cached():
+    metrics_display = console.MetricDisplay("task_name")
+
+    metrics_display.update_metrics({"a": "1"})
+    table = metrics_display.get_renderable()
+
+    metrics_display.update_metrics({"a": "1"})
+
+    assert metrics_display.get_renderable() is table
+
+    metrics_display.update_metrics({"a": "2"})
+
+    assert metrics_display.get_renderable() is not table
+
+
+def test_metrics_panel_rebuilds_changed_display():
+    metrics_panel = console.MetricsPanel()
+
+    metrics_panel.add_metric("task_a", {"a": "1"})
+    metrics_panel.add_metric("task_b", {"b": "1"})
+
+    panel = metrics_panel.get_renderable()
+    table_a, table_b = panel.renderable.renderables
+
+    metrics_panel.add_metric("task_a", {"a": "1"})
+
+    assert metrics_panel.get_renderable() is panel
+
+    metrics_panel.add_metric("task_b", {"b": "2"})
+    new_table_a, new_table_b = metrics_panel.get_renderable().renderable.renderables
+
+    assert new_table_a is table_a
+    assert new_table_b is not table_b
+
+
+def test_live_panel_cached():
+    tasks_panel = console.TasksPanel()
+    metrics_panel = console.MetricsPanel()
+
+    live_panel = console.LivePanel("test_name", tasks_panel, metrics_panel)
+
+    tasks_panel.add_running_task("task_name", "abc")
+    renderable = live_panel.get_renderable()
+
+    assert live_panel.get_renderable() is renderable
+
+    tasks_panel.update_task_success("task_name")
+
+    assert live_panel.get_renderable() is not renderable
@@ -1,3 +1,7 @@
+from unittest.mock import Mock
+
+import pytest
+
 from cicadad.util import context
 
 
@@ -11,3 +15,35 @@ def test_encode_decode_non_dict():
     ctx = "foo"
 
     assert context.decode_context(context.encode_context(ctx)) == ctx
+
+
+def test_hash_context_value_sorts_keys():
+    first_hash, data = context.hash_context_value({"a": 1, "b": 2})
+    second_hash, _ = context.hash_context_value({"b": 2, "a": 1})
+
+    assert first_hash == second_hash
+    assert data == b'{"a": 1, "b": 2}'
+
+
+def test_resolve_context():
+    hash, data = context.hash_context_value({"output": 42})
+    refs = context.decode_context(
+        context.encode_context(context.make_context_refs({"s1": hash}))
+    )
+
+    resolved = context.resolve_context(refs, {hash: data}.get)
+
+    assert resolved == {"s1": {"output": 42}}
+
+
+def test_resolve_context_plain():
+    assert context.resolve_context({"s1": {"output": 42}}, Mock()) == {
+        "s1": {"output": 42}
+    }
+
+
+def test_resolve_context_missing():
+    refs = context.make_context_refs({"s1": "abc"})
+
+    with pytest.raises(ValueError):
+        context.resolve_context(refs, lambda hash: None)
@@ -0,0 +1,21 @@
+from unittest.mock import Mock
+import io
+import json
+
+from cicadad.util import printing
+
+
+def test_json_lines_writer():
+    stream = io.StringIO()
+    stream.flush = Mock()  # type: ignore
+
+    writer = printing.JSONLinesWriter(stream)
+
+    writer.write("event", {"kind": "TEST_STARTED"})
+    writer.write("summary", {"passed": ["s1"], "failed": []})
+
+    lines = stream.getvalue().splitlines()
+
+    assert [json.loads(line)["type"] for line in lines] == ["event", "summary"]
+    assert json.loads(lines[1])["passed"] == ["s1"]
+    assert stream.flush.call_count == 2